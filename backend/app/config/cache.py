@@ -0,0 +1,248 @@
+import asyncio
+import functools
+import logging
+import secrets
+import time
+from typing import Optional, List, Sequence, Callable, Awaitable, get_type_hints
+from pydantic import TypeAdapter
+from app.config.settings import REDIS_URL, CACHE_TTL_SECONDS, CACHE_MEMORY_MAX_ENTRIES
+
+try:
+    # aioredis 2.x lives on inside redis-py as redis.asyncio (same API); the standalone
+    # aioredis package cannot be imported on Python 3.11+
+    import redis.asyncio as aioredis
+except ImportError:
+    try:
+        import aioredis
+    except (ImportError, TypeError):
+        aioredis = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Shared read cache for person profiles, organization details and reference lists.
+#
+# Keys are versioned instead of deleted: every entity ("country", "person", "organization", ...)
+# has a counter under version:<entity> that the model write functions bump (app/config/entity_version.py),
+# and a cached value is stored under cache:<function>:<args>:<epoch>-<versions of its entities>.
+# A write therefore invalidates every cached read of that entity with one INCR; old values are
+# never read again and expire after CACHE_TTL_SECONDS. The same versions build the ETags of
+# app/controllers/etag.py, so with Redis every worker sees every write.
+#
+# cache:epoch is a random token created on first use; if Redis is flushed the counters restart
+# from 0 under a new epoch, so no old key or ETag can match again.
+#
+# Without REDIS_URL (or without the redis package) InMemoryCache keeps the same data in this
+# process; it is also the fake used in tests. If Redis fails the cache is bypassed and reads go
+# to the database.
+
+EPOCH_KEY = "cache:epoch"
+
+class InMemoryCache:
+    name = "memory"
+
+    def __init__(self, max_entries: int = CACHE_MEMORY_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data = {}  # key -> (value, expires_at or None)
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    def _get(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self._data.items() if expires_at is not None and expires_at <= now]:
+            del self._data[key]
+        # Still full: drop the oldest cached values, never the counters
+        for key in [key for key, (_, expires_at) in self._data.items() if expires_at is not None]:
+            if len(self._data) < self.max_entries:
+                break
+            del self._data[key]
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None, nx: bool = False) -> bool:
+        if nx and self._get(key) is not None:
+            return False
+        if len(self._data) >= self.max_entries:
+            self._evict()
+        self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self._get(key) or 0) + 1
+        self._data[key] = (str(value).encode(), None)
+        return value
+
+class RedisCache:
+    name = "redis"
+
+    def __init__(self, url: str):
+        self.url = url
+        self._redis = None
+
+    async def connect(self) -> None:
+        self._redis = aioredis.from_url(self.url)
+        await self._redis.ping()
+        logger.info(f"Connected to Redis cache: {self.url}")
+
+    async def disconnect(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return await self._redis.mget(keys)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None, nx: bool = False) -> bool:
+        return bool(await self._redis.set(key, value, ex=ttl, nx=nx))
+
+    async def incr(self, key: str) -> int:
+        return await self._redis.incr(key)
+
+class CacheMetrics:
+    # Counters of this process; GET /v1/cache/metrics
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.hit_seconds = 0.0
+        self.load_seconds = 0.0
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        loads = self.misses - self.coalesced
+        avg_load = self.load_seconds / loads if loads else 0.0
+        avg_hit = self.hit_seconds / self.hits if self.hits else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "avg_hit_ms": avg_hit * 1000,
+            "avg_load_ms": avg_load * 1000,
+            # Database time the hits did not spend, estimated from the average load
+            "saved_seconds": max(0.0, self.hits * (avg_load - avg_hit)),
+        }
+
+class SharedCache:
+    def __init__(self, backend):
+        self.backend = backend
+        self.metrics = CacheMetrics()
+        self._inflight = {}  # key -> Future of the load running in this process
+
+    async def connect(self) -> None:
+        try:
+            await self.backend.connect()
+        except Exception as e:
+            logger.error(f"Cache backend {self.backend.name} unavailable, using the database only until it is back: {str(e)}")
+
+    async def disconnect(self) -> None:
+        await self.backend.disconnect()
+
+    async def versions(self, entities: Sequence[str]) -> Optional[str]:
+        # "<epoch>-<v1>.<v2>..." in one round trip, None when the backend is down
+        try:
+            values = await self.backend.mget([EPOCH_KEY] + [f"version:{entity}" for entity in entities])
+            if values[0] is None:
+                await self.backend.set(EPOCH_KEY, secrets.token_hex(4).encode(), nx=True)
+                values[0] = (await self.backend.mget([EPOCH_KEY]))[0]
+        except Exception as e:
+            self.metrics.errors += 1
+            logger.warning(f"Cache versions unavailable: {str(e)}")
+            return None
+        return values[0].decode() + "-" + ".".join(value.decode() if value else "0" for value in values[1:])
+
+    async def bump(self, entities: Sequence[str]) -> None:
+        try:
+            for entity in entities:
+                await self.backend.incr(f"version:{entity}")
+        except Exception as e:
+            self.metrics.errors += 1
+            logger.error(f"Cache invalidation failed for {list(entities)}: {str(e)}")
+
+    async def get_or_load(self, entities: Sequence[str], key: str, loader: Callable[[], Awaitable], adapter: Optional[TypeAdapter], ttl: int):
+        version = await self.versions(entities)
+        if version is None:
+            return await loader()
+        key = f"cache:{key}:{version}"
+        started = time.perf_counter()
+        try:
+            cached = (await self.backend.mget([key]))[0]
+        except Exception as e:
+            self.metrics.errors += 1
+            logger.warning(f"Cache read failed: {str(e)}")
+            cached = None
+        if cached is not None:
+            result = adapter.validate_json(cached) if adapter is not None else cached
+            self.metrics.hits += 1
+            self.metrics.hit_seconds += time.perf_counter() - started
+            return result
+
+        self.metrics.misses += 1
+        # Single flight: concurrent misses for the same key in this process wait for one load
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.metrics.coalesced += 1
+            return await asyncio.shield(inflight)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+            self.metrics.load_seconds += time.perf_counter() - started
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here, the waiters re-raise it
+            raise
+        finally:
+            del self._inflight[key]
+        if result is not None:
+            try:
+                await self.backend.set(key, adapter.dump_json(result) if adapter is not None else result, ttl)
+            except Exception as e:
+                self.metrics.errors += 1
+                logger.warning(f"Cache write failed: {str(e)}")
+        return result
+
+def _backend():
+    if not REDIS_URL:
+        return InMemoryCache()
+    if aioredis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed, using the in-memory cache")
+        return InMemoryCache()
+    return RedisCache(REDIS_URL)
+
+cache = SharedCache(_backend())
+
+def cached(*entities: str, ttl: int = CACHE_TTL_SECONDS):
+    # Caches a model read function under its arguments and the versions of entities; the result
+    # is (de)serialized with its return annotation, bytes (prebuilt JSON) are stored as they are.
+    # Not found (None) is not cached.
+    # Write functions that read their own changes inside a transaction must use func.__wrapped__.
+    def decorator(func):
+        return_type = get_type_hints(func)["return"]
+        adapter = TypeAdapter(return_type) if return_type is not bytes else None
+        name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = ":".join([name, *map(str, args), *(f"{k}={v}" for k, v in sorted(kwargs.items()))])
+            return await cache.get_or_load(entities, key, lambda: func(*args, **kwargs), adapter, ttl)
+        return wrapper
+    return decorator
@@ -0,0 +1,160 @@
+import gzip
+import logging
+import zlib
+from typing import Optional
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from app.config.fast_json import json_response
+from app.config.settings import COMPRESSION_MINIMUM_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_BROTLI_QUALITY
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Response compression.
+#
+# CompressionMiddleware compresses responses of at least COMPRESSION_MINIMUM_SIZE bytes with brotli
+# (when the Brotli package is installed) or gzip, whichever the client accepts. Streamed responses
+# (StreamingResponse, NDJSON) are compressed as they go: every body message is flushed on its own,
+# so a client reading lines sees each one when it is sent instead of when the buffer fills.
+#
+# Reference lists that rarely change (country, industry_type) are compressed once at the best level
+# and kept in the shared cache next to the plain body (compress() in the model, encoded_response()
+# in the controller); the middleware leaves responses that already have a Content-Encoding alone.
+#
+# A compressed body is not byte-identical to the plain one, so its ETag is made weak (W/"...").
+# If-None-Match uses the weak comparison (app/controllers/etag.py), so 304s still work.
+
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript", "application/xml")
+
+def accepted_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    # Best of ENCODINGS by the q-values of Accept-Encoding, None for identity
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    best = max(ENCODINGS, key=lambda encoding: qualities.get(encoding, qualities.get("*", 0.0)))
+    return best if qualities.get(best, qualities.get("*", 0.0)) > 0 else None
+
+def compress(body: bytes, encoding: Optional[str], level: Optional[int] = None) -> bytes:
+    # Whole body at once; level None uses the best one (for bodies compressed once and cached)
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if level is None else level)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9 if level is None else level, mtime=0)
+    return body
+
+def weak_etag(etag: str) -> str:
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+def encoded_response(body: bytes, encoding: Optional[str], response: Optional[Response] = None) -> Response:
+    # json_response() for a body already compressed with encoding (or plain when None)
+    result = json_response(body, response)
+    result.headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        result.headers["Content-Encoding"] = encoding
+        if "etag" in result.headers:
+            result.headers["ETag"] = weak_etag(result.headers["etag"])
+    return result
+
+class StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            # wbits 31: gzip header and trailer
+            self._zlib = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._brotli = None
+
+    def compress(self, data: bytes) -> bytes:
+        # Compressed and flushed, so the client can decode everything sent so far
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH)
+
+class CompressionMiddleware:
+    # ASGI middleware, app.add_middleware(CompressionMiddleware)
+    def __init__(self, app, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = accepted_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=list(start["headers"]))
+                start = {**start, "headers": headers.raw}
+                content_type = headers.get("content-type", "")
+                if (
+                    start["status"] < 200 or start["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = StreamCompressor(encoding)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "etag" in headers:
+                    headers["ETag"] = weak_etag(headers["etag"])
+                if not more_body:
+                    # Whole body in one message
+                    body = compressor.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                # Streamed: the compressed length is not known up front
+                del headers["Content-Length"]
+                await send(start)
+
+            body = compressor.compress(body) if more_body else compressor.finish(body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,28 @@
+import asyncio
+import logging
+from typing import Awaitable
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Independent model reads of one request at the same time instead of one after the other:
+#
+#   reads = await gather_reads(profile=get_person(person_id), roles=get_party_roles_by_party_id(person_id))
+#   reads["profile"], reads["roles"]
+#
+# Every read runs in its own task and `databases` gives each task its own pooled connection, so
+# the queries overlap and the request takes about as long as the slowest one. Each read holds a
+# connection while it runs: with the pool busy they queue for one and it is no slower than in
+# sequence. Only for reads: writes in separate tasks are separate transactions (use a unit of
+# work, app/config/unit_of_work.py). If one read fails the others are cancelled and the error
+# is raised.
+
+async def gather_reads(**reads: Awaitable) -> dict:
+    tasks = {name: asyncio.ensure_future(read) for name, read in reads.items()}
+    try:
+        results = await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+    return dict(zip(tasks, results))
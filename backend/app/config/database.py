@@ -1,4 +1,9 @@
 from databases import Database
-from app.config.settings import DATABASE_URL
+from app.config.settings import DATABASE_URL, DATABASE_REPLICA_URL, DATABASE_POOL_MIN_SIZE, DATABASE_POOL_MAX_SIZE
+from app.config.replica import DatabaseRouter
 
-database = Database(DATABASE_URL)
\ No newline at end of file
+# primary เสมอ, replica เฉพาะเมื่อตั้ง DATABASE_REPLICA_URL (การเลือกว่า query ไหนไปที่ใดอยู่ใน app/config/replica.py)
+primary = Database(DATABASE_URL, min_size=DATABASE_POOL_MIN_SIZE, max_size=DATABASE_POOL_MAX_SIZE)
+replica = Database(DATABASE_REPLICA_URL, min_size=DATABASE_POOL_MIN_SIZE, max_size=DATABASE_POOL_MAX_SIZE) if DATABASE_REPLICA_URL else None
+
+database = DatabaseRouter(primary, replica)
@@ -0,0 +1,68 @@
+import functools
+import logging
+from typing import Optional
+from app.config.cache import cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Version counter per entity ("country", "person", ...) for the ETags built in app/controllers/etag.py
+# and the keys of the shared read cache (app/config/cache.py). The create/update/delete functions in
+# app/models are wrapped with @bumps_version, which bumps the counter once the write has returned
+# (and committed), so answering If-None-Match needs no query. With REDIS_URL the counters are shared
+# by all workers, otherwise they live in this process.
+
+# Entities whose cached reads and ETags show a table, for writes that bypass the model functions
+# (app/jobs/csv_load.py, app/jobs/search_key_backfill.py)
+TABLE_ENTITIES = {
+    "party": ("person", "organization"),
+    "person": ("person",),
+    "personname": ("person",),
+    "maritalstatus": ("person",),
+    "physicalcharacteristic": ("person",),
+    "citizenship": ("person",),
+    "organization": ("organization",),
+    "legal_organization": ("organization",),
+    "corporation": ("organization",),
+    "government_agency": ("organization",),
+    "informal_organization": ("organization",),
+    "team": ("organization",),
+    "family": ("organization",),
+    "other_informal_organization": ("organization",),
+    "personnametype": ("person_name_type",),
+    "maritalstatustype": ("marital_status_type",),
+    "physicalcharacteristictype": ("physical_characteristic_type",),
+    **{table: (table,) for table in (
+        "country", "gender_type", "ethnicity", "income_range", "minority_type", "industry_type",
+        "employee_count_range", "party_type", "role_type", "priority_type", "party_relationship_type",
+        "party_relationship_status_type", "contact_mechanism_type", "communication_event_status_type",
+        "communication_event_purpose_type",
+    )},
+}
+
+def table_entities(tables) -> list:
+    return sorted({entity for table in tables for entity in TABLE_ENTITIES.get(table, ())})
+
+async def bump_version(*entities: str) -> None:
+    await cache.bump(entities)
+
+async def entity_version(*entities: str) -> Optional[str]:
+    # None when the cache backend is down: no ETag, no cache
+    return await cache.versions(entities)
+
+def bumps_version(*entities: str):
+    # Bump after a successful write; None / False results mean nothing changed. Called with a
+    # caller's unit of work (uow=, app/config/unit_of_work.py) the bump waits for its commit.
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            if result:
+                uow = kwargs.get("uow")
+                if uow is not None:
+                    uow.after_commit(lambda: bump_version(*entities))
+                else:
+                    await bump_version(*entities)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,76 @@
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Callable, Mapping, Optional, Sequence, Type, Union, get_args, get_origin
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fast path for large list responses.
+#
+# Normally a list endpoint builds XOut(**record) for every row in the model and FastAPI then
+# validates the objects again against response_model and walks them with jsonable_encoder before
+# json.dumps. For rows that come straight from our own SELECT that work is redundant:
+# record_encoder(XOut) returns a function that writes the records as the JSON FastAPI would
+# have produced for List[XOut] (same keys in field order, defaults for columns the query does
+# not select, float fields as floats), using orjson when it is installed.
+# The endpoint returns the bytes with json_response(); response_model stays for the OpenAPI docs.
+# Only for trusted rows: nothing is validated. Measured in benchmarks/person_list_json.py.
+
+def _is_float(annotation) -> bool:
+    if annotation is float:
+        return True
+    return get_origin(annotation) is Union and float in get_args(annotation)
+
+def _default(value):
+    # Types neither orjson nor json handle, as pydantic writes them
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def dumps(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+def record_encoder(model: Type[BaseModel]) -> Callable[[Sequence[Mapping]], bytes]:
+    fields = [
+        (field.alias or name, name, field.get_default(), _is_float(field.annotation))
+        for name, field in model.model_fields.items()
+    ]
+
+    def encode(records: Sequence[Mapping]) -> bytes:
+        if not records:
+            return b"[]"
+        columns = set(records[0].keys())
+        plan = [(key, name if name in columns else None, default, is_float) for key, name, default, is_float in fields]
+        rows = []
+        for record in records:
+            row = {}
+            for key, name, default, is_float in plan:
+                if name is None:
+                    row[key] = default
+                    continue
+                value = record[name]
+                if is_float and value is not None:
+                    value = float(value)
+                row[key] = value
+            rows.append(row)
+        return dumps(rows)
+    return encode
+
+def json_response(body: bytes, response: Optional[Response] = None) -> Response:
+    # FastAPI does not add headers set on the injected Response (ETag, Cache-Control from
+    # app/controllers/etag.py) to a Response returned by the endpoint, so copy them over
+    headers = dict(response.headers) if response is not None else None
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,270 @@
+import asyncio
+import functools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+import asyncpg
+from databases import Database
+from starlette.datastructures import Headers, MutableHeaders
+from app.config.settings import REPLICA_MAX_LAG_SECONDS, REPLICA_STATUS_INTERVAL_SECONDS, REPLICA_STICKY_SECONDS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Read-replica routing. app/config/database.py exports a DatabaseRouter as `database`, so the models
+# keep calling database.fetch_one(...) etc.; with DATABASE_REPLICA_URL unset everything goes to the
+# primary as before.
+#
+# - Writes (execute, execute_many), transactions and database.connection() always use the primary;
+#   so do reads made inside a transaction or a held connection, and every read while handling a
+#   POST/PUT/PATCH/DELETE.
+# - Reads go to the replica only from model functions marked @replica_read, and only when the
+#   replica is connected, at most REPLICA_MAX_LAG_SECONDS behind, and has replayed the caller's
+#   last write (read-your-writes, below). Otherwise, or when the replica connection fails, the
+#   primary answers.
+# - Read-your-writes: after a successful write request ReadAfterMiddleware returns the primary's
+#   WAL position (pg_current_wal_lsn) in the X-Read-After header and the read_after cookie. Sent
+#   back with the next requests (the cookie is, for REPLICA_STICKY_SECONDS), reads use the replica
+#   only once pg_last_wal_replay_lsn() has reached it.
+# - The replica's replay position and lag are read at most every REPLICA_STATUS_INTERVAL_SECONDS
+#   (one query shared by all requests of the worker), once more when a token is ahead of it.
+#
+# The @cached model functions (person, reference lists) stay on the primary: a version bump makes
+# the next read of any client reload the cache, and a lagging replica would store the old rows
+# under the new version.
+
+READ_AFTER_HEADER = "x-read-after"
+READ_AFTER_COOKIE = "read_after"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Errors after which the read is retried on the primary: connection lost / refused, and queries
+# cancelled by the replica because of a conflict with WAL replay (SQLSTATE 40001)
+REPLICA_ERRORS = (
+    OSError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+    asyncpg.SerializationError,
+)
+
+REPLICA_STATUS_QUERY = """
+    SELECT CAST(pg_last_wal_replay_lsn() AS TEXT) AS replay_lsn,
+           CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+           END AS lag_seconds
+"""
+
+_replica_read = ContextVar("replica_read", default=False)
+_on_primary = ContextVar("on_primary", default=False)
+_read_after = ContextVar("read_after", default=None)
+
+def parse_lsn(value: Optional[str]) -> Optional[int]:
+    # "16/B374D848" -> comparable int, None when missing or malformed
+    if not value:
+        return None
+    high, separator, low = value.partition("/")
+    try:
+        return (int(high, 16) << 32) | int(low, 16) if separator else None
+    except ValueError:
+        return None
+
+def replica_read(func):
+    # Marks a read-only model function whose queries may be answered by the replica
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _replica_read.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _replica_read.reset(token)
+    return wrapper
+
+class _OnPrimary:
+    # async with around database.transaction() / database.connection(): every read inside uses the primary
+    def __init__(self, inner):
+        self.inner = inner
+
+    async def __aenter__(self):
+        self.token = _on_primary.set(True)
+        try:
+            return await self.inner.__aenter__()
+        except BaseException:
+            _on_primary.reset(self.token)
+            raise
+
+    async def __aexit__(self, *exc_info):
+        try:
+            return await self.inner.__aexit__(*exc_info)
+        finally:
+            _on_primary.reset(self.token)
+
+class ReplicaStatus:
+    def __init__(self, replica: Database):
+        self.replica = replica
+        self.replay_lsn = None
+        self.lag_seconds = None
+        self.checked = None  # time.monotonic() of the last check
+        self.error = None
+        self._lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        try:
+            if not self.replica.is_connected:
+                await self.replica.connect()
+            result = await self.replica.fetch_one(query=REPLICA_STATUS_QUERY)
+            self.replay_lsn = parse_lsn(result["replay_lsn"])
+            self.lag_seconds = float(result["lag_seconds"]) if result["lag_seconds"] is not None else None
+            if self.replay_lsn is None and self.error is None:
+                logger.warning("DATABASE_REPLICA_URL is not a standby (pg_last_wal_replay_lsn() is NULL), reading from the primary")
+            if self.error is not None:
+                logger.info(f"Replica reachable again, lag {self.lag_seconds} s")
+            self.error = None
+        except Exception as e:
+            self.mark_down(str(e))
+        self.checked = time.monotonic()
+
+    def mark_down(self, error: str) -> None:
+        if self.error is None:
+            logger.warning(f"Replica unavailable, reading from the primary: {error}")
+        self.error = error
+        self.replay_lsn = None
+        self.checked = time.monotonic()
+
+    async def _refresh(self, older_than: float) -> None:
+        # One check at a time (a reconnect can take a while); meanwhile the other reads use the last result
+        if self._lock.locked() or (self.checked is not None and self.checked > older_than):
+            return
+        async with self._lock:
+            await self.refresh()
+
+    def _caught_up(self, read_after: Optional[int]) -> bool:
+        if self.error is not None or self.replay_lsn is None:
+            return False
+        if self.lag_seconds is None or self.lag_seconds > REPLICA_MAX_LAG_SECONDS:
+            return False
+        return read_after is None or self.replay_lsn >= read_after
+
+    async def usable(self, read_after: Optional[int]) -> bool:
+        await self._refresh(time.monotonic() - REPLICA_STATUS_INTERVAL_SECONDS)
+        if read_after is not None and self.replay_lsn is not None and self.replay_lsn < read_after:
+            # The cached position may be up to an interval old, look once more before using the primary
+            await self._refresh(time.monotonic())
+        return self._caught_up(read_after)
+
+class DatabaseRouter:
+    # The part of the databases.Database interface the app uses, split over a primary and an optional replica
+    def __init__(self, primary: Database, replica: Optional[Database] = None):
+        self.primary = primary
+        self.replica = replica
+        self.status = ReplicaStatus(replica) if replica is not None else None
+
+    @property
+    def is_connected(self) -> bool:
+        return self.primary.is_connected
+
+    async def connect(self) -> None:
+        await self.primary.connect()
+        if self.replica is not None:
+            # Not fatal: reads use the primary and the status check reconnects
+            try:
+                await self.replica.connect()
+            except Exception as e:
+                self.status.mark_down(str(e))
+
+    async def disconnect(self) -> None:
+        await self.primary.disconnect()
+        if self.replica is not None and self.replica.is_connected:
+            await self.replica.disconnect()
+
+    def transaction(self, **kwargs):
+        return _OnPrimary(self.primary.transaction(**kwargs))
+
+    def connection(self):
+        return _OnPrimary(self.primary.connection())
+
+    async def execute(self, query, values: Optional[dict] = None):
+        return await self.primary.execute(query=query, values=values)
+
+    async def execute_many(self, query, values: list):
+        return await self.primary.execute_many(query=query, values=values)
+
+    async def _use_replica(self) -> bool:
+        if self.replica is None or not _replica_read.get() or _on_primary.get():
+            return False
+        return await self.status.usable(_read_after.get())
+
+    async def _read(self, method: str, **kwargs):
+        if await self._use_replica():
+            try:
+                return await getattr(self.replica, method)(**kwargs)
+            except REPLICA_ERRORS as e:
+                self.status.mark_down(str(e))
+        return await getattr(self.primary, method)(**kwargs)
+
+    async def fetch_one(self, query, values: Optional[dict] = None):
+        return await self._read("fetch_one", query=query, values=values)
+
+    async def fetch_all(self, query, values: Optional[dict] = None):
+        return await self._read("fetch_all", query=query, values=values)
+
+    async def fetch_val(self, query, values: Optional[dict] = None, column=0):
+        return await self._read("fetch_val", query=query, values=values, column=column)
+
+    async def iterate(self, query, values: Optional[dict] = None):
+        # No retry: rows may already have been handed out
+        database = self.replica if await self._use_replica() else self.primary
+        async for row in database.iterate(query=query, values=values):
+            yield row
+
+    async def current_lsn(self) -> str:
+        return await self.primary.fetch_val(query="SELECT CAST(pg_current_wal_lsn() AS TEXT)")
+
+class ReadAfterMiddleware:
+    # Reads the X-Read-After header / read_after cookie of the request; answers write requests with the new one
+    def __init__(self, app, database: DatabaseRouter):
+        self.app = app
+        self.database = database
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.database.replica is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        read_after = parse_lsn(headers.get(READ_AFTER_HEADER))
+        if read_after is None:
+            read_after = parse_lsn(_cookie(headers, READ_AFTER_COOKIE))
+        write = scope["method"] not in SAFE_METHODS
+        tokens = [_read_after.set(read_after)]
+        if write:
+            tokens.append(_on_primary.set(True))
+
+        async def send_with_lsn(message):
+            if write and message["type"] == "http.response.start" and message["status"] < 400:
+                try:
+                    lsn = await self.database.current_lsn()
+                except Exception as e:
+                    logger.error(f"Could not read the WAL position for X-Read-After: {str(e)}")
+                    lsn = None
+                if lsn:
+                    response_headers = MutableHeaders(scope=message)
+                    response_headers[READ_AFTER_HEADER] = lsn
+                    response_headers.append(
+                        "set-cookie", f"{READ_AFTER_COOKIE}={lsn}; Max-Age={REPLICA_STICKY_SECONDS}; Path=/; HttpOnly; SameSite=Lax"
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_lsn)
+        finally:
+            for var, token in zip((_read_after, _on_primary), tokens):
+                var.reset(token)
+
+def _cookie(headers: Headers, name: str) -> Optional[str]:
+    for header in headers.getlist("cookie"):
+        for pair in header.split(";"):
+            key, _, value = pair.strip().partition("=")
+            if key == name:
+                return value
+    return None
@@ -0,0 +1,79 @@
+import importlib
+import logging
+import time
+from contextlib import contextmanager
+from typing import List, Sequence
+from fastapi import APIRouter
+from app.config.settings import STARTUP_IMPORT_BUDGET_MS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Startup-time report: how long the router imports, the database connect and the other startup
+# phases took, logged once the app is ready so cold starts of new containers can be compared.
+#
+# Routers are still registered up front (routing and /docs need every route), but each controller
+# module is imported through import_routers() and timed. The first import also pays for the shared
+# modules it pulls in (schemas, models, database), so look at the slowest modules and the total.
+# With STARTUP_IMPORT_BUDGET_MS set, a total above the budget is logged as a warning.
+#
+# The clock starts when app/main.py imports this module; uvicorn's own start is not included.
+# The app counts as ready once the warm-up (app/models/warmup.py) has finished, see GET /v1/health/ready.
+
+class StartupReport:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports = {}  # module -> seconds
+        self.phases = {}  # phase -> seconds, in the order they ran
+        self.ready_seconds = None
+        self.warmup = None  # "done", "timed out", "failed" or "skipped"
+
+    def import_routers(self, modules: Sequence[str]) -> List[APIRouter]:
+        routers = []
+        for module in modules:
+            started = time.perf_counter()
+            routers.append(importlib.import_module(module).router)
+            self.imports[module] = time.perf_counter() - started
+        total_ms = sum(self.imports.values()) * 1000
+        if STARTUP_IMPORT_BUDGET_MS and total_ms > STARTUP_IMPORT_BUDGET_MS:
+            logger.warning(
+                f"Router imports took {total_ms:.0f} ms, budget {STARTUP_IMPORT_BUDGET_MS} ms; "
+                f"slowest: {self._slowest_imports()}"
+            )
+        return routers
+
+    @contextmanager
+    def phase(self, name: str):
+        # with startup_report.phase("database connect"): await database.connect()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    def _slowest_imports(self, count: int = 5) -> str:
+        slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:count]
+        return ", ".join(f"{module.rsplit('.', 1)[-1]} {seconds * 1000:.0f} ms" for module, seconds in slowest)
+
+    @property
+    def is_ready(self) -> bool:
+        return self.ready_seconds is not None
+
+    def ready(self) -> None:
+        self.ready_seconds = time.perf_counter() - self.started
+        phases = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.phases.items())
+        logger.info(
+            f"Startup ready in {self.ready_seconds * 1000:.0f} ms: "
+            f"router imports {sum(self.imports.values()) * 1000:.0f} ms ({len(self.imports)} modules; slowest: {self._slowest_imports()}), "
+            f"{phases}, warm-up {self.warmup}"
+        )
+
+    def snapshot(self) -> dict:
+        return {
+            "warmup": self.warmup,
+            "ready_ms": self.ready_seconds * 1000 if self.ready_seconds is not None else None,
+            "imports_ms": {module: seconds * 1000 for module, seconds in self.imports.items()},
+            "phases_ms": {name: seconds * 1000 for name, seconds in self.phases.items()},
+        }
+
+startup_report = StartupReport()
@@ -0,0 +1,84 @@
+import logging
+import re
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, List, Optional
+from app.config.database import database
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Unit of work: one pooled connection and one transaction shared by several model calls.
+#
+#   async with unit_of_work() as uow:
+#       person = await create_person(body.person, uow=uow)
+#       await create_party_role(PartyRoleCreate(party_id=person.id, ...), uow=uow)
+#
+# Model write functions take uow: Optional[UnitOfWork] = None and open their own with
+# `async with unit_of_work(uow) as uow:`, so called alone they behave as before (own transaction)
+# and called with a caller's unit of work they join it: no SAVEPOINT / RELEASE round trips as with
+# nested database.transaction(), everything commits or rolls back together, and @bumps_version
+# bumps only after the commit (a bump before it would let another request cache the old rows
+# under the new version).
+#
+# Queries go straight to the held connection. Reads through the global `database` inside the
+# block (e.g. get_person.__wrapped__) also use it: the connection belongs to the task, as with
+# database.transaction().
+#
+# execute_many sends every row in one pipelined round trip (asyncpg executemany); databases'
+# own execute_many waits for each row. A unit of work is not for concurrent use (asyncio.gather):
+# one connection runs one query at a time.
+
+# Same rule as SQLAlchemy text(): :name, not ::type casts, and :name::type is no parameter at all
+# (write CAST(:name AS type)); the lookahead also stops \w+ from backtracking to :nam
+_BIND_PARAM = re.compile(r"(?<![:\w\\]):(\w+)(?![:\w])")
+
+def _positional(query: str, values: List[dict]):
+    # "... :id ... :name" -> "... $1 ... $2" and the argument lists in that order
+    names = []
+
+    def number(match):
+        if match.group(1) not in names:
+            names.append(match.group(1))
+        return f"${names.index(match.group(1)) + 1}"
+
+    sql = _BIND_PARAM.sub(number, query)
+    return sql, [[row[name] for name in names] for row in values]
+
+class UnitOfWork:
+    def __init__(self, connection):
+        self.connection = connection
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    async def fetch_one(self, query: str, values: Optional[dict] = None):
+        return await self.connection.fetch_one(query=query, values=values)
+
+    async def fetch_all(self, query: str, values: Optional[dict] = None):
+        return await self.connection.fetch_all(query=query, values=values)
+
+    async def fetch_val(self, query: str, values: Optional[dict] = None, column=0):
+        return await self.connection.fetch_val(query=query, values=values, column=column)
+
+    async def execute(self, query: str, values: Optional[dict] = None):
+        return await self.connection.execute(query=query, values=values)
+
+    async def execute_many(self, query: str, values: List[dict]) -> None:
+        if not values:
+            return
+        sql, args = _positional(query, values)
+        await self.connection.raw_connection.executemany(sql, args)
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._after_commit.append(callback)
+
+@asynccontextmanager
+async def unit_of_work(uow: Optional[UnitOfWork] = None):
+    if uow is not None:
+        # Joined: the caller's block commits
+        yield uow
+        return
+    async with database.connection() as connection:
+        uow = UnitOfWork(connection)
+        async with connection.transaction():
+            yield uow
+    for callback in uow._after_commit:
+        await callback()
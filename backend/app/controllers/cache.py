@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+from app.config.cache import cache
+from app.schemas.cache import CacheMetricsOut
+from app.controllers.users.user import get_current_user
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1/cache", tags=["cache"])
+
+@router.get("/metrics", response_model=CacheMetricsOut)
+async def get_cache_metrics_endpoint(current_user: dict = Depends(get_current_user)):
+    # Counters of the worker that answers this request
+    metrics = cache.metrics.snapshot()
+    logger.info(f"Cache metrics: hit_ratio={metrics['hit_ratio']:.2f}")
+    return CacheMetricsOut(backend=cache.backend.name, **metrics)
@@ -42,7 +42,9 @@ async def update_citizenship_endpoint(citizenship_id: int, citizenship: Citizens
     result = await update_citizenship(citizenship_id, citizenship)
     if not result:
         logger.warning(f"Failed to update citizenship: id={citizenship_id}")
-        raise HTTPException(status_code=404, detail="Citizenship not found or already exists")
+        if await get_citizenship(citizenship_id):
+            raise HTTPException(status_code=400, detail="Citizenship already exists or another one is open")
+        raise HTTPException(status_code=404, detail="Citizenship not found")
     logger.info(f"Updated citizenship: id={result.id}, person_id={result.person_id}")
     return result
 
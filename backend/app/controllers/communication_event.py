@@ -1,11 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional
+from datetime import datetime
 from app.models.communication_event import (
-    create_communication_event, get_communication_event, get_all_communication_events,
-    update_communication_event, delete_communication_event, get_communication_events_by_party_relationship_id
+    COMMUNICATION_EVENT_FIELDS, create_communication_event, get_communication_event, get_all_communication_events,
+    update_communication_event, delete_communication_event, get_communication_events_by_party_relationship_id,
+    get_communication_events_by_time_range
 )
 from app.schemas.communication_event import CommunicationEventCreate, CommunicationEventUpdate, CommunicationEventOut
 from app.controllers.users.user import get_current_user
+from app.controllers.fields import parse_fields
+from app.config.fast_json import dumps, json_response
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -13,6 +17,19 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/communicationevent", tags=["communicationevent"])
 
+INCLUDE_OPTIONS = {"purposes"}
+
+def parse_include(include: Optional[str]) -> set:
+    # ?include=purposes (comma separated) embeds related rows in the same query
+    if not include:
+        return set()
+    requested = {item.strip() for item in include.split(",") if item.strip()}
+    unknown = requested - INCLUDE_OPTIONS
+    if unknown:
+        logger.warning(f"Unknown include option: {sorted(unknown)}")
+        raise HTTPException(status_code=400, detail=f"Unknown include option: {', '.join(sorted(unknown))}")
+    return requested
+
 @router.post("/", response_model=CommunicationEventOut)
 async def create_communication_event_endpoint(communication_event: CommunicationEventCreate, current_user: dict = Depends(get_current_user)):
     result = await create_communication_event(communication_event)
@@ -22,26 +39,87 @@ async def create_communication_event_endpoint(communication_event: Communication
     logger.info(f"Created communication_event: id={result.id}")
     return result
 
+# Declared before /{communication_event_id} so "bytimerange" is not parsed as an id
+@router.get("/bytimerange", response_model=List[CommunicationEventOut])
+async def get_communication_events_by_time_range_endpoint(
+    datetime_start: datetime,
+    datetime_end: datetime,
+    communication_event_status_type_id: Optional[int] = None,
+    contact_mechanism_type_id: Optional[int] = None,
+    communication_event_purpose_type_id: Optional[int] = None,
+    after_datetime_start: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    include_purposes = "purposes" in parse_include(include)
+    selected = parse_fields(fields, COMMUNICATION_EVENT_FIELDS.fields)
+    if datetime_end < datetime_start:
+        logger.warning(f"Invalid time range: datetime_start={datetime_start}, datetime_end={datetime_end}")
+        raise HTTPException(status_code=400, detail="datetime_end must not be before datetime_start")
+    if (after_datetime_start is None) != (after_id is None):
+        # One half of the keyset cursor would silently restart from the first page
+        raise HTTPException(status_code=400, detail="after_datetime_start and after_id must be given together")
+    results = await get_communication_events_by_time_range(
+        datetime_start, datetime_end,
+        communication_event_status_type_id=communication_event_status_type_id,
+        contact_mechanism_type_id=contact_mechanism_type_id,
+        communication_event_purpose_type_id=communication_event_purpose_type_id,
+        after_datetime_start=after_datetime_start,
+        after_id=after_id,
+        limit=limit,
+        include_purposes=include_purposes,
+        fields=selected
+    )
+    logger.info(f"Retrieved {len(results)} communication_events between {datetime_start} and {datetime_end}")
+    # ?fields= rows are dicts with only the selected keys, written as they are
+    return json_response(dumps(results)) if selected else results
+
 @router.get("/{communication_event_id}", response_model=CommunicationEventOut)
-async def get_communication_event_endpoint(communication_event_id: int, current_user: dict = Depends(get_current_user)):
-    result = await get_communication_event(communication_event_id)
+async def get_communication_event_endpoint(
+    communication_event_id: int,
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    selected = parse_fields(fields, COMMUNICATION_EVENT_FIELDS.fields)
+    result = await get_communication_event(
+        communication_event_id,
+        include_purposes="purposes" in parse_include(include),
+        fields=selected
+    )
     if not result:
         logger.warning(f"Communication_event not found: id={communication_event_id}")
         raise HTTPException(status_code=404, detail="Communication_event not found")
-    logger.info(f"Retrieved communication_event: id={result.id}")
-    return result
+    logger.info(f"Retrieved communication_event: id={communication_event_id}")
+    return json_response(dumps(result)) if selected else result
 
 @router.get("/", response_model=List[CommunicationEventOut])
-async def get_all_communication_events_endpoint(current_user: dict = Depends(get_current_user)):
-    results = await get_all_communication_events()
+async def get_all_communication_events_endpoint(include: Optional[str] = None, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, COMMUNICATION_EVENT_FIELDS.fields)
+    results = await get_all_communication_events(include_purposes="purposes" in parse_include(include), fields=selected)
     logger.info(f"Retrieved {len(results)} communication_events")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.get("/bypartyrelationshipid/{party_relationship_id}", response_model=List[CommunicationEventOut])
-async def get_communication_events_by_party_relationship_id_endpoint(party_relationship_id: int, current_user: dict = Depends(get_current_user)):
-    results = await get_communication_events_by_party_relationship_id(party_relationship_id)
+async def get_communication_events_by_party_relationship_id_endpoint(
+    party_relationship_id: int,
+    datetime_start: Optional[datetime] = None,
+    datetime_end: Optional[datetime] = None,
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    selected = parse_fields(fields, COMMUNICATION_EVENT_FIELDS.fields)
+    results = await get_communication_events_by_party_relationship_id(
+        party_relationship_id, datetime_start, datetime_end,
+        include_purposes="purposes" in parse_include(include),
+        fields=selected
+    )
     logger.info(f"Retrieved {len(results)} communication_events for party_relationship_id={party_relationship_id}")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.put("/{communication_event_id}", response_model=CommunicationEventOut)
 async def update_communication_event_endpoint(communication_event_id: int, communication_event: CommunicationEventUpdate, current_user: dict = Depends(get_current_user)):
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional
+from datetime import datetime
 from app.models.communication_event_purpose import (
     create_communication_event_purpose, get_communication_event_purpose, get_all_communication_event_purposes,
     update_communication_event_purpose, delete_communication_event_purpose,
-    get_communication_event_purposes_by_communication_event_id
+    get_communication_event_purposes_by_communication_event_id, get_communication_event_purposes_by_time_range
 )
 from app.schemas.communication_event_purpose import CommunicationEventPurposeCreate, CommunicationEventPurposeUpdate, CommunicationEventPurposeOut
 from app.controllers.users.user import get_current_user
@@ -23,6 +24,30 @@ async def create_communication_event_purpose_endpoint(communication_event_purpos
     logger.info(f"Created communication_event_purpose: id={result.id}")
     return result
 
+# Declared before /{communication_event_purpose_id} so "bytimerange" is not parsed as an id
+@router.get("/bytimerange", response_model=List[CommunicationEventPurposeOut])
+async def get_communication_event_purposes_by_time_range_endpoint(
+    datetime_start: datetime,
+    datetime_end: datetime,
+    communication_event_purpose_type_id: Optional[int] = None,
+    after_communication_event_datetime_start: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: dict = Depends(get_current_user)
+):
+    if datetime_end < datetime_start:
+        logger.warning(f"Invalid time range: datetime_start={datetime_start}, datetime_end={datetime_end}")
+        raise HTTPException(status_code=400, detail="datetime_end must not be before datetime_start")
+    results = await get_communication_event_purposes_by_time_range(
+        datetime_start, datetime_end,
+        communication_event_purpose_type_id=communication_event_purpose_type_id,
+        after_communication_event_datetime_start=after_communication_event_datetime_start,
+        after_id=after_id,
+        limit=limit
+    )
+    logger.info(f"Retrieved {len(results)} communication_event_purposes between {datetime_start} and {datetime_end}")
+    return results
+
 @router.get("/{communication_event_purpose_id}", response_model=CommunicationEventPurposeOut)
 async def get_communication_event_purpose_endpoint(communication_event_purpose_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_communication_event_purpose(communication_event_purpose_id)
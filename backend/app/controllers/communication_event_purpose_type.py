@@ -6,6 +6,8 @@ from app.models.communication_event_purpose_type import (
 )
 from app.schemas.communication_event_purpose_type import CommunicationEventPurposeTypeCreate, CommunicationEventPurposeTypeUpdate, CommunicationEventPurposeTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_communication_event_purpose_type_endpoint(communication_event_p
     logger.info(f"Created communication_event_purpose_type: id={result.id}")
     return result
 
-@router.get("/{communication_event_purpose_type_id}", response_model=CommunicationEventPurposeTypeOut)
+@router.get("/{communication_event_purpose_type_id}", response_model=CommunicationEventPurposeTypeOut, dependencies=[etag_cache("communication_event_purpose_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_communication_event_purpose_type_endpoint(communication_event_purpose_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_communication_event_purpose_type(communication_event_purpose_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_communication_event_purpose_type_endpoint(communication_event_purp
     logger.info(f"Retrieved communication_event_purpose_type: id={result.id}")
     return result
 
-@router.get("/", response_model=List[CommunicationEventPurposeTypeOut])
+@router.get("/", response_model=List[CommunicationEventPurposeTypeOut], dependencies=[etag_cache("communication_event_purpose_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_communication_event_purpose_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_communication_event_purpose_types()
     logger.info(f"Retrieved {len(results)} communication_event_purpose_types")
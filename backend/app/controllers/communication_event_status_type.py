@@ -6,6 +6,8 @@ from app.models.communication_event_status_type import (
 )
 from app.schemas.communication_event_status_type import CommunicationEventStatusTypeCreate, CommunicationEventStatusTypeUpdate, CommunicationEventStatusTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_communication_event_status_type_endpoint(communication_event_st
     logger.info(f"Created communication_event_status_type: id={result.id}")
     return result
 
-@router.get("/{communication_event_status_type_id}", response_model=CommunicationEventStatusTypeOut)
+@router.get("/{communication_event_status_type_id}", response_model=CommunicationEventStatusTypeOut, dependencies=[etag_cache("communication_event_status_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_communication_event_status_type_endpoint(communication_event_status_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_communication_event_status_type(communication_event_status_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_communication_event_status_type_endpoint(communication_event_statu
     logger.info(f"Retrieved communication_event_status_type: id={result.id}")
     return result
 
-@router.get("/", response_model=List[CommunicationEventStatusTypeOut])
+@router.get("/", response_model=List[CommunicationEventStatusTypeOut], dependencies=[etag_cache("communication_event_status_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_communication_event_status_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_communication_event_status_types()
     logger.info(f"Retrieved {len(results)} communication_event_status_types")
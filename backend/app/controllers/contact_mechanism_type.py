@@ -6,6 +6,8 @@ from app.models.contact_mechanism_type import (
 )
 from app.schemas.contact_mechanism_type import ContactMechanismTypeCreate, ContactMechanismTypeUpdate, ContactMechanismTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_contact_mechanism_type_endpoint(contact_mechanism_type: Contact
     logger.info(f"Created contact_mechanism_type: id={result.id}")
     return result
 
-@router.get("/{contact_mechanism_type_id}", response_model=ContactMechanismTypeOut)
+@router.get("/{contact_mechanism_type_id}", response_model=ContactMechanismTypeOut, dependencies=[etag_cache("contact_mechanism_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_contact_mechanism_type_endpoint(contact_mechanism_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_contact_mechanism_type(contact_mechanism_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_contact_mechanism_type_endpoint(contact_mechanism_type_id: int, cu
     logger.info(f"Retrieved contact_mechanism_type: id={result.id}")
     return result
 
-@router.get("/", response_model=List[ContactMechanismTypeOut])
+@router.get("/", response_model=List[ContactMechanismTypeOut], dependencies=[etag_cache("contact_mechanism_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_contact_mechanism_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_contact_mechanism_types()
     logger.info(f"Retrieved {len(results)} contact_mechanism_types")
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from typing import List
 from app.models.country import (
-    create_country, get_country, get_all_countries,
+    create_country, get_country, get_all_countries_body,
     update_country, delete_country
 )
 from app.schemas.country import CountryCreate, CountryUpdate, CountryOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
+from app.config.compression import accepted_encoding, encoded_response
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +25,7 @@ async def create_country_endpoint(country: CountryCreate, current_user: dict = D
     logger.info(f"Created country: id={result.id}, isocode={result.isocode}")
     return result
 
-@router.get("/{country_id}", response_model=CountryOut)
+@router.get("/{country_id}", response_model=CountryOut, dependencies=[etag_cache("country", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_country_endpoint(country_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_country(country_id)
     if not result:
@@ -31,11 +34,13 @@ async def get_country_endpoint(country_id: int, current_user: dict = Depends(get
     logger.info(f"Retrieved country: id={result.id}, isocode={result.isocode}")
     return result
 
-@router.get("/", response_model=List[CountryOut])
-async def get_all_countries_endpoint(current_user: dict = Depends(get_current_user)):
-    results = await get_all_countries()
-    logger.info(f"Retrieved {len(results)} countries")
-    return results
+@router.get("/", response_model=List[CountryOut], dependencies=[etag_cache("country", cache_control=REFERENCE_CACHE_CONTROL)])
+async def get_all_countries_endpoint(request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+    # Pre-compressed body from the shared cache, compressed once per version and encoding
+    encoding = accepted_encoding(request.headers.get("accept-encoding"))
+    body = await get_all_countries_body(encoding)
+    logger.info(f"Retrieved countries ({len(body)} bytes, encoding={encoding})")
+    return encoded_response(body, encoding, response)
 
 @router.put("/{country_id}", response_model=CountryOut)
 async def update_country_endpoint(country_id: int, country: CountryUpdate, current_user: dict = Depends(get_current_user)):
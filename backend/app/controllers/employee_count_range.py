@@ -6,6 +6,8 @@ from app.models.employee_count_range import (
 )
 from app.schemas.employee_count_range import EmployeeCountRangeCreate, EmployeeCountRangeUpdate, EmployeeCountRangeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_employee_count_range_endpoint(employee_count_range: EmployeeCou
     logger.info(f"Created employee count range: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{employee_count_range_id}", response_model=EmployeeCountRangeOut)
+@router.get("/{employee_count_range_id}", response_model=EmployeeCountRangeOut, dependencies=[etag_cache("employee_count_range", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_employee_count_range_endpoint(employee_count_range_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_employee_count_range(employee_count_range_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_employee_count_range_endpoint(employee_count_range_id: int, curren
     logger.info(f"Retrieved employee count range: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[EmployeeCountRangeOut])
+@router.get("/", response_model=List[EmployeeCountRangeOut], dependencies=[etag_cache("employee_count_range", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_employee_count_ranges_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_employee_count_ranges()
     logger.info(f"Retrieved {len(results)} employee count ranges")
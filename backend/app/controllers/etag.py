@@ -0,0 +1,38 @@
+from fastapi import Depends, HTTPException, Request, Response
+from typing import Optional
+import hashlib
+import logging
+from app.config.entity_version import entity_version
+from app.config.settings import ENTITY_CACHE_CONTROL
+from app.controllers.users.user import get_current_user
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/"x" matches "x"
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def etag_cache(*entities: str, cache_control: str = ENTITY_CACHE_CONTROL):
+    # Route dependency for GET endpoints whose response only changes when one of the entities is
+    # written: dependencies=[etag_cache("country", cache_control=REFERENCE_CACHE_CONTROL)].
+    # Runs after authentication and before the endpoint, so a matching If-None-Match is answered
+    # with 304 without a query; otherwise the ETag and Cache-Control are added to the response.
+    # The version is read before the endpoint queries, so a write racing the query can only make
+    # the next request refetch, never keep stale data under a current ETag.
+    async def dependency(request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+        resource = hashlib.blake2b(f"{request.url.path}?{request.url.query}".encode(), digest_size=6).hexdigest()
+        version = await entity_version(*entities)
+        if version is None:
+            return
+        etag = f'"{resource}-{version}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            logger.info(f"Not modified: {request.url.path}")
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return Depends(dependency)
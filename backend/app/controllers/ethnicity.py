@@ -6,6 +6,8 @@ from app.models.ethnicity import (
 )
 from app.schemas.ethnicity import EthnicityCreate, EthnicityUpdate, EthnicityOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_ethnicity_endpoint(ethnicity: EthnicityCreate, current_user: di
     logger.info(f"Created ethnicity: id={result.id}, name_en={result.name_en}")
     return result
 
-@router.get("/{ethnicity_id}", response_model=EthnicityOut)
+@router.get("/{ethnicity_id}", response_model=EthnicityOut, dependencies=[etag_cache("ethnicity", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_ethnicity_endpoint(ethnicity_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_ethnicity(ethnicity_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_ethnicity_endpoint(ethnicity_id: int, current_user: dict = Depends
     logger.info(f"Retrieved ethnicity: id={result.id}, name_en={result.name_en}")
     return result
 
-@router.get("/", response_model=List[EthnicityOut])
+@router.get("/", response_model=List[EthnicityOut], dependencies=[etag_cache("ethnicity", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_ethnicities_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_ethnicities()
     logger.info(f"Retrieved {len(results)} ethnicities")
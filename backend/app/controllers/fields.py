@@ -0,0 +1,19 @@
+from fastapi import HTTPException
+from typing import Optional, List, Sequence
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    # ?fields=id,fname (comma separated) returns only those fields, in the order of allowed;
+    # id is always returned. None means the full response.
+    if not fields:
+        return None
+    requested = {item.strip() for item in fields.split(",") if item.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        logger.warning(f"Unknown field: {sorted(unknown)}")
+        raise HTTPException(status_code=400, detail=f"Unknown field: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return [name for name in allowed if name in requested]
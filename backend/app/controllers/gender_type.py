@@ -6,6 +6,8 @@ from app.models.gender_type import (
 )
 from app.schemas.gender_type import GenderTypeCreate, GenderTypeUpdate, GenderTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_gender_type_endpoint(gender_type: GenderTypeCreate, current_use
     logger.info(f"สร้างประเภทเพศ: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{gender_type_id}", response_model=GenderTypeOut)
+@router.get("/{gender_type_id}", response_model=GenderTypeOut, dependencies=[etag_cache("gender_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_gender_type_endpoint(gender_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_gender_type(gender_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_gender_type_endpoint(gender_type_id: int, current_user: dict = Dep
     logger.info(f"ดึงข้อมูลประเภทเพศ: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[GenderTypeOut])
+@router.get("/", response_model=List[GenderTypeOut], dependencies=[etag_cache("gender_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_gender_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_gender_types()
     logger.info(f"ดึงข้อมูล {len(results)} ประเภทเพศ")
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Response
+from app.config.startup import startup_report
+from app.schemas.health import ReadinessOut
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Probes for the container platform, no authentication:
+# live answers as soon as the server accepts requests, ready only after the warm-up
+router = APIRouter(prefix="/v1/health", tags=["health"])
+
+@router.get("/live")
+async def get_liveness_endpoint():
+    return {"status": "alive"}
+
+@router.get("/ready", response_model=ReadinessOut)
+async def get_readiness_endpoint(response: Response):
+    if not startup_report.is_ready:
+        response.status_code = 503
+        return ReadinessOut(status="warming up", **startup_report.snapshot())
+    return ReadinessOut(status="ready", **startup_report.snapshot())
\ No newline at end of file
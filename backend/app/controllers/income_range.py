@@ -6,6 +6,8 @@ from app.models.income_range import (
 )
 from app.schemas.income_range import IncomeRangeCreate, IncomeRangeUpdate, IncomeRangeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_income_range_endpoint(income_range: IncomeRangeCreate, current_
     logger.info(f"Created income range: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{income_range_id}", response_model=IncomeRangeOut)
+@router.get("/{income_range_id}", response_model=IncomeRangeOut, dependencies=[etag_cache("income_range", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_income_range_endpoint(income_range_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_income_range(income_range_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_income_range_endpoint(income_range_id: int, current_user: dict = D
     logger.info(f"Retrieved income range: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[IncomeRangeOut])
+@router.get("/", response_model=List[IncomeRangeOut], dependencies=[etag_cache("income_range", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_income_ranges_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_income_ranges()
     logger.info(f"Retrieved {len(results)} income ranges")
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from typing import List
 from app.models.industry_type import (
-    create_industry_type, get_industry_type, get_all_industry_types,
+    create_industry_type, get_industry_type, get_all_industry_types_body,
     update_industry_type, delete_industry_type
 )
 from app.schemas.industry_type import IndustryTypeCreate, IndustryTypeUpdate, IndustryTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
+from app.config.compression import accepted_encoding, encoded_response
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +25,7 @@ async def create_industry_type_endpoint(industry_type: IndustryTypeCreate, curre
     logger.info(f"Created industry type: id={result.id}, naics_code={result.naics_code}")
     return result
 
-@router.get("/{industry_type_id}", response_model=IndustryTypeOut)
+@router.get("/{industry_type_id}", response_model=IndustryTypeOut, dependencies=[etag_cache("industry_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_industry_type_endpoint(industry_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_industry_type(industry_type_id)
     if not result:
@@ -31,11 +34,13 @@ async def get_industry_type_endpoint(industry_type_id: int, current_user: dict =
     logger.info(f"Retrieved industry type: id={result.id}, naics_code={result.naics_code}")
     return result
 
-@router.get("/", response_model=List[IndustryTypeOut])
-async def get_all_industry_types_endpoint(current_user: dict = Depends(get_current_user)):
-    results = await get_all_industry_types()
-    logger.info(f"Retrieved {len(results)} industry types")
-    return results
+@router.get("/", response_model=List[IndustryTypeOut], dependencies=[etag_cache("industry_type", cache_control=REFERENCE_CACHE_CONTROL)])
+async def get_all_industry_types_endpoint(request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+    # Pre-compressed body from the shared cache, compressed once per version and encoding
+    encoding = accepted_encoding(request.headers.get("accept-encoding"))
+    body = await get_all_industry_types_body(encoding)
+    logger.info(f"Retrieved industry types ({len(body)} bytes, encoding={encoding})")
+    return encoded_response(body, encoding, response)
 
 @router.put("/{industry_type_id}", response_model=IndustryTypeOut)
 async def update_industry_type_endpoint(industry_type_id: int, industry_type: IndustryTypeUpdate, current_user: dict = Depends(get_current_user)):
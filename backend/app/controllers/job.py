@@ -0,0 +1,41 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional
+from pydantic import ValidationError
+from app.models.job import JOB_KINDS, enqueue_job, get_job, get_jobs
+from app.schemas.job import JOB_PARAMS, JobCreate, JobOut, JobStatus
+from app.controllers.users.user import get_current_user
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Heavy operations are queued here and run by app/jobs/worker.py; poll GET /v1/jobs/{id}
+router = APIRouter(prefix="/v1/jobs", tags=["jobs"])
+
+@router.post("/", response_model=JobOut, status_code=202)
+async def enqueue_job_endpoint(job: JobCreate, current_user: dict = Depends(get_current_user)):
+    if job.kind not in JOB_KINDS:
+        raise HTTPException(status_code=400, detail=f"Unknown job kind: {job.kind}, expected one of {', '.join(JOB_KINDS)}")
+    try:
+        params = JOB_PARAMS[job.kind].model_validate(job.params)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    result = await enqueue_job(job.kind, params.model_dump(), int(current_user["id"]), job.max_attempts)
+    logger.info(f"Enqueued job: id={result.id}, kind={result.kind} by user: {current_user.get('id')}")
+    return result
+
+@router.get("/{job_id}", response_model=JobOut)
+async def get_job_endpoint(job_id: int, current_user: dict = Depends(get_current_user)):
+    result = await get_job(job_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return result
+
+@router.get("/", response_model=List[JobOut])
+async def get_jobs_endpoint(
+    status: Optional[JobStatus] = None,
+    kind: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: dict = Depends(get_current_user)
+):
+    return await get_jobs(status, kind, limit)
@@ -42,7 +42,9 @@ async def update_marital_status_endpoint(marital_status_id: int, marital_status:
     result = await update_marital_status(marital_status_id, marital_status)
     if not result:
         logger.warning(f"Failed to update marital status: id={marital_status_id}")
-        raise HTTPException(status_code=404, detail="Marital status not found or already exists")
+        if await get_marital_status(marital_status_id):
+            raise HTTPException(status_code=400, detail="Marital status already exists or another one is open")
+        raise HTTPException(status_code=404, detail="Marital status not found")
     logger.info(f"Updated marital status: id={result.id}, person_id={result.person_id}")
     return result
 
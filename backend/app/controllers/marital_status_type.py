@@ -6,6 +6,8 @@ from app.models.marital_status_type import (
 )
 from app.schemas.marital_status_type import MaritalStatusTypeCreate, MaritalStatusTypeUpdate, MaritalStatusTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_marital_status_type_endpoint(marital_status_type: MaritalStatus
     logger.info(f"Created marital status type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{marital_status_type_id}", response_model=MaritalStatusTypeOut)
+@router.get("/{marital_status_type_id}", response_model=MaritalStatusTypeOut, dependencies=[etag_cache("marital_status_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_marital_status_type_endpoint(marital_status_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_marital_status_type(marital_status_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_marital_status_type_endpoint(marital_status_type_id: int, current_
     logger.info(f"Retrieved marital status type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[MaritalStatusTypeOut])
+@router.get("/", response_model=List[MaritalStatusTypeOut], dependencies=[etag_cache("marital_status_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_marital_status_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_marital_status_types()
     logger.info(f"Retrieved {len(results)} marital status types")
@@ -6,6 +6,8 @@ from app.models.minority_type import (
 )
 from app.schemas.minority_type import MinorityTypeCreate, MinorityTypeUpdate, MinorityTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_minority_type_endpoint(minority_type: MinorityTypeCreate, curre
     logger.info(f"Created minority type: id={result.id}, name_en={result.name_en}")
     return result
 
-@router.get("/{minority_type_id}", response_model=MinorityTypeOut)
+@router.get("/{minority_type_id}", response_model=MinorityTypeOut, dependencies=[etag_cache("minority_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_minority_type_endpoint(minority_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_minority_type(minority_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_minority_type_endpoint(minority_type_id: int, current_user: dict =
     logger.info(f"Retrieved minority type: id={result.id}, name_en={result.name_en}")
     return result
 
-@router.get("/", response_model=List[MinorityTypeOut])
+@router.get("/", response_model=List[MinorityTypeOut], dependencies=[etag_cache("minority_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_minority_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_minority_types()
     logger.info(f"Retrieved {len(results)} minority types")
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional
+from datetime import datetime
+from app.models.party import get_party_timeline, merge_party
+from app.schemas.party import PartyTimelineItemOut, PartyMergeOut
+from app.controllers.users.user import get_current_user
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1/party", tags=["party"])
+
+@router.get("/{party_id}/timeline", response_model=List[PartyTimelineItemOut])
+async def get_party_timeline_endpoint(
+    party_id: int,
+    before_event_time: Optional[datetime] = None,
+    before_item_key: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: dict = Depends(get_current_user)
+):
+    if (before_event_time is None) != (before_item_key is None):
+        # One half of the keyset cursor would silently restart from the newest item
+        raise HTTPException(status_code=400, detail="before_event_time and before_item_key must be given together")
+    results = await get_party_timeline(party_id, before_event_time, before_item_key, limit)
+    logger.info(f"Retrieved {len(results)} timeline items for party_id={party_id}")
+    return results
+
+@router.post("/{party_id}/merge_into/{target_party_id}", response_model=PartyMergeOut)
+async def merge_party_endpoint(
+    party_id: int,
+    target_party_id: int,
+    current_user: dict = Depends(get_current_user)
+):
+    if party_id == target_party_id:
+        raise HTTPException(status_code=400, detail="Cannot merge a party into itself")
+    result = await merge_party(party_id, target_party_id)
+    if not result:
+        logger.warning(f"Failed to merge party {party_id} into {target_party_id}")
+        raise HTTPException(status_code=400, detail="Parties not found or not of the same kind")
+    logger.info(f"Merged party {party_id} into {target_party_id}")
+    return result
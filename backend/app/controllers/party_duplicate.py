@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List, Optional, Literal
+from app.models.party_duplicate import get_party_duplicate_candidates, update_party_duplicate_candidate
+from app.schemas.party_duplicate import PartyDuplicateCandidateUpdate, PartyDuplicateCandidateOut
+from app.controllers.users.user import get_current_user
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1/partyduplicate", tags=["party_duplicate"])
+
+@router.get("/", response_model=List[PartyDuplicateCandidateOut])
+async def get_party_duplicate_candidates_endpoint(
+    status: Literal["pending", "merged", "rejected"] = "pending",
+    party_kind: Optional[Literal["person", "organization"]] = None,
+    min_score: float = Query(0, ge=0, le=1),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: dict = Depends(get_current_user)
+):
+    results = await get_party_duplicate_candidates(status, party_kind, min_score, limit)
+    logger.info(f"Retrieved {len(results)} party duplicate candidates")
+    return results
+
+@router.put("/{candidate_id}", response_model=PartyDuplicateCandidateOut)
+async def update_party_duplicate_candidate_endpoint(
+    candidate_id: int,
+    candidate: PartyDuplicateCandidateUpdate,
+    current_user: dict = Depends(get_current_user)
+):
+    result = await update_party_duplicate_candidate(candidate_id, candidate)
+    if not result:
+        raise HTTPException(status_code=404, detail="Party duplicate candidate not found")
+    logger.info(f"Updated party duplicate candidate: id={result.id}, status={result.status}")
+    return result
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from typing import List, Optional
 from app.models.party_relationship import (
-    create_party_relationship, get_party_relationship, get_all_party_relationships,
+    PARTY_RELATIONSHIP_FIELDS, create_party_relationship, get_party_relationship, get_all_party_relationships,
     update_party_relationship, delete_party_relationship,
     get_party_relationships_by_from_party_role_id, get_party_relationships_by_to_party_role_id
 )
 from app.schemas.party_relationship import PartyRelationshipCreate, PartyRelationshipUpdate, PartyRelationshipOut
 from app.controllers.users.user import get_current_user
+from app.controllers.fields import parse_fields
+from app.config.fast_json import dumps, json_response
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -24,31 +26,36 @@ async def create_party_relationship_endpoint(party_relationship: PartyRelationsh
     return result
 
 @router.get("/{party_relationship_id}", response_model=PartyRelationshipOut)
-async def get_party_relationship_endpoint(party_relationship_id: int, current_user: dict = Depends(get_current_user)):
-    result = await get_party_relationship(party_relationship_id)
+async def get_party_relationship_endpoint(party_relationship_id: int, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_RELATIONSHIP_FIELDS.fields)
+    result = await get_party_relationship(party_relationship_id, fields=selected)
     if not result:
         logger.warning(f"Party_relationship not found: id={party_relationship_id}")
         raise HTTPException(status_code=404, detail="Party_relationship not found")
-    logger.info(f"Retrieved party_relationship: id={result.id}")
-    return result
+    logger.info(f"Retrieved party_relationship: id={party_relationship_id}")
+    # ?fields= rows are dicts with only the selected keys, written as they are
+    return json_response(dumps(result)) if selected else result
 
 @router.get("/", response_model=List[PartyRelationshipOut])
-async def get_all_party_relationships_endpoint(current_user: dict = Depends(get_current_user)):
-    results = await get_all_party_relationships()
+async def get_all_party_relationships_endpoint(fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_RELATIONSHIP_FIELDS.fields)
+    results = await get_all_party_relationships(fields=selected)
     logger.info(f"Retrieved {len(results)} party_relationships")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.get("/byfrompartyroleid/{from_party_role_id}", response_model=List[PartyRelationshipOut])
-async def get_party_relationships_by_from_party_role_id_endpoint(from_party_role_id: int, current_user: dict = Depends(get_current_user)):
-    results = await get_party_relationships_by_from_party_role_id(from_party_role_id)
+async def get_party_relationships_by_from_party_role_id_endpoint(from_party_role_id: int, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_RELATIONSHIP_FIELDS.fields)
+    results = await get_party_relationships_by_from_party_role_id(from_party_role_id, fields=selected)
     logger.info(f"Retrieved {len(results)} party_relationships for from_party_role_id={from_party_role_id}")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.get("/bytopartyroleid/{to_party_role_id}", response_model=List[PartyRelationshipOut])
-async def get_party_relationships_by_to_party_role_id_endpoint(to_party_role_id: int, current_user: dict = Depends(get_current_user)):
-    results = await get_party_relationships_by_to_party_role_id(to_party_role_id)
+async def get_party_relationships_by_to_party_role_id_endpoint(to_party_role_id: int, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_RELATIONSHIP_FIELDS.fields)
+    results = await get_party_relationships_by_to_party_role_id(to_party_role_id, fields=selected)
     logger.info(f"Retrieved {len(results)} party_relationships for to_party_role_id={to_party_role_id}")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.put("/{party_relationship_id}", response_model=PartyRelationshipOut)
 async def update_party_relationship_endpoint(party_relationship_id: int, party_relationship: PartyRelationshipUpdate, current_user: dict = Depends(get_current_user)):
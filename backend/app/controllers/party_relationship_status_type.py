@@ -6,6 +6,8 @@ from app.models.party_relationship_status_type import (
 )
 from app.schemas.party_relationship_status_type import PartyRelationshipStatusTypeCreate, PartyRelationshipStatusTypeUpdate, PartyRelationshipStatusTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_party_relationship_status_type_endpoint(party_relationship_stat
     logger.info(f"Created party_relationship_status_type: id={result.id}")
     return result
 
-@router.get("/{party_relationship_status_type_id}", response_model=PartyRelationshipStatusTypeOut)
+@router.get("/{party_relationship_status_type_id}", response_model=PartyRelationshipStatusTypeOut, dependencies=[etag_cache("party_relationship_status_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_party_relationship_status_type_endpoint(party_relationship_status_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_party_relationship_status_type(party_relationship_status_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_party_relationship_status_type_endpoint(party_relationship_status_
     logger.info(f"Retrieved party_relationship_status_type: id={result.id}")
     return result
 
-@router.get("/", response_model=List[PartyRelationshipStatusTypeOut])
+@router.get("/", response_model=List[PartyRelationshipStatusTypeOut], dependencies=[etag_cache("party_relationship_status_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_party_relationship_status_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_party_relationship_status_types()
     logger.info(f"Retrieved {len(results)} party_relationship_status_types")
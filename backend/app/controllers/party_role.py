@@ -1,11 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from typing import List, Optional
 from app.models.party_role import (
-    create_party_role, get_party_role, get_all_party_roles,
+    PARTY_ROLE_FIELDS, create_party_role, get_party_role, get_all_party_roles,
     update_party_role, delete_party_role, get_party_roles_by_party_id
 )
 from app.schemas.party_role import PartyRoleCreate, PartyRoleUpdate, PartyRoleOut
 from app.controllers.users.user import get_current_user
+from app.controllers.fields import parse_fields
+from app.config.fast_json import dumps, json_response
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -23,25 +25,29 @@ async def create_party_role_endpoint(party_role: PartyRoleCreate, current_user:
     return result
 
 @router.get("/{party_role_id}", response_model=PartyRoleOut)
-async def get_party_role_endpoint(party_role_id: int, current_user: dict = Depends(get_current_user)):
-    result = await get_party_role(party_role_id)
+async def get_party_role_endpoint(party_role_id: int, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_ROLE_FIELDS.fields)
+    result = await get_party_role(party_role_id, fields=selected)
     if not result:
         logger.warning(f"Party_role not found: id={party_role_id}")
         raise HTTPException(status_code=404, detail="Party_role not found")
-    logger.info(f"Retrieved party_role: id={result.id}")
-    return result
+    logger.info(f"Retrieved party_role: id={party_role_id}")
+    # ?fields= rows are dicts with only the selected keys, written as they are
+    return json_response(dumps(result)) if selected else result
 
 @router.get("/", response_model=List[PartyRoleOut])
-async def get_all_party_roles_endpoint(current_user: dict = Depends(get_current_user)):
-    results = await get_all_party_roles()
+async def get_all_party_roles_endpoint(fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_ROLE_FIELDS.fields)
+    results = await get_all_party_roles(fields=selected)
     logger.info(f"Retrieved {len(results)} party_roles")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.get("/bypartyid/{party_id}", response_model=List[PartyRoleOut])
-async def get_party_roles_by_party_id_endpoint(party_id: int, current_user: dict = Depends(get_current_user)):
-    results = await get_party_roles_by_party_id(party_id)
+async def get_party_roles_by_party_id_endpoint(party_id: int, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PARTY_ROLE_FIELDS.fields)
+    results = await get_party_roles_by_party_id(party_id, fields=selected)
     logger.info(f"Retrieved {len(results)} party_roles for party_id={party_id}")
-    return results
+    return json_response(dumps(results)) if selected else results
 
 @router.put("/{party_role_id}", response_model=PartyRoleOut)
 async def update_party_role_endpoint(party_role_id: int, party_role: PartyRoleUpdate, current_user: dict = Depends(get_current_user)):
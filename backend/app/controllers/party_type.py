@@ -6,6 +6,8 @@ from app.models.party_type import (
 )
 from app.schemas.party_type import PartyTypeCreate, PartyTypeUpdate, PartyTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_party_type_endpoint(party_type: PartyTypeCreate, current_user:
     logger.info(f"Created party type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{party_type_id}", response_model=PartyTypeOut)
+@router.get("/{party_type_id}", response_model=PartyTypeOut, dependencies=[etag_cache("party_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_party_type_endpoint(party_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_party_type(party_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_party_type_endpoint(party_type_id: int, current_user: dict = Depen
     logger.info(f"Retrieved party type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[PartyTypeOut])
+@router.get("/", response_model=List[PartyTypeOut], dependencies=[etag_cache("party_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_party_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_party_types()
     logger.info(f"Retrieved {len(results)} party types")
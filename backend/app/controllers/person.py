@@ -1,11 +1,22 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Response
+from typing import List, Optional
 from app.models.person import (
-    create_person, get_person, get_all_persons,
-    update_person, delete_person
+    PERSON_ENTITIES, PERSON_FIELDS, create_person, get_person, get_person_json, get_all_persons_json,
+    update_person, patch_person, delete_person
 )
-from app.schemas.person import PersonCreate, PersonUpdate, PersonOut
+from app.models.classify_by_eeoc import create_classify_by_eeoc, get_classify_by_eeoc_by_person_id
+from app.models.classify_by_income import get_classify_by_income_by_person_id
+from app.models.passport import get_passports_by_person_id
+from app.models.party_role import create_party_role, get_party_roles_by_party_id
+from app.schemas.person import PersonCreate, PersonUpdate, PersonOut, PersonOnboardCreate, PersonOnboardOut, PersonFullOut
+from app.schemas.classify_by_eeoc import ClassifyByEeocCreate
+from app.schemas.party_role import PartyRoleCreate
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.controllers.fields import parse_fields
+from app.config.fast_json import json_response
+from app.config.unit_of_work import unit_of_work
+from app.config.concurrent import gather_reads
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -13,6 +24,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/person", tags=["person"])
 
+person_etag = etag_cache(*PERSON_ENTITIES)
+
 @router.post("/", response_model=PersonOut)
 async def create_person_endpoint(person: PersonCreate, current_user: dict = Depends(get_current_user)):
     try:
@@ -26,9 +39,39 @@ async def create_person_endpoint(person: PersonCreate, current_user: dict = Depe
         logger.error(f"Error creating person: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/{person_id}", response_model=PersonOut)
-async def get_person_endpoint(person_id: int, current_user: dict = Depends(get_current_user)):
+@router.post("/onboard", response_model=PersonOnboardOut)
+async def onboard_person_endpoint(onboard: PersonOnboardCreate, current_user: dict = Depends(get_current_user)):
+    # Person, classification and roles on one connection in one transaction: all or nothing
+    try:
+        async with unit_of_work() as uow:
+            person = await create_person(onboard.person, uow=uow)
+            classify_by_eeoc = None
+            if onboard.classify_by_eeoc:
+                classify_by_eeoc = await create_classify_by_eeoc(
+                    ClassifyByEeocCreate(party_id=person.id, **onboard.classify_by_eeoc.model_dump()), uow=uow
+                )
+            party_roles = [
+                await create_party_role(PartyRoleCreate(party_id=person.id, **party_role.model_dump()), uow=uow)
+                for party_role in onboard.party_roles
+            ]
+        logger.info(f"Onboarded person: id={person.id} with {len(party_roles)} roles by user: {current_user.get('username')}")
+        return PersonOnboardOut(person=person, classify_by_eeoc=classify_by_eeoc, party_roles=party_roles)
+    except Exception as e:
+        logger.error(f"Error onboarding person: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.get("/{person_id}", response_model=PersonOut, dependencies=[person_etag])
+async def get_person_endpoint(person_id: int, response: Response, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PERSON_FIELDS.fields)
     try:
+        if selected:
+            # ?fields=: only the selected columns (and their joins), as JSON bytes
+            body = await get_person_json(person_id, selected)
+            if body is None:
+                logger.warning(f"Person not found: id={person_id} by user: {current_user.get('username')}")
+                raise HTTPException(status_code=404, detail="Person not found")
+            logger.info(f"Retrieved person: id={person_id} fields={selected} by user: {current_user.get('username')}")
+            return json_response(body, response)
         result = await get_person(person_id)
         if not result:
             logger.warning(f"Person not found: id={person_id} by user: {current_user.get('username')}")
@@ -39,12 +82,36 @@ async def get_person_endpoint(person_id: int, current_user: dict = Depends(get_c
         logger.error(f"Error retrieving person id={person_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/", response_model=List[PersonOut])
-async def get_all_persons_endpoint(current_user: dict = Depends(get_current_user)):
+@router.get("/{person_id}/full", response_model=PersonFullOut)
+async def get_person_full_endpoint(person_id: int, current_user: dict = Depends(get_current_user)):
+    try:
+        # Independent reads, each on its own pooled connection at the same time
+        reads = await gather_reads(
+            profile=get_person(person_id),
+            classify_by_eeoc=get_classify_by_eeoc_by_person_id(person_id),
+            classify_by_income=get_classify_by_income_by_person_id(person_id),
+            passports=get_passports_by_person_id(person_id),
+            party_roles=get_party_roles_by_party_id(person_id),
+        )
+        if not reads["profile"]:
+            logger.warning(f"Person not found: id={person_id} by user: {current_user.get('username')}")
+            raise HTTPException(status_code=404, detail="Person not found")
+        logger.info(f"Retrieved full person: id={person_id} by user: {current_user.get('username')}")
+        return PersonFullOut(**reads)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving full person id={person_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.get("/", response_model=List[PersonOut], dependencies=[person_etag])
+async def get_all_persons_endpoint(response: Response, fields: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    selected = parse_fields(fields, PERSON_FIELDS.fields)
     try:
-        results = await get_all_persons()
-        logger.info(f"Retrieved {len(results)} persons by user: {current_user.get('username')}")
-        return results
+        # Fast path: JSON bytes built from the records, FastAPI does not re-validate them
+        body = await get_all_persons_json(selected)
+        logger.info(f"Retrieved persons ({len(body)} bytes) by user: {current_user.get('username')}")
+        return json_response(body, response)
     except Exception as e:
         logger.error(f"Error retrieving all persons: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -62,6 +129,21 @@ async def update_person_endpoint(person_id: int, person: PersonUpdate, current_u
         logger.error(f"Error updating person id={person_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.patch("/{person_id}", response_model=PersonOut)
+async def patch_person_endpoint(person_id: int, person: PersonUpdate, current_user: dict = Depends(get_current_user)):
+    try:
+        result = await patch_person(person_id, person)
+        if not result:
+            logger.warning(f"Person not found for patch: id={person_id} by user: {current_user.get('username')}")
+            raise HTTPException(status_code=404, detail="Person not found")
+        logger.info(f"Patched person: id={result.id} by user: {current_user.get('username')}")
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error patching person id={person_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @router.delete("/{person_id}", response_model=dict)
 async def delete_person_endpoint(person_id: int, current_user: dict = Depends(get_current_user)):
     try:
@@ -42,7 +42,9 @@ async def update_person_name_endpoint(person_name_id: int, person_name: PersonNa
     result = await update_person_name(person_name_id, person_name)
     if not result:
         logger.warning(f"Failed to update person name: id={person_name_id}")
-        raise HTTPException(status_code=404, detail="Person name not found or already exists")
+        if await get_person_name(person_name_id):
+            raise HTTPException(status_code=400, detail="Person name already exists or another one is open")
+        raise HTTPException(status_code=404, detail="Person name not found")
     logger.info(f"Updated person name: id={result.id}, name={result.name}")
     return result
 
@@ -6,6 +6,8 @@ from app.models.person_name_type import (
 )
 from app.schemas.person_name_type import PersonNameTypeCreate, PersonNameTypeUpdate, PersonNameTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_person_name_type_endpoint(person_name_type: PersonNameTypeCreat
     logger.info(f"Created person name type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{person_name_type_id}", response_model=PersonNameTypeOut)
+@router.get("/{person_name_type_id}", response_model=PersonNameTypeOut, dependencies=[etag_cache("person_name_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_person_name_type_endpoint(person_name_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_person_name_type(person_name_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_person_name_type_endpoint(person_name_type_id: int, current_user:
     logger.info(f"Retrieved person name type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[PersonNameTypeOut])
+@router.get("/", response_model=List[PersonNameTypeOut], dependencies=[etag_cache("person_name_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_person_name_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_person_name_types()
     logger.info(f"Retrieved {len(results)} person name types")
@@ -42,7 +42,9 @@ async def update_physical_characteristic_endpoint(physical_characteristic_id: in
     result = await update_physical_characteristic(physical_characteristic_id, physical_characteristic)
     if not result:
         logger.warning(f"Failed to update physical characteristic: id={physical_characteristic_id}")
-        raise HTTPException(status_code=404, detail="Physical characteristic not found or already exists")
+        if await get_physical_characteristic(physical_characteristic_id):
+            raise HTTPException(status_code=400, detail="Physical characteristic already exists or another one is open")
+        raise HTTPException(status_code=404, detail="Physical characteristic not found")
     logger.info(f"Updated physical characteristic: id={result.id}, person_id={result.person_id}")
     return result
 
@@ -6,6 +6,8 @@ from app.models.physical_characteristic_type import (
 )
 from app.schemas.physical_characteristic_type import PhysicalCharacteristicTypeCreate, PhysicalCharacteristicTypeUpdate, PhysicalCharacteristicTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_physical_characteristic_type_endpoint(physical_characteristic_t
     logger.info(f"Created physical characteristic type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/{physical_characteristic_type_id}", response_model=PhysicalCharacteristicTypeOut)
+@router.get("/{physical_characteristic_type_id}", response_model=PhysicalCharacteristicTypeOut, dependencies=[etag_cache("physical_characteristic_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_physical_characteristic_type_endpoint(physical_characteristic_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_physical_characteristic_type(physical_characteristic_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_physical_characteristic_type_endpoint(physical_characteristic_type
     logger.info(f"Retrieved physical characteristic type: id={result.id}, description={result.description}")
     return result
 
-@router.get("/", response_model=List[PhysicalCharacteristicTypeOut])
+@router.get("/", response_model=List[PhysicalCharacteristicTypeOut], dependencies=[etag_cache("physical_characteristic_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_physical_characteristic_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_physical_characteristic_types()
     logger.info(f"Retrieved {len(results)} physical characteristic types")
@@ -6,6 +6,8 @@ from app.models.priority_type import (
 )
 from app.schemas.priority_type import PriorityTypeCreate, PriorityTypeUpdate, PriorityTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_priority_type_endpoint(priority_type: PriorityTypeCreate, curre
     logger.info(f"Created priority_type: id={result.id}")
     return result
 
-@router.get("/{priority_type_id}", response_model=PriorityTypeOut)
+@router.get("/{priority_type_id}", response_model=PriorityTypeOut, dependencies=[etag_cache("priority_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_priority_type_endpoint(priority_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_priority_type(priority_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_priority_type_endpoint(priority_type_id: int, current_user: dict =
     logger.info(f"Retrieved priority_type: id={result.id}")
     return result
 
-@router.get("/", response_model=List[PriorityTypeOut])
+@router.get("/", response_model=List[PriorityTypeOut], dependencies=[etag_cache("priority_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_priority_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_priority_types()
     logger.info(f"Retrieved {len(results)} priority_types")
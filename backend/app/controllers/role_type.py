@@ -6,6 +6,8 @@ from app.models.role_type import (
 )
 from app.schemas.role_type import RoleTypeCreate, RoleTypeUpdate, RoleTypeOut
 from app.controllers.users.user import get_current_user
+from app.controllers.etag import etag_cache
+from app.config.settings import REFERENCE_CACHE_CONTROL
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +24,7 @@ async def create_role_type_endpoint(role_type: RoleTypeCreate, current_user: dic
     logger.info(f"Created role_type: id={result.id}")
     return result
 
-@router.get("/{role_type_id}", response_model=RoleTypeOut)
+@router.get("/{role_type_id}", response_model=RoleTypeOut, dependencies=[etag_cache("role_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_role_type_endpoint(role_type_id: int, current_user: dict = Depends(get_current_user)):
     result = await get_role_type(role_type_id)
     if not result:
@@ -31,7 +33,7 @@ async def get_role_type_endpoint(role_type_id: int, current_user: dict = Depends
     logger.info(f"Retrieved role_type: id={result.id}")
     return result
 
-@router.get("/", response_model=List[RoleTypeOut])
+@router.get("/", response_model=List[RoleTypeOut], dependencies=[etag_cache("role_type", cache_control=REFERENCE_CACHE_CONTROL)])
 async def get_all_role_types_endpoint(current_user: dict = Depends(get_current_user)):
     results = await get_all_role_types()
     logger.info(f"Retrieved {len(results)} role_types")
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+from typing import List
+from app.models.search import search_parties
+from app.schemas.search import SearchResultOut
+from app.controllers.users.user import get_current_user
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1/search", tags=["search"])
+
+@router.get("/", response_model=List[SearchResultOut])
+async def search_parties_endpoint(
+    q: str = Query(..., min_length=1, max_length=128),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: dict = Depends(get_current_user)
+):
+    results = await search_parties(q, limit)
+    logger.info(f"Search returned {len(results)} parties for user: {current_user.get('username')}")
+    return results
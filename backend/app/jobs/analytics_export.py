@@ -0,0 +1,391 @@
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+from app.config.database import database
+from app.config.settings import JOB_EXPORT_BASE_DIR
+from app.jobs.progress import JobProgress
+from app.schemas.job import AnalyticsExportParams, resolve_job_path
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Export of the party model for analytics, instead of paging through the get_all_* endpoints.
+# Run from backend/ (or queued: POST /v1/jobs/ {"kind": "analytics_export", "params": {"format": "parquet"}}):
+#   python -m app.jobs.analytics_export --out exports --format parquet
+#   python -m app.jobs.analytics_export --out exports --format csv --only persons --only organizations
+#   python -m app.jobs.analytics_export --out exports --full
+#
+# Datasets (DATASETS): persons with their current names, organizations with their most specific
+# subtype, classifications (eeoc / income / industry / minority / size with the value), party
+# relationships with both parties and roles, communication events with their purposes.
+#
+# - One consistent snapshot: a REPEATABLE READ transaction exports it (pg_export_snapshot) and
+#   every dataset, --jobs at a time on their own connections, reads in that snapshot.
+# - Constant memory: csv is COPY (query) TO STDOUT streamed into a gzip file; parquet / arrow read
+#   a server-side cursor --batch-size rows at a time and write one record batch per fetch (pyarrow).
+# - Incremental: out/watermarks.json keeps the last exported id (communication events: the last
+#   datetime_start) per dataset and the next run only exports rows past it, into a new file
+#   out/<dataset>/<dataset>-<time>.<ext>. Rows are exported once, when they appear: later updates
+#   of an exported row, or events inserted with a datetime_start before the watermark, need --full.
+# - Late commits: a transaction can take an id below the watermark and commit after the snapshot.
+#   The ids missing from the snapshot in the last GAP_WINDOW ids below the watermark are kept in
+#   watermarks.json ("gaps") and exported by a later run once they exist, each row once. A row
+#   whose transaction commits more than GAP_WINDOW ids later (or a communication event, whose
+#   watermark is its datetime_start) needs --full.
+# - The result has rows, seconds and rows/sec per dataset.
+
+FORMATS = {"csv": "csv.gz", "parquet": "parquet", "arrow": "arrow"}
+
+# Ids below the watermark that are watched for late commits
+GAP_WINDOW = 10000
+
+class Dataset(NamedTuple):
+    # query takes $1 (lower bound, exclusive) and $2 (upper bound, inclusive) on watermark_column,
+    # and for id watermarks $3: ids below the watermark that were missing from the last export
+    query: str
+    watermark_table: str
+    watermark_column: str
+    initial: object
+    # Ids missing from this table are gaps (persons / organizations share the party ids); None: no gaps
+    gap_table: Optional[str] = None
+
+PERSONS_QUERY = """
+    SELECT p.id, p.personal_id_number, p.birthdate, p.mothermaidenname, p.totalyearworkexperience,
+           p.comment, p.gender_type_id, gt.description AS gender,
+           n.fname, n.mname, n.lname, n.nickname
+    FROM person p
+    LEFT JOIN gender_type gt ON gt.id = p.gender_type_id
+    LEFT JOIN LATERAL (
+        SELECT max(pn.name) FILTER (WHERE pnt.description = 'FirstName') AS fname,
+               max(pn.name) FILTER (WHERE pnt.description = 'MiddleName') AS mname,
+               max(pn.name) FILTER (WHERE pnt.description = 'LastName') AS lname,
+               max(pn.name) FILTER (WHERE pnt.description = 'Nickname') AS nickname
+        FROM personname pn
+        JOIN personnametype pnt ON pnt.id = pn.personnametype_id
+        WHERE pn.person_id = p.id AND pn.thrudate IS NULL
+    ) n ON TRUE
+    WHERE (p.id > $1 AND p.id <= $2) OR p.id = ANY($3::int[])
+    ORDER BY p.id
+"""
+
+ORGANIZATIONS_QUERY = """
+    SELECT o.id, o.name_en, o.name_th, lo.federal_tax_id_number,
+           CASE
+               WHEN c.id IS NOT NULL THEN 'corporation'
+               WHEN ga.id IS NOT NULL THEN 'government_agency'
+               WHEN lo.id IS NOT NULL THEN 'legal_organization'
+               WHEN t.id IS NOT NULL THEN 'team'
+               WHEN f.id IS NOT NULL THEN 'family'
+               WHEN oio.id IS NOT NULL THEN 'other_informal_organization'
+               WHEN io.id IS NOT NULL THEN 'informal_organization'
+               ELSE 'organization'
+           END AS subtype
+    FROM organization o
+    LEFT JOIN legal_organization lo ON lo.id = o.id
+    LEFT JOIN corporation c ON c.id = o.id
+    LEFT JOIN government_agency ga ON ga.id = o.id
+    LEFT JOIN informal_organization io ON io.id = o.id
+    LEFT JOIN team t ON t.id = o.id
+    LEFT JOIN family f ON f.id = o.id
+    LEFT JOIN other_informal_organization oio ON oio.id = o.id
+    WHERE (o.id > $1 AND o.id <= $2) OR o.id = ANY($3::int[])
+    ORDER BY o.id
+"""
+
+CLASSIFICATIONS_QUERY = """
+    SELECT pc.id, pc.party_id, pc.fromdate, pc.thrudate, pc.party_type_id, pt.description AS party_type,
+           CASE
+               WHEN cbe.id IS NOT NULL THEN 'eeoc'
+               WHEN cbi.id IS NOT NULL THEN 'income'
+               WHEN cbind.id IS NOT NULL THEN 'industry'
+               WHEN cbm.id IS NOT NULL THEN 'minority'
+               WHEN cbs.id IS NOT NULL THEN 'size'
+           END AS classification,
+           COALESCE(cbe.ethnicity_id, cbi.income_range_id, cbind.industry_type_id, cbm.minority_type_id, cbs.employee_count_range_id) AS value_id,
+           COALESCE(e.name_en, ir.description, it.description, mt.name_en, ecr.description) AS value
+    FROM party_classification pc
+    LEFT JOIN party_type pt ON pt.id = pc.party_type_id
+    LEFT JOIN classify_by_eeoc cbe ON cbe.id = pc.id
+    LEFT JOIN ethnicity e ON e.id = cbe.ethnicity_id
+    LEFT JOIN classify_by_income cbi ON cbi.id = pc.id
+    LEFT JOIN income_range ir ON ir.id = cbi.income_range_id
+    LEFT JOIN classify_by_industry cbind ON cbind.id = pc.id
+    LEFT JOIN industry_type it ON it.id = cbind.industry_type_id
+    LEFT JOIN classify_by_minority cbm ON cbm.id = pc.id
+    LEFT JOIN minority_type mt ON mt.id = cbm.minority_type_id
+    LEFT JOIN classify_by_size cbs ON cbs.id = pc.id
+    LEFT JOIN employee_count_range ecr ON ecr.id = cbs.employee_count_range_id
+    WHERE (pc.id > $1 AND pc.id <= $2) OR pc.id = ANY($3::int[])
+    ORDER BY pc.id
+"""
+
+RELATIONSHIPS_QUERY = """
+    SELECT pr.id, pr.from_date, pr.thru_date, pr.comment,
+           pr.from_party_role_id, fr.party_id AS from_party_id, frt.description AS from_role,
+           pr.to_party_role_id, tr.party_id AS to_party_id, trt.description AS to_role,
+           prt.description AS relationship_type, pt.description AS priority, prst.description AS status
+    FROM party_relationship pr
+    LEFT JOIN party_role fr ON fr.id = pr.from_party_role_id
+    LEFT JOIN role_type frt ON frt.id = fr.role_type_id
+    LEFT JOIN party_role tr ON tr.id = pr.to_party_role_id
+    LEFT JOIN role_type trt ON trt.id = tr.role_type_id
+    LEFT JOIN party_relationship_type prt ON prt.id = pr.party_relationship_type_id
+    LEFT JOIN priority_type pt ON pt.id = pr.priority_type_id
+    LEFT JOIN party_relationship_status_type prst ON prst.id = pr.party_relationship_status_type_id
+    WHERE (pr.id > $1 AND pr.id <= $2) OR pr.id = ANY($3::int[])
+    ORDER BY pr.id
+"""
+
+# Bounded on the partition key, so only the partitions past the watermark are read
+COMMUNICATION_EVENTS_QUERY = """
+    SELECT ce.id, ce.datetime_start, ce.datetime_end, ce.note, ce.party_relationship_id,
+           cmt.description AS contact_mechanism_type, cest.description AS status,
+           (
+               SELECT string_agg(cept.description, ',' ORDER BY cept.description)
+               FROM communication_event_purpose cep
+               JOIN communication_event_purpose_type cept ON cept.id = cep.communication_event_purpose_type_id
+               WHERE cep.communication_event_id = ce.id
+                 AND cep.communication_event_datetime_start = ce.datetime_start
+           ) AS purposes
+    FROM communication_event ce
+    LEFT JOIN contact_mechanism_type cmt ON cmt.id = ce.contact_mechanism_type_id
+    LEFT JOIN communication_event_status_type cest ON cest.id = ce.communication_event_status_type_id
+    WHERE ce.datetime_start > $1 AND ce.datetime_start <= $2
+    ORDER BY ce.datetime_start, ce.id
+"""
+
+DATASETS = {
+    "persons": Dataset(PERSONS_QUERY, "person", "id", 0, "party"),
+    "organizations": Dataset(ORGANIZATIONS_QUERY, "organization", "id", 0, "party"),
+    "classifications": Dataset(CLASSIFICATIONS_QUERY, "party_classification", "id", 0, "party_classification"),
+    "relationships": Dataset(RELATIONSHIPS_QUERY, "party_relationship", "id", 0, "party_relationship"),
+    "communication_events": Dataset(COMMUNICATION_EVENTS_QUERY, "communication_event", "datetime_start", datetime(1, 1, 1)),
+}
+
+class ExportResult(NamedTuple):
+    dataset: str
+    path: Optional[str]
+    rows: int
+    seconds: float
+    watermark: object
+    gaps: List[int]
+
+def _arrow_type(type_name: str):
+    return {
+        "int2": pyarrow.int16(),
+        "int4": pyarrow.int32(),
+        "int8": pyarrow.int64(),
+        "float4": pyarrow.float32(),
+        "float8": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+        "date": pyarrow.date32(),
+        "timestamp": pyarrow.timestamp("us"),
+        "timestamptz": pyarrow.timestamp("us", tz="UTC"),
+    }.get(type_name)
+
+def _watermark_to_json(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def _watermark_from_json(value, initial):
+    return datetime.fromisoformat(value) if isinstance(initial, datetime) else value
+
+def read_watermarks(out: str) -> dict:
+    path = os.path.join(out, "watermarks.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def write_watermarks(out: str, watermarks: dict) -> None:
+    # Written last and renamed into place: an export that fails half way is simply run again
+    path = os.path.join(out, "watermarks.json")
+    with open(path + ".part", "w", encoding="utf-8") as file:
+        json.dump(watermarks, file, indent=2, sort_keys=True)
+    os.replace(path + ".part", path)
+
+async def _write_csv(raw, query: str, args: list, path: str) -> int:
+    with gzip.open(path, "wb", compresslevel=6) as file:
+        async def write(chunk: bytes) -> None:
+            file.write(chunk)
+        status = await raw.copy_from_query(query, *args, output=write, format="csv", header=True)
+    return int(status.split()[-1])
+
+async def _write_arrow(raw, query: str, args: list, path: str, file_format: str, batch_size: int) -> int:
+    statement = await raw.prepare(query)
+    attributes = statement.get_attributes()
+    # Columns of other types (numeric, varchar, ...) are written as strings
+    types = [_arrow_type(attribute.type.name) for attribute in attributes]
+    schema = pyarrow.schema([
+        (attribute.name, arrow_type or pyarrow.string()) for attribute, arrow_type in zip(attributes, types)
+    ])
+    if file_format == "parquet":
+        writer = pyarrow.parquet.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pyarrow.ipc.new_file(path, schema, options=pyarrow.ipc.IpcWriteOptions(compression="zstd"))
+    rows = 0
+    try:
+        cursor = await statement.cursor(*args)
+        while True:
+            records = await cursor.fetch(batch_size)
+            if not records:
+                break
+            columns = []
+            for index, arrow_type in enumerate(types):
+                values = [record[index] for record in records]
+                if arrow_type is None:
+                    values = [None if value is None else str(value) for value in values]
+                columns.append(pyarrow.array(values, type=schema.field(index).type))
+            writer.write_batch(pyarrow.RecordBatch.from_arrays(columns, schema=schema))
+            rows += len(records)
+    finally:
+        writer.close()
+    return rows
+
+async def _missing_ids(raw, table: str, low: int, high: int) -> List[int]:
+    # Ids in (low, high] not in the snapshot: rolled back, deleted, or not committed yet
+    if high <= low:
+        return []
+    return await raw.fetchval(f"""
+        SELECT COALESCE(array_agg(g ORDER BY g), '{{}}')
+        FROM generate_series($1::int + 1, $2::int) g
+        WHERE NOT EXISTS (SELECT 1 FROM {table} WHERE id = g)
+    """, low, high)
+
+async def export_dataset(name: str, snapshot: str, out: str, file_format: str, since, gaps: List[int],
+                         batch_size: int, stamp: str) -> ExportResult:
+    dataset = DATASETS[name]
+    started = time.perf_counter()
+    async with database.connection() as connection:
+        async with connection.transaction(isolation="repeatable_read", readonly=True):
+            raw = connection.raw_connection
+            await raw.execute(f"SET TRANSACTION SNAPSHOT '{snapshot}'")
+            watermark = await raw.fetchval(
+                f"SELECT max({dataset.watermark_column}) FROM {dataset.watermark_table} WHERE {dataset.watermark_column} > $1",
+                since
+            )
+            # Gaps of the last export that were committed since
+            late = await raw.fetchval(
+                f"SELECT COALESCE(array_agg(id), '{{}}') FROM {dataset.watermark_table} WHERE id = ANY($1::int[])", gaps
+            ) if dataset.gap_table and gaps else []
+            if watermark is None and not late:
+                logger.info(f"{name}: nothing past {since}")
+                return ExportResult(name, None, 0, time.perf_counter() - started, since, gaps)
+            watermark = since if watermark is None else watermark
+            if dataset.gap_table:
+                missing = await _missing_ids(raw, dataset.gap_table, max(since, watermark - GAP_WINDOW), watermark)
+                gaps = sorted(set(gaps) - set(late)) + missing
+                gaps = [gap for gap in gaps if gap > watermark - GAP_WINDOW]
+            args = [since, watermark, late] if dataset.gap_table else [since, watermark]
+            os.makedirs(os.path.join(out, name), exist_ok=True)
+            path = os.path.join(out, name, f"{name}-{stamp}.{FORMATS[file_format]}")
+            if file_format == "csv":
+                rows = await _write_csv(raw, dataset.query, args, path + ".part")
+            else:
+                rows = await _write_arrow(raw, dataset.query, args, path + ".part", file_format, batch_size)
+    os.replace(path + ".part", path)
+    seconds = time.perf_counter() - started
+    logger.info(f"{name}: {rows} rows ({len(late)} late commits) to {path} in {seconds:.2f} s ({rows / seconds:.0f} rows/s)")
+    return ExportResult(name, path, rows, seconds, watermark, gaps)
+
+async def export(out: str, file_format: str = "parquet", only: Optional[List[str]] = None, full: bool = False,
+                 jobs: int = 2, batch_size: int = 50000, progress: Optional[JobProgress] = None) -> dict:
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown format {file_format!r}, expected one of {', '.join(FORMATS)}")
+    if file_format != "csv" and pyarrow is None:
+        raise ValueError(f"Format {file_format} needs the pyarrow package (pip install pyarrow), csv does not")
+    names = only or list(DATASETS)
+    unknown = [name for name in names if name not in DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown datasets {unknown}, expected some of {', '.join(DATASETS)}")
+
+    os.makedirs(out, exist_ok=True)
+    watermarks = read_watermarks(out)
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    semaphore = asyncio.Semaphore(jobs)
+    results: Dict[str, ExportResult] = {}
+    started = time.perf_counter()
+
+    async def export_one(name: str, snapshot: str) -> None:
+        dataset = DATASETS[name]
+        since = dataset.initial if full or name not in watermarks else _watermark_from_json(watermarks[name], dataset.initial)
+        gaps = [] if full else watermarks.get("gaps", {}).get(name, [])
+        async with semaphore:
+            results[name] = await export_dataset(name, snapshot, out, file_format, since, gaps, batch_size, stamp)
+        if progress:
+            await progress(len(results), len(names), f"{name}: {results[name].rows} rows")
+
+    # The snapshot stays importable while this transaction is open
+    async with database.connection() as connection:
+        async with connection.transaction(isolation="repeatable_read", readonly=True):
+            snapshot = await connection.raw_connection.fetchval("SELECT pg_export_snapshot()")
+            await asyncio.gather(*(export_one(name, snapshot) for name in names))
+
+    for name, result in results.items():
+        watermarks[name] = _watermark_to_json(result.watermark)
+        watermarks.setdefault("gaps", {})[name] = result.gaps
+    write_watermarks(out, watermarks)
+
+    seconds = time.perf_counter() - started
+    total = sum(result.rows for result in results.values())
+    logger.info(f"Exported {total} rows in {seconds:.2f} s ({total / seconds:.0f} rows/s)")
+    return {
+        "datasets": {
+            name: {
+                "path": result.path,
+                "rows": result.rows,
+                "seconds": round(result.seconds, 3),
+                "rows_per_second": round(result.rows / result.seconds) if result.seconds else None,
+                "watermark": _watermark_to_json(result.watermark),
+            }
+            for name, result in results.items()
+        },
+        "rows": total,
+        "seconds": round(seconds, 3),
+    }
+
+async def run_job(params: dict, progress: JobProgress) -> dict:
+    # Queue handler (app/jobs/worker.py); params: AnalyticsExportParams, "out" is inside JOB_EXPORT_BASE_DIR
+    params = AnalyticsExportParams.model_validate(params)
+    return await export(
+        resolve_job_path(JOB_EXPORT_BASE_DIR, params.out),
+        params.format,
+        params.only,
+        params.full,
+        params.jobs,
+        params.batch_size,
+        progress=progress,
+    )
+
+async def run(args) -> None:
+    await database.connect()
+    try:
+        await export(args.out, args.format, args.only, args.full, args.jobs, args.batch_size)
+    finally:
+        await database.disconnect()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the party model to Parquet / Arrow / gzip CSV for analytics")
+    parser.add_argument("--out", default="exports", help="output directory (keeps watermarks.json)")
+    parser.add_argument("--format", choices=list(FORMATS), default="parquet")
+    parser.add_argument("--only", action="append", choices=list(DATASETS), help="dataset to export (repeatable)")
+    parser.add_argument("--full", action="store_true", help="ignore the watermarks and export every row")
+    parser.add_argument("--jobs", type=int, default=2, help="datasets exported at the same time")
+    parser.add_argument("--batch-size", type=int, default=50000, help="rows per cursor fetch / record batch")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
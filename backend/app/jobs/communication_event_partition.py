@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+import logging
+from app.config.database import database
+from app.config.settings import COMMUNICATION_EVENT_PARTITION_MONTHS_AHEAD, COMMUNICATION_EVENT_RETENTION_MONTHS
+from app.models.communication_event import create_communication_event_partitions, detach_communication_event_partitions
+from app.jobs.progress import JobProgress
+from app.schemas.job import CommunicationEventPartitionParams
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Partition maintenance for communication_event / communication_event_purpose
+# (schema in note_for_database/communication_event_partition.sql)
+# Run daily, e.g. from cron on the docker host:
+#   docker compose exec backend python -m app.jobs.communication_event_partition
+#   docker compose exec backend python -m app.jobs.communication_event_partition --no-detach
+# or queued: POST /v1/jobs/ {"kind": "communication_event_partition", "params": {"detach": false}}
+
+async def run(months_ahead: int, retention_months: int, detach: bool) -> None:
+    await database.connect()
+    try:
+        created = await create_communication_event_partitions(months_ahead)
+        logger.info(f"Partitions created: {len(created)}")
+        if detach:
+            detached = await detach_communication_event_partitions(retention_months)
+            logger.info(f"Partitions detached to communication_event_archive: {len(detached)}")
+    finally:
+        await database.disconnect()
+
+async def run_job(params: dict, progress: JobProgress) -> dict:
+    # Queue handler (app/jobs/worker.py); params: CommunicationEventPartitionParams
+    params = CommunicationEventPartitionParams.model_validate(params)
+    created = await create_communication_event_partitions(params.months_ahead)
+    await progress(1, 2, f"{len(created)} partitions created")
+    detached = []
+    if params.detach:
+        detached = await detach_communication_event_partitions(params.retention_months)
+    return {"created": created, "detached": detached}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Create upcoming and detach expired communication_event partitions")
+    parser.add_argument("--months-ahead", type=int, default=COMMUNICATION_EVENT_PARTITION_MONTHS_AHEAD)
+    parser.add_argument("--retention-months", type=int, default=COMMUNICATION_EVENT_RETENTION_MONTHS)
+    parser.add_argument("--no-detach", action="store_true", help="only create partitions")
+    args = parser.parse_args()
+    asyncio.run(run(args.months_ahead, args.retention_months, not args.no_detach))
+
+if __name__ == "__main__":
+    main()
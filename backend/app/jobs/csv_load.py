@@ -0,0 +1,320 @@
+import argparse
+import asyncio
+import csv
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from app.config.cache import cache
+from app.config.database import database
+from app.config.entity_version import TABLE_ENTITIES, bump_version, table_entities
+from app.config.settings import JOB_IMPORT_BASE_DIR
+from app.jobs.progress import JobProgress
+from app.jobs.search_key_backfill import backfill_person_names, backfill_organizations
+from app.schemas.job import CsvLoadParams, resolve_job_path
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bulk load of the staticData/*/ CSV seed sets (or a production snapshot in the same layout)
+# instead of one psql COPY per file (note_for_database/how_to_import_csv_data.md) followed by
+# reset_max_seq_id_all.sql. Run from backend/ (staticData is mounted at /staticData in the
+# backend and worker containers, ../staticData from /app):
+#   python -m app.jobs.csv_load --dry-run
+#   python -m app.jobs.csv_load --truncate --jobs 8
+#   python -m app.jobs.csv_load --dir /snapshots/2025-06 --only person --only personname
+# or queued: POST /v1/jobs/ {"kind": "csv_load", "params": {"truncate": true}}
+#
+# 1. Every */*.csv is matched to a table: the file name without a "static_" prefix, with or
+#    without underscores (static_person_name_type.csv -> personnametype). Files without a table
+#    (country_suppertype.csv) are skipped; identical copies of one table's file are loaded once.
+# 2. The foreign keys are read from pg_constraint and the tables ordered in levels: each level
+#    only references tables of earlier levels, the tables of one level are loaded in parallel
+#    (--jobs connections), each with COPY FROM STDIN in its own transaction.
+# 3. A NOT NULL column missing from the CSV is filled through a composite foreign key whose other
+#    columns are in the file: communication_event_purpose.csv has no
+#    communication_event_datetime_start (partition key), it is taken from communication_event.
+#    Those files go through a temporary staging table and INSERT ... SELECT ... JOIN.
+# 4. Sequences of the loaded tables are set past MAX(id), rows written are checked against the
+#    rows of each file (and against count(*) with --truncate), and the search keys of new
+#    personname / organization rows are filled (app/jobs/search_key_backfill.py).
+# --truncate empties the loaded tables first (TRUNCATE ... CASCADE: tables referencing them,
+# e.g. party_duplicate_candidate, are emptied too).
+
+DEFAULT_DIR = os.path.join("..", "staticData")
+
+TABLES_QUERY = """
+    SELECT c.relname AS table_name
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p') AND NOT c.relispartition
+"""
+
+COLUMNS_QUERY = """
+    SELECT table_name, column_name, is_nullable = 'NO' AND column_default IS NULL AS required
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+    ORDER BY table_name, ordinal_position
+"""
+
+# Foreign keys between public tables, declared ones only (not the copies on partitions)
+FOREIGN_KEYS_QUERY = """
+    SELECT child.relname AS table_name,
+           parent.relname AS parent_table,
+           ARRAY(
+               SELECT a.attname FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, n)
+               JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+               ORDER BY k.n
+           ) AS columns,
+           ARRAY(
+               SELECT a.attname FROM unnest(con.confkey) WITH ORDINALITY AS k(attnum, n)
+               JOIN pg_attribute a ON a.attrelid = con.confrelid AND a.attnum = k.attnum
+               ORDER BY k.n
+           ) AS parent_columns
+    FROM pg_constraint con
+    JOIN pg_class child ON child.oid = con.conrelid
+    JOIN pg_class parent ON parent.oid = con.confrelid
+    JOIN pg_namespace n ON n.oid = child.relnamespace
+    WHERE con.contype = 'f' AND n.nspname = 'public' AND con.conparentid = 0
+"""
+
+class ForeignKey(NamedTuple):
+    parent_table: str
+    columns: List[str]
+    parent_columns: List[str]
+
+class CsvFile(NamedTuple):
+    path: str
+    table: str
+    columns: List[str]
+    rows: int
+
+class LoadResult(NamedTuple):
+    table: str
+    path: str
+    expected: int
+    written: int
+    seconds: float
+
+def _ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+def read_csv_file(path: str) -> Tuple[List[str], int]:
+    # Header columns and data rows (quoted newlines count as one row, blank lines not at all)
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        return [column.strip() for column in header], sum(1 for row in reader if row)
+
+def table_for(path: str, tables: set) -> Optional[str]:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if stem.startswith("static_"):
+        stem = stem[len("static_"):]
+    for candidate in (stem, stem.replace("_", "")):
+        if candidate in tables:
+            return candidate
+    return None
+
+def discover(directory: str, tables: set, only: Optional[List[str]]) -> List[CsvFile]:
+    found: Dict[str, CsvFile] = {}
+    for folder in sorted(os.listdir(directory)):
+        folder_path = os.path.join(directory, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for name in sorted(os.listdir(folder_path)):
+            if not name.endswith(".csv"):
+                continue
+            path = os.path.join(folder_path, name)
+            table = table_for(path, tables)
+            if table is None:
+                logger.warning(f"Skipped {path}: no table {name[:-4]}")
+                continue
+            if only and table not in only:
+                continue
+            columns, rows = read_csv_file(path)
+            if table in found:
+                with open(found[table].path, "rb") as first, open(path, "rb") as second:
+                    if first.read() != second.read():
+                        raise ValueError(f"{found[table].path} and {path} are both for table {table} but differ")
+                logger.info(f"Skipped {path}: same file as {found[table].path}")
+                continue
+            found[table] = CsvFile(path, table, columns, rows)
+    return list(found.values())
+
+def dependency_levels(files: List[CsvFile], foreign_keys: Dict[str, List[ForeignKey]]) -> List[List[CsvFile]]:
+    # Kahn's algorithm over the tables being loaded; references to other tables are already there
+    by_table = {file.table: file for file in files}
+    parents = {
+        table: {fk.parent_table for fk in foreign_keys.get(table, []) if fk.parent_table in by_table and fk.parent_table != table}
+        for table in by_table
+    }
+    levels, loaded = [], set()
+    while len(loaded) < len(by_table):
+        level = sorted(table for table in by_table if table not in loaded and parents[table] <= loaded)
+        if not level:
+            cycle = sorted(set(by_table) - loaded)
+            raise ValueError(f"Foreign keys form a cycle between: {', '.join(cycle)}")
+        levels.append([by_table[table] for table in level])
+        loaded.update(level)
+    return levels
+
+def derived_columns(file: CsvFile, required: List[str], foreign_keys: List[ForeignKey]) -> List[Tuple[ForeignKey, Dict[str, str]]]:
+    # For each required column missing from the file, the composite foreign key that can fill it:
+    # [(fk, {missing column: parent column})]
+    missing = [column for column in required if column not in file.columns]
+    derived = []
+    for fk in foreign_keys:
+        fills = {column: parent for column, parent in zip(fk.columns, fk.parent_columns) if column in missing}
+        present = [column for column in fk.columns if column in file.columns]
+        if fills and present:
+            derived.append((fk, fills))
+            missing = [column for column in missing if column not in fills]
+    if missing:
+        raise ValueError(f"{file.path}: required columns {', '.join(missing)} of {file.table} are missing")
+    return derived
+
+def _row_count(status: str) -> int:
+    # "COPY 25" / "INSERT 0 25"
+    return int(status.split()[-1])
+
+async def load_file(file: CsvFile, derived: List[Tuple[ForeignKey, Dict[str, str]]]) -> LoadResult:
+    started = time.perf_counter()
+    async with database.connection() as connection:
+        async with connection.transaction():
+            raw = connection.raw_connection
+            await raw.execute("SET LOCAL synchronous_commit = off")
+            if not derived:
+                status = await raw.copy_to_table(file.table, source=file.path, columns=file.columns, format="csv", header=True)
+            else:
+                stage = f"csv_load_{file.table}"
+                columns = ", ".join(_ident(column) for column in file.columns)
+                await raw.execute(f"CREATE TEMP TABLE {_ident(stage)} ON COMMIT DROP AS SELECT {columns} FROM {_ident(file.table)} WITH NO DATA")
+                await raw.copy_to_table(stage, source=file.path, columns=file.columns, format="csv", header=True)
+                targets = list(file.columns)
+                selects = [f"s.{_ident(column)}" for column in file.columns]
+                joins = []
+                for number, (fk, fills) in enumerate(derived):
+                    alias = f"p{number}"
+                    conditions = [
+                        f"{alias}.{_ident(parent)} = s.{_ident(column)}"
+                        for column, parent in zip(fk.columns, fk.parent_columns) if column in file.columns
+                    ]
+                    joins.append(f"JOIN {_ident(fk.parent_table)} {alias} ON {' AND '.join(conditions)}")
+                    for column, parent in fills.items():
+                        targets.append(column)
+                        selects.append(f"{alias}.{_ident(parent)}")
+                status = await raw.execute(f"""
+                    INSERT INTO {_ident(file.table)} ({", ".join(_ident(column) for column in targets)})
+                    SELECT {", ".join(selects)}
+                    FROM {_ident(stage)} s
+                    {" ".join(joins)}
+                """)
+    result = LoadResult(file.table, file.path, file.rows, _row_count(status), time.perf_counter() - started)
+    logger.info(f"{file.table}: {result.written} rows from {file.path} in {result.seconds:.2f} s")
+    return result
+
+async def reset_sequences(tables: List[str]) -> None:
+    # Same as note_for_database/reset_max_seq_id_all.sql, for the loaded tables only
+    for table in tables:
+        sequence = await database.fetch_val(query="SELECT pg_get_serial_sequence(:table, 'id')", values={"table": table})
+        if sequence is None:
+            continue
+        next_id = await database.fetch_val(query=f"SELECT COALESCE(MAX(id), 0) + 1 FROM {_ident(table)}")
+        await database.fetch_val(query="SELECT setval(:sequence, :next_id, false)", values={"sequence": sequence, "next_id": next_id})
+        logger.info(f"{table}: sequence {sequence} starts at {next_id}")
+
+async def load(directory: str, only: Optional[List[str]] = None, truncate: bool = False, jobs: int = 4,
+               search_keys: bool = True, dry_run: bool = False, progress: Optional[JobProgress] = None) -> dict:
+    tables = {row["table_name"] for row in await database.fetch_all(query=TABLES_QUERY)}
+    required = defaultdict(list)
+    for row in await database.fetch_all(query=COLUMNS_QUERY):
+        if row["required"]:
+            required[row["table_name"]].append(row["column_name"])
+    foreign_keys = defaultdict(list)
+    for row in await database.fetch_all(query=FOREIGN_KEYS_QUERY):
+        foreign_keys[row["table_name"]].append(ForeignKey(row["parent_table"], list(row["columns"]), list(row["parent_columns"])))
+
+    files = discover(directory, tables, only)
+    levels = dependency_levels(files, foreign_keys)
+    derived = {file.table: derived_columns(file, required[file.table], foreign_keys[file.table]) for file in files}
+    for number, level in enumerate(levels, start=1):
+        logger.info(f"Level {number}: {', '.join(f'{file.table} ({file.rows})' for file in level)}")
+    if dry_run:
+        return {"levels": [[file.table for file in level] for level in levels]}
+
+    loaded_tables = [file.table for file in files]
+    results: List[LoadResult] = []
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def load_one(file: CsvFile) -> LoadResult:
+        async with semaphore:
+            return await load_file(file, derived[file.table])
+
+    try:
+        if truncate:
+            await database.execute(query=f"TRUNCATE {', '.join(_ident(table) for table in loaded_tables)} RESTART IDENTITY CASCADE")
+            logger.info(f"Truncated {len(loaded_tables)} tables")
+        for number, level in enumerate(levels, start=1):
+            results.extend(await asyncio.gather(*(load_one(file) for file in level)))
+            if progress:
+                await progress(number, len(levels), f"level {number}: {', '.join(file.table for file in level)}")
+        await reset_sequences(loaded_tables)
+    finally:
+        # Cached reads and ETags of the written tables are stale now, also after a failed level
+        # (the earlier ones are committed); TRUNCATE ... CASCADE may have emptied any table
+        await bump_version(*table_entities(TABLE_ENTITIES if truncate else loaded_tables))
+
+    mismatches = [f"{result.table}: {result.written} rows written, {result.expected} in {result.path}" for result in results if result.written != result.expected]
+    if truncate:
+        for result in results:
+            count = await database.fetch_val(query=f"SELECT count(*) FROM {_ident(result.table)}")
+            if count != result.expected:
+                mismatches.append(f"{result.table}: {count} rows in the table, {result.expected} in {result.path}")
+
+    if search_keys:
+        if "personname" in loaded_tables:
+            await backfill_person_names(1000, False)
+        if "organization" in loaded_tables:
+            await backfill_organizations(1000, False)
+
+    total = sum(result.written for result in results)
+    logger.info(f"Loaded {total} rows into {len(results)} tables in {sum(result.seconds for result in results):.2f} s of COPY")
+    if mismatches:
+        raise ValueError("Row counts do not match: " + "; ".join(mismatches))
+    return {"tables": {result.table: result.written for result in results}, "rows": total}
+
+async def run_job(params: dict, progress: JobProgress) -> dict:
+    # Queue handler (app/jobs/worker.py); params: CsvLoadParams, "dir" is inside JOB_IMPORT_BASE_DIR
+    params = CsvLoadParams.model_validate(params)
+    return await load(
+        resolve_job_path(JOB_IMPORT_BASE_DIR, params.dir),
+        params.only,
+        params.truncate,
+        params.jobs,
+        params.search_keys,
+        progress=progress,
+    )
+
+async def run(args) -> None:
+    await database.connect()
+    await cache.connect()
+    try:
+        await load(args.dir, args.only, args.truncate, args.jobs, not args.no_search_keys, args.dry_run)
+    finally:
+        await cache.disconnect()
+        await database.disconnect()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load staticData/*/ CSV files with COPY in foreign-key order")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="directory with one folder per data set")
+    parser.add_argument("--only", action="append", help="table to load (repeatable), default: every table with a file")
+    parser.add_argument("--truncate", action="store_true", help="empty the loaded tables first (CASCADE)")
+    parser.add_argument("--jobs", type=int, default=4, help="tables loaded at the same time")
+    parser.add_argument("--no-search-keys", action="store_true", help="do not fill personname / organization search keys")
+    parser.add_argument("--dry-run", action="store_true", help="only print the files, tables and load order")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import logging
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from difflib import SequenceMatcher
+from itertools import combinations
+from typing import NamedTuple, Optional, FrozenSet, Dict, List, Tuple
+from app.config.database import database
+from app.config.settings import PARTY_DEDUP_MIN_SCORE, PARTY_DEDUP_MAX_BLOCK_SIZE
+from app.models.party_duplicate import (
+    iterate_person_features, iterate_organization_features, save_party_duplicate_candidates
+)
+from app.jobs.progress import JobProgress
+from app.schemas.job import PartyDedupParams
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Duplicate-party detection, results go to party_duplicate_candidate for review
+# (note_for_database/party_duplicate.sql, GET /v1/partyduplicate/)
+#   docker compose exec backend python -m app.jobs.party_dedup
+#   docker compose exec backend python -m app.jobs.party_dedup --kind person --workers 4
+# or queued: POST /v1/jobs/ {"kind": "party_dedup", "params": {"kinds": ["person"], "workers": 4}}
+#
+# 1. Load one compact feature tuple per party (streamed from the database).
+# 2. Blocking: every party gets a few keys (identity number, passport number, phonetic name
+#    plus birthdate, normalized organization name, ...). Only parties that share a key are
+#    compared, so the work grows with the number of true look-alikes instead of n². Blocks
+#    larger than --max-block-size (placeholder ids, very common names) are skipped and logged.
+# 3. Scoring: candidate pairs are split into chunks and scored in a process pool; each chunk
+#    carries only the features of its own parties.
+# 4. Pairs scoring at least --min-score are upserted into the review table.
+
+class PersonFeatures(NamedTuple):
+    personal_id_number: Optional[str]
+    birthdate: Optional[date]
+    name_key: Optional[str]
+    name_phonetic: Optional[str]
+    fname_phonetic: Optional[str]
+    lname_phonetic: Optional[str]
+    country_ids: FrozenSet[int]
+    passport_numbers: FrozenSet[str]
+
+class OrganizationFeatures(NamedTuple):
+    federal_tax_id_number: Optional[str]
+    name_en_key: Optional[str]
+    name_en_phonetic: Optional[str]
+    name_th_key: Optional[str]
+    name_th_phonetic: Optional[str]
+
+def normalize_identifier(value: Optional[str]) -> Optional[str]:
+    # "1-2345-67890-12-3" and "1234567890123" are the same number
+    if not value:
+        return None
+    return re.sub(r"[^A-Za-z0-9]", "", value).upper() or None
+
+def person_features(row: dict) -> PersonFeatures:
+    return PersonFeatures(
+        personal_id_number=normalize_identifier(row["personal_id_number"]),
+        birthdate=row["birthdate"],
+        name_key=row["name_key"],
+        name_phonetic=row["name_phonetic"],
+        fname_phonetic=row["fname_phonetic"],
+        lname_phonetic=row["lname_phonetic"],
+        country_ids=frozenset(row["country_ids"]),
+        passport_numbers=frozenset(number for number in row["passport_numbers"] if number)
+    )
+
+def organization_features(row: dict) -> OrganizationFeatures:
+    return OrganizationFeatures(
+        federal_tax_id_number=normalize_identifier(row["federal_tax_id_number"]),
+        name_en_key=row["name_en_key"],
+        name_en_phonetic=row["name_en_phonetic"],
+        name_th_key=row["name_th_key"],
+        name_th_phonetic=row["name_th_phonetic"]
+    )
+
+def person_blocking_keys(features: PersonFeatures) -> List[str]:
+    keys = []
+    if features.personal_id_number:
+        keys.append(f"pid:{features.personal_id_number}")
+    keys.extend(f"passport:{number}" for number in features.passport_numbers)
+    if features.name_phonetic:
+        keys.append(f"name:{features.name_phonetic}")
+    if features.birthdate:
+        # Same birthdate and one name that sounds the same (covers a changed last name)
+        if features.lname_phonetic:
+            keys.append(f"lname_birthdate:{features.lname_phonetic}:{features.birthdate}")
+        if features.fname_phonetic:
+            keys.append(f"fname_birthdate:{features.fname_phonetic}:{features.birthdate}")
+    return keys
+
+def organization_blocking_keys(features: OrganizationFeatures) -> List[str]:
+    keys = []
+    if features.federal_tax_id_number:
+        keys.append(f"tax:{features.federal_tax_id_number}")
+    for prefix, value in (
+        ("name_en", features.name_en_key), ("name_en_phonetic", features.name_en_phonetic),
+        ("name_th", features.name_th_key), ("name_th_phonetic", features.name_th_phonetic),
+    ):
+        if value:
+            keys.append(f"{prefix}:{value}")
+    return keys
+
+def _similarity(a: Optional[str], b: Optional[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return SequenceMatcher(None, a, b).ratio()
+
+def score_person_pair(a: PersonFeatures, b: PersonFeatures) -> Tuple[float, List[str]]:
+    score = 0.0
+    reasons = []
+    if a.personal_id_number and a.personal_id_number == b.personal_id_number:
+        score += 0.45
+        reasons.append("personal_id_number")
+    if a.passport_numbers & b.passport_numbers:
+        score += 0.35
+        reasons.append("passport_number")
+    name_similarity = _similarity(a.name_key, b.name_key)
+    score += 0.35 * name_similarity
+    if name_similarity >= 0.85:
+        reasons.append("name")
+    if a.name_phonetic and a.name_phonetic == b.name_phonetic:
+        score += 0.05
+        reasons.append("name_phonetic")
+    if a.birthdate and b.birthdate:
+        if a.birthdate == b.birthdate:
+            score += 0.25
+            reasons.append("birthdate")
+        else:
+            score -= 0.25
+    if a.country_ids and b.country_ids:
+        if a.country_ids & b.country_ids:
+            score += 0.05
+            reasons.append("citizenship")
+        else:
+            score -= 0.1
+    return max(0.0, min(1.0, score)), reasons
+
+def score_organization_pair(a: OrganizationFeatures, b: OrganizationFeatures) -> Tuple[float, List[str]]:
+    score = 0.0
+    reasons = []
+    if a.federal_tax_id_number and b.federal_tax_id_number:
+        if a.federal_tax_id_number == b.federal_tax_id_number:
+            score += 0.5
+            reasons.append("federal_tax_id_number")
+        else:
+            score -= 0.3
+    for label, key_a, key_b in (("name_en", a.name_en_key, b.name_en_key), ("name_th", a.name_th_key, b.name_th_key)):
+        similarity = _similarity(key_a, key_b)
+        score += 0.3 * similarity
+        if similarity >= 0.85:
+            reasons.append(label)
+    if (a.name_en_phonetic and a.name_en_phonetic == b.name_en_phonetic) or \
+            (a.name_th_phonetic and a.name_th_phonetic == b.name_th_phonetic):
+        score += 0.1
+        reasons.append("name_phonetic")
+    return max(0.0, min(1.0, score)), reasons
+
+PARTY_KINDS = {
+    "person": (iterate_person_features, person_features, person_blocking_keys, score_person_pair),
+    "organization": (iterate_organization_features, organization_features, organization_blocking_keys, score_organization_pair),
+}
+
+def score_chunk(kind: str, pairs: List[Tuple[int, int]], features: Dict[int, tuple], min_score: float) -> List[dict]:
+    # Runs in a worker process
+    score_pair = PARTY_KINDS[kind][3]
+    candidates = []
+    for party_id, duplicate_party_id in pairs:
+        score, reasons = score_pair(features[party_id], features[duplicate_party_id])
+        if score >= min_score:
+            candidates.append({
+                "party_id": party_id,
+                "duplicate_party_id": duplicate_party_id,
+                "party_kind": kind,
+                "score": round(score, 4),
+                "reasons": reasons
+            })
+    return candidates
+
+def build_candidate_pairs(features: Dict[int, tuple], blocking_keys, max_block_size: int) -> Tuple[List[Tuple[int, int]], int]:
+    blocks = defaultdict(list)
+    for party_id, party_features in features.items():
+        for key in blocking_keys(party_features):
+            blocks[key].append(party_id)
+    pairs = set()
+    skipped = 0
+    for key, party_ids in blocks.items():
+        if len(party_ids) < 2:
+            continue
+        if len(party_ids) > max_block_size:
+            skipped += 1
+            logger.warning(f"Skipped block {key!r}: {len(party_ids)} parties")
+            continue
+        pairs.update(combinations(sorted(party_ids), 2))
+    return sorted(pairs), skipped
+
+async def dedup(kind: str, min_score: float, max_block_size: int, workers: int, chunk_size: int, progress: Optional[JobProgress] = None) -> int:
+    iterate_features, make_features, blocking_keys, _ = PARTY_KINDS[kind]
+    features = {}
+    async for row in iterate_features():
+        features[row["id"]] = make_features(row)
+    pairs, skipped = build_candidate_pairs(features, blocking_keys, max_block_size)
+    logger.info(f"{kind}: {len(features)} parties, {len(pairs)} candidate pairs, {skipped} blocks skipped")
+
+    loop = asyncio.get_running_loop()
+    saved = 0
+    scored = 0
+    pending = set()
+    chunk_sizes = {}  # future -> pairs in its chunk
+
+    async def save(chunk_pairs: int, candidates: List[dict]) -> None:
+        # Progress counts pairs whose chunk is scored and saved, so the last report is done == total
+        nonlocal saved, scored
+        saved += await save_party_duplicate_candidates(candidates)
+        scored += chunk_pairs
+        if progress:
+            await progress(scored, len(pairs), f"{kind}: pairs scored")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start:start + chunk_size]
+            chunk_features = {party_id: features[party_id] for pair in chunk for party_id in pair}
+            future = loop.run_in_executor(pool, score_chunk, kind, chunk, chunk_features, min_score)
+            chunk_sizes[future] = len(chunk)
+            pending.add(future)
+            # Keep a bounded number of chunks in flight
+            if len(pending) >= workers * 2:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    await save(chunk_sizes.pop(future), future.result())
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                await save(chunk_sizes.pop(future), future.result())
+    logger.info(f"{kind}: {saved} candidates written to party_duplicate_candidate")
+    return saved
+
+async def run(kinds: List[str], min_score: float, max_block_size: int, workers: int, chunk_size: int) -> None:
+    await database.connect()
+    try:
+        for kind in kinds:
+            await dedup(kind, min_score, max_block_size, workers, chunk_size)
+    finally:
+        await database.disconnect()
+
+async def run_job(params: dict, progress: JobProgress) -> dict:
+    # Queue handler (app/jobs/worker.py); params: PartyDedupParams
+    params = PartyDedupParams.model_validate(params)
+    saved = {}
+    for kind in params.kinds or sorted(PARTY_KINDS):
+        saved[kind] = await dedup(
+            kind,
+            params.min_score,
+            params.max_block_size,
+            params.workers or os.cpu_count() or 1,
+            params.chunk_size,
+            progress,
+        )
+    return {"candidates": saved}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Find duplicate persons and organizations for review")
+    parser.add_argument("--kind", choices=sorted(PARTY_KINDS), action="append", help="default: both")
+    parser.add_argument("--min-score", type=float, default=PARTY_DEDUP_MIN_SCORE)
+    parser.add_argument("--max-block-size", type=int, default=PARTY_DEDUP_MAX_BLOCK_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=5000, help="pairs per worker task")
+    args = parser.parse_args()
+    asyncio.run(run(args.kind or sorted(PARTY_KINDS), args.min_score, args.max_block_size, args.workers, args.chunk_size))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import time
+from typing import Optional
+from app.models.job import report_job_progress
+
+# Progress of a queued job, passed to its handler by app/jobs/worker.py:
+#   await progress(done, total, "personname: last id=1234")
+# Stored on the job row for GET /v1/jobs/{id}, at most every min_interval seconds (a handler may
+# report after every batch) and always for the final done == total.
+
+class JobProgress:
+    def __init__(self, job_id: int, min_interval: float = 1.0):
+        self.job_id = job_id
+        self.min_interval = min_interval
+        self._written = 0.0
+
+    async def __call__(self, done: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+        now = time.monotonic()
+        if now - self._written < self.min_interval and done != total:
+            return
+        self._written = now
+        await report_job_progress(self.job_id, {"done": done, "total": total, "message": message})
@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import logging
+from typing import Optional
+from app.config.cache import cache
+from app.config.database import database
+from app.config.entity_version import bump_version
+from app.models.search_key import search_keys
+from app.jobs.progress import JobProgress
+from app.schemas.job import SearchKeyBackfillParams
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fills personname / organization search keys (note_for_database/search_key.sql)
+# Run once after the migration, and again whenever app/models/search_key.py changes:
+#   docker compose exec backend python -m app.jobs.search_key_backfill
+#   docker compose exec backend python -m app.jobs.search_key_backfill --all
+# or queued: POST /v1/jobs/ {"kind": "search_key_backfill", "params": {"all": true}}
+
+async def backfill_person_names(batch_size: int, recompute: bool, progress: Optional[JobProgress] = None) -> int:
+    pending = "" if recompute else "AND name_key IS NULL AND name IS NOT NULL"
+    last_id = 0
+    total = 0
+    while True:
+        rows = await database.fetch_all(query=f"""
+            SELECT id, name FROM personname
+            WHERE id > :last_id {pending}
+            ORDER BY id
+            LIMIT :limit
+        """, values={"last_id": last_id, "limit": batch_size})
+        if not rows:
+            if total:
+                await bump_version("person")
+            return total
+        async with database.transaction():
+            await database.execute_many(query="""
+                UPDATE personname SET name_key = :name_key, name_phonetic = :name_phonetic
+                WHERE id = :id
+            """, values=[{"id": row["id"], **search_keys("name", row["name"])} for row in rows])
+        last_id = rows[-1]["id"]
+        total += len(rows)
+        logger.info(f"personname: {total} rows, last id={last_id}")
+        if progress:
+            await progress(total, message=f"personname: last id={last_id}")
+
+async def backfill_organizations(batch_size: int, recompute: bool, progress: Optional[JobProgress] = None) -> int:
+    pending = "" if recompute else "AND ((name_en_key IS NULL AND name_en IS NOT NULL) OR (name_th_key IS NULL AND name_th IS NOT NULL))"
+    last_id = 0
+    total = 0
+    while True:
+        rows = await database.fetch_all(query=f"""
+            SELECT id, name_en, name_th FROM organization
+            WHERE id > :last_id {pending}
+            ORDER BY id
+            LIMIT :limit
+        """, values={"last_id": last_id, "limit": batch_size})
+        if not rows:
+            if total:
+                await bump_version("organization")
+            return total
+        async with database.transaction():
+            await database.execute_many(query="""
+                UPDATE organization
+                SET name_en_key = :name_en_key, name_en_phonetic = :name_en_phonetic,
+                    name_th_key = :name_th_key, name_th_phonetic = :name_th_phonetic
+                WHERE id = :id
+            """, values=[
+                {"id": row["id"], **search_keys("name_en", row["name_en"]), **search_keys("name_th", row["name_th"])}
+                for row in rows
+            ])
+        last_id = rows[-1]["id"]
+        total += len(rows)
+        logger.info(f"organization: {total} rows, last id={last_id}")
+        if progress:
+            await progress(total, message=f"organization: last id={last_id}")
+
+async def run(batch_size: int, recompute: bool) -> None:
+    await database.connect()
+    await cache.connect()
+    try:
+        names = await backfill_person_names(batch_size, recompute)
+        organizations = await backfill_organizations(batch_size, recompute)
+        logger.info(f"Search keys written: personname={names}, organization={organizations}")
+    finally:
+        await cache.disconnect()
+        await database.disconnect()
+
+async def run_job(params: dict, progress: JobProgress) -> dict:
+    # Queue handler (app/jobs/worker.py); params: SearchKeyBackfillParams
+    params = SearchKeyBackfillParams.model_validate(params)
+    batch_size = params.batch_size
+    recompute = params.all
+    names = await backfill_person_names(batch_size, recompute, progress)
+    organizations = await backfill_organizations(batch_size, recompute, progress)
+    return {"personname": names, "organization": organizations}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fill personname / organization search key columns")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--all", action="store_true", help="recompute every row, not only rows without keys")
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size, args.all))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+from app.config.cache import cache
+from app.config.database import database
+from app.config.settings import (
+    JOB_POLL_INTERVAL_SECONDS, JOB_HEARTBEAT_SECONDS, JOB_LEASE_SECONDS, JOB_WORKER_CONCURRENCY
+)
+from app.models.job import JOB_KINDS, claim_job, heartbeat_job, complete_job, fail_job, requeue_stale_jobs
+from app.schemas.job import JobOut
+from app.jobs import analytics_export, communication_event_partition, csv_load, party_dedup, search_key_backfill
+from app.jobs.progress import JobProgress
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Worker for the job queue (note_for_database/job_queue.sql). Heavy work (dedup, backfills,
+# partition maintenance, later imports and exports) is enqueued by POST /v1/jobs/ and runs here,
+# in its own process with its own pool, so API latency does not depend on it.
+#   docker compose exec backend python -m app.jobs.worker
+#   docker compose exec backend python -m app.jobs.worker --concurrency 2
+#   docker compose exec backend python -m app.jobs.worker --once   (drain the due jobs and exit)
+# Several workers (containers) can run side by side: claims use FOR UPDATE SKIP LOCKED.
+#
+# Each handler is `async def run_job(params: dict, progress: JobProgress) -> dict`; the returned
+# dict becomes the job result. A failed attempt is retried while attempts are left (see fail_job).
+# While a job runs a heartbeat is written every JOB_HEARTBEAT_SECONDS; every poll also requeues
+# jobs of workers that stopped sending them for JOB_LEASE_SECONDS.
+#
+# SIGTERM / SIGINT: no new jobs are claimed, running ones finish. A worker killed before that
+# loses its jobs to the lease check, and they run again (handlers must be safe to re-run).
+
+JOB_HANDLERS = {
+    "analytics_export": analytics_export.run_job,
+    "communication_event_partition": communication_event_partition.run_job,
+    "csv_load": csv_load.run_job,
+    "party_dedup": party_dedup.run_job,
+    "search_key_backfill": search_key_backfill.run_job,
+}
+
+WORKER_NAME = f"{socket.gethostname()}:{os.getpid()}"
+
+async def _heartbeat(job_id: int) -> None:
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+        try:
+            await heartbeat_job(job_id)
+        except Exception as e:
+            logger.error(f"Heartbeat failed for job id={job_id}: {str(e)}")
+
+async def run_one(job: JobOut) -> None:
+    handler = JOB_HANDLERS.get(job.kind)
+    if handler is None:
+        await fail_job(job.id, WORKER_NAME, job.attempts, f"no handler for kind {job.kind!r}")
+        return
+    logger.info(f"Running job: id={job.id}, kind={job.kind}, attempt {job.attempts}/{job.max_attempts}")
+    heartbeat = asyncio.create_task(_heartbeat(job.id))
+    try:
+        result = await handler(job.params, JobProgress(job.id))
+    except Exception as e:
+        logger.exception(f"Job failed: id={job.id}, kind={job.kind}")
+        await fail_job(job.id, WORKER_NAME, job.attempts, f"{type(e).__name__}: {str(e)}")
+        return
+    finally:
+        heartbeat.cancel()
+    await complete_job(job.id, WORKER_NAME, job.attempts, result)
+
+async def work(stop: asyncio.Event, once: bool) -> None:
+    # One slot: claim, run, repeat; sleeps JOB_POLL_INTERVAL_SECONDS when nothing is due
+    while not stop.is_set():
+        try:
+            await requeue_stale_jobs(JOB_LEASE_SECONDS)
+            job = await claim_job(WORKER_NAME)
+        except Exception as e:
+            logger.error(f"Could not claim a job: {str(e)}")
+            job = None
+        if job is not None:
+            try:
+                await run_one(job)
+            except Exception as e:
+                # The outcome was not written; the lease check will run the job again
+                logger.error(f"Could not record the outcome of job id={job.id}: {str(e)}")
+            continue
+        if once:
+            return
+        try:
+            await asyncio.wait_for(stop.wait(), JOB_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+async def run(concurrency: int, once: bool) -> None:
+    missing = set(JOB_KINDS) - set(JOB_HANDLERS)
+    if missing:
+        logger.warning(f"Job kinds without a handler: {sorted(missing)}")
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+    await database.connect()
+    # model writes and imports bump entity versions (app/config/entity_version.py) in the shared cache
+    await cache.connect()
+    try:
+        logger.info(f"Job worker {WORKER_NAME} started with {concurrency} slots")
+        await asyncio.gather(*(work(stop, once) for _ in range(concurrency)))
+    finally:
+        await cache.disconnect()
+        await database.disconnect()
+        logger.info(f"Job worker {WORKER_NAME} stopped")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run queued jobs (POST /v1/jobs/)")
+    parser.add_argument("--concurrency", type=int, default=JOB_WORKER_CONCURRENCY, help="jobs run at the same time")
+    parser.add_argument("--once", action="store_true", help="run the jobs that are due, then exit")
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.once))
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,66 @@
-from dotenv import load_dotenv
+from app.config.startup import startup_report
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config.database import database
-from app.controllers.auth.auth import router as auth_router
-from app.controllers.citizenship import router as citizenship_router
-from app.controllers.classify_by_eeoc import router as classify_by_eeoc_router
-from app.controllers.classify_by_income import router as classify_by_income_router
-from app.controllers.classify_by_industry import router as classify_by_industry_router
-from app.controllers.classify_by_minority import router as classify_by_minority_router
-from app.controllers.classify_by_size import router as classify_by_size_router
-from app.controllers.corporation import router as corporation_router
-from app.controllers.country import router as country_router
-from app.controllers.employee_count_range import router as employee_count_range_router
-from app.controllers.ethnicity import router as ethnicity_router
-from app.controllers.family import router as family_router
-from app.controllers.gender_type import router as gender_type_router
-from app.controllers.government_agency import router as government_agency_router
-from app.controllers.income_range import router as income_range_router
-from app.controllers.industry_type import router as industry_type_router
-from app.controllers.informal_organization import router as informal_organization_router
-from app.controllers.legal_organization import router as legal_organization_router
-from app.controllers.marital_status import router as marital_status_router
-from app.controllers.marital_status_type import router as marital_status_type_router
-from app.controllers.minority_type import router as minority_type_router
-from app.controllers.other_informal_organization import router as other_informal_organization_router
-from app.controllers.party_type import router as party_type_router
-from app.controllers.passport import router as passport_router
-from app.controllers.person import router as person_router
-from app.controllers.person_name import router as person_name_router
-from app.controllers.person_name_type import router as person_name_type_router
-from app.controllers.physical_characteristic import router as physical_characteristic_router
-from app.controllers.physical_characteristic_type import router as physical_characteristic_type_router
-from app.controllers.team import router as team_router
-from app.controllers.users.user import router as user_router
-from app.controllers.role_type import router as role_type_router
-from app.controllers.party_relationship_type import router as party_relationship_type_router
-from app.controllers.party_relationship_status_type import router as party_relationship_status_type_router
-from app.controllers.priority_type import router as priority_type_router
-from app.controllers.communication_event_status_type import router as communication_event_status_type_router
-from app.controllers.contact_mechanism_type import router as contact_mechanism_type_router
-from app.controllers.communication_event_purpose_type import router as communication_event_purpose_type_router
-from app.controllers.party_role import router as party_role_router
-from app.controllers.party_relationship import router as party_relationship_router
-from app.controllers.communication_event import router as communication_event_router
-from app.controllers.communication_event_purpose import router as communication_event_purpose_router
+from app.config.cache import cache
+from app.config.compression import CompressionMiddleware
+from app.config.replica import ReadAfterMiddleware
+from app.config.settings import WARMUP_ENABLED
+from app.models.warmup import run_warm_up
 
-
-
-# โหลด .env ก่อน import อื่นๆ
-load_dotenv()
+# controller ทั้งหมด (ลำดับเดียวกับที่ include), import ผ่าน startup_report เพื่อวัดเวลาของแต่ละโมดูล
+ROUTER_MODULES = [
+    "app.controllers.auth.auth",
+    "app.controllers.health",
+    "app.controllers.cache",
+    "app.controllers.citizenship",
+    "app.controllers.classify_by_eeoc",
+    "app.controllers.classify_by_income",
+    "app.controllers.classify_by_industry",
+    "app.controllers.classify_by_minority",
+    "app.controllers.classify_by_size",
+    "app.controllers.corporation",
+    "app.controllers.country",
+    "app.controllers.employee_count_range",
+    "app.controllers.ethnicity",
+    "app.controllers.family",
+    "app.controllers.gender_type",
+    "app.controllers.government_agency",
+    "app.controllers.income_range",
+    "app.controllers.industry_type",
+    "app.controllers.informal_organization",
+    "app.controllers.legal_organization",
+    "app.controllers.marital_status",
+    "app.controllers.marital_status_type",
+    "app.controllers.minority_type",
+    "app.controllers.other_informal_organization",
+    "app.controllers.party",
+    "app.controllers.party_duplicate",
+    "app.controllers.party_type",
+    "app.controllers.passport",
+    "app.controllers.person",
+    "app.controllers.person_name",
+    "app.controllers.person_name_type",
+    "app.controllers.physical_characteristic",
+    "app.controllers.physical_characteristic_type",
+    "app.controllers.search",
+    "app.controllers.team",
+    "app.controllers.users.user",
+    "app.controllers.role_type",
+    "app.controllers.party_relationship_type",
+    "app.controllers.party_relationship_status_type",
+    "app.controllers.priority_type",
+    "app.controllers.communication_event_status_type",
+    "app.controllers.contact_mechanism_type",
+    "app.controllers.communication_event_purpose_type",
+    "app.controllers.party_role",
+    "app.controllers.party_relationship",
+    "app.controllers.communication_event",
+    "app.controllers.communication_event_purpose",
+    "app.controllers.job",
+]
 
 app = FastAPI()
 
@@ -62,57 +73,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# บีบอัด response (gzip/brotli) ที่ใหญ่กว่า COMPRESSION_MINIMUM_SIZE
+app.add_middleware(CompressionMiddleware)
+
+# read-your-writes เมื่อมี read replica: ส่ง/รับตำแหน่ง WAL หลังเขียนผ่าน X-Read-After หรือ cookie read_after
+app.add_middleware(ReadAfterMiddleware, database=database)
+
 # รวม routers
-app.include_router(auth_router)
-app.include_router(citizenship_router)
-app.include_router(classify_by_eeoc_router)
-app.include_router(classify_by_income_router)
-app.include_router(classify_by_industry_router)
-app.include_router(classify_by_minority_router)
-app.include_router(classify_by_size_router)
-app.include_router(corporation_router)
-app.include_router(country_router)
-app.include_router(employee_count_range_router)
-app.include_router(ethnicity_router)
-app.include_router(family_router)
-app.include_router(gender_type_router)
-app.include_router(government_agency_router)
-app.include_router(income_range_router)
-app.include_router(industry_type_router)
-app.include_router(informal_organization_router)
-app.include_router(legal_organization_router)
-app.include_router(marital_status_router)
-app.include_router(marital_status_type_router)
-app.include_router(minority_type_router)
-app.include_router(other_informal_organization_router)
-app.include_router(party_type_router)
-app.include_router(passport_router)
-app.include_router(person_router)
-app.include_router(person_name_router)
-app.include_router(person_name_type_router)
-app.include_router(physical_characteristic_router)
-app.include_router(physical_characteristic_type_router)
-app.include_router(team_router)
-app.include_router(user_router)
-app.include_router(role_type_router)
-app.include_router(party_relationship_type_router)
-app.include_router(party_relationship_status_type_router)
-app.include_router(priority_type_router)
-app.include_router(communication_event_status_type_router)
-app.include_router(contact_mechanism_type_router)
-app.include_router(communication_event_purpose_type_router)
-app.include_router(party_role_router)
-app.include_router(party_relationship_router)
-app.include_router(communication_event_router)
-app.include_router(communication_event_purpose_router)
+for router in startup_report.import_routers(ROUTER_MODULES):
+    app.include_router(router)
 
 @app.on_event("startup")
 async def startup():
-    await database.connect()
+    with startup_report.phase("database connect"):
+        await database.connect()
+    with startup_report.phase("cache connect"):
+        await cache.connect()
+    # warm-up ทำงานเบื้องหลัง, /v1/health/ready ตอบ 200 เมื่อเสร็จ
+    if WARMUP_ENABLED:
+        app.state.warmup_task = asyncio.create_task(run_warm_up())
+    else:
+        startup_report.warmup = "skipped"
+        startup_report.ready()
 
 @app.on_event("shutdown")
 async def shutdown():
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
     await database.disconnect()
+    await cache.disconnect()
 
 @app.get("/")
 async def root():
@@ -1,11 +1,13 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.citizenship import CitizenshipCreate, CitizenshipUpdate, CitizenshipOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("person")
 async def create_citizenship(citizenship: CitizenshipCreate) -> Optional[CitizenshipOut]:
     query = """
         SELECT id FROM citizenship 
@@ -28,14 +30,34 @@ async def create_citizenship(citizenship: CitizenshipCreate) -> Optional[Citizen
         RETURNING id, fromdate, thrudate, person_id, country_id
     """
     try:
-        result = await database.fetch_one(query=query, values={
-            "fromdate": citizenship.fromdate,
-            "thrudate": citizenship.thrudate,
-            "person_id": citizenship.person_id,
-            "country_id": citizenship.country_id
-        })
-        logger.info(f"Created citizenship: id={result['id']}, person_id={result['person_id']}")
-        return CitizenshipOut(**result)
+        async with database.transaction():
+            # One open row per citizenship (person, country): a new open row closes the current one
+            # A backdated row (older than the open one) goes in as closed history, ending where the open one starts
+            thrudate = citizenship.thrudate
+            if thrudate is None:
+                query_close = """
+                    WITH newer AS (
+                        SELECT fromdate FROM citizenship
+                        WHERE person_id = :person_id AND country_id = :country_id AND thrudate IS NULL AND fromdate > :fromdate
+                    ), closed AS (
+                        UPDATE citizenship SET thrudate = :fromdate
+                        WHERE person_id = :person_id AND country_id = :country_id AND thrudate IS NULL AND fromdate <= :fromdate
+                    )
+                    SELECT fromdate FROM newer
+                """
+                thrudate = await database.fetch_val(query_close, values={
+                    "fromdate": citizenship.fromdate,
+                    "person_id": citizenship.person_id,
+                    "country_id": citizenship.country_id
+                })
+            result = await database.fetch_one(query=query, values={
+                "fromdate": citizenship.fromdate,
+                "thrudate": thrudate,
+                "person_id": citizenship.person_id,
+                "country_id": citizenship.country_id
+            })
+            logger.info(f"Created citizenship: id={result['id']}, person_id={result['person_id']}")
+            return CitizenshipOut(**result)
     except Exception as e:
         logger.error(f"Error creating citizenship: {str(e)}")
         raise
@@ -61,6 +83,7 @@ async def get_all_citizenships() -> List[CitizenshipOut]:
     logger.info(f"Retrieved {len(results)} citizenships")
     return [CitizenshipOut(**result) for result in results]
 
+@bumps_version("person")
 async def update_citizenship(citizenship_id: int, citizenship: CitizenshipUpdate) -> Optional[CitizenshipOut]:
     if any([citizenship.fromdate, citizenship.thrudate, citizenship.person_id, citizenship.country_id]):
         query = """
@@ -81,6 +104,23 @@ async def update_citizenship(citizenship_id: int, citizenship: CitizenshipUpdate
         if existing:
             logger.warning(f"Citizenship already exists for person_id={citizenship.person_id}, country_id={citizenship.country_id}")
             return None
+        # The row stays or becomes open: another open row with the same key would break citizenship_open_uidx
+        query = """
+            SELECT o.id FROM citizenship c
+            JOIN citizenship o ON o.person_id = COALESCE(:person_id, c.person_id)
+                AND o.country_id = COALESCE(:country_id, c.country_id)
+                AND o.thrudate IS NULL AND o.id != c.id
+            WHERE c.id = :id AND COALESCE(:thrudate, c.thrudate) IS NULL
+        """
+        open_row = await database.fetch_one(query=query, values={
+            "person_id": citizenship.person_id,
+            "country_id": citizenship.country_id,
+            "thrudate": citizenship.thrudate,
+            "id": citizenship_id
+        })
+        if open_row:
+            logger.warning(f"Citizenship has another open row: id={open_row['id']}")
+            return None
 
     query = """
         UPDATE citizenship
@@ -108,6 +148,7 @@ async def update_citizenship(citizenship_id: int, citizenship: CitizenshipUpdate
         logger.error(f"Error updating citizenship: {str(e)}")
         raise
 
+@bumps_version("person")
 async def delete_citizenship(citizenship_id: int) -> bool:
     query = """
         SELECT id FROM passport WHERE citizenship_id = :id LIMIT 1
@@ -1,13 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.unit_of_work import UnitOfWork, unit_of_work
 import logging
 from app.schemas.classify_by_eeoc import ClassifyByEeocCreate, ClassifyByEeocUpdate, ClassifyByEeocOut, ClassifyByEeocByPersonIdOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def create_classify_by_eeoc(classify_by_eeoc: ClassifyByEeocCreate) -> Optional[ClassifyByEeocOut]:
-    async with database.transaction():
+async def create_classify_by_eeoc(classify_by_eeoc: ClassifyByEeocCreate, *, uow: Optional[UnitOfWork] = None) -> Optional[ClassifyByEeocOut]:
+    async with unit_of_work(uow) as uow:
         try:
             # 1. Insert into party_classification
             query_party_cl = """
@@ -15,7 +16,7 @@ async def create_classify_by_eeoc(classify_by_eeoc: ClassifyByEeocCreate) -> Opt
                 VALUES (:fromdate, :thrudate, :party_id, :party_type_id)
                 RETURNING id
             """
-            party_cl_result = await database.fetch_one(query=query_party_cl, values={
+            party_cl_result = await uow.fetch_one(query=query_party_cl, values={
                 "fromdate": classify_by_eeoc.fromdate,
                 "thrudate": classify_by_eeoc.thrudate,
                 "party_id": classify_by_eeoc.party_id,
@@ -28,7 +29,7 @@ async def create_classify_by_eeoc(classify_by_eeoc: ClassifyByEeocCreate) -> Opt
                 INSERT INTO person_classification (id)
                 VALUES (:id)
             """
-            await database.execute(query=query_person_cl, values={"id": new_id})
+            await uow.execute(query=query_person_cl, values={"id": new_id})
 
             # 3. Insert into classify_by_eeoc
             query_eeoc = """
@@ -36,7 +37,7 @@ async def create_classify_by_eeoc(classify_by_eeoc: ClassifyByEeocCreate) -> Opt
                 VALUES (:id, :ethnicity_id)
                 RETURNING id
             """
-            await database.execute(query=query_eeoc, values={
+            await uow.execute(query=query_eeoc, values={
                 "id": new_id,
                 "ethnicity_id": classify_by_eeoc.ethnicity_id
             })
@@ -51,7 +52,7 @@ async def create_classify_by_eeoc(classify_by_eeoc: ClassifyByEeocCreate) -> Opt
                 JOIN ethnicity e ON ce.ethnicity_id = e.id
                 WHERE ce.id = :id
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": new_id})
+            result = await uow.fetch_one(query=query_fetch, values={"id": new_id})
             logger.info(f"Created classify_by_eeoc: id={new_id}")
             return ClassifyByEeocOut(**result)
         except Exception as e:
@@ -104,8 +105,8 @@ async def get_classify_by_eeoc_by_person_id(person_id: int) -> List[ClassifyByEe
     logger.info(f"Retrieved {len(results)} classify_by_eeoc by person_id: {person_id}")
     return [ClassifyByEeocByPersonIdOut(**result) for result in results]
 
-async def update_classify_by_eeoc(classify_by_eeoc_id: int, classify_by_eeoc: ClassifyByEeocUpdate) -> Optional[ClassifyByEeocOut]:
-    async with database.transaction():
+async def update_classify_by_eeoc(classify_by_eeoc_id: int, classify_by_eeoc: ClassifyByEeocUpdate, *, uow: Optional[UnitOfWork] = None) -> Optional[ClassifyByEeocOut]:
+    async with unit_of_work(uow) as uow:
         try:
             # Update party_classification
             query_party_cl = """
@@ -116,7 +117,7 @@ async def update_classify_by_eeoc(classify_by_eeoc_id: int, classify_by_eeoc: Cl
                     party_type_id = COALESCE(:party_type_id, party_type_id)
                 WHERE id = :id
             """
-            await database.execute(query=query_party_cl, values={
+            await uow.execute(query=query_party_cl, values={
                 "fromdate": classify_by_eeoc.fromdate,
                 "thrudate": classify_by_eeoc.thrudate,
                 "party_id": classify_by_eeoc.party_id,
@@ -131,7 +132,7 @@ async def update_classify_by_eeoc(classify_by_eeoc_id: int, classify_by_eeoc: Cl
                 WHERE id = :id
                 RETURNING id
             """
-            result = await database.fetch_one(query=query_eeoc, values={
+            result = await uow.fetch_one(query=query_eeoc, values={
                 "ethnicity_id": classify_by_eeoc.ethnicity_id,
                 "id": classify_by_eeoc_id
             })
@@ -149,22 +150,22 @@ async def update_classify_by_eeoc(classify_by_eeoc_id: int, classify_by_eeoc: Cl
                 JOIN ethnicity e ON ce.ethnicity_id = e.id
                 WHERE ce.id = :id
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": classify_by_eeoc_id})
+            result = await uow.fetch_one(query=query_fetch, values={"id": classify_by_eeoc_id})
             logger.info(f"Updated classify_by_eeoc: id={classify_by_eeoc_id}")
             return ClassifyByEeocOut(**result)
         except Exception as e:
             logger.error(f"Error updating classify_by_eeoc: {str(e)}")
             raise
 
-async def delete_classify_by_eeoc(classify_by_eeoc_id: int) -> bool:
-    async with database.transaction():
+async def delete_classify_by_eeoc(classify_by_eeoc_id: int, *, uow: Optional[UnitOfWork] = None) -> bool:
+    async with unit_of_work(uow) as uow:
         try:
             # Delete from classify_by_eeoc
             query_eeoc = """
                 DELETE FROM classify_by_eeoc WHERE id = :id
                 RETURNING id
             """
-            eeoc_result = await database.fetch_one(query=query_eeoc, values={"id": classify_by_eeoc_id})
+            eeoc_result = await uow.fetch_one(query=query_eeoc, values={"id": classify_by_eeoc_id})
             if not eeoc_result:
                 logger.warning(f"Classify_by_eeoc not found for deletion: id={classify_by_eeoc_id}")
                 return False
@@ -173,13 +174,13 @@ async def delete_classify_by_eeoc(classify_by_eeoc_id: int) -> bool:
             query_person_cl = """
                 DELETE FROM person_classification WHERE id = :id
             """
-            await database.execute(query=query_person_cl, values={"id": classify_by_eeoc_id})
+            await uow.execute(query=query_person_cl, values={"id": classify_by_eeoc_id})
 
             # Delete from party_classification
             query_party_cl = """
                 DELETE FROM party_classification WHERE id = :id
             """
-            await database.execute(query=query_party_cl, values={"id": classify_by_eeoc_id})
+            await uow.execute(query=query_party_cl, values={"id": classify_by_eeoc_id})
 
             logger.info(f"Deleted classify_by_eeoc: id={classify_by_eeoc_id}")
             return True
@@ -1,18 +1,74 @@
-from typing import Optional, List
+from typing import Optional, List, Union
+from datetime import datetime
 from app.config.database import database
+from app.config.replica import replica_read
 import logging
 from app.schemas.communication_event import CommunicationEventCreate, CommunicationEventUpdate, CommunicationEventOut
+from app.models.projection import Projection
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ?include=purposes: purposes are aggregated per event in the same query instead of one request per event
+PURPOSES_JOIN = """LEFT JOIN LATERAL (
+            SELECT json_agg(json_build_object(
+                       'id', cep.id,
+                       'communication_event_id', cep.communication_event_id,
+                       'communication_event_datetime_start', cep.communication_event_datetime_start,
+                       'communication_event_purpose_type_id', cep.communication_event_purpose_type_id,
+                       'communication_event_note', ce.note,
+                       'communication_event_purpose_type_description', cept.description
+                   ) ORDER BY cep.id DESC) AS purposes
+            FROM communication_event_purpose cep
+            JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
+            WHERE cep.communication_event_id = ce.id
+              AND cep.communication_event_datetime_start = ce.datetime_start
+        ) cep_agg ON TRUE"""
+
+# Read queries; ?fields= selects a subset (rows come back as dicts). The type/status/relationship
+# columns are nullable, so the full response keeps their INNER JOINs (inner_joins) and never returns
+# a row CommunicationEventOut cannot hold.
+COMMUNICATION_EVENT_FIELDS = Projection(
+    "communication_event ce",
+    {
+        "id": "ce.id",
+        "datetime_start": "ce.datetime_start",
+        "datetime_end": "ce.datetime_end",
+        "note": "ce.note",
+        "contact_mechanism_type_id": "ce.contact_mechanism_type_id",
+        "communication_event_status_type_id": "ce.communication_event_status_type_id",
+        "party_relationship_id": "ce.party_relationship_id",
+        "contact_mechanism_type_description": ("cmt.description", "cmt"),
+        "communication_event_status_type_description": ("cest.description", "cest"),
+        "party_relationship_comment": ("pr.comment", "pr"),
+        "purposes": ("COALESCE(cep_agg.purposes, '[]'::json)", "cep_agg"),
+    },
+    joins={
+        "cmt": "LEFT JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id",
+        "cest": "LEFT JOIN communication_event_status_type cest ON ce.communication_event_status_type_id = cest.id",
+        "pr": "LEFT JOIN party_relationship pr ON ce.party_relationship_id = pr.id",
+        "cep_agg": PURPOSES_JOIN,
+    },
+    optional=("purposes",),
+    json_columns=("purposes",),
+    inner_joins=("cmt", "cest", "pr")
+)
+
+def communication_event_select(fields: Optional[List[str]] = None, include_purposes: bool = False) -> str:
+    return COMMUNICATION_EVENT_FIELDS.sql(fields, include=("purposes",) if include_purposes else ())
+
+def to_communication_event_out(result, fields: Optional[List[str]] = None) -> Union[CommunicationEventOut, dict]:
+    # asyncpg returns json columns as text
+    data = COMMUNICATION_EVENT_FIELDS.row(result)
+    return data if fields else CommunicationEventOut(**data)
+
 async def create_communication_event(communication_event: CommunicationEventCreate) -> Optional[CommunicationEventOut]:
     async with database.transaction():
         try:
             query = """
                 INSERT INTO communication_event (datetime_start, datetime_end, note, contact_mechanism_type_id, 
                                                communication_event_status_type_id, party_relationship_id)
-                VALUES (:datetime_start, :datetime_end, :note, :contact_mechanism_type_id, 
+                VALUES (COALESCE(:datetime_start, CURRENT_TIMESTAMP), :datetime_end, :note, :contact_mechanism_type_id, 
                         :communication_event_status_type_id, :party_relationship_id)
                 RETURNING id, datetime_start, datetime_end, note, contact_mechanism_type_id, 
                           communication_event_status_type_id, party_relationship_id
@@ -27,6 +83,7 @@ async def create_communication_event(communication_event: CommunicationEventCrea
             })
             new_id = result["id"]
 
+            # datetime_start is the partition key; filtering on it touches only one partition
             query_fetch = """
                 SELECT ce.id, ce.datetime_start, ce.datetime_end, ce.note, ce.contact_mechanism_type_id, 
                        ce.communication_event_status_type_id, ce.party_relationship_id,
@@ -37,26 +94,23 @@ async def create_communication_event(communication_event: CommunicationEventCrea
                 JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id
                 JOIN communication_event_status_type cest ON ce.communication_event_status_type_id = cest.id
                 JOIN party_relationship pr ON ce.party_relationship_id = pr.id
-                WHERE ce.id = :id
+                WHERE ce.id = :id AND ce.datetime_start = :datetime_start
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": new_id})
+            result = await database.fetch_one(query=query_fetch, values={"id": new_id, "datetime_start": result["datetime_start"]})
             logger.info(f"Created communication_event: id={new_id}")
             return CommunicationEventOut(**result)
         except Exception as e:
             logger.error(f"Error creating communication_event: {str(e)}")
             raise
 
-async def get_communication_event(communication_event_id: int) -> Optional[CommunicationEventOut]:
-    query = """
-        SELECT ce.id, ce.datetime_start, ce.datetime_end, ce.note, ce.contact_mechanism_type_id, 
-               ce.communication_event_status_type_id, ce.party_relationship_id,
-               cmt.description AS contact_mechanism_type_description,
-               cest.description AS communication_event_status_type_description,
-               pr.comment AS party_relationship_comment
-        FROM communication_event ce
-        JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id
-        JOIN communication_event_status_type cest ON ce.communication_event_status_type_id = cest.id
-        JOIN party_relationship pr ON ce.party_relationship_id = pr.id
+@replica_read
+async def get_communication_event(
+    communication_event_id: int,
+    include_purposes: bool = False,
+    fields: Optional[List[str]] = None
+) -> Optional[Union[CommunicationEventOut, dict]]:
+    query = f"""
+        {communication_event_select(fields, include_purposes)}
         WHERE ce.id = :id
     """
     result = await database.fetch_one(query=query, values={"id": communication_event_id})
@@ -64,42 +118,98 @@ async def get_communication_event(communication_event_id: int) -> Optional[Commu
         logger.warning(f"Communication_event not found: id={communication_event_id}")
         return None
     logger.info(f"Retrieved communication_event: id={result['id']}")
-    return CommunicationEventOut(**result)
+    return to_communication_event_out(result, fields)
 
-async def get_all_communication_events() -> List[CommunicationEventOut]:
-    query = """
-        SELECT ce.id, ce.datetime_start, ce.datetime_end, ce.note, ce.contact_mechanism_type_id, 
-               ce.communication_event_status_type_id, ce.party_relationship_id,
-               cmt.description AS contact_mechanism_type_description,
-               cest.description AS communication_event_status_type_description,
-               pr.comment AS party_relationship_comment
-        FROM communication_event ce
-        JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id
-        JOIN communication_event_status_type cest ON ce.communication_event_status_type_id = cest.id
-        JOIN party_relationship pr ON ce.party_relationship_id = pr.id
+@replica_read
+async def get_all_communication_events(include_purposes: bool = False, fields: Optional[List[str]] = None) -> List[Union[CommunicationEventOut, dict]]:
+    query = f"""
+        {communication_event_select(fields, include_purposes)}
         ORDER BY ce.id ASC
     """
     results = await database.fetch_all(query=query)
     logger.info(f"Retrieved {len(results)} communication_events")
-    return [CommunicationEventOut(**result) for result in results]
+    return [to_communication_event_out(result, fields) for result in results]
 
-async def get_communication_events_by_party_relationship_id(party_relationship_id: int) -> List[CommunicationEventOut]:
-    query = """
-        SELECT ce.id, ce.datetime_start, ce.datetime_end, ce.note, ce.contact_mechanism_type_id, 
-               ce.communication_event_status_type_id, ce.party_relationship_id,
-               cmt.description AS contact_mechanism_type_description,
-               cest.description AS communication_event_status_type_description,
-               pr.comment AS party_relationship_comment
-        FROM communication_event ce
-        JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id
-        JOIN communication_event_status_type cest ON ce.communication_event_status_type_id = cest.id
-        JOIN party_relationship pr ON ce.party_relationship_id = pr.id
-        WHERE ce.party_relationship_id = :party_relationship_id
+@replica_read
+async def get_communication_events_by_party_relationship_id(
+    party_relationship_id: int,
+    datetime_start: Optional[datetime] = None,
+    datetime_end: Optional[datetime] = None,
+    include_purposes: bool = False,
+    fields: Optional[List[str]] = None
+) -> List[Union[CommunicationEventOut, dict]]:
+    # Optional bounds on datetime_start let the planner skip months outside the window
+    conditions = ["ce.party_relationship_id = :party_relationship_id"]
+    values = {"party_relationship_id": party_relationship_id}
+    if datetime_start is not None:
+        conditions.append("ce.datetime_start >= :datetime_start")
+        values["datetime_start"] = datetime_start
+    if datetime_end is not None:
+        conditions.append("ce.datetime_start <= :datetime_end")
+        values["datetime_end"] = datetime_end
+
+    query = f"""
+        {communication_event_select(fields, include_purposes)}
+        WHERE {' AND '.join(conditions)}
         ORDER BY ce.datetime_start DESC, ce.id DESC
     """
-    results = await database.fetch_all(query=query, values={"party_relationship_id": party_relationship_id})
+    results = await database.fetch_all(query=query, values=values)
     logger.info(f"Retrieved {len(results)} communication_events for party_relationship_id={party_relationship_id}")
-    return [CommunicationEventOut(**result) for result in results]
+    return [to_communication_event_out(result, fields) for result in results]
+
+@replica_read
+async def get_communication_events_by_time_range(
+    datetime_start: datetime,
+    datetime_end: datetime,
+    communication_event_status_type_id: Optional[int] = None,
+    contact_mechanism_type_id: Optional[int] = None,
+    communication_event_purpose_type_id: Optional[int] = None,
+    after_datetime_start: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = 100,
+    include_purposes: bool = False,
+    fields: Optional[List[str]] = None
+) -> List[Union[CommunicationEventOut, dict]]:
+    # datetime_start is bounded on both sides so the (datetime_start, id) index serves both the range and the keyset order
+    conditions = [
+        "ce.datetime_start >= :datetime_start",
+        "ce.datetime_start <= :datetime_end",
+        "COALESCE(ce.datetime_end, ce.datetime_start) <= :datetime_end"
+    ]
+    values = {"datetime_start": datetime_start, "datetime_end": datetime_end, "limit": limit}
+
+    if communication_event_status_type_id is not None:
+        conditions.append("ce.communication_event_status_type_id = :communication_event_status_type_id")
+        values["communication_event_status_type_id"] = communication_event_status_type_id
+    if contact_mechanism_type_id is not None:
+        conditions.append("ce.contact_mechanism_type_id = :contact_mechanism_type_id")
+        values["contact_mechanism_type_id"] = contact_mechanism_type_id
+    if communication_event_purpose_type_id is not None:
+        conditions.append("""
+            EXISTS (
+                SELECT 1 FROM communication_event_purpose cep
+                WHERE cep.communication_event_id = ce.id
+                AND cep.communication_event_datetime_start = ce.datetime_start
+                AND cep.communication_event_purpose_type_id = :communication_event_purpose_type_id
+            )
+        """)
+        values["communication_event_purpose_type_id"] = communication_event_purpose_type_id
+
+    # Keyset pagination: continue after the last (datetime_start, id) of the previous page
+    if after_datetime_start is not None and after_id is not None:
+        conditions.append("(ce.datetime_start, ce.id) > (:after_datetime_start, :after_id)")
+        values["after_datetime_start"] = after_datetime_start
+        values["after_id"] = after_id
+
+    query = f"""
+        {communication_event_select(fields, include_purposes)}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY ce.datetime_start ASC, ce.id ASC
+        LIMIT :limit
+    """
+    results = await database.fetch_all(query=query, values=values)
+    logger.info(f"Retrieved {len(results)} communication_events between {datetime_start} and {datetime_end}")
+    return [to_communication_event_out(result, fields) for result in results]
 
 async def update_communication_event(communication_event_id: int, communication_event: CommunicationEventUpdate) -> Optional[CommunicationEventOut]:
     async with database.transaction():
@@ -139,9 +249,9 @@ async def update_communication_event(communication_event_id: int, communication_
                 JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id
                 JOIN communication_event_status_type cest ON ce.communication_event_status_type_id = cest.id
                 JOIN party_relationship pr ON ce.party_relationship_id = pr.id
-                WHERE ce.id = :id
+                WHERE ce.id = :id AND ce.datetime_start = :datetime_start
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": communication_event_id})
+            result = await database.fetch_one(query=query_fetch, values={"id": communication_event_id, "datetime_start": result["datetime_start"]})
             logger.info(f"Updated communication_event: id={communication_event_id}")
             return CommunicationEventOut(**result)
         except Exception as e:
@@ -164,4 +274,34 @@ async def delete_communication_event(communication_event_id: int) -> bool:
             return True
         except Exception as e:
             logger.error(f"Error deleting communication_event: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+async def create_communication_event_partitions(months_ahead: int) -> List[str]:
+    # Creates the monthly partitions of communication_event and communication_event_purpose
+    # from the current month up to months_ahead months later (existing months are skipped)
+    query = """
+        SELECT partition_name
+        FROM create_communication_event_partitions(CURRENT_DATE, :months_ahead) AS partition_name
+    """
+    results = await database.fetch_all(query=query, values={"months_ahead": months_ahead})
+    created = [result["partition_name"] for result in results]
+    logger.info(f"Created {len(created)} communication_event partitions: {created}")
+    return created
+
+async def detach_communication_event_partitions(retention_months: int) -> List[str]:
+    # Detaches months older than retention_months into the communication_event_archive schema
+    query = """
+        SELECT partition_name
+        FROM detach_communication_event_partitions(
+            (date_trunc('month', CURRENT_DATE) - make_interval(months => :retention_months))::date
+        ) AS partition_name
+    """
+    async with database.transaction():
+        try:
+            results = await database.fetch_all(query=query, values={"retention_months": retention_months})
+            detached = [result["partition_name"] for result in results]
+            logger.info(f"Detached {len(detached)} communication_event partitions: {detached}")
+            return detached
+        except Exception as e:
+            logger.error(f"Error detaching communication_event partitions: {str(e)}")
+            raise
@@ -1,4 +1,5 @@
 from typing import Optional, List
+from datetime import datetime
 from app.config.database import database
 import logging
 from app.schemas.communication_event_purpose import CommunicationEventPurposeCreate, CommunicationEventPurposeUpdate, CommunicationEventPurposeOut
@@ -9,27 +10,38 @@ logger = logging.getLogger(__name__)
 async def create_communication_event_purpose(communication_event_purpose: CommunicationEventPurposeCreate) -> Optional[CommunicationEventPurposeOut]:
     async with database.transaction():
         try:
+            # Copy the event's datetime_start so the purpose lands in the same monthly partition
             query = """
-                INSERT INTO communication_event_purpose (communication_event_id, communication_event_purpose_type_id)
-                VALUES (:communication_event_id, :communication_event_purpose_type_id)
-                RETURNING id, communication_event_id, communication_event_purpose_type_id
+                INSERT INTO communication_event_purpose (communication_event_id, communication_event_datetime_start, 
+                                                         communication_event_purpose_type_id)
+                SELECT ce.id, ce.datetime_start, :communication_event_purpose_type_id
+                FROM communication_event ce
+                WHERE ce.id = :communication_event_id
+                RETURNING id, communication_event_id, communication_event_datetime_start, communication_event_purpose_type_id
             """
             result = await database.fetch_one(query=query, values={
                 "communication_event_id": communication_event_purpose.communication_event_id,
                 "communication_event_purpose_type_id": communication_event_purpose.communication_event_purpose_type_id
             })
+            if not result:
+                logger.warning(f"Communication_event not found for communication_event_purpose: communication_event_id={communication_event_purpose.communication_event_id}")
+                return None
             new_id = result["id"]
 
             query_fetch = """
-                SELECT cep.id, cep.communication_event_id, cep.communication_event_purpose_type_id,
+                SELECT cep.id, cep.communication_event_id, cep.communication_event_datetime_start, cep.communication_event_purpose_type_id,
                        ce.note AS communication_event_note,
                        cept.description AS communication_event_purpose_type_description
                 FROM communication_event_purpose cep
                 JOIN communication_event ce ON cep.communication_event_id = ce.id
+                    AND cep.communication_event_datetime_start = ce.datetime_start
                 JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
-                WHERE cep.id = :id
+                WHERE cep.id = :id AND cep.communication_event_datetime_start = :communication_event_datetime_start
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": new_id})
+            result = await database.fetch_one(query=query_fetch, values={
+                "id": new_id,
+                "communication_event_datetime_start": result["communication_event_datetime_start"]
+            })
             logger.info(f"Created communication_event_purpose: id={new_id}")
             return CommunicationEventPurposeOut(**result)
         except Exception as e:
@@ -38,11 +50,12 @@ async def create_communication_event_purpose(communication_event_purpose: Commun
 
 async def get_communication_event_purpose(communication_event_purpose_id: int) -> Optional[CommunicationEventPurposeOut]:
     query = """
-        SELECT cep.id, cep.communication_event_id, cep.communication_event_purpose_type_id,
+        SELECT cep.id, cep.communication_event_id, cep.communication_event_datetime_start, cep.communication_event_purpose_type_id,
                ce.note AS communication_event_note,
                cept.description AS communication_event_purpose_type_description
         FROM communication_event_purpose cep
         JOIN communication_event ce ON cep.communication_event_id = ce.id
+            AND cep.communication_event_datetime_start = ce.datetime_start
         JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
         WHERE cep.id = :id
     """
@@ -55,11 +68,12 @@ async def get_communication_event_purpose(communication_event_purpose_id: int) -
 
 async def get_all_communication_event_purposes() -> List[CommunicationEventPurposeOut]:
     query = """
-        SELECT cep.id, cep.communication_event_id, cep.communication_event_purpose_type_id,
+        SELECT cep.id, cep.communication_event_id, cep.communication_event_datetime_start, cep.communication_event_purpose_type_id,
                ce.note AS communication_event_note,
                cept.description AS communication_event_purpose_type_description
         FROM communication_event_purpose cep
         JOIN communication_event ce ON cep.communication_event_id = ce.id
+            AND cep.communication_event_datetime_start = ce.datetime_start
         JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
         ORDER BY cep.id ASC
     """
@@ -69,11 +83,12 @@ async def get_all_communication_event_purposes() -> List[CommunicationEventPurpo
 
 async def get_communication_event_purposes_by_communication_event_id(communication_event_id: int) -> List[CommunicationEventPurposeOut]:
     query = """
-        SELECT cep.id, cep.communication_event_id, cep.communication_event_purpose_type_id,
+        SELECT cep.id, cep.communication_event_id, cep.communication_event_datetime_start, cep.communication_event_purpose_type_id,
                ce.note AS communication_event_note,
                cept.description AS communication_event_purpose_type_description
         FROM communication_event_purpose cep
         JOIN communication_event ce ON cep.communication_event_id = ce.id
+            AND cep.communication_event_datetime_start = ce.datetime_start
         JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
         WHERE cep.communication_event_id = :communication_event_id
         ORDER BY cep.id DESC
@@ -82,15 +97,58 @@ async def get_communication_event_purposes_by_communication_event_id(communicati
     logger.info(f"Retrieved {len(results)} communication_event_purposes for communication_event_id={communication_event_id}")
     return [CommunicationEventPurposeOut(**result) for result in results]
 
+async def get_communication_event_purposes_by_time_range(
+    datetime_start: datetime,
+    datetime_end: datetime,
+    communication_event_purpose_type_id: Optional[int] = None,
+    after_communication_event_datetime_start: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = 100
+) -> List[CommunicationEventPurposeOut]:
+    # Both sides are bounded on the partition key, so only the months in the window are scanned
+    # and the join to communication_event is done partition by partition
+    conditions = [
+        "cep.communication_event_datetime_start >= :datetime_start",
+        "cep.communication_event_datetime_start <= :datetime_end"
+    ]
+    values = {"datetime_start": datetime_start, "datetime_end": datetime_end, "limit": limit}
+    if communication_event_purpose_type_id is not None:
+        conditions.append("cep.communication_event_purpose_type_id = :communication_event_purpose_type_id")
+        values["communication_event_purpose_type_id"] = communication_event_purpose_type_id
+    if after_communication_event_datetime_start is not None and after_id is not None:
+        conditions.append("(cep.communication_event_datetime_start, cep.id) > (:after_communication_event_datetime_start, :after_id)")
+        values["after_communication_event_datetime_start"] = after_communication_event_datetime_start
+        values["after_id"] = after_id
+
+    query = f"""
+        SELECT cep.id, cep.communication_event_id, cep.communication_event_datetime_start, cep.communication_event_purpose_type_id,
+               ce.note AS communication_event_note,
+               cept.description AS communication_event_purpose_type_description
+        FROM communication_event_purpose cep
+        JOIN communication_event ce ON cep.communication_event_id = ce.id
+            AND cep.communication_event_datetime_start = ce.datetime_start
+        JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY cep.communication_event_datetime_start ASC, cep.id ASC
+        LIMIT :limit
+    """
+    results = await database.fetch_all(query=query, values=values)
+    logger.info(f"Retrieved {len(results)} communication_event_purposes between {datetime_start} and {datetime_end}")
+    return [CommunicationEventPurposeOut(**result) for result in results]
+
 async def update_communication_event_purpose(communication_event_purpose_id: int, communication_event_purpose: CommunicationEventPurposeUpdate) -> Optional[CommunicationEventPurposeOut]:
     async with database.transaction():
         try:
             query = """
                 UPDATE communication_event_purpose
                 SET communication_event_id = COALESCE(:communication_event_id, communication_event_id),
+                    communication_event_datetime_start = COALESCE(
+                        (SELECT datetime_start FROM communication_event WHERE id = :communication_event_id),
+                        communication_event_datetime_start
+                    ),
                     communication_event_purpose_type_id = COALESCE(:communication_event_purpose_type_id, communication_event_purpose_type_id)
                 WHERE id = :id
-                RETURNING id, communication_event_id, communication_event_purpose_type_id
+                RETURNING id, communication_event_id, communication_event_datetime_start, communication_event_purpose_type_id
             """
             result = await database.fetch_one(query=query, values={
                 "communication_event_id": communication_event_purpose.communication_event_id,
@@ -102,15 +160,19 @@ async def update_communication_event_purpose(communication_event_purpose_id: int
                 return None
 
             query_fetch = """
-                SELECT cep.id, cep.communication_event_id, cep.communication_event_purpose_type_id,
+                SELECT cep.id, cep.communication_event_id, cep.communication_event_datetime_start, cep.communication_event_purpose_type_id,
                        ce.note AS communication_event_note,
                        cept.description AS communication_event_purpose_type_description
                 FROM communication_event_purpose cep
                 JOIN communication_event ce ON cep.communication_event_id = ce.id
+                    AND cep.communication_event_datetime_start = ce.datetime_start
                 JOIN communication_event_purpose_type cept ON cep.communication_event_purpose_type_id = cept.id
-                WHERE cep.id = :id
+                WHERE cep.id = :id AND cep.communication_event_datetime_start = :communication_event_datetime_start
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": communication_event_purpose_id})
+            result = await database.fetch_one(query=query_fetch, values={
+                "id": communication_event_purpose_id,
+                "communication_event_datetime_start": result["communication_event_datetime_start"]
+            })
             logger.info(f"Updated communication_event_purpose: id={communication_event_purpose_id}")
             return CommunicationEventPurposeOut(**result)
         except Exception as e:
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.communication_event_status_type import CommunicationEventStatusTypeCreate, CommunicationEventStatusTypeUpdate, CommunicationEventStatusTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("communication_event_status_type")
 async def create_communication_event_status_type(communication_event_status_type: CommunicationEventStatusTypeCreate) -> Optional[CommunicationEventStatusTypeOut]:
     async with database.transaction():
         try:
@@ -21,6 +24,7 @@ async def create_communication_event_status_type(communication_event_status_type
             logger.error(f"Error creating communication_event_status_type: {str(e)}")
             raise
 
+@cached("communication_event_status_type")
 async def get_communication_event_status_type(communication_event_status_type_id: int) -> Optional[CommunicationEventStatusTypeOut]:
     query = """
         SELECT id, description
@@ -34,6 +38,7 @@ async def get_communication_event_status_type(communication_event_status_type_id
     logger.info(f"Retrieved communication_event_status_type: id={result['id']}")
     return CommunicationEventStatusTypeOut(**result)
 
+@cached("communication_event_status_type")
 async def get_all_communication_event_status_types() -> List[CommunicationEventStatusTypeOut]:
     query = """
         SELECT id, description
@@ -44,6 +49,7 @@ async def get_all_communication_event_status_types() -> List[CommunicationEventS
     logger.info(f"Retrieved {len(results)} communication_event_status_types")
     return [CommunicationEventStatusTypeOut(**result) for result in results]
 
+@bumps_version("communication_event_status_type")
 async def update_communication_event_status_type(communication_event_status_type_id: int, communication_event_status_type: CommunicationEventStatusTypeUpdate) -> Optional[CommunicationEventStatusTypeOut]:
     async with database.transaction():
         try:
@@ -66,6 +72,7 @@ async def update_communication_event_status_type(communication_event_status_type
             logger.error(f"Error updating communication_event_status_type: {str(e)}")
             raise
 
+@bumps_version("communication_event_status_type")
 async def delete_communication_event_status_type(communication_event_status_type_id: int) -> bool:
     async with database.transaction():
         try:
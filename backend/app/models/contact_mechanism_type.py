@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.contact_mechanism_type import ContactMechanismTypeCreate, ContactMechanismTypeUpdate, ContactMechanismTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("contact_mechanism_type")
 async def create_contact_mechanism_type(contact_mechanism_type: ContactMechanismTypeCreate) -> Optional[ContactMechanismTypeOut]:
     async with database.transaction():
         try:
@@ -21,6 +24,7 @@ async def create_contact_mechanism_type(contact_mechanism_type: ContactMechanism
             logger.error(f"Error creating contact_mechanism_type: {str(e)}")
             raise
 
+@cached("contact_mechanism_type")
 async def get_contact_mechanism_type(contact_mechanism_type_id: int) -> Optional[ContactMechanismTypeOut]:
     query = """
         SELECT id, description
@@ -34,6 +38,7 @@ async def get_contact_mechanism_type(contact_mechanism_type_id: int) -> Optional
     logger.info(f"Retrieved contact_mechanism_type: id={result['id']}")
     return ContactMechanismTypeOut(**result)
 
+@cached("contact_mechanism_type")
 async def get_all_contact_mechanism_types() -> List[ContactMechanismTypeOut]:
     query = """
         SELECT id, description
@@ -44,6 +49,7 @@ async def get_all_contact_mechanism_types() -> List[ContactMechanismTypeOut]:
     logger.info(f"Retrieved {len(results)} contact_mechanism_types")
     return [ContactMechanismTypeOut(**result) for result in results]
 
+@bumps_version("contact_mechanism_type")
 async def update_contact_mechanism_type(contact_mechanism_type_id: int, contact_mechanism_type: ContactMechanismTypeUpdate) -> Optional[ContactMechanismTypeOut]:
     async with database.transaction():
         try:
@@ -66,6 +72,7 @@ async def update_contact_mechanism_type(contact_mechanism_type_id: int, contact_
             logger.error(f"Error updating contact_mechanism_type: {str(e)}")
             raise
 
+@bumps_version("contact_mechanism_type")
 async def delete_contact_mechanism_type(contact_mechanism_type_id: int) -> bool:
     async with database.transaction():
         try:
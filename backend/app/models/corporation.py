@@ -1,13 +1,18 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.unit_of_work import UnitOfWork, unit_of_work
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.corporation import CorporationCreate, CorporationUpdate, CorporationOut
+from app.models.search_key import search_keys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def create_corporation(corporation: CorporationCreate) -> Optional[CorporationOut]:
-    async with database.transaction():
+@bumps_version("organization")
+async def create_corporation(corporation: CorporationCreate, *, uow: Optional[UnitOfWork] = None) -> Optional[CorporationOut]:
+    async with unit_of_work(uow) as uow:
         try:
             # 1. Insert into party
             query_party = """
@@ -15,19 +20,21 @@ async def create_corporation(corporation: CorporationCreate) -> Optional[Corpora
                 VALUES (DEFAULT)
                 RETURNING id
             """
-            party_result = await database.fetch_one(query=query_party)
+            party_result = await uow.fetch_one(query=query_party)
             party_id = party_result["id"]
 
             # 2. Insert into organization
             query_organization = """
-                INSERT INTO organization (id, name_en, name_th)
-                VALUES (:id, :name_en, :name_th)
+                INSERT INTO organization (id, name_en, name_th, name_en_key, name_en_phonetic, name_th_key, name_th_phonetic)
+                VALUES (:id, :name_en, :name_th, :name_en_key, :name_en_phonetic, :name_th_key, :name_th_phonetic)
                 RETURNING id
             """
-            await database.fetch_one(query=query_organization, values={
+            await uow.fetch_one(query=query_organization, values={
                 "id": party_id,
                 "name_en": corporation.name_en,
-                "name_th": corporation.name_th
+                "name_th": corporation.name_th,
+                **search_keys("name_en", corporation.name_en),
+                **search_keys("name_th", corporation.name_th)
             })
 
             # 3. Insert into legal_organization
@@ -36,7 +43,7 @@ async def create_corporation(corporation: CorporationCreate) -> Optional[Corpora
                 VALUES (:id, :federal_tax_id_number)
                 RETURNING id
             """
-            await database.fetch_one(query=query_legal, values={
+            await uow.fetch_one(query=query_legal, values={
                 "id": party_id,
                 "federal_tax_id_number": corporation.federal_tax_id_number
             })
@@ -47,7 +54,7 @@ async def create_corporation(corporation: CorporationCreate) -> Optional[Corpora
                 VALUES (:id)
                 RETURNING id
             """
-            result = await database.fetch_one(query=query_corporation, values={"id": party_id})
+            result = await uow.fetch_one(query=query_corporation, values={"id": party_id})
             logger.info(f"สร้าง corporation: id={result['id']}")
             return CorporationOut(
                 id=result['id'],
@@ -59,6 +66,7 @@ async def create_corporation(corporation: CorporationCreate) -> Optional[Corpora
             logger.error(f"ข้อผิดพลาดในการสร้าง corporation: {str(e)}")
             raise
 
+@cached("organization")
 async def get_corporation(corporation_id: int) -> Optional[CorporationOut]:
     query = """
         SELECT c.id, o.name_en, o.name_th, lo.federal_tax_id_number
@@ -75,6 +83,7 @@ async def get_corporation(corporation_id: int) -> Optional[CorporationOut]:
     logger.info(f"ดึงข้อมูล corporation: id={result['id']}")
     return CorporationOut(**result)
 
+@cached("organization")
 async def get_all_corporations() -> List[CorporationOut]:
     query = """
         SELECT c.id, o.name_en, o.name_th, lo.federal_tax_id_number
@@ -88,20 +97,27 @@ async def get_all_corporations() -> List[CorporationOut]:
     logger.info(f"ดึงข้อมูล {len(results)} corporations")
     return [CorporationOut(**result) for result in results]
 
-async def update_corporation(corporation_id: int, corporation: CorporationUpdate) -> Optional[CorporationOut]:
-    async with database.transaction():
+@bumps_version("organization")
+async def update_corporation(corporation_id: int, corporation: CorporationUpdate, *, uow: Optional[UnitOfWork] = None) -> Optional[CorporationOut]:
+    async with unit_of_work(uow) as uow:
         try:
             # Update organization
             query_organization = """
                 UPDATE organization
                 SET name_en = COALESCE(:name_en, name_en),
-                    name_th = COALESCE(:name_th, name_th)
+                    name_th = COALESCE(:name_th, name_th),
+                    name_en_key = COALESCE(:name_en_key, name_en_key),
+                    name_en_phonetic = COALESCE(:name_en_phonetic, name_en_phonetic),
+                    name_th_key = COALESCE(:name_th_key, name_th_key),
+                    name_th_phonetic = COALESCE(:name_th_phonetic, name_th_phonetic)
                 WHERE id = :id
                 RETURNING id
             """
-            org_result = await database.fetch_one(query=query_organization, values={
+            org_result = await uow.fetch_one(query=query_organization, values={
                 "name_en": corporation.name_en,
                 "name_th": corporation.name_th,
+                **search_keys("name_en", corporation.name_en),
+                **search_keys("name_th", corporation.name_th),
                 "id": corporation_id
             })
             if not org_result:
@@ -115,7 +131,7 @@ async def update_corporation(corporation_id: int, corporation: CorporationUpdate
                 WHERE id = :id
                 RETURNING id, federal_tax_id_number
             """
-            legal_result = await database.fetch_one(query=query_legal, values={
+            legal_result = await uow.fetch_one(query=query_legal, values={
                 "federal_tax_id_number": corporation.federal_tax_id_number,
                 "id": corporation_id
             })
@@ -128,22 +144,23 @@ async def update_corporation(corporation_id: int, corporation: CorporationUpdate
                 JOIN organization o ON lo.id = o.id
                 WHERE c.id = :id
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": corporation_id})
+            result = await uow.fetch_one(query=query_fetch, values={"id": corporation_id})
             logger.info(f"อัปเดต corporation: id={result['id']}")
             return CorporationOut(**result)
         except Exception as e:
             logger.error(f"ข้อผิดพลาดในการอัปเดต corporation: {str(e)}")
             raise
 
-async def delete_corporation(corporation_id: int) -> bool:
-    async with database.transaction():
+@bumps_version("organization")
+async def delete_corporation(corporation_id: int, *, uow: Optional[UnitOfWork] = None) -> bool:
+    async with unit_of_work(uow) as uow:
         try:
             # Delete from corporation
             query_corporation = """
                 DELETE FROM corporation WHERE id = :id
                 RETURNING id
             """
-            corporation_result = await database.fetch_one(query=query_corporation, values={"id": corporation_id})
+            corporation_result = await uow.fetch_one(query=query_corporation, values={"id": corporation_id})
             if not corporation_result:
                 logger.warning(f"ไม่พบ corporation สำหรับลบ: id={corporation_id}")
                 return False
@@ -153,21 +170,21 @@ async def delete_corporation(corporation_id: int) -> bool:
                 DELETE FROM legal_organization WHERE id = :id
                 RETURNING id
             """
-            await database.fetch_one(query=query_legal, values={"id": corporation_id})
+            await uow.fetch_one(query=query_legal, values={"id": corporation_id})
 
             # Delete from organization
             query_organization = """
                 DELETE FROM organization WHERE id = :id
                 RETURNING id
             """
-            await database.fetch_one(query=query_organization, values={"id": corporation_id})
+            await uow.fetch_one(query=query_organization, values={"id": corporation_id})
 
             # Delete from party
             query_party = """
                 DELETE FROM party WHERE id = :id
                 RETURNING id
             """
-            await database.fetch_one(query=query_party, values={"id": corporation_id})
+            await uow.fetch_one(query=query_party, values={"id": corporation_id})
 
             logger.info(f"ลบ corporation: id={corporation_id}")
             return True
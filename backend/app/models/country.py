@@ -1,11 +1,18 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.compression import compress
+from app.config.fast_json import record_encoder
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.country import CountryCreate, CountryUpdate, CountryOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+encode_countries = record_encoder(CountryOut)
+
+@bumps_version("country")
 async def create_country(country: CountryCreate) -> Optional[CountryOut]:
     query = """
         SELECT id, isocode, name_en, name_th FROM country WHERE isocode = :isocode
@@ -28,6 +35,7 @@ async def create_country(country: CountryCreate) -> Optional[CountryOut]:
         logger.error(f"Error creating country: {str(e)}")
         raise
 
+@cached("country")
 async def get_country(country_id: int) -> Optional[CountryOut]:
     query = """
         SELECT id, isocode, name_en, name_th FROM country WHERE id = :id
@@ -39,6 +47,7 @@ async def get_country(country_id: int) -> Optional[CountryOut]:
     logger.info(f"Retrieved country: id={result['id']}, isocode={result['isocode']}")
     return CountryOut(**result)
 
+@cached("country")
 async def get_all_countries() -> List[CountryOut]:
     query = """
         SELECT id, isocode, name_en, name_th FROM country
@@ -47,6 +56,17 @@ async def get_all_countries() -> List[CountryOut]:
     logger.info(f"Retrieved {len(results)} countries")
     return [CountryOut(**result) for result in results]
 
+@cached("country")
+async def get_all_countries_body(encoding: Optional[str] = None) -> bytes:
+    # GET /v1/country/ response as JSON bytes, compressed once per encoding and version
+    query = """
+        SELECT id, isocode, name_en, name_th FROM country
+    """
+    results = await database.fetch_all(query=query)
+    logger.info(f"Retrieved {len(results)} countries, encoding={encoding}")
+    return compress(encode_countries(results), encoding)
+
+@bumps_version("country")
 async def update_country(country_id: int, country: CountryUpdate) -> Optional[CountryOut]:
     if country.isocode:
         query = """
@@ -76,6 +96,7 @@ async def update_country(country_id: int, country: CountryUpdate) -> Optional[Co
         logger.error(f"Error updating country: {str(e)}")
         raise
 
+@bumps_version("country")
 async def delete_country(country_id: int) -> bool:
     query = """
         DELETE FROM country WHERE id = :id
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.employee_count_range import EmployeeCountRangeCreate, EmployeeCountRangeUpdate, EmployeeCountRangeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("employee_count_range")
 async def create_employee_count_range(employee_count_range: EmployeeCountRangeCreate) -> Optional[EmployeeCountRangeOut]:
     query = """
         SELECT id, description FROM employee_count_range WHERE description = :description
@@ -28,6 +31,7 @@ async def create_employee_count_range(employee_count_range: EmployeeCountRangeCr
         logger.error(f"Error creating employee count range: {str(e)}")
         raise
 
+@cached("employee_count_range")
 async def get_employee_count_range(employee_count_range_id: int) -> Optional[EmployeeCountRangeOut]:
     query = """
         SELECT id, description FROM employee_count_range WHERE id = :id
@@ -39,6 +43,7 @@ async def get_employee_count_range(employee_count_range_id: int) -> Optional[Emp
     logger.info(f"Retrieved employee count range: id={result['id']}, description={result['description']}")
     return EmployeeCountRangeOut(**result)
 
+@cached("employee_count_range")
 async def get_all_employee_count_ranges() -> List[EmployeeCountRangeOut]:
     query = """
         SELECT id, description FROM employee_count_range
@@ -47,6 +52,7 @@ async def get_all_employee_count_ranges() -> List[EmployeeCountRangeOut]:
     logger.info(f"Retrieved {len(results)} employee count ranges")
     return [EmployeeCountRangeOut(**result) for result in results]
 
+@bumps_version("employee_count_range")
 async def update_employee_count_range(employee_count_range_id: int, employee_count_range: EmployeeCountRangeUpdate) -> Optional[EmployeeCountRangeOut]:
     if employee_count_range.description:
         query = """
@@ -74,6 +80,7 @@ async def update_employee_count_range(employee_count_range_id: int, employee_cou
         logger.error(f"Error updating employee count range: {str(e)}")
         raise
 
+@bumps_version("employee_count_range")
 async def delete_employee_count_range(employee_count_range_id: int) -> bool:
     query = """
         DELETE FROM employee_count_range WHERE id = :id
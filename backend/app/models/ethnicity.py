@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.ethnicity import EthnicityCreate, EthnicityUpdate, EthnicityOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("ethnicity")
 async def create_ethnicity(ethnicity: EthnicityCreate) -> Optional[EthnicityOut]:
     query = """
         SELECT id, name_en, name_th FROM ethnicity WHERE name_en = :name_en
@@ -28,6 +31,7 @@ async def create_ethnicity(ethnicity: EthnicityCreate) -> Optional[EthnicityOut]
         logger.error(f"Error creating ethnicity: {str(e)}")
         raise
 
+@cached("ethnicity")
 async def get_ethnicity(ethnicity_id: int) -> Optional[EthnicityOut]:
     query = """
         SELECT id, name_en, name_th FROM ethnicity WHERE id = :id
@@ -39,6 +43,7 @@ async def get_ethnicity(ethnicity_id: int) -> Optional[EthnicityOut]:
     logger.info(f"Retrieved ethnicity: id={result['id']}, name_en={result['name_en']}")
     return EthnicityOut(**result)
 
+@cached("ethnicity")
 async def get_all_ethnicities() -> List[EthnicityOut]:
     query = """
         SELECT id, name_en, name_th FROM ethnicity
@@ -47,6 +52,7 @@ async def get_all_ethnicities() -> List[EthnicityOut]:
     logger.info(f"Retrieved {len(results)} ethnicities")
     return [EthnicityOut(**result) for result in results]
 
+@bumps_version("ethnicity")
 async def update_ethnicity(ethnicity_id: int, ethnicity: EthnicityUpdate) -> Optional[EthnicityOut]:
     if ethnicity.name_en:
         query = """
@@ -75,6 +81,7 @@ async def update_ethnicity(ethnicity_id: int, ethnicity: EthnicityUpdate) -> Opt
         logger.error(f"Error updating ethnicity: {str(e)}")
         raise
 
+@bumps_version("ethnicity")
 async def delete_ethnicity(ethnicity_id: int) -> bool:
     query = """
         DELETE FROM ethnicity WHERE id = :id
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.gender_type import GenderTypeCreate, GenderTypeUpdate, GenderTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("gender_type")
 async def create_gender_type(gender_type: GenderTypeCreate) -> Optional[GenderTypeOut]:
     query = """
         SELECT id, description FROM gender_type WHERE description = :description
@@ -28,6 +31,7 @@ async def create_gender_type(gender_type: GenderTypeCreate) -> Optional[GenderTy
         logger.error(f"ข้อผิดพลาดในการสร้างประเภทเพศ: {str(e)}")
         raise
 
+@cached("gender_type")
 async def get_gender_type(gender_type_id: int) -> Optional[GenderTypeOut]:
     query = """
         SELECT id, description FROM gender_type WHERE id = :id
@@ -39,6 +43,7 @@ async def get_gender_type(gender_type_id: int) -> Optional[GenderTypeOut]:
     logger.info(f"ดึงข้อมูลประเภทเพศ: id={result['id']}, description={result['description']}")
     return GenderTypeOut(**result)
 
+@cached("gender_type")
 async def get_all_gender_types() -> List[GenderTypeOut]:
     query = """
         SELECT id, description FROM gender_type ORDER BY id ASC
@@ -47,6 +52,7 @@ async def get_all_gender_types() -> List[GenderTypeOut]:
     logger.info(f"ดึงข้อมูล {len(results)} ประเภทเพศ")
     return [GenderTypeOut(**result) for result in results]
 
+@bumps_version("gender_type")
 async def update_gender_type(gender_type_id: int, gender_type: GenderTypeUpdate) -> Optional[GenderTypeOut]:
     if gender_type.description:
         query = """
@@ -74,6 +80,7 @@ async def update_gender_type(gender_type_id: int, gender_type: GenderTypeUpdate)
         logger.error(f"ข้อผิดพลาดในการอัปเดตประเภทเพศ: {str(e)}")
         raise
 
+@bumps_version("gender_type")
 async def delete_gender_type(gender_type_id: int) -> bool:
     # ตรวจสอบว่า gender_type_id ถูกอ้างอิงในตาราง person หรือไม่
     query_check = """
@@ -1,11 +1,15 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.government_agency import GovernmentAgencyCreate, GovernmentAgencyUpdate, GovernmentAgencyOut
+from app.models.search_key import search_keys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("organization")
 async def create_government_agency(government_agency: GovernmentAgencyCreate) -> Optional[GovernmentAgencyOut]:
     async with database.transaction():
         try:
@@ -20,14 +24,16 @@ async def create_government_agency(government_agency: GovernmentAgencyCreate) ->
 
             # 2. Insert into organization
             query_organization = """
-                INSERT INTO organization (id, name_en, name_th)
-                VALUES (:id, :name_en, :name_th)
+                INSERT INTO organization (id, name_en, name_th, name_en_key, name_en_phonetic, name_th_key, name_th_phonetic)
+                VALUES (:id, :name_en, :name_th, :name_en_key, :name_en_phonetic, :name_th_key, :name_th_phonetic)
                 RETURNING id
             """
             await database.fetch_one(query=query_organization, values={
                 "id": party_id,
                 "name_en": government_agency.name_en,
-                "name_th": government_agency.name_th
+                "name_th": government_agency.name_th,
+                **search_keys("name_en", government_agency.name_en),
+                **search_keys("name_th", government_agency.name_th)
             })
 
             # 3. Insert into legal_organization
@@ -59,6 +65,7 @@ async def create_government_agency(government_agency: GovernmentAgencyCreate) ->
             logger.error(f"ข้อผิดพลาดในการสร้าง government agency: {str(e)}")
             raise
 
+@cached("organization")
 async def get_government_agency(government_agency_id: int) -> Optional[GovernmentAgencyOut]:
     query = """
         SELECT ga.id, o.name_en, o.name_th, lo.federal_tax_id_number
@@ -75,6 +82,7 @@ async def get_government_agency(government_agency_id: int) -> Optional[Governmen
     logger.info(f"ดึงข้อมูล government agency: id={result['id']}")
     return GovernmentAgencyOut(**result)
 
+@cached("organization")
 async def get_all_government_agencies() -> List[GovernmentAgencyOut]:
     query = """
         SELECT ga.id, o.name_en, o.name_th, lo.federal_tax_id_number
@@ -88,6 +96,7 @@ async def get_all_government_agencies() -> List[GovernmentAgencyOut]:
     logger.info(f"ดึงข้อมูล {len(results)} government agencies")
     return [GovernmentAgencyOut(**result) for result in results]
 
+@bumps_version("organization")
 async def update_government_agency(government_agency_id: int, government_agency: GovernmentAgencyUpdate) -> Optional[GovernmentAgencyOut]:
     async with database.transaction():
         try:
@@ -95,13 +104,19 @@ async def update_government_agency(government_agency_id: int, government_agency:
             query_organization = """
                 UPDATE organization
                 SET name_en = COALESCE(:name_en, name_en),
-                    name_th = COALESCE(:name_th, name_th)
+                    name_th = COALESCE(:name_th, name_th),
+                    name_en_key = COALESCE(:name_en_key, name_en_key),
+                    name_en_phonetic = COALESCE(:name_en_phonetic, name_en_phonetic),
+                    name_th_key = COALESCE(:name_th_key, name_th_key),
+                    name_th_phonetic = COALESCE(:name_th_phonetic, name_th_phonetic)
                 WHERE id = :id
                 RETURNING id
             """
             org_result = await database.fetch_one(query=query_organization, values={
                 "name_en": government_agency.name_en,
                 "name_th": government_agency.name_th,
+                **search_keys("name_en", government_agency.name_en),
+                **search_keys("name_th", government_agency.name_th),
                 "id": government_agency_id
             })
             if not org_result:
@@ -135,6 +150,7 @@ async def update_government_agency(government_agency_id: int, government_agency:
             logger.error(f"ข้อผิดพลาดในการอัปเดต government agency: {str(e)}")
             raise
 
+@bumps_version("organization")
 async def delete_government_agency(government_agency_id: int) -> bool:
     async with database.transaction():
         try:
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.income_range import IncomeRangeCreate, IncomeRangeUpdate, IncomeRangeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("income_range")
 async def create_income_range(income_range: IncomeRangeCreate) -> Optional[IncomeRangeOut]:
     query = """
         SELECT id, description FROM income_range WHERE description = :description
@@ -28,6 +31,7 @@ async def create_income_range(income_range: IncomeRangeCreate) -> Optional[Incom
         logger.error(f"Error creating income range: {str(e)}")
         raise
 
+@cached("income_range")
 async def get_income_range(income_range_id: int) -> Optional[IncomeRangeOut]:
     query = """
         SELECT id, description FROM income_range WHERE id = :id
@@ -39,6 +43,7 @@ async def get_income_range(income_range_id: int) -> Optional[IncomeRangeOut]:
     logger.info(f"Retrieved income range: id={result['id']}, description={result['description']}")
     return IncomeRangeOut(**result)
 
+@cached("income_range")
 async def get_all_income_ranges() -> List[IncomeRangeOut]:
     query = """
         SELECT id, description FROM income_range
@@ -47,6 +52,7 @@ async def get_all_income_ranges() -> List[IncomeRangeOut]:
     logger.info(f"Retrieved {len(results)} income ranges")
     return [IncomeRangeOut(**result) for result in results]
 
+@bumps_version("income_range")
 async def update_income_range(income_range_id: int, income_range: IncomeRangeUpdate) -> Optional[IncomeRangeOut]:
     if income_range.description:
         query = """
@@ -74,6 +80,7 @@ async def update_income_range(income_range_id: int, income_range: IncomeRangeUpd
         logger.error(f"Error updating income range: {str(e)}")
         raise
 
+@bumps_version("income_range")
 async def delete_income_range(income_range_id: int) -> bool:
     query = """
         DELETE FROM income_range WHERE id = :id
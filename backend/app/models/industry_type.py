@@ -1,11 +1,18 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.compression import compress
+from app.config.fast_json import record_encoder
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.industry_type import IndustryTypeCreate, IndustryTypeUpdate, IndustryTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+encode_industry_types = record_encoder(IndustryTypeOut)
+
+@bumps_version("industry_type")
 async def create_industry_type(industry_type: IndustryTypeCreate) -> Optional[IndustryTypeOut]:
     query = """
         SELECT id, naics_code, description FROM industry_type WHERE naics_code = :naics_code
@@ -28,6 +35,7 @@ async def create_industry_type(industry_type: IndustryTypeCreate) -> Optional[In
         logger.error(f"Error creating industry type: {str(e)}")
         raise
 
+@cached("industry_type")
 async def get_industry_type(industry_type_id: int) -> Optional[IndustryTypeOut]:
     query = """
         SELECT id, naics_code, description FROM industry_type WHERE id = :id
@@ -39,6 +47,7 @@ async def get_industry_type(industry_type_id: int) -> Optional[IndustryTypeOut]:
     logger.info(f"Retrieved industry type: id={result['id']}, naics_code={result['naics_code']}")
     return IndustryTypeOut(**result)
 
+@cached("industry_type")
 async def get_all_industry_types() -> List[IndustryTypeOut]:
     query = """
         SELECT id, naics_code, description FROM industry_type
@@ -47,6 +56,17 @@ async def get_all_industry_types() -> List[IndustryTypeOut]:
     logger.info(f"Retrieved {len(results)} industry types")
     return [IndustryTypeOut(**result) for result in results]
 
+@cached("industry_type")
+async def get_all_industry_types_body(encoding: Optional[str] = None) -> bytes:
+    # GET /v1/industrytype/ response as JSON bytes, compressed once per encoding and version
+    query = """
+        SELECT id, naics_code, description FROM industry_type
+    """
+    results = await database.fetch_all(query=query)
+    logger.info(f"Retrieved {len(results)} industry types, encoding={encoding}")
+    return compress(encode_industry_types(results), encoding)
+
+@bumps_version("industry_type")
 async def update_industry_type(industry_type_id: int, industry_type: IndustryTypeUpdate) -> Optional[IndustryTypeOut]:
     if industry_type.naics_code:
         query = """
@@ -75,6 +95,7 @@ async def update_industry_type(industry_type_id: int, industry_type: IndustryTyp
         logger.error(f"Error updating industry type: {str(e)}")
         raise
 
+@bumps_version("industry_type")
 async def delete_industry_type(industry_type_id: int) -> bool:
     query = """
         DELETE FROM industry_type WHERE id = :id
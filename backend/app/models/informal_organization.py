@@ -1,11 +1,15 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.informal_organization import InformalOrganizationCreate, InformalOrganizationUpdate, InformalOrganizationOut
+from app.models.search_key import search_keys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("organization")
 async def create_informal_organization(informal_organization: InformalOrganizationCreate) -> Optional[InformalOrganizationOut]:
     async with database.transaction():
         try:
@@ -20,14 +24,16 @@ async def create_informal_organization(informal_organization: InformalOrganizati
 
             # 2. Insert into organization
             query_organization = """
-                INSERT INTO organization (id, name_en, name_th)
-                VALUES (:id, :name_en, :name_th)
+                INSERT INTO organization (id, name_en, name_th, name_en_key, name_en_phonetic, name_th_key, name_th_phonetic)
+                VALUES (:id, :name_en, :name_th, :name_en_key, :name_en_phonetic, :name_th_key, :name_th_phonetic)
                 RETURNING id
             """
             await database.fetch_one(query=query_organization, values={
                 "id": party_id,
                 "name_en": informal_organization.name_en,
-                "name_th": informal_organization.name_th
+                "name_th": informal_organization.name_th,
+                **search_keys("name_en", informal_organization.name_en),
+                **search_keys("name_th", informal_organization.name_th)
             })
 
             # 3. Insert into informal_organization
@@ -47,6 +53,7 @@ async def create_informal_organization(informal_organization: InformalOrganizati
             logger.error(f"Error creating informal organization: {str(e)}")
             raise
 
+@cached("organization")
 async def get_informal_organization(informal_organization_id: int) -> Optional[InformalOrganizationOut]:
     query = """
         SELECT io.id, o.name_en, o.name_th
@@ -62,6 +69,7 @@ async def get_informal_organization(informal_organization_id: int) -> Optional[I
     logger.info(f"Retrieved informal organization: id={result['id']}")
     return InformalOrganizationOut(**result)
 
+@cached("organization")
 async def get_all_informal_organizations() -> List[InformalOrganizationOut]:
     query = """
         SELECT io.id, o.name_en, o.name_th
@@ -74,6 +82,7 @@ async def get_all_informal_organizations() -> List[InformalOrganizationOut]:
     logger.info(f"Retrieved {len(results)} informal organizations")
     return [InformalOrganizationOut(**result) for result in results]
 
+@bumps_version("organization")
 async def update_informal_organization(informal_organization_id: int, informal_organization: InformalOrganizationUpdate) -> Optional[InformalOrganizationOut]:
     async with database.transaction():
         try:
@@ -81,13 +90,19 @@ async def update_informal_organization(informal_organization_id: int, informal_o
             query_organization = """
                 UPDATE organization
                 SET name_en = COALESCE(:name_en, name_en),
-                    name_th = COALESCE(:name_th, name_th)
+                    name_th = COALESCE(:name_th, name_th),
+                    name_en_key = COALESCE(:name_en_key, name_en_key),
+                    name_en_phonetic = COALESCE(:name_en_phonetic, name_en_phonetic),
+                    name_th_key = COALESCE(:name_th_key, name_th_key),
+                    name_th_phonetic = COALESCE(:name_th_phonetic, name_th_phonetic)
                 WHERE id = :id
                 RETURNING id, name_en, name_th
             """
             result = await database.fetch_one(query=query_organization, values={
                 "name_en": informal_organization.name_en,
                 "name_th": informal_organization.name_th,
+                **search_keys("name_en", informal_organization.name_en),
+                **search_keys("name_th", informal_organization.name_th),
                 "id": informal_organization_id
             })
             if not result:
@@ -99,6 +114,7 @@ async def update_informal_organization(informal_organization_id: int, informal_o
             logger.error(f"Error updating informal organization: {str(e)}")
             raise
 
+@bumps_version("organization")
 async def delete_informal_organization(informal_organization_id: int) -> bool:
     async with database.transaction():
         try:
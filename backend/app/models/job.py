@@ -0,0 +1,155 @@
+import json
+import logging
+from typing import Optional, List
+from app.config.database import database
+from app.config.settings import JOB_MAX_ATTEMPTS, JOB_RETRY_DELAY_SECONDS
+from app.schemas.job import JobOut
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Job queue table `job` (note_for_database/job_queue.sql). Requests only enqueue and read;
+# claiming, heartbeats, progress and the outcome are written by app/jobs/worker.py.
+
+# Kinds the worker has a handler for (JOB_HANDLERS in app/jobs/worker.py)
+JOB_KINDS = ("analytics_export", "communication_event_partition", "csv_load", "party_dedup", "search_key_backfill")
+
+JOB_COLUMNS = """
+    id, kind, params, status, attempts, max_attempts, run_after, progress, result, error,
+    worker, created_by, created_at, started_at, heartbeat_at, finished_at
+"""
+
+def to_job_out(result) -> JobOut:
+    # jsonb arrives as text from asyncpg
+    data = dict(result)
+    for name in ("params", "progress", "result"):
+        if isinstance(data[name], str):
+            data[name] = json.loads(data[name])
+    return JobOut(**data)
+
+async def enqueue_job(kind: str, params: dict, created_by: Optional[int] = None, max_attempts: Optional[int] = None) -> JobOut:
+    query = f"""
+        INSERT INTO job (kind, params, max_attempts, created_by)
+        VALUES (:kind, CAST(:params AS JSONB), :max_attempts, :created_by)
+        RETURNING {JOB_COLUMNS}
+    """
+    result = await database.fetch_one(query=query, values={
+        "kind": kind,
+        "params": json.dumps(params),
+        "max_attempts": max_attempts or JOB_MAX_ATTEMPTS,
+        "created_by": created_by
+    })
+    logger.info(f"Enqueued job: id={result['id']}, kind={kind}")
+    return to_job_out(result)
+
+async def get_job(job_id: int) -> Optional[JobOut]:
+    result = await database.fetch_one(query=f"SELECT {JOB_COLUMNS} FROM job WHERE id = :id", values={"id": job_id})
+    if not result:
+        logger.warning(f"Job not found: id={job_id}")
+        return None
+    return to_job_out(result)
+
+async def get_jobs(status: Optional[str] = None, kind: Optional[str] = None, limit: int = 100) -> List[JobOut]:
+    conditions = ["TRUE"]
+    values = {"limit": limit}
+    if status is not None:
+        conditions.append("status = :status")
+        values["status"] = status
+    if kind is not None:
+        conditions.append("kind = :kind")
+        values["kind"] = kind
+    query = f"""
+        SELECT {JOB_COLUMNS}
+        FROM job
+        WHERE {" AND ".join(conditions)}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+    """
+    results = await database.fetch_all(query=query, values=values)
+    logger.info(f"Retrieved {len(results)} jobs")
+    return [to_job_out(result) for result in results]
+
+async def claim_job(worker: str) -> Optional[JobOut]:
+    # The oldest due queued job; SKIP LOCKED passes over rows another worker is claiming right now
+    query = f"""
+        UPDATE job
+        SET status = 'running',
+            attempts = attempts + 1,
+            worker = :worker,
+            started_at = now(),
+            heartbeat_at = now(),
+            error = NULL
+        WHERE id = (
+            SELECT id FROM job
+            WHERE status = 'queued' AND run_after <= now()
+            ORDER BY run_after, id
+            FOR UPDATE SKIP LOCKED
+            LIMIT 1
+        )
+        RETURNING {JOB_COLUMNS}
+    """
+    result = await database.fetch_one(query=query, values={"worker": worker})
+    return to_job_out(result) if result else None
+
+async def heartbeat_job(job_id: int) -> None:
+    await database.execute(query="UPDATE job SET heartbeat_at = now() WHERE id = :id AND status = 'running'", values={"id": job_id})
+
+async def report_job_progress(job_id: int, progress: dict) -> None:
+    query = """
+        UPDATE job SET progress = CAST(:progress AS JSONB), heartbeat_at = now()
+        WHERE id = :id AND status = 'running'
+    """
+    await database.execute(query=query, values={"id": job_id, "progress": json.dumps(progress)})
+
+# complete_job / fail_job only touch the attempt `attempt` of `worker`: once its lease has expired
+# the job may be queued again or running elsewhere (also in another slot of the same worker), and
+# a late outcome must not overwrite that run
+
+async def complete_job(job_id: int, worker: str, attempt: int, result: Optional[dict]) -> bool:
+    query = """
+        UPDATE job SET status = 'succeeded', result = CAST(:result AS JSONB), finished_at = now()
+        WHERE id = :id AND status = 'running' AND worker = :worker AND attempts = :attempt
+        RETURNING id
+    """
+    updated = await database.fetch_val(query=query, values={"id": job_id, "worker": worker, "attempt": attempt, "result": json.dumps(result)})
+    if updated is None:
+        logger.warning(f"Job id={job_id} is no longer run by {worker}, result dropped")
+        return False
+    logger.info(f"Job succeeded: id={job_id}")
+    return True
+
+async def fail_job(job_id: int, worker: str, attempt: int, error: str) -> Optional[str]:
+    # Queued again after JOB_RETRY_DELAY_SECONDS x attempts while attempts are left, else failed;
+    # returns the new status, None when the attempt is no longer this worker's
+    query = """
+        UPDATE job
+        SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+            run_after = now() + make_interval(secs => :retry_delay * attempts),
+            finished_at = CASE WHEN attempts < max_attempts THEN NULL ELSE now() END,
+            error = :error
+        WHERE id = :id AND status = 'running' AND worker = :worker AND attempts = :attempt
+        RETURNING status
+    """
+    status = await database.fetch_val(query=query, values={
+        "id": job_id, "worker": worker, "attempt": attempt, "error": error, "retry_delay": JOB_RETRY_DELAY_SECONDS
+    })
+    if status is None:
+        logger.warning(f"Job id={job_id} is no longer run by {worker}, error dropped: {error}")
+        return None
+    logger.warning(f"Job attempt failed: id={job_id}, now {status}: {error}")
+    return status
+
+async def requeue_stale_jobs(lease_seconds: int) -> List[int]:
+    # Running jobs without a heartbeat for lease_seconds: their worker died or lost the database
+    query = """
+        UPDATE job
+        SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+            finished_at = CASE WHEN attempts < max_attempts THEN NULL ELSE now() END,
+            error = 'worker stopped sending heartbeats (' || COALESCE(worker, '?') || ')'
+        WHERE status = 'running' AND heartbeat_at < now() - make_interval(secs => :lease_seconds)
+        RETURNING id
+    """
+    results = await database.fetch_all(query=query, values={"lease_seconds": lease_seconds})
+    if results:
+        logger.warning(f"Requeued or failed {len(results)} stale jobs: {[result['id'] for result in results]}")
+    return [result["id"] for result in results]
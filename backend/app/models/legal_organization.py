@@ -1,11 +1,15 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.legal_organization import LegalOrganizationCreate, LegalOrganizationUpdate, LegalOrganizationOut
+from app.models.search_key import search_keys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("organization")
 async def create_legal_organization(legal_organization: LegalOrganizationCreate) -> Optional[LegalOrganizationOut]:
     query_check = """
         SELECT id FROM legal_organization WHERE federal_tax_id_number = :federal_tax_id_number
@@ -28,14 +32,16 @@ async def create_legal_organization(legal_organization: LegalOrganizationCreate)
 
             # 2. Insert into organization
             query_organization = """
-                INSERT INTO organization (id, name_en, name_th)
-                VALUES (:id, :name_en, :name_th)
+                INSERT INTO organization (id, name_en, name_th, name_en_key, name_en_phonetic, name_th_key, name_th_phonetic)
+                VALUES (:id, :name_en, :name_th, :name_en_key, :name_en_phonetic, :name_th_key, :name_th_phonetic)
                 RETURNING id
             """
             await database.fetch_one(query=query_organization, values={
                 "id": party_id,
                 "name_en": legal_organization.name_en,
-                "name_th": legal_organization.name_th
+                "name_th": legal_organization.name_th,
+                **search_keys("name_en", legal_organization.name_en),
+                **search_keys("name_th", legal_organization.name_th)
             })
 
             # 3. Insert into legal_organization
@@ -59,6 +65,7 @@ async def create_legal_organization(legal_organization: LegalOrganizationCreate)
             logger.error(f"Error creating legal organization: {str(e)}")
             raise
 
+@cached("organization")
 async def get_legal_organization(legal_organization_id: int) -> Optional[LegalOrganizationOut]:
     query = """
         SELECT lo.id, o.name_en, o.name_th, lo.federal_tax_id_number
@@ -74,6 +81,7 @@ async def get_legal_organization(legal_organization_id: int) -> Optional[LegalOr
     logger.info(f"Retrieved legal organization: id={result['id']}")
     return LegalOrganizationOut(**result)
 
+@cached("organization")
 async def get_all_legal_organizations() -> List[LegalOrganizationOut]:
     query = """
         SELECT lo.id, o.name_en, o.name_th, lo.federal_tax_id_number
@@ -86,6 +94,7 @@ async def get_all_legal_organizations() -> List[LegalOrganizationOut]:
     logger.info(f"Retrieved {len(results)} legal organizations")
     return [LegalOrganizationOut(**result) for result in results]
 
+@bumps_version("organization")
 async def update_legal_organization(legal_organization_id: int, legal_organization: LegalOrganizationUpdate) -> Optional[LegalOrganizationOut]:
     if legal_organization.federal_tax_id_number:
         query_check = """
@@ -107,13 +116,19 @@ async def update_legal_organization(legal_organization_id: int, legal_organizati
                 query_organization = """
                     UPDATE organization
                     SET name_en = COALESCE(:name_en, name_en),
-                        name_th = COALESCE(:name_th, name_th)
+                        name_th = COALESCE(:name_th, name_th),
+                        name_en_key = COALESCE(:name_en_key, name_en_key),
+                        name_en_phonetic = COALESCE(:name_en_phonetic, name_en_phonetic),
+                        name_th_key = COALESCE(:name_th_key, name_th_key),
+                        name_th_phonetic = COALESCE(:name_th_phonetic, name_th_phonetic)
                     WHERE id = :id
                     RETURNING name_en, name_th
                 """
                 org_result = await database.fetch_one(query=query_organization, values={
                     "name_en": legal_organization.name_en,
                     "name_th": legal_organization.name_th,
+                    **search_keys("name_en", legal_organization.name_en),
+                    **search_keys("name_th", legal_organization.name_th),
                     "id": legal_organization_id
                 })
 
@@ -150,6 +165,7 @@ async def update_legal_organization(legal_organization_id: int, legal_organizati
             logger.error(f"Error updating legal organization: {str(e)}")
             raise
 
+@bumps_version("organization")
 async def delete_legal_organization(legal_organization_id: int) -> bool:
     async with database.transaction():
         try:
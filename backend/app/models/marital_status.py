@@ -1,11 +1,13 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.marital_status import MaritalStatusCreate, MaritalStatusUpdate, MaritalStatusOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("person")
 async def create_marital_status(marital_status: MaritalStatusCreate) -> Optional[MaritalStatusOut]:
     query = """
         SELECT id FROM maritalstatus 
@@ -29,14 +31,33 @@ async def create_marital_status(marital_status: MaritalStatusCreate) -> Optional
         RETURNING id, fromdate, thrudate, person_id, maritalstatustype_id
     """
     try:
-        result = await database.fetch_one(query=query, values={
-            "fromdate": marital_status.fromdate,
-            "thrudate": marital_status.thrudate,
-            "person_id": marital_status.person_id,
-            "maritalstatustype_id": marital_status.maritalstatustype_id
-        })
-        logger.info(f"Created marital status: id={result['id']}, person_id={result['person_id']}")
-        return MaritalStatusOut(**result)
+        async with database.transaction():
+            # One open marital status per person: a new open row closes the current one
+            # A backdated row (older than the open one) goes in as closed history, ending where the open one starts
+            thrudate = marital_status.thrudate
+            if thrudate is None:
+                query_close = """
+                    WITH newer AS (
+                        SELECT fromdate FROM maritalstatus
+                        WHERE person_id = :person_id AND thrudate IS NULL AND fromdate > :fromdate
+                    ), closed AS (
+                        UPDATE maritalstatus SET thrudate = :fromdate
+                        WHERE person_id = :person_id AND thrudate IS NULL AND fromdate <= :fromdate
+                    )
+                    SELECT fromdate FROM newer
+                """
+                thrudate = await database.fetch_val(query_close, values={
+                    "fromdate": marital_status.fromdate,
+                    "person_id": marital_status.person_id
+                })
+            result = await database.fetch_one(query=query, values={
+                "fromdate": marital_status.fromdate,
+                "thrudate": thrudate,
+                "person_id": marital_status.person_id,
+                "maritalstatustype_id": marital_status.maritalstatustype_id
+            })
+            logger.info(f"Created marital status: id={result['id']}, person_id={result['person_id']}")
+            return MaritalStatusOut(**result)
     except Exception as e:
         logger.error(f"Error creating marital status: {str(e)}")
         raise
@@ -62,6 +83,7 @@ async def get_all_marital_statuses() -> List[MaritalStatusOut]:
     logger.info(f"Retrieved {len(results)} marital statuses")
     return [MaritalStatusOut(**result) for result in results]
 
+@bumps_version("person")
 async def update_marital_status(marital_status_id: int, marital_status: MaritalStatusUpdate) -> Optional[MaritalStatusOut]:
     if any([marital_status.fromdate, marital_status.thrudate, marital_status.person_id, marital_status.maritalstatustype_id]):
         query = """
@@ -82,6 +104,21 @@ async def update_marital_status(marital_status_id: int, marital_status: MaritalS
         if existing:
             logger.warning(f"Marital status already exists: person_id={marital_status.person_id}, type_id={marital_status.maritalstatustype_id}")
             return None
+        # The row stays or becomes open: another open row with the same key would break maritalstatus_open_uidx
+        query = """
+            SELECT o.id FROM maritalstatus c
+            JOIN maritalstatus o ON o.person_id = COALESCE(:person_id, c.person_id)
+                AND o.thrudate IS NULL AND o.id != c.id
+            WHERE c.id = :id AND COALESCE(:thrudate, c.thrudate) IS NULL
+        """
+        open_row = await database.fetch_one(query=query, values={
+            "person_id": marital_status.person_id,
+            "thrudate": marital_status.thrudate,
+            "id": marital_status_id
+        })
+        if open_row:
+            logger.warning(f"Marital status has another open row: id={open_row['id']}")
+            return None
 
     query = """
         UPDATE maritalstatus
@@ -109,6 +146,7 @@ async def update_marital_status(marital_status_id: int, marital_status: MaritalS
         logger.error(f"Error updating marital status: {str(e)}")
         raise
 
+@bumps_version("person")
 async def delete_marital_status(marital_status_id: int) -> bool:
     query = """
         DELETE FROM maritalstatus WHERE id = :id
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.marital_status_type import MaritalStatusTypeCreate, MaritalStatusTypeUpdate, MaritalStatusTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("marital_status_type")
 async def create_marital_status_type(marital_status_type: MaritalStatusTypeCreate) -> Optional[MaritalStatusTypeOut]:
     query = """
         SELECT id, description FROM maritalstatustype WHERE description = :description
@@ -28,6 +31,7 @@ async def create_marital_status_type(marital_status_type: MaritalStatusTypeCreat
         logger.error(f"Error creating marital status type: {str(e)}")
         raise
 
+@cached("marital_status_type")
 async def get_marital_status_type(marital_status_type_id: int) -> Optional[MaritalStatusTypeOut]:
     query = """
         SELECT id, description FROM maritalstatustype WHERE id = :id
@@ -39,6 +43,7 @@ async def get_marital_status_type(marital_status_type_id: int) -> Optional[Marit
     logger.info(f"Retrieved marital status type: id={result['id']}, description={result['description']}")
     return MaritalStatusTypeOut(**result)
 
+@cached("marital_status_type")
 async def get_all_marital_status_types() -> List[MaritalStatusTypeOut]:
     query = """
         SELECT id, description FROM maritalstatustype
@@ -47,6 +52,7 @@ async def get_all_marital_status_types() -> List[MaritalStatusTypeOut]:
     logger.info(f"Retrieved {len(results)} marital status types")
     return [MaritalStatusTypeOut(**result) for result in results]
 
+@bumps_version("marital_status_type")
 async def update_marital_status_type(marital_status_type_id: int, marital_status_type: MaritalStatusTypeUpdate) -> Optional[MaritalStatusTypeOut]:
     if marital_status_type.description:
         query = """
@@ -74,6 +80,7 @@ async def update_marital_status_type(marital_status_type_id: int, marital_status
         logger.error(f"Error updating marital status type: {str(e)}")
         raise
 
+@bumps_version("marital_status_type")
 async def delete_marital_status_type(marital_status_type_id: int) -> bool:
     query = """
         DELETE FROM maritalstatustype WHERE id = :id
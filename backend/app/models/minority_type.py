@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.minority_type import MinorityTypeCreate, MinorityTypeUpdate, MinorityTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("minority_type")
 async def create_minority_type(minority_type: MinorityTypeCreate) -> Optional[MinorityTypeOut]:
     query = """
         SELECT id, name_en, name_th FROM minority_type WHERE name_en = :name_en
@@ -28,6 +31,7 @@ async def create_minority_type(minority_type: MinorityTypeCreate) -> Optional[Mi
         logger.error(f"Error creating minority type: {str(e)}")
         raise
 
+@cached("minority_type")
 async def get_minority_type(minority_type_id: int) -> Optional[MinorityTypeOut]:
     query = """
         SELECT id, name_en, name_th FROM minority_type WHERE id = :id
@@ -39,6 +43,7 @@ async def get_minority_type(minority_type_id: int) -> Optional[MinorityTypeOut]:
     logger.info(f"Retrieved minority type: id={result['id']}, name_en={result['name_en']}")
     return MinorityTypeOut(**result)
 
+@cached("minority_type")
 async def get_all_minority_types() -> List[MinorityTypeOut]:
     query = """
         SELECT id, name_en, name_th FROM minority_type
@@ -47,6 +52,7 @@ async def get_all_minority_types() -> List[MinorityTypeOut]:
     logger.info(f"Retrieved {len(results)} minority types")
     return [MinorityTypeOut(**result) for result in results]
 
+@bumps_version("minority_type")
 async def update_minority_type(minority_type_id: int, minority_type: MinorityTypeUpdate) -> Optional[MinorityTypeOut]:
     if minority_type.name_en:
         query = """
@@ -75,6 +81,7 @@ async def update_minority_type(minority_type_id: int, minority_type: MinorityTyp
         logger.error(f"Error updating minority type: {str(e)}")
         raise
 
+@bumps_version("minority_type")
 async def delete_minority_type(minority_type_id: int) -> bool:
     query = """
         DELETE FROM minority_type WHERE id = :id
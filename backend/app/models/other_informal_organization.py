@@ -1,11 +1,15 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.other_informal_organization import OtherInformalOrganizationCreate, OtherInformalOrganizationUpdate, OtherInformalOrganizationOut
+from app.models.search_key import search_keys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("organization")
 async def create_other_informal_organization(other_informal_organization: OtherInformalOrganizationCreate) -> Optional[OtherInformalOrganizationOut]:
     async with database.transaction():
         try:
@@ -20,14 +24,16 @@ async def create_other_informal_organization(other_informal_organization: OtherI
 
             # 2. Insert into organization
             query_organization = """
-                INSERT INTO organization (id, name_en, name_th)
-                VALUES (:id, :name_en, :name_th)
+                INSERT INTO organization (id, name_en, name_th, name_en_key, name_en_phonetic, name_th_key, name_th_phonetic)
+                VALUES (:id, :name_en, :name_th, :name_en_key, :name_en_phonetic, :name_th_key, :name_th_phonetic)
                 RETURNING id
             """
             await database.fetch_one(query=query_organization, values={
                 "id": party_id,
                 "name_en": other_informal_organization.name_en,
-                "name_th": other_informal_organization.name_th
+                "name_th": other_informal_organization.name_th,
+                **search_keys("name_en", other_informal_organization.name_en),
+                **search_keys("name_th", other_informal_organization.name_th)
             })
 
             # 3. Insert into informal_organization
@@ -55,6 +61,7 @@ async def create_other_informal_organization(other_informal_organization: OtherI
             logger.error(f"ข้อผิดพลาดในการสร้าง other informal organization: {str(e)}")
             raise
 
+@cached("organization")
 async def get_other_informal_organization(other_informal_organization_id: int) -> Optional[OtherInformalOrganizationOut]:
     query = """
         SELECT oio.id, o.name_en, o.name_th
@@ -71,6 +78,7 @@ async def get_other_informal_organization(other_informal_organization_id: int) -
     logger.info(f"ดึงข้อมูล other informal organization: id={result['id']}")
     return OtherInformalOrganizationOut(**result)
 
+@cached("organization")
 async def get_all_other_informal_organizations() -> List[OtherInformalOrganizationOut]:
     query = """
         SELECT oio.id, o.name_en, o.name_th
@@ -84,6 +92,7 @@ async def get_all_other_informal_organizations() -> List[OtherInformalOrganizati
     logger.info(f"ดึงข้อมูล {len(results)} other informal organizations")
     return [OtherInformalOrganizationOut(**result) for result in results]
 
+@bumps_version("organization")
 async def update_other_informal_organization(other_informal_organization_id: int, other_informal_organization: OtherInformalOrganizationUpdate) -> Optional[OtherInformalOrganizationOut]:
     async with database.transaction():
         try:
@@ -91,13 +100,19 @@ async def update_other_informal_organization(other_informal_organization_id: int
             query_organization = """
                 UPDATE organization
                 SET name_en = COALESCE(:name_en, name_en),
-                    name_th = COALESCE(:name_th, name_th)
+                    name_th = COALESCE(:name_th, name_th),
+                    name_en_key = COALESCE(:name_en_key, name_en_key),
+                    name_en_phonetic = COALESCE(:name_en_phonetic, name_en_phonetic),
+                    name_th_key = COALESCE(:name_th_key, name_th_key),
+                    name_th_phonetic = COALESCE(:name_th_phonetic, name_th_phonetic)
                 WHERE id = :id
                 RETURNING id, name_en, name_th
             """
             result = await database.fetch_one(query=query_organization, values={
                 "name_en": other_informal_organization.name_en,
                 "name_th": other_informal_organization.name_th,
+                **search_keys("name_en", other_informal_organization.name_en),
+                **search_keys("name_th", other_informal_organization.name_th),
                 "id": other_informal_organization_id
             })
             if not result:
@@ -109,6 +124,7 @@ async def update_other_informal_organization(other_informal_organization_id: int
             logger.error(f"ข้อผิดพลาดในการอัปเดต other informal organization: {str(e)}")
             raise
 
+@bumps_version("organization")
 async def delete_other_informal_organization(other_informal_organization_id: int) -> bool:
     async with database.transaction():
         try:
@@ -0,0 +1,280 @@
+from typing import Optional, List
+from datetime import datetime
+from app.config.database import database
+from app.config.entity_version import bumps_version
+import logging
+from app.schemas.party import PartyTimelineItemOut, PartyMergeOut
+from app.models.person import PERSON_COLUMNS
+from app.config.settings import PARTY_MERGE_STATEMENT_TIMEOUT_MS
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def get_party_timeline(
+    party_id: int,
+    before_event_time: Optional[datetime] = None,
+    before_item_key: Optional[str] = None,
+    limit: int = 100
+) -> List[PartyTimelineItemOut]:
+    # One query merges roles, relationships (either side), their communication events and
+    # classifications into a newest-first stream. Temporal rows give a "start" item at their
+    # from date and an "end" item at their thru date; rows without a date are left out.
+    # Keyset pagination on (event_time, item_key) continues after the last item of the previous page.
+    values = {"party_id": party_id, "limit": limit}
+    keyset = ""
+    if before_event_time is not None and before_item_key is not None:
+        keyset = "WHERE (items.event_time, items.item_key) < (:before_event_time, :before_item_key)"
+        values["before_event_time"] = before_event_time
+        values["before_item_key"] = before_item_key
+
+    query = f"""
+        WITH roles AS (
+            SELECT pr.id, pr.fromdate, pr.thrudate, rt.description
+            FROM party_role pr
+            LEFT JOIN role_type rt ON pr.role_type_id = rt.id
+            WHERE pr.party_id = :party_id
+        ),
+        relationships AS (
+            SELECT rel.id, rel.from_date, rel.thru_date, rel.from_party_role_id, prt.description
+            FROM party_relationship rel
+            LEFT JOIN party_relationship_type prt ON rel.party_relationship_type_id = prt.id
+            WHERE rel.from_party_role_id IN (SELECT id FROM roles)
+               OR rel.to_party_role_id IN (SELECT id FROM roles)
+        ),
+        classifications AS (
+            SELECT pc.id, pc.fromdate, pc.thrudate,
+                   COALESCE(e.name_en, ir.description, it.description, mt.name_en, ecr.description) AS description
+            FROM party_classification pc
+            LEFT JOIN classify_by_eeoc cbe ON cbe.id = pc.id
+            LEFT JOIN ethnicity e ON cbe.ethnicity_id = e.id
+            LEFT JOIN classify_by_income cbi ON cbi.id = pc.id
+            LEFT JOIN income_range ir ON cbi.income_range_id = ir.id
+            LEFT JOIN classify_by_industry cbin ON cbin.id = pc.id
+            LEFT JOIN industry_type it ON cbin.industry_type_id = it.id
+            LEFT JOIN classify_by_minority cbm ON cbm.id = pc.id
+            LEFT JOIN minority_type mt ON cbm.minority_type_id = mt.id
+            LEFT JOIN classify_by_size cbs ON cbs.id = pc.id
+            LEFT JOIN employee_count_range ecr ON cbs.employee_count_range_id = ecr.id
+            WHERE pc.party_id = :party_id
+        ),
+        items AS (
+            SELECT 'party_role'::text AS item_type, r.id AS item_id, 'start'::text AS change,
+                   r.fromdate::timestamp AS event_time, r.description,
+                   r.id AS party_role_id, NULL::int AS party_relationship_id
+            FROM roles r WHERE r.fromdate IS NOT NULL
+            UNION ALL
+            SELECT 'party_role', r.id, 'end', r.thrudate::timestamp, r.description, r.id, NULL
+            FROM roles r WHERE r.thrudate IS NOT NULL
+            UNION ALL
+            SELECT 'party_relationship', rel.id, 'start', rel.from_date::timestamp, rel.description,
+                   rel.from_party_role_id, rel.id
+            FROM relationships rel WHERE rel.from_date IS NOT NULL
+            UNION ALL
+            SELECT 'party_relationship', rel.id, 'end', rel.thru_date::timestamp, rel.description,
+                   rel.from_party_role_id, rel.id
+            FROM relationships rel WHERE rel.thru_date IS NOT NULL
+            UNION ALL
+            SELECT 'communication_event', ce.id, 'start', ce.datetime_start, COALESCE(ce.note, cmt.description),
+                   NULL, ce.party_relationship_id
+            FROM communication_event ce
+            JOIN relationships rel ON ce.party_relationship_id = rel.id
+            LEFT JOIN contact_mechanism_type cmt ON ce.contact_mechanism_type_id = cmt.id
+            UNION ALL
+            SELECT 'party_classification', c.id, 'start', c.fromdate::timestamp, c.description, NULL, NULL
+            FROM classifications c WHERE c.fromdate IS NOT NULL
+            UNION ALL
+            SELECT 'party_classification', c.id, 'end', c.thrudate::timestamp, c.description, NULL, NULL
+            FROM classifications c WHERE c.thrudate IS NOT NULL
+        )
+        SELECT items.*
+        FROM (
+            SELECT i.*, i.item_type || ':' || i.change || ':' || lpad(i.item_id::text, 12, '0') AS item_key
+            FROM items i
+        ) items
+        {keyset}
+        ORDER BY items.event_time DESC, items.item_key DESC
+        LIMIT :limit
+    """
+    results = await database.fetch_all(query=query, values=values)
+    logger.info(f"Retrieved {len(results)} timeline items for party_id={party_id}")
+    return [PartyTimelineItemOut(**result) for result in results]
+
+# Open source role -> open target role of the same role type (the target's oldest one if it has several)
+ROLE_MAP = """
+    SELECT DISTINCT ON (s.id) s.id AS source_role_id, t.id AS target_role_id
+    FROM party_role s
+    JOIN party_role t ON t.party_id = :target_party_id
+        AND t.role_type_id = s.role_type_id
+        AND t.thrudate IS NULL
+    WHERE s.party_id = :party_id AND s.thrudate IS NULL
+    ORDER BY s.id, t.fromdate, t.id
+"""
+
+# Person history tables and the columns that identify "the same attribute" (see temporal_single_open_row.sql)
+PERSON_TEMPORAL_KEYS = {
+    "personname": ["personnametype_id"],
+    "maritalstatus": [],
+    "physicalcharacteristic": ["physicalcharacteristictype_id"],
+    "citizenship": ["country_id"],
+}
+
+ORGANIZATION_NAME_COLUMNS = {
+    "name_en": ["name_en", "name_en_key", "name_en_phonetic"],
+    "name_th": ["name_th", "name_th_key", "name_th_phonetic"],
+}
+
+async def _count(query: str, values: dict) -> int:
+    # query is a data-modifying statement with RETURNING
+    return await database.fetch_val(query=f"WITH changed AS ({query}) SELECT COUNT(*) FROM changed", values=values)
+
+@bumps_version("person", "organization")
+async def merge_party(party_id: int, target_party_id: int) -> Optional[PartyMergeOut]:
+    # Moves everything that belongs to party_id onto target_party_id and deletes party_id, in one
+    # transaction. Every step is one set-based statement on an indexed foreign key column
+    # (note_for_database/party_merge_index.sql), so the cost depends on the rows owned directly by
+    # the party: relationships follow their party_role and communication events follow their
+    # relationship, neither is rewritten however many there are.
+    #
+    # Temporal rows: where both parties have an open row for the same attribute, the target's
+    # current value wins and the source row is closed when the target's value started.
+    values = {"party_id": party_id, "target_party_id": target_party_id}
+    moved = {}
+    closed = {}
+    async with database.transaction():
+        try:
+            await database.execute(f"SET LOCAL statement_timeout = {int(PARTY_MERGE_STATEMENT_TIMEOUT_MS)}")
+
+            # 1. Lock both parties (in id order, so two merges cannot deadlock) and check their kind
+            query_parties = """
+                SELECT p.id,
+                    CASE
+                        WHEN EXISTS (SELECT 1 FROM person WHERE id = p.id) THEN 'person'
+                        WHEN EXISTS (SELECT 1 FROM organization WHERE id = p.id) THEN 'organization'
+                    END AS party_kind
+                FROM party p
+                WHERE p.id IN (:party_id, :target_party_id)
+                ORDER BY p.id
+                FOR UPDATE
+            """
+            parties = await database.fetch_all(query=query_parties, values=values)
+            kinds = {row["party_kind"] for row in parties}
+            if len(parties) != 2 or len(kinds) != 1 or None in kinds:
+                logger.warning(f"Cannot merge party {party_id} into {target_party_id}: not found or not of the same kind")
+                return None
+            party_kind = kinds.pop()
+
+            # 2. Roles: relationships of a source role that the target already holds move to the
+            #    target's role, the other roles move as they are
+            moved["party_relationship"] = await _count(f"""
+                UPDATE party_relationship rel
+                SET from_party_role_id = m.target_role_id
+                FROM ({ROLE_MAP}) m
+                WHERE rel.from_party_role_id = m.source_role_id
+                RETURNING rel.id
+            """, values)
+            moved["party_relationship"] += await _count(f"""
+                UPDATE party_relationship rel
+                SET to_party_role_id = m.target_role_id
+                FROM ({ROLE_MAP}) m
+                WHERE rel.to_party_role_id = m.source_role_id
+                RETURNING rel.id
+            """, values)
+            closed["party_role"] = await _count(f"""
+                DELETE FROM party_role pr
+                USING ({ROLE_MAP}) m
+                WHERE pr.id = m.source_role_id
+                RETURNING pr.id
+            """, values)
+            moved["party_role"] = await _count("""
+                UPDATE party_role SET party_id = :target_party_id WHERE party_id = :party_id RETURNING id
+            """, values)
+
+            # 3. Classifications (the classify_by_* rows share the id and follow)
+            moved["party_classification"] = await _count("""
+                UPDATE party_classification SET party_id = :target_party_id WHERE party_id = :party_id RETURNING id
+            """, values)
+
+            if party_kind == "person":
+                # 4. Passports of a citizenship the target also holds move to the target's citizenship
+                moved["passport"] = await _count("""
+                    UPDATE passport pp
+                    SET citizenship_id = t.id
+                    FROM citizenship s
+                    JOIN citizenship t ON t.person_id = :target_party_id
+                        AND t.country_id = s.country_id
+                        AND t.thrudate IS NULL
+                    WHERE pp.citizenship_id = s.id
+                    AND s.person_id = :party_id
+                    AND s.thrudate IS NULL
+                    RETURNING pp.id
+                """, values)
+
+                # 5. History tables: close clashing open rows, then move everything
+                for table, keys in PERSON_TEMPORAL_KEYS.items():
+                    key_match = "".join(f" AND t.{key} = s.{key}" for key in keys)
+                    closed[table] = await _count(f"""
+                        UPDATE {table} s
+                        SET thrudate = GREATEST(COALESCE(t.fromdate, CURRENT_DATE), s.fromdate)
+                        FROM {table} t
+                        WHERE s.person_id = :party_id AND s.thrudate IS NULL
+                        AND t.person_id = :target_party_id AND t.thrudate IS NULL{key_match}
+                        RETURNING s.id
+                    """, values)
+                    moved[table] = await _count(f"""
+                        UPDATE {table} SET person_id = :target_party_id WHERE person_id = :party_id RETURNING id
+                    """, values)
+
+                # 6. Fill the target's empty columns from the source
+                fill = ", ".join(f"{column} = COALESCE(t.{column}, s.{column})" for column in PERSON_COLUMNS)
+                await database.execute(query=f"""
+                    UPDATE person t SET {fill}
+                    FROM person s
+                    WHERE t.id = :target_party_id AND s.id = :party_id
+                """, values=values)
+            else:
+                fill = ", ".join(
+                    f"{column} = CASE WHEN t.{name} IS NULL THEN s.{column} ELSE t.{column} END"
+                    for name, columns in ORGANIZATION_NAME_COLUMNS.items() for column in columns
+                )
+                await database.execute(query=f"""
+                    UPDATE organization t SET {fill}
+                    FROM organization s
+                    WHERE t.id = :target_party_id AND s.id = :party_id
+                """, values=values)
+                await database.execute(query="""
+                    UPDATE legal_organization t
+                    SET federal_tax_id_number = COALESCE(t.federal_tax_id_number, s.federal_tax_id_number)
+                    FROM legal_organization s
+                    WHERE t.id = :target_party_id AND s.id = :party_id
+                """, values=values)
+
+            # 7. Record the merge on the reviewed pair, drop the source's other pending pairs (party_dedup
+            #    finds them again against the target), then delete the source; its subtype rows go with it
+            #    (ON DELETE CASCADE) and the remaining candidate rows keep the target id (ON DELETE SET NULL)
+            await database.execute(query="""
+                UPDATE party_duplicate_candidate
+                SET status = 'merged',
+                    merged_party_id = :party_id,
+                    merged_into_party_id = :target_party_id,
+                    reviewed_at = CURRENT_TIMESTAMP
+                WHERE party_id = LEAST(CAST(:party_id AS INT), CAST(:target_party_id AS INT))
+                AND duplicate_party_id = GREATEST(CAST(:party_id AS INT), CAST(:target_party_id AS INT))
+            """, values=values)
+            closed["party_duplicate_candidate"] = await _count("""
+                DELETE FROM party_duplicate_candidate
+                WHERE (party_id = :party_id OR duplicate_party_id = :party_id)
+                AND status = 'pending'
+                RETURNING id
+            """, {"party_id": party_id})
+            await database.execute(query="DELETE FROM party WHERE id = :party_id", values={"party_id": party_id})
+            logger.info(f"Merged party {party_id} into {target_party_id}: moved={moved}, closed={closed}")
+            return PartyMergeOut(
+                party_id=party_id,
+                target_party_id=target_party_id,
+                party_kind=party_kind,
+                moved=moved,
+                closed=closed
+            )
+        except Exception as e:
+            logger.error(f"Error merging party {party_id} into {target_party_id}: {str(e)}")
+            raise
@@ -0,0 +1,132 @@
+from typing import Optional, List, AsyncIterator
+from app.config.database import database
+import logging
+from app.schemas.party_duplicate import PartyDuplicateCandidateUpdate, PartyDuplicateCandidateOut
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Review table party_duplicate_candidate (note_for_database/party_duplicate.sql),
+# filled by app/jobs/party_dedup.py
+
+async def iterate_person_features() -> AsyncIterator[dict]:
+    # One row per person with everything the dedup job blocks and scores on; streamed with a
+    # server-side cursor so millions of persons are never held as one result set
+    query = """
+        SELECT
+            p.id,
+            p.personal_id_number,
+            p.birthdate,
+            names.name_key,
+            names.name_phonetic,
+            names.fname_phonetic,
+            names.lname_phonetic,
+            COALESCE(ct.country_ids, '{}') AS country_ids,
+            COALESCE(ct.passport_numbers, '{}') AS passport_numbers
+        FROM person p
+        LEFT JOIN LATERAL (
+            SELECT
+                string_agg(pn.name_key, ' ' ORDER BY pnt.description) AS name_key,
+                string_agg(pn.name_phonetic, '' ORDER BY pnt.description) AS name_phonetic,
+                MAX(pn.name_phonetic) FILTER (WHERE pnt.description = 'FirstName') AS fname_phonetic,
+                MAX(pn.name_phonetic) FILTER (WHERE pnt.description = 'LastName') AS lname_phonetic
+            FROM personname pn
+            JOIN personnametype pnt ON pn.personnametype_id = pnt.id
+            WHERE pn.person_id = p.id
+            AND pn.thrudate IS NULL
+            AND pnt.description IN ('FirstName', 'MiddleName', 'LastName')
+        ) names ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT
+                array_agg(DISTINCT c.country_id) FILTER (WHERE c.country_id IS NOT NULL) AS country_ids,
+                array_agg(DISTINCT upper(regexp_replace(pp.passportnumber, '[^A-Za-z0-9]', '', 'g')))
+                    FILTER (WHERE pp.passportnumber IS NOT NULL) AS passport_numbers
+            FROM citizenship c
+            LEFT JOIN passport pp ON pp.citizenship_id = c.id
+            WHERE c.person_id = p.id
+        ) ct ON TRUE
+        ORDER BY p.id
+    """
+    async for row in database.iterate(query=query):
+        yield dict(row)
+
+async def iterate_organization_features() -> AsyncIterator[dict]:
+    query = """
+        SELECT
+            o.id,
+            lo.federal_tax_id_number,
+            o.name_en_key,
+            o.name_en_phonetic,
+            o.name_th_key,
+            o.name_th_phonetic
+        FROM organization o
+        LEFT JOIN legal_organization lo ON lo.id = o.id
+        ORDER BY o.id
+    """
+    async for row in database.iterate(query=query):
+        yield dict(row)
+
+async def save_party_duplicate_candidates(candidates: List[dict]) -> int:
+    # candidates: party_id < duplicate_party_id, party_kind, score, reasons.
+    # Pending pairs get the new score; reviewed pairs are left alone.
+    if not candidates:
+        return 0
+    query = """
+        INSERT INTO party_duplicate_candidate (party_id, duplicate_party_id, party_kind, score, reasons)
+        VALUES (:party_id, :duplicate_party_id, :party_kind, :score, :reasons)
+        ON CONFLICT (party_id, duplicate_party_id) DO UPDATE
+        SET score = EXCLUDED.score,
+            reasons = EXCLUDED.reasons
+        WHERE party_duplicate_candidate.status = 'pending'
+    """
+    async with database.transaction():
+        try:
+            await database.execute_many(query=query, values=candidates)
+            logger.info(f"Saved {len(candidates)} party duplicate candidates")
+            return len(candidates)
+        except Exception as e:
+            logger.error(f"Error saving party duplicate candidates: {str(e)}")
+            raise
+
+async def get_party_duplicate_candidates(
+    status: str = "pending",
+    party_kind: Optional[str] = None,
+    min_score: float = 0,
+    limit: int = 100
+) -> List[PartyDuplicateCandidateOut]:
+    conditions = ["status = :status", "score >= :min_score"]
+    values = {"status": status, "min_score": min_score, "limit": limit}
+    if party_kind is not None:
+        conditions.append("party_kind = :party_kind")
+        values["party_kind"] = party_kind
+    query = f"""
+        SELECT id, party_id, duplicate_party_id, party_kind, score, reasons, status, created_at, reviewed_at,
+            merged_party_id, merged_into_party_id
+        FROM party_duplicate_candidate
+        WHERE {' AND '.join(conditions)}
+        ORDER BY score DESC, id ASC
+        LIMIT :limit
+    """
+    results = await database.fetch_all(query=query, values=values)
+    logger.info(f"Retrieved {len(results)} party duplicate candidates: status={status}")
+    return [PartyDuplicateCandidateOut(**result) for result in results]
+
+async def update_party_duplicate_candidate(candidate_id: int, candidate: PartyDuplicateCandidateUpdate) -> Optional[PartyDuplicateCandidateOut]:
+    query = """
+        UPDATE party_duplicate_candidate
+        SET status = :status,
+            reviewed_at = CASE WHEN :status = 'pending' THEN NULL ELSE CURRENT_TIMESTAMP END
+        WHERE id = :id
+        RETURNING id, party_id, duplicate_party_id, party_kind, score, reasons, status, created_at, reviewed_at,
+            merged_party_id, merged_into_party_id
+    """
+    try:
+        result = await database.fetch_one(query=query, values={"status": candidate.status, "id": candidate_id})
+        if not result:
+            logger.warning(f"Party duplicate candidate not found for update: id={candidate_id}")
+            return None
+        logger.info(f"Updated party duplicate candidate: id={result['id']}, status={result['status']}")
+        return PartyDuplicateCandidateOut(**result)
+    except Exception as e:
+        logger.error(f"Error updating party duplicate candidate: {str(e)}")
+        raise
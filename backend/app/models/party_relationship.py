@@ -1,11 +1,43 @@
-from typing import Optional, List
+from typing import Optional, List, Union
 from app.config.database import database
+from app.config.replica import replica_read
 import logging
 from app.schemas.party_relationship import PartyRelationshipCreate, PartyRelationshipUpdate, PartyRelationshipOut
+from app.models.projection import Projection
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Read queries; ?fields= selects a subset (rows come back as dicts). The type/priority/status
+# columns are nullable, so the full response keeps their INNER JOINs (inner_joins) and never returns
+# a row PartyRelationshipOut cannot hold.
+PARTY_RELATIONSHIP_FIELDS = Projection(
+    "party_relationship pr",
+    {
+        "id": "pr.id",
+        "from_date": "pr.from_date",
+        "thru_date": "pr.thru_date",
+        "comment": "pr.comment",
+        "from_party_role_id": "pr.from_party_role_id",
+        "to_party_role_id": "pr.to_party_role_id",
+        "party_relationship_type_id": "pr.party_relationship_type_id",
+        "priority_type_id": "pr.priority_type_id",
+        "party_relationship_status_type_id": "pr.party_relationship_status_type_id",
+        "party_relationship_type_description": ("prt.description", "prt"),
+        "priority_type_description": ("pt.description", "pt"),
+        "party_relationship_status_type_description": ("prst.description", "prst"),
+    },
+    joins={
+        "prt": "LEFT JOIN party_relationship_type prt ON pr.party_relationship_type_id = prt.id",
+        "pt": "LEFT JOIN priority_type pt ON pr.priority_type_id = pt.id",
+        "prst": "LEFT JOIN party_relationship_status_type prst ON pr.party_relationship_status_type_id = prst.id",
+    },
+    inner_joins=("prt", "pt", "prst")
+)
+
+def to_party_relationship_out(result, fields: Optional[List[str]] = None) -> Union[PartyRelationshipOut, dict]:
+    return PARTY_RELATIONSHIP_FIELDS.row(result) if fields else PartyRelationshipOut(**result)
+
 async def create_party_relationship(party_relationship: PartyRelationshipCreate) -> Optional[PartyRelationshipOut]:
     async with database.transaction():
         try:
@@ -48,17 +80,10 @@ async def create_party_relationship(party_relationship: PartyRelationshipCreate)
             logger.error(f"Error creating party_relationship: {str(e)}")
             raise
 
-async def get_party_relationship(party_relationship_id: int) -> Optional[PartyRelationshipOut]:
-    query = """
-        SELECT pr.id, pr.from_date, pr.thru_date, pr.comment, pr.from_party_role_id, pr.to_party_role_id,
-               pr.party_relationship_type_id, pr.priority_type_id, pr.party_relationship_status_type_id,
-               prt.description AS party_relationship_type_description,
-               pt.description AS priority_type_description,
-               prst.description AS party_relationship_status_type_description
-        FROM party_relationship pr
-        JOIN party_relationship_type prt ON pr.party_relationship_type_id = prt.id
-        JOIN priority_type pt ON pr.priority_type_id = pt.id
-        JOIN party_relationship_status_type prst ON pr.party_relationship_status_type_id = prst.id
+@replica_read
+async def get_party_relationship(party_relationship_id: int, fields: Optional[List[str]] = None) -> Optional[Union[PartyRelationshipOut, dict]]:
+    query = f"""
+        {PARTY_RELATIONSHIP_FIELDS.sql(fields)}
         WHERE pr.id = :id
     """
     result = await database.fetch_one(query=query, values={"id": party_relationship_id})
@@ -66,60 +91,39 @@ async def get_party_relationship(party_relationship_id: int) -> Optional[PartyRe
         logger.warning(f"Party_relationship not found: id={party_relationship_id}")
         return None
     logger.info(f"Retrieved party_relationship: id={result['id']}")
-    return PartyRelationshipOut(**result)
+    return to_party_relationship_out(result, fields)
 
-async def get_all_party_relationships() -> List[PartyRelationshipOut]:
-    query = """
-        SELECT pr.id, pr.from_date, pr.thru_date, pr.comment, pr.from_party_role_id, pr.to_party_role_id,
-               pr.party_relationship_type_id, pr.priority_type_id, pr.party_relationship_status_type_id,
-               prt.description AS party_relationship_type_description,
-               pt.description AS priority_type_description,
-               prst.description AS party_relationship_status_type_description
-        FROM party_relationship pr
-        JOIN party_relationship_type prt ON pr.party_relationship_type_id = prt.id
-        JOIN priority_type pt ON pr.priority_type_id = pt.id
-        JOIN party_relationship_status_type prst ON pr.party_relationship_status_type_id = prst.id
+@replica_read
+async def get_all_party_relationships(fields: Optional[List[str]] = None) -> List[Union[PartyRelationshipOut, dict]]:
+    query = f"""
+        {PARTY_RELATIONSHIP_FIELDS.sql(fields)}
         ORDER BY pr.id ASC
     """
     results = await database.fetch_all(query=query)
     logger.info(f"Retrieved {len(results)} party_relationships")
-    return [PartyRelationshipOut(**result) for result in results]
+    return [to_party_relationship_out(result, fields) for result in results]
 
-async def get_party_relationships_by_from_party_role_id(from_party_role_id: int) -> List[PartyRelationshipOut]:
-    query = """
-        SELECT pr.id, pr.from_date, pr.thru_date, pr.comment, pr.from_party_role_id, pr.to_party_role_id,
-               pr.party_relationship_type_id, pr.priority_type_id, pr.party_relationship_status_type_id,
-               prt.description AS party_relationship_type_description,
-               pt.description AS priority_type_description,
-               prst.description AS party_relationship_status_type_description
-        FROM party_relationship pr
-        JOIN party_relationship_type prt ON pr.party_relationship_type_id = prt.id
-        JOIN priority_type pt ON pr.priority_type_id = pt.id
-        JOIN party_relationship_status_type prst ON pr.party_relationship_status_type_id = prst.id
+@replica_read
+async def get_party_relationships_by_from_party_role_id(from_party_role_id: int, fields: Optional[List[str]] = None) -> List[Union[PartyRelationshipOut, dict]]:
+    query = f"""
+        {PARTY_RELATIONSHIP_FIELDS.sql(fields)}
         WHERE pr.from_party_role_id = :from_party_role_id
         ORDER BY pr.from_date DESC, pr.id DESC
     """
     results = await database.fetch_all(query=query, values={"from_party_role_id": from_party_role_id})
     logger.info(f"Retrieved {len(results)} party_relationships for from_party_role_id={from_party_role_id}")
-    return [PartyRelationshipOut(**result) for result in results]
+    return [to_party_relationship_out(result, fields) for result in results]
 
-async def get_party_relationships_by_to_party_role_id(to_party_role_id: int) -> List[PartyRelationshipOut]:
-    query = """
-        SELECT pr.id, pr.from_date, pr.thru_date, pr.comment, pr.from_party_role_id, pr.to_party_role_id,
-               pr.party_relationship_type_id, pr.priority_type_id, pr.party_relationship_status_type_id,
-               prt.description AS party_relationship_type_description,
-               pt.description AS priority_type_description,
-               prst.description AS party_relationship_status_type_description
-        FROM party_relationship pr
-        JOIN party_relationship_type prt ON pr.party_relationship_type_id = prt.id
-        JOIN priority_type pt ON pr.priority_type_id = pt.id
-        JOIN party_relationship_status_type prst ON pr.party_relationship_status_type_id = prst.id
+@replica_read
+async def get_party_relationships_by_to_party_role_id(to_party_role_id: int, fields: Optional[List[str]] = None) -> List[Union[PartyRelationshipOut, dict]]:
+    query = f"""
+        {PARTY_RELATIONSHIP_FIELDS.sql(fields)}
         WHERE pr.to_party_role_id = :to_party_role_id
         ORDER BY pr.from_date DESC, pr.id DESC
     """
     results = await database.fetch_all(query=query, values={"to_party_role_id": to_party_role_id})
     logger.info(f"Retrieved {len(results)} party_relationships for to_party_role_id={to_party_role_id}")
-    return [PartyRelationshipOut(**result) for result in results]
+    return [to_party_relationship_out(result, fields) for result in results]
 
 async def update_party_relationship(party_relationship_id: int, party_relationship: PartyRelationshipUpdate) -> Optional[PartyRelationshipOut]:
     async with database.transaction():
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.party_relationship_status_type import PartyRelationshipStatusTypeCreate, PartyRelationshipStatusTypeUpdate, PartyRelationshipStatusTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("party_relationship_status_type")
 async def create_party_relationship_status_type(party_relationship_status_type: PartyRelationshipStatusTypeCreate) -> Optional[PartyRelationshipStatusTypeOut]:
     async with database.transaction():
         try:
@@ -21,6 +24,7 @@ async def create_party_relationship_status_type(party_relationship_status_type:
             logger.error(f"Error creating party_relationship_status_type: {str(e)}")
             raise
 
+@cached("party_relationship_status_type")
 async def get_party_relationship_status_type(party_relationship_status_type_id: int) -> Optional[PartyRelationshipStatusTypeOut]:
     query = """
         SELECT id, description
@@ -34,6 +38,7 @@ async def get_party_relationship_status_type(party_relationship_status_type_id:
     logger.info(f"Retrieved party_relationship_status_type: id={result['id']}")
     return PartyRelationshipStatusTypeOut(**result)
 
+@cached("party_relationship_status_type")
 async def get_all_party_relationship_status_types() -> List[PartyRelationshipStatusTypeOut]:
     query = """
         SELECT id, description
@@ -44,6 +49,7 @@ async def get_all_party_relationship_status_types() -> List[PartyRelationshipSta
     logger.info(f"Retrieved {len(results)} party_relationship_status_types")
     return [PartyRelationshipStatusTypeOut(**result) for result in results]
 
+@bumps_version("party_relationship_status_type")
 async def update_party_relationship_status_type(party_relationship_status_type_id: int, party_relationship_status_type: PartyRelationshipStatusTypeUpdate) -> Optional[PartyRelationshipStatusTypeOut]:
     async with database.transaction():
         try:
@@ -66,6 +72,7 @@ async def update_party_relationship_status_type(party_relationship_status_type_i
             logger.error(f"Error updating party_relationship_status_type: {str(e)}")
             raise
 
+@bumps_version("party_relationship_status_type")
 async def delete_party_relationship_status_type(party_relationship_status_type_id: int) -> bool:
     async with database.transaction():
         try:
@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.party_relationship_type import PartyRelationshipTypeCreate, PartyRelationshipTypeUpdate, PartyRelationshipTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("party_relationship_type")
 async def create_party_relationship_type(party_relationship_type: PartyRelationshipTypeCreate) -> Optional[PartyRelationshipTypeOut]:
     async with database.transaction():
         try:
@@ -21,6 +24,7 @@ async def create_party_relationship_type(party_relationship_type: PartyRelations
             logger.error(f"Error creating party_relationship_type: {str(e)}")
             raise
 
+@cached("party_relationship_type")
 async def get_party_relationship_type(party_relationship_type_id: int) -> Optional[PartyRelationshipTypeOut]:
     query = """
         SELECT id, description
@@ -34,6 +38,7 @@ async def get_party_relationship_type(party_relationship_type_id: int) -> Option
     logger.info(f"Retrieved party_relationship_type: id={result['id']}")
     return PartyRelationshipTypeOut(**result)
 
+@cached("party_relationship_type")
 async def get_all_party_relationship_types() -> List[PartyRelationshipTypeOut]:
     query = """
         SELECT id, description
@@ -44,6 +49,7 @@ async def get_all_party_relationship_types() -> List[PartyRelationshipTypeOut]:
     logger.info(f"Retrieved {len(results)} party_relationship_types")
     return [PartyRelationshipTypeOut(**result) for result in results]
 
+@bumps_version("party_relationship_type")
 async def update_party_relationship_type(party_relationship_type_id: int, party_relationship_type: PartyRelationshipTypeUpdate) -> Optional[PartyRelationshipTypeOut]:
     async with database.transaction():
         try:
@@ -66,6 +72,7 @@ async def update_party_relationship_type(party_relationship_type_id: int, party_
             logger.error(f"Error updating party_relationship_type: {str(e)}")
             raise
 
+@bumps_version("party_relationship_type")
 async def delete_party_relationship_type(party_relationship_type_id: int) -> bool:
     async with database.transaction():
         try:
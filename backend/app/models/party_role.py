@@ -1,20 +1,49 @@
-from typing import Optional, List
+from typing import Optional, List, Union
 from app.config.database import database
+from app.config.unit_of_work import UnitOfWork, unit_of_work
+from app.config.replica import replica_read
 import logging
 from app.schemas.party_role import PartyRoleCreate, PartyRoleUpdate, PartyRoleOut
+from app.models.projection import Projection
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def create_party_role(party_role: PartyRoleCreate) -> Optional[PartyRoleOut]:
-    async with database.transaction():
+# Read queries; ?fields= selects a subset (rows come back as dicts)
+PARTY_ROLE_FIELDS = Projection(
+    "party_role pr",
+    {
+        "id": "pr.id",
+        "party_id": "pr.party_id",
+        "role_type_id": "pr.role_type_id",
+        "fromdate": "pr.fromdate",
+        "thrudate": "pr.thrudate",
+        "type": ("CASE WHEN p.id IS NOT NULL THEN 'person' WHEN o.id IS NOT NULL THEN 'organization' END", "p", "o"),
+        "name_en": ("o.name_en", "o"),
+        "name_th": ("o.name_th", "o"),
+        "personal_id_number": ("p.personal_id_number", "p"),
+        "comment": ("p.comment", "p"),
+        "role_type_description": ("rt.description", "rt"),
+    },
+    joins={
+        "p": "LEFT JOIN person p ON pr.party_id = p.id",
+        "o": "LEFT JOIN organization o ON pr.party_id = o.id",
+        "rt": "LEFT JOIN role_type rt ON pr.role_type_id = rt.id",
+    }
+)
+
+def to_party_role_out(result, fields: Optional[List[str]] = None) -> Union[PartyRoleOut, dict]:
+    return PARTY_ROLE_FIELDS.row(result) if fields else PartyRoleOut(**result)
+
+async def create_party_role(party_role: PartyRoleCreate, *, uow: Optional[UnitOfWork] = None) -> Optional[PartyRoleOut]:
+    async with unit_of_work(uow) as uow:
         try:
             query = """
                 INSERT INTO party_role (party_id, role_type_id, fromdate, thrudate)
                 VALUES (:party_id, :role_type_id, :fromdate, :thrudate)
                 RETURNING id, party_id, role_type_id, fromdate, thrudate
             """
-            result = await database.fetch_one(query=query, values={
+            result = await uow.fetch_one(query=query, values={
                 "party_id": party_role.party_id,
                 "role_type_id": party_role.role_type_id,
                 "fromdate": party_role.fromdate,
@@ -36,26 +65,17 @@ async def create_party_role(party_role: PartyRoleCreate) -> Optional[PartyRoleOu
                 LEFT JOIN role_type rt ON pr.role_type_id = rt.id
                 WHERE pr.id = :id
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": new_id})
+            result = await uow.fetch_one(query=query_fetch, values={"id": new_id})
             logger.info(f"Created party_role: id={new_id}")
             return PartyRoleOut(**result)
         except Exception as e:
             logger.error(f"Error creating party_role: {str(e)}")
             raise
 
-async def get_party_role(party_role_id: int) -> Optional[PartyRoleOut]:
-    query = """
-        SELECT pr.id, pr.party_id, pr.role_type_id, pr.fromdate, pr.thrudate,
-               CASE 
-                   WHEN p.id IS NOT NULL THEN 'person'
-                   WHEN o.id IS NOT NULL THEN 'organization'
-               END AS type,
-               o.name_en, o.name_th, p.personal_id_number, p.comment,
-               rt.description AS role_type_description
-        FROM party_role pr
-        LEFT JOIN person p ON pr.party_id = p.id
-        LEFT JOIN organization o ON pr.party_id = o.id
-        LEFT JOIN role_type rt ON pr.role_type_id = rt.id
+@replica_read
+async def get_party_role(party_role_id: int, fields: Optional[List[str]] = None) -> Optional[Union[PartyRoleOut, dict]]:
+    query = f"""
+        {PARTY_ROLE_FIELDS.sql(fields)}
         WHERE pr.id = :id
     """
     result = await database.fetch_one(query=query, values={"id": party_role_id})
@@ -63,49 +83,31 @@ async def get_party_role(party_role_id: int) -> Optional[PartyRoleOut]:
         logger.warning(f"Party_role not found: id={party_role_id}")
         return None
     logger.info(f"Retrieved party_role: id={result['id']}")
-    return PartyRoleOut(**result)
+    return to_party_role_out(result, fields)
 
-async def get_all_party_roles() -> List[PartyRoleOut]:
-    query = """
-        SELECT pr.id, pr.party_id, pr.role_type_id, pr.fromdate, pr.thrudate,
-               CASE 
-                   WHEN p.id IS NOT NULL THEN 'person'
-                   WHEN o.id IS NOT NULL THEN 'organization'
-               END AS type,
-               o.name_en, o.name_th, p.personal_id_number, p.comment,
-               rt.description AS role_type_description
-        FROM party_role pr
-        LEFT JOIN person p ON pr.party_id = p.id
-        LEFT JOIN organization o ON pr.party_id = o.id
-        LEFT JOIN role_type rt ON pr.role_type_id = rt.id
+@replica_read
+async def get_all_party_roles(fields: Optional[List[str]] = None) -> List[Union[PartyRoleOut, dict]]:
+    query = f"""
+        {PARTY_ROLE_FIELDS.sql(fields)}
         ORDER BY pr.id ASC
     """
     results = await database.fetch_all(query=query)
     logger.info(f"Retrieved {len(results)} party_roles")
-    return [PartyRoleOut(**result) for result in results]
+    return [to_party_role_out(result, fields) for result in results]
 
-async def get_party_roles_by_party_id(party_id: int) -> List[PartyRoleOut]:
-    query = """
-        SELECT pr.id, pr.party_id, pr.role_type_id, pr.fromdate, pr.thrudate,
-               CASE 
-                   WHEN p.id IS NOT NULL THEN 'person'
-                   WHEN o.id IS NOT NULL THEN 'organization'
-               END AS type,
-               o.name_en, o.name_th, p.personal_id_number, p.comment,
-               rt.description AS role_type_description
-        FROM party_role pr
-        LEFT JOIN person p ON pr.party_id = p.id
-        LEFT JOIN organization o ON pr.party_id = o.id
-        LEFT JOIN role_type rt ON pr.role_type_id = rt.id
+@replica_read
+async def get_party_roles_by_party_id(party_id: int, fields: Optional[List[str]] = None) -> List[Union[PartyRoleOut, dict]]:
+    query = f"""
+        {PARTY_ROLE_FIELDS.sql(fields)}
         WHERE pr.party_id = :party_id
         ORDER BY pr.fromdate DESC, pr.id DESC
     """
     results = await database.fetch_all(query=query, values={"party_id": party_id})
     logger.info(f"Retrieved {len(results)} party_roles for party_id={party_id}")
-    return [PartyRoleOut(**result) for result in results]
+    return [to_party_role_out(result, fields) for result in results]
 
-async def update_party_role(party_role_id: int, party_role: PartyRoleUpdate) -> Optional[PartyRoleOut]:
-    async with database.transaction():
+async def update_party_role(party_role_id: int, party_role: PartyRoleUpdate, *, uow: Optional[UnitOfWork] = None) -> Optional[PartyRoleOut]:
+    async with unit_of_work(uow) as uow:
         try:
             query = """
                 UPDATE party_role
@@ -116,7 +118,7 @@ async def update_party_role(party_role_id: int, party_role: PartyRoleUpdate) ->
                 WHERE id = :id
                 RETURNING id, party_id, role_type_id, fromdate, thrudate
             """
-            result = await database.fetch_one(query=query, values={
+            result = await uow.fetch_one(query=query, values={
                 "party_id": party_role.party_id,
                 "role_type_id": party_role.role_type_id,
                 "fromdate": party_role.fromdate,
@@ -141,22 +143,22 @@ async def update_party_role(party_role_id: int, party_role: PartyRoleUpdate) ->
                 LEFT JOIN role_type rt ON pr.role_type_id = rt.id
                 WHERE pr.id = :id
             """
-            result = await database.fetch_one(query=query_fetch, values={"id": party_role_id})
+            result = await uow.fetch_one(query=query_fetch, values={"id": party_role_id})
             logger.info(f"Updated party_role: id={party_role_id}")
             return PartyRoleOut(**result)
         except Exception as e:
             logger.error(f"Error updating party_role: {str(e)}")
             raise
 
-async def delete_party_role(party_role_id: int) -> bool:
-    async with database.transaction():
+async def delete_party_role(party_role_id: int, *, uow: Optional[UnitOfWork] = None) -> bool:
+    async with unit_of_work(uow) as uow:
         try:
             query = """
                 DELETE FROM party_role
                 WHERE id = :id
                 RETURNING id
             """
-            result = await database.fetch_one(query=query, values={"id": party_role_id})
+            result = await uow.fetch_one(query=query, values={"id": party_role_id})
             if not result:
                 logger.warning(f"Party_role not found for deletion: id={party_role_id}")
                 return False
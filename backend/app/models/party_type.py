@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.party_type import PartyTypeCreate, PartyTypeUpdate, PartyTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("party_type")
 async def create_party_type(party_type: PartyTypeCreate) -> Optional[PartyTypeOut]:
     query = """
         SELECT id, description FROM party_type WHERE description = :description
@@ -28,6 +31,7 @@ async def create_party_type(party_type: PartyTypeCreate) -> Optional[PartyTypeOu
         logger.error(f"Error creating party type: {str(e)}")
         raise
 
+@cached("party_type")
 async def get_party_type(party_type_id: int) -> Optional[PartyTypeOut]:
     query = """
         SELECT id, description FROM party_type WHERE id = :id
@@ -39,6 +43,7 @@ async def get_party_type(party_type_id: int) -> Optional[PartyTypeOut]:
     logger.info(f"Retrieved party type: id={result['id']}, description={result['description']}")
     return PartyTypeOut(**result)
 
+@cached("party_type")
 async def get_all_party_types() -> List[PartyTypeOut]:
     query = """
         SELECT id, description FROM party_type
@@ -47,6 +52,7 @@ async def get_all_party_types() -> List[PartyTypeOut]:
     logger.info(f"Retrieved {len(results)} party types")
     return [PartyTypeOut(**result) for result in results]
 
+@bumps_version("party_type")
 async def update_party_type(party_type_id: int, party_type: PartyTypeUpdate) -> Optional[PartyTypeOut]:
     if party_type.description:
         query = """
@@ -74,6 +80,7 @@ async def update_party_type(party_type_id: int, party_type: PartyTypeUpdate) ->
         logger.error(f"Error updating party type: {str(e)}")
         raise
 
+@bumps_version("party_type")
 async def delete_party_type(party_type_id: int) -> bool:
     query = """
         SELECT id FROM party_classification WHERE party_type_id = :id LIMIT 1
@@ -68,6 +68,18 @@ async def get_passports_by_citizenship(citizenship_id: int) -> List[PassportOut]
     logger.info(f"Retrieved {len(results)} passports for citizenship_id={citizenship_id}")
     return [PassportOut(**result) for result in results]
 
+async def get_passports_by_person_id(person_id: int) -> List[PassportOut]:
+    query = """
+        SELECT pp.id, pp.passportnumber, pp.fromdate, pp.thrudate, pp.citizenship_id
+        FROM passport pp
+        JOIN citizenship c ON pp.citizenship_id = c.id
+        WHERE c.person_id = :person_id
+        ORDER BY pp.fromdate DESC, pp.id DESC
+    """
+    results = await database.fetch_all(query=query, values={"person_id": person_id})
+    logger.info(f"Retrieved {len(results)} passports for person_id={person_id}")
+    return [PassportOut(**result) for result in results]
+
 async def update_passport(passport_id: int, passport: PassportUpdate) -> Optional[PassportOut]:
     if passport.passportnumber or passport.citizenship_id:
         query = """
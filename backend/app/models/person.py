@@ -1,13 +1,26 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.unit_of_work import UnitOfWork, unit_of_work
+from app.config.cache import cached
+from app.config.fast_json import record_encoder, dumps
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.person import PersonCreate, PersonUpdate, PersonOut
+from app.models.search_key import search_keys
+from app.models.projection import Projection
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def create_person(person: PersonCreate) -> Optional[PersonOut]:
-    async with database.transaction():
+# PersonOut also carries descriptions from these reference tables, a write to any of them
+# changes cached profiles and ETags
+PERSON_ENTITIES = ("person", "gender_type", "person_name_type", "marital_status_type", "physical_characteristic_type", "country")
+
+encode_persons = record_encoder(PersonOut)
+
+@bumps_version("person")
+async def create_person(person: PersonCreate, *, uow: Optional[UnitOfWork] = None) -> Optional[PersonOut]:
+    async with unit_of_work(uow) as uow:
         try:
             # Insert into party
             query_party = """
@@ -15,7 +28,7 @@ async def create_person(person: PersonCreate) -> Optional[PersonOut]:
                 VALUES (DEFAULT)
                 RETURNING id
             """
-            party_result = await database.fetch_one(query=query_party)
+            party_result = await uow.fetch_one(query=query_party)
             new_id = party_result["id"]
 
             # Insert into person
@@ -30,7 +43,7 @@ async def create_person(person: PersonCreate) -> Optional[PersonOut]:
                 )
                 RETURNING id
             """
-            await database.fetch_one(query=query_person, values={
+            await uow.fetch_one(query=query_person, values={
                 "id": new_id,
                 "personal_id_number": person.personal_id_number,
                 "birthdate": person.birthdate,
@@ -40,34 +53,16 @@ async def create_person(person: PersonCreate) -> Optional[PersonOut]:
                 "gender_type_id": person.gender_type_id
             })
 
-            # Insert into personname for fname, mname, lname, nickname
-            if person.fname:
-                query_fname = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'FirstName'), CURRENT_DATE)
-                """
-                await database.execute(query_fname, values={"person_id": new_id, "name": person.fname})
-
-            if person.mname:
-                query_mname = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'MiddleName'), CURRENT_DATE)
-                """
-                await database.execute(query_mname, values={"person_id": new_id, "name": person.mname})
-
-            if person.lname:
-                query_lname = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'LastName'), CURRENT_DATE)
-                """
-                await database.execute(query_lname, values={"person_id": new_id, "name": person.lname})
-
-            if person.nickname:
-                query_nickname = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'Nickname'), CURRENT_DATE)
-                """
-                await database.execute(query_nickname, values={"person_id": new_id, "name": person.nickname})
+            # Insert into personname for fname, mname, lname, nickname (one pipelined round trip)
+            query_name = """
+                INSERT INTO personname (person_id, name, personnametype_id, fromdate, name_key, name_phonetic)
+                VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = :name_type), CURRENT_DATE, :name_key, :name_phonetic)
+            """
+            await uow.execute_many(query_name, values=[
+                {"person_id": new_id, "name": name, "name_type": name_type, **search_keys("name", name)}
+                for name_type, name in (("FirstName", person.fname), ("MiddleName", person.mname), ("LastName", person.lname), ("Nickname", person.nickname))
+                if name
+            ])
 
             # Insert into maritalstatus
             if person.marital_status_type_id:
@@ -75,26 +70,21 @@ async def create_person(person: PersonCreate) -> Optional[PersonOut]:
                     INSERT INTO maritalstatus (person_id, maritalstatustype_id, fromdate)
                     VALUES (:person_id, :maritalstatustype_id, CURRENT_DATE)
                 """
-                await database.execute(query_marital, values={
+                await uow.execute(query_marital, values={
                     "person_id": new_id,
                     "maritalstatustype_id": person.marital_status_type_id
                 })
 
-            # Insert into physicalcharacteristic for height
-            if person.height_val:
-                query_height = """
-                    INSERT INTO physicalcharacteristic (person_id, val, physicalcharacteristictype_id, fromdate)
-                    VALUES (:person_id, :val, (SELECT id FROM physicalcharacteristictype WHERE description = 'Height'), CURRENT_DATE)
-                """
-                await database.execute(query_height, values={"person_id": new_id, "val": person.height_val})
-
-            # Insert into physicalcharacteristic for weight
-            if person.weight_val:
-                query_weight = """
-                    INSERT INTO physicalcharacteristic (person_id, val, physicalcharacteristictype_id, fromdate)
-                    VALUES (:person_id, :val, (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight'), CURRENT_DATE)
-                """
-                await database.execute(query_weight, values={"person_id": new_id, "val": person.weight_val})
+            # Insert into physicalcharacteristic for height and weight (one pipelined round trip)
+            query_physical = """
+                INSERT INTO physicalcharacteristic (person_id, val, physicalcharacteristictype_id, fromdate)
+                VALUES (:person_id, :val, (SELECT id FROM physicalcharacteristictype WHERE description = :characteristic_type), CURRENT_DATE)
+            """
+            await uow.execute_many(query_physical, values=[
+                {"person_id": new_id, "val": val, "characteristic_type": characteristic_type}
+                for characteristic_type, val in (("Height", person.height_val), ("Weight", person.weight_val))
+                if val
+            ])
 
             # Insert into citizenship
             if person.country_id:
@@ -102,279 +92,371 @@ async def create_person(person: PersonCreate) -> Optional[PersonOut]:
                     INSERT INTO citizenship (person_id, country_id, fromdate)
                     VALUES (:person_id, :country_id, CURRENT_DATE)
                 """
-                await database.execute(query_citizenship, values={"person_id": new_id, "country_id": person.country_id})
+                await uow.execute(query_citizenship, values={"person_id": new_id, "country_id": person.country_id})
 
-            return await get_person(new_id)
+            # get_person.__wrapped__ reads past the cache, inside this transaction
+            return await get_person.__wrapped__(new_id)
         except Exception as e:
             logger.error(f"Error creating person: {str(e)}")
             raise
 
+# Current rows are the open ones (thrudate IS NULL). The partial unique indexes from
+# note_for_database/temporal_single_open_row.sql keep one per (person, type) and
+# INCLUDE the selected columns, so each lookup is an index-only scan; thrudate of an
+# open row is always NULL and is not read from the table.
+GET_PERSON_QUERY = """
+    SELECT 
+        p.id, 
+        p.personal_id_number, 
+        p.birthdate, 
+        p.mothermaidenname, 
+        p.totalyearworkexperience, 
+        p.comment, 
+        p.gender_type_id,
+        gt.description AS gender_description,
+        pn1.id AS fname_id,
+        pn1.name AS fname,
+        pn1.fromdate AS fname_fromdate,
+        CAST(NULL AS DATE) AS fname_thrudate,
+        pn1.personnametype_id AS fname_personnametype_id,
+        pnt1.description AS fname_personnametype_description,
+        pn2.id AS mname_id,
+        pn2.name AS mname,
+        pn2.fromdate AS mname_fromdate,
+        CAST(NULL AS DATE) AS mname_thrudate,
+        pn2.personnametype_id AS mname_personnametype_id,
+        pnt2.description AS mname_personnametype_description,
+        pn3.id AS lname_id,
+        pn3.name AS lname,
+        pn3.fromdate AS lname_fromdate,
+        CAST(NULL AS DATE) AS lname_thrudate,
+        pn3.personnametype_id AS lname_personnametype_id,
+        pnt3.description AS lname_personnametype_description,
+        pn4.id AS nickname_id,
+        pn4.name AS nickname,
+        pn4.fromdate AS nickname_fromdate,
+        CAST(NULL AS DATE) AS nickname_thrudate,
+        pn4.personnametype_id AS nickname_personnametype_id,
+        pnt4.description AS nickname_personnametype_description,
+        ms.id AS marital_status_id,
+        ms.fromdate AS marital_status_fromdate,
+        CAST(NULL AS DATE) AS marital_status_thrudate,
+        ms.maritalstatustype_id AS marital_status_type_id,
+        mst.description AS marital_status_type_description,
+        pc1.id AS height_id,
+        pc1.val AS height_val,
+        pc1.fromdate AS height_fromdate,
+        CAST(NULL AS DATE) AS height_thrudate,
+        pc1.physicalcharacteristictype_id AS height_type_id,
+        pct1.description AS height_type_description,
+        pc2.id AS weight_id,
+        pc2.val AS weight_val,
+        pc2.fromdate AS weight_fromdate,
+        CAST(NULL AS DATE) AS weight_thrudate,
+        pc2.physicalcharacteristictype_id AS weight_type_id,
+        pct2.description AS weight_type_description,
+        c.id AS citizenship_id,
+        c.fromdate AS citizenship_fromdate,
+        CAST(NULL AS DATE) AS citizenship_thrudate,
+        c.country_id AS country_id,
+        co.isocode AS country_isocode,
+        co.name_en AS country_name_en,
+        co.name_th AS country_name_th
+    FROM person p
+    LEFT JOIN gender_type gt ON p.gender_type_id = gt.id
+    LEFT JOIN personname pn1 
+        ON pn1.person_id = p.id 
+        AND pn1.thrudate IS NULL 
+        AND pn1.personnametype_id = (SELECT id FROM personnametype WHERE description = 'FirstName')
+    LEFT JOIN personnametype pnt1 ON pn1.personnametype_id = pnt1.id
+    LEFT JOIN personname pn2 
+        ON pn2.person_id = p.id 
+        AND pn2.thrudate IS NULL 
+        AND pn2.personnametype_id = (SELECT id FROM personnametype WHERE description = 'MiddleName')
+    LEFT JOIN personnametype pnt2 ON pn2.personnametype_id = pnt2.id
+    LEFT JOIN personname pn3 
+        ON pn3.person_id = p.id 
+        AND pn3.thrudate IS NULL 
+        AND pn3.personnametype_id = (SELECT id FROM personnametype WHERE description = 'LastName')
+    LEFT JOIN personnametype pnt3 ON pn3.personnametype_id = pnt3.id
+    LEFT JOIN personname pn4 
+        ON pn4.person_id = p.id 
+        AND pn4.thrudate IS NULL 
+        AND pn4.personnametype_id = (SELECT id FROM personnametype WHERE description = 'Nickname')
+    LEFT JOIN personnametype pnt4 ON pn4.personnametype_id = pnt4.id
+    LEFT JOIN maritalstatus ms 
+        ON ms.person_id = p.id 
+        AND ms.thrudate IS NULL
+    LEFT JOIN maritalstatustype mst ON ms.maritalstatustype_id = mst.id
+    LEFT JOIN physicalcharacteristic pc1 
+        ON pc1.person_id = p.id 
+        AND pc1.thrudate IS NULL 
+        AND pc1.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
+    LEFT JOIN physicalcharacteristictype pct1 ON pc1.physicalcharacteristictype_id = pct1.id
+    LEFT JOIN physicalcharacteristic pc2 
+        ON pc2.person_id = p.id 
+        AND pc2.thrudate IS NULL 
+        AND pc2.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')
+    LEFT JOIN physicalcharacteristictype pct2 ON pc2.physicalcharacteristictype_id = pct2.id
+    LEFT JOIN LATERAL (
+        -- Dual citizenship keeps one open row per country; show the latest one
+        SELECT id, fromdate, country_id FROM citizenship
+        WHERE person_id = p.id
+        AND thrudate IS NULL
+        ORDER BY fromdate DESC, id DESC
+        LIMIT 1
+    ) c ON TRUE
+    LEFT JOIN country co ON c.country_id = co.id
+    WHERE p.id = :id
+"""
+
+@cached(*PERSON_ENTITIES)
 async def get_person(person_id: int) -> Optional[PersonOut]:
-    query = """
-        WITH ranked_names AS (
-            SELECT 
-                pn.*, 
-                ROW_NUMBER() OVER (PARTITION BY pn.person_id, pn.personnametype_id ORDER BY pn.fromdate DESC, pn.id DESC) AS rn
-            FROM personname pn
-        ),
-        ranked_marital AS (
-            SELECT 
-                ms.*, 
-                ROW_NUMBER() OVER (PARTITION BY ms.person_id ORDER BY ms.fromdate DESC, ms.id DESC) AS rn
-            FROM maritalstatus ms
-        ),
-        ranked_physical AS (
-            SELECT 
-                pc.*, 
-                ROW_NUMBER() OVER (PARTITION BY pc.person_id, pc.physicalcharacteristictype_id ORDER BY pc.fromdate DESC, pc.id DESC) AS rn
-            FROM physicalcharacteristic pc
-        ),
-        ranked_citizenship AS (
-            SELECT 
-                c.*, 
-                ROW_NUMBER() OVER (PARTITION BY c.person_id ORDER BY c.fromdate DESC, c.id DESC) AS rn
-            FROM citizenship c
-        )
-        SELECT 
-            p.id, 
-            p.personal_id_number, 
-            p.birthdate, 
-            p.mothermaidenname, 
-            p.totalyearworkexperience, 
-            p.comment, 
-            p.gender_type_id,
-            gt.description AS gender_description,
-            pn1.id AS fname_id,
-            pn1.name AS fname,
-            pn1.fromdate AS fname_fromdate,
-            pn1.thrudate AS fname_thrudate,
-            pn1.personnametype_id AS fname_personnametype_id,
-            pnt1.description AS fname_personnametype_description,
-            pn2.id AS mname_id,
-            pn2.name AS mname,
-            pn2.fromdate AS mname_fromdate,
-            pn2.thrudate AS mname_thrudate,
-            pn2.personnametype_id AS mname_personnametype_id,
-            pnt2.description AS mname_personnametype_description,
-            pn3.id AS lname_id,
-            pn3.name AS lname,
-            pn3.fromdate AS lname_fromdate,
-            pn3.thrudate AS lname_thrudate,
-            pn3.personnametype_id AS lname_personnametype_id,
-            pnt3.description AS lname_personnametype_description,
-            pn4.id AS nickname_id,
-            pn4.name AS nickname,
-            pn4.fromdate AS nickname_fromdate,
-            pn4.thrudate AS nickname_thrudate,
-            pn4.personnametype_id AS nickname_personnametype_id,
-            pnt4.description AS nickname_personnametype_description,
-            ms.id AS marital_status_id,
-            ms.fromdate AS marital_status_fromdate,
-            ms.thrudate AS marital_status_thrudate,
-            ms.maritalstatustype_id AS marital_status_type_id,
-            mst.description AS marital_status_type_description,
-            pc1.id AS height_id,
-            pc1.val AS height_val,
-            pc1.fromdate AS height_fromdate,
-            pc1.thrudate AS height_thrudate,
-            pc1.physicalcharacteristictype_id AS height_type_id,
-            pct1.description AS height_type_description,
-            pc2.id AS weight_id,
-            pc2.val AS weight_val,
-            pc2.fromdate AS weight_fromdate,
-            pc2.thrudate AS weight_thrudate,
-            pc2.physicalcharacteristictype_id AS weight_type_id,
-            pct2.description AS weight_type_description,
-            c.id AS citizenship_id,
-            c.fromdate AS citizenship_fromdate,
-            c.thrudate AS citizenship_thrudate,
-            c.country_id AS country_id,
-            co.isocode AS country_isocode,
-            co.name_en AS country_name_en,
-            co.name_th AS country_name_th
-        FROM person p
-        LEFT JOIN gender_type gt ON p.gender_type_id = gt.id
-        LEFT JOIN ranked_names pn1 
-            ON pn1.person_id = p.id 
-            AND pn1.rn = 1 
-            AND pn1.personnametype_id = (SELECT id FROM personnametype WHERE description = 'FirstName')
-        LEFT JOIN personnametype pnt1 ON pn1.personnametype_id = pnt1.id
-        LEFT JOIN ranked_names pn2 
-            ON pn2.person_id = p.id 
-            AND pn2.rn = 1 
-            AND pn2.personnametype_id = (SELECT id FROM personnametype WHERE description = 'MiddleName')
-        LEFT JOIN personnametype pnt2 ON pn2.personnametype_id = pnt2.id
-        LEFT JOIN ranked_names pn3 
-            ON pn3.person_id = p.id 
-            AND pn3.rn = 1 
-            AND pn3.personnametype_id = (SELECT id FROM personnametype WHERE description = 'LastName')
-        LEFT JOIN personnametype pnt3 ON pn3.personnametype_id = pnt3.id
-        LEFT JOIN ranked_names pn4 
-            ON pn4.person_id = p.id 
-            AND pn4.rn = 1 
-            AND pn4.personnametype_id = (SELECT id FROM personnametype WHERE description = 'Nickname')
-        LEFT JOIN personnametype pnt4 ON pn4.personnametype_id = pnt4.id
-        LEFT JOIN ranked_marital ms 
-            ON ms.person_id = p.id 
-            AND ms.rn = 1
-        LEFT JOIN maritalstatustype mst ON ms.maritalstatustype_id = mst.id
-        LEFT JOIN ranked_physical pc1 
-            ON pc1.person_id = p.id 
-            AND pc1.rn = 1 
-            AND pc1.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
-        LEFT JOIN physicalcharacteristictype pct1 ON pc1.physicalcharacteristictype_id = pct1.id
-        LEFT JOIN ranked_physical pc2 
-            ON pc2.person_id = p.id 
-            AND pc2.rn = 1 
-            AND pc2.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')
-        LEFT JOIN physicalcharacteristictype pct2 ON pc2.physicalcharacteristictype_id = pct2.id
-        LEFT JOIN ranked_citizenship c 
-            ON c.person_id = p.id 
-            AND c.rn = 1
-        LEFT JOIN country co ON c.country_id = co.id
-        WHERE p.id = :id
-    """
-    result = await database.fetch_one(query=query, values={"id": person_id})
+    result = await database.fetch_one(query=GET_PERSON_QUERY, values={"id": person_id})
     if not result:
         logger.warning(f"Person not found: id={person_id}")
         return None
     logger.info(f"Fetched person: id={result['id']}")
     return PersonOut(**result)
 
+# Current rows are the open ones (thrudate IS NULL). The partial unique indexes from
+# note_for_database/temporal_single_open_row.sql keep one per (person, type) and
+# INCLUDE the selected columns, so each lookup is an index-only scan; thrudate of an
+# open row is always NULL and is not read from the table.
+GET_ALL_PERSONS_QUERY = """
+    SELECT 
+        p.id, 
+        p.personal_id_number, 
+        p.birthdate, 
+        p.mothermaidenname, 
+        p.totalyearworkexperience, 
+        p.comment, 
+        p.gender_type_id,
+        gt.description AS gender_description,
+        pn1.id AS fname_id,
+        pn1.name AS fname,
+        pn1.fromdate AS fname_fromdate,
+        CAST(NULL AS DATE) AS fname_thrudate,
+        pn1.personnametype_id AS fname_personnametype_id,
+        pnt1.description AS fname_personnametype_description,
+        pn2.id AS mname_id,
+        pn2.name AS mname,
+        pn2.fromdate AS mname_fromdate,
+        CAST(NULL AS DATE) AS mname_thrudate,
+        pn2.personnametype_id AS mname_personnametype_id,
+        pnt2.description AS mname_personnametype_description,
+        pn3.id AS lname_id,
+        pn3.name AS lname,
+        pn3.fromdate AS lname_fromdate,
+        CAST(NULL AS DATE) AS lname_thrudate,
+        pn3.personnametype_id AS lname_personnametype_id,
+        pnt3.description AS lname_personnametype_description,
+        pn4.id AS nickname_id,
+        pn4.name AS nickname,
+        pn4.fromdate AS nickname_fromdate,
+        CAST(NULL AS DATE) AS nickname_thrudate,
+        pn4.personnametype_id AS nickname_personnametype_id,
+        pnt4.description AS nickname_personnametype_description,
+        ms.id AS marital_status_id,
+        ms.fromdate AS marital_status_fromdate,
+        CAST(NULL AS DATE) AS marital_status_thrudate,
+        ms.maritalstatustype_id AS marital_status_type_id,
+        mst.description AS marital_status_type_description,
+        pc1.id AS height_id,
+        pc1.val AS height_val,
+        pc1.fromdate AS height_fromdate,
+        CAST(NULL AS DATE) AS height_thrudate,
+        pc1.physicalcharacteristictype_id AS height_type_id,
+        pct1.description AS height_type_description,
+        pc2.id AS weight_id,
+        pc2.val AS weight_val,
+        pc2.fromdate AS weight_fromdate,
+        CAST(NULL AS DATE) AS weight_thrudate,
+        pc2.physicalcharacteristictype_id AS weight_type_id,
+        pct2.description AS weight_type_description,
+        c.id AS citizenship_id,
+        c.fromdate AS citizenship_fromdate,
+        CAST(NULL AS DATE) AS citizenship_thrudate,
+        c.country_id AS country_id,
+        co.isocode AS country_isocode,
+        co.name_en AS country_name_en,
+        co.name_th AS country_name_th
+    FROM person p
+    LEFT JOIN gender_type gt ON p.gender_type_id = gt.id
+    LEFT JOIN personname pn1 
+        ON pn1.person_id = p.id 
+        AND pn1.thrudate IS NULL 
+        AND pn1.personnametype_id = (SELECT id FROM personnametype WHERE description = 'FirstName')
+    LEFT JOIN personnametype pnt1 ON pn1.personnametype_id = pnt1.id
+    LEFT JOIN personname pn2 
+        ON pn2.person_id = p.id 
+        AND pn2.thrudate IS NULL 
+        AND pn2.personnametype_id = (SELECT id FROM personnametype WHERE description = 'MiddleName')
+    LEFT JOIN personnametype pnt2 ON pn2.personnametype_id = pnt2.id
+    LEFT JOIN personname pn3 
+        ON pn3.person_id = p.id 
+        AND pn3.thrudate IS NULL 
+        AND pn3.personnametype_id = (SELECT id FROM personnametype WHERE description = 'LastName')
+    LEFT JOIN personnametype pnt3 ON pn3.personnametype_id = pnt3.id
+    LEFT JOIN personname pn4 
+        ON pn4.person_id = p.id 
+        AND pn4.thrudate IS NULL 
+        AND pn4.personnametype_id = (SELECT id FROM personnametype WHERE description = 'Nickname')
+    LEFT JOIN personnametype pnt4 ON pn4.personnametype_id = pnt4.id
+    LEFT JOIN maritalstatus ms 
+        ON ms.person_id = p.id 
+        AND ms.thrudate IS NULL
+    LEFT JOIN maritalstatustype mst ON ms.maritalstatustype_id = mst.id
+    LEFT JOIN physicalcharacteristic pc1 
+        ON pc1.person_id = p.id 
+        AND pc1.thrudate IS NULL 
+        AND pc1.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
+    LEFT JOIN physicalcharacteristictype pct1 ON pc1.physicalcharacteristictype_id = pct1.id
+    LEFT JOIN physicalcharacteristic pc2 
+        ON pc2.person_id = p.id 
+        AND pc2.thrudate IS NULL 
+        AND pc2.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')
+    LEFT JOIN physicalcharacteristictype pct2 ON pc2.physicalcharacteristictype_id = pct2.id
+    LEFT JOIN LATERAL (
+        -- Dual citizenship keeps one open row per country; show the latest one
+        SELECT id, fromdate, country_id FROM citizenship
+        WHERE person_id = p.id
+        AND thrudate IS NULL
+        ORDER BY fromdate DESC, id DESC
+        LIMIT 1
+    ) c ON TRUE
+    LEFT JOIN country co ON c.country_id = co.id
+    ORDER BY p.id ASC
+"""
+
+@cached(*PERSON_ENTITIES)
 async def get_all_persons() -> List[PersonOut]:
-    query = """
-        WITH ranked_names AS (
-            SELECT 
-                pn.*, 
-                ROW_NUMBER() OVER (PARTITION BY pn.person_id, pn.personnametype_id ORDER BY pn.fromdate DESC, pn.id DESC) AS rn
-            FROM personname pn
-        ),
-        ranked_marital AS (
-            SELECT 
-                ms.*, 
-                ROW_NUMBER() OVER (PARTITION BY ms.person_id ORDER BY ms.fromdate DESC, ms.id DESC) AS rn
-            FROM maritalstatus ms
-        ),
-        ranked_physical AS (
-            SELECT 
-                pc.*, 
-                ROW_NUMBER() OVER (PARTITION BY pc.person_id, pc.physicalcharacteristictype_id ORDER BY pc.fromdate DESC, pc.id DESC) AS rn
-            FROM physicalcharacteristic pc
-        ),
-        ranked_citizenship AS (
-            SELECT 
-                c.*, 
-                ROW_NUMBER() OVER (PARTITION BY c.person_id ORDER BY c.fromdate DESC, c.id DESC) AS rn
-            FROM citizenship c
-        )
-        SELECT 
-            p.id, 
-            p.personal_id_number, 
-            p.birthdate, 
-            p.mothermaidenname, 
-            p.totalyearworkexperience, 
-            p.comment, 
-            p.gender_type_id,
-            gt.description AS gender_description,
-            pn1.id AS fname_id,
-            pn1.name AS fname,
-            pn1.fromdate AS fname_fromdate,
-            pn1.thrudate AS fname_thrudate,
-            pn1.personnametype_id AS fname_personnametype_id,
-            pnt1.description AS fname_personnametype_description,
-            pn2.id AS mname_id,
-            pn2.name AS mname,
-            pn2.fromdate AS mname_fromdate,
-            pn2.thrudate AS mname_thrudate,
-            pn2.personnametype_id AS mname_personnametype_id,
-            pnt2.description AS mname_personnametype_description,
-            pn3.id AS lname_id,
-            pn3.name AS lname,
-            pn3.fromdate AS lname_fromdate,
-            pn3.thrudate AS lname_thrudate,
-            pn3.personnametype_id AS lname_personnametype_id,
-            pnt3.description AS lname_personnametype_description,
-            pn4.id AS nickname_id,
-            pn4.name AS nickname,
-            pn4.fromdate AS nickname_fromdate,
-            pn4.thrudate AS nickname_thrudate,
-            pn4.personnametype_id AS nickname_personnametype_id,
-            pnt4.description AS nickname_personnametype_description,
-            ms.id AS marital_status_id,
-            ms.fromdate AS marital_status_fromdate,
-            ms.thrudate AS marital_status_thrudate,
-            ms.maritalstatustype_id AS marital_status_type_id,
-            mst.description AS marital_status_type_description,
-            pc1.id AS height_id,
-            pc1.val AS height_val,
-            pc1.fromdate AS height_fromdate,
-            pc1.thrudate AS height_thrudate,
-            pc1.physicalcharacteristictype_id AS height_type_id,
-            pct1.description AS height_type_description,
-            pc2.id AS weight_id,
-            pc2.val AS weight_val,
-            pc2.fromdate AS weight_fromdate,
-            pc2.thrudate AS weight_thrudate,
-            pc2.physicalcharacteristictype_id AS weight_type_id,
-            pct2.description AS weight_type_description,
-            c.id AS citizenship_id,
-            c.fromdate AS citizenship_fromdate,
-            c.thrudate AS citizenship_thrudate,
-            c.country_id AS country_id,
-            co.isocode AS country_isocode,
-            co.name_en AS country_name_en,
-            co.name_th AS country_name_th
-        FROM person p
-        LEFT JOIN gender_type gt ON p.gender_type_id = gt.id
-        LEFT JOIN ranked_names pn1 
-            ON pn1.person_id = p.id 
-            AND pn1.rn = 1 
-            AND pn1.personnametype_id = (SELECT id FROM personnametype WHERE description = 'FirstName')
-        LEFT JOIN personnametype pnt1 ON pn1.personnametype_id = pnt1.id
-        LEFT JOIN ranked_names pn2 
-            ON pn2.person_id = p.id 
-            AND pn2.rn = 1 
-            AND pn2.personnametype_id = (SELECT id FROM personnametype WHERE description = 'MiddleName')
-        LEFT JOIN personnametype pnt2 ON pn2.personnametype_id = pnt2.id
-        LEFT JOIN ranked_names pn3 
-            ON pn3.person_id = p.id 
-            AND pn3.rn = 1 
-            AND pn3.personnametype_id = (SELECT id FROM personnametype WHERE description = 'LastName')
-        LEFT JOIN personnametype pnt3 ON pn3.personnametype_id = pnt3.id
-        LEFT JOIN ranked_names pn4 
-            ON pn4.person_id = p.id 
-            AND pn4.rn = 1 
-            AND pn4.personnametype_id = (SELECT id FROM personnametype WHERE description = 'Nickname')
-        LEFT JOIN personnametype pnt4 ON pn4.personnametype_id = pnt4.id
-        LEFT JOIN ranked_marital ms 
-            ON ms.person_id = p.id 
-            AND ms.rn = 1
-        LEFT JOIN maritalstatustype mst ON ms.maritalstatustype_id = mst.id
-        LEFT JOIN ranked_physical pc1 
-            ON pc1.person_id = p.id 
-            AND pc1.rn = 1 
-            AND pc1.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
-        LEFT JOIN physicalcharacteristictype pct1 ON pc1.physicalcharacteristictype_id = pct1.id
-        LEFT JOIN ranked_physical pc2 
-            ON pc2.person_id = p.id 
-            AND pc2.rn = 1 
-            AND pc2.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')
-        LEFT JOIN physicalcharacteristictype pct2 ON pc2.physicalcharacteristictype_id = pct2.id
-        LEFT JOIN ranked_citizenship c 
-            ON c.person_id = p.id 
-            AND c.rn = 1
-        LEFT JOIN country co ON c.country_id = co.id
+    results = await database.fetch_all(query=GET_ALL_PERSONS_QUERY)
+    logger.info(f"Fetched {len(results)} persons")
+    return [PersonOut(**result) for result in results]
+
+# ?fields= sparse fieldsets: the columns of the queries above, each with the joins it reads, so
+# fields=id,fname,lname joins personname twice instead of the whole profile
+PERSON_FIELDS_COLUMNS = {
+    "id": "p.id",
+    "personal_id_number": "p.personal_id_number",
+    "birthdate": "p.birthdate",
+    "mothermaidenname": "p.mothermaidenname",
+    "totalyearworkexperience": "p.totalyearworkexperience",
+    "comment": "p.comment",
+    "gender_type_id": "p.gender_type_id",
+    "gender_description": ("gt.description", "gt"),
+}
+PERSON_FIELDS_JOINS = {"gt": "LEFT JOIN gender_type gt ON p.gender_type_id = gt.id"}
+
+for prefix, n, description in (("fname", 1, "FirstName"), ("mname", 2, "MiddleName"), ("lname", 3, "LastName"), ("nickname", 4, "Nickname")):
+    PERSON_FIELDS_COLUMNS.update({
+        f"{prefix}_id": (f"pn{n}.id", f"pn{n}"),
+        prefix: (f"pn{n}.name", f"pn{n}"),
+        f"{prefix}_fromdate": (f"pn{n}.fromdate", f"pn{n}"),
+        f"{prefix}_thrudate": "CAST(NULL AS DATE)",
+        f"{prefix}_personnametype_id": (f"pn{n}.personnametype_id", f"pn{n}"),
+        f"{prefix}_personnametype_description": (f"pnt{n}.description", f"pn{n}", f"pnt{n}"),
+    })
+    PERSON_FIELDS_JOINS.update({
+        f"pn{n}": f"""LEFT JOIN personname pn{n}
+            ON pn{n}.person_id = p.id
+            AND pn{n}.thrudate IS NULL
+            AND pn{n}.personnametype_id = (SELECT id FROM personnametype WHERE description = '{description}')""",
+        f"pnt{n}": f"LEFT JOIN personnametype pnt{n} ON pn{n}.personnametype_id = pnt{n}.id",
+    })
+
+PERSON_FIELDS_COLUMNS.update({
+    "marital_status_id": ("ms.id", "ms"),
+    "marital_status_fromdate": ("ms.fromdate", "ms"),
+    "marital_status_thrudate": "CAST(NULL AS DATE)",
+    "marital_status_type_id": ("ms.maritalstatustype_id", "ms"),
+    "marital_status_type_description": ("mst.description", "ms", "mst"),
+})
+PERSON_FIELDS_JOINS.update({
+    "ms": """LEFT JOIN maritalstatus ms
+            ON ms.person_id = p.id
+            AND ms.thrudate IS NULL""",
+    "mst": "LEFT JOIN maritalstatustype mst ON ms.maritalstatustype_id = mst.id",
+})
+
+for prefix, n, description in (("height", 1, "Height"), ("weight", 2, "Weight")):
+    PERSON_FIELDS_COLUMNS.update({
+        f"{prefix}_id": (f"pc{n}.id", f"pc{n}"),
+        # PersonOut turns the numeric into a float; these rows are written as they come
+        f"{prefix}_val": (f"CAST(pc{n}.val AS DOUBLE PRECISION)", f"pc{n}"),
+        f"{prefix}_fromdate": (f"pc{n}.fromdate", f"pc{n}"),
+        f"{prefix}_thrudate": "CAST(NULL AS DATE)",
+        f"{prefix}_type_id": (f"pc{n}.physicalcharacteristictype_id", f"pc{n}"),
+        f"{prefix}_type_description": (f"pct{n}.description", f"pc{n}", f"pct{n}"),
+    })
+    PERSON_FIELDS_JOINS.update({
+        f"pc{n}": f"""LEFT JOIN physicalcharacteristic pc{n}
+            ON pc{n}.person_id = p.id
+            AND pc{n}.thrudate IS NULL
+            AND pc{n}.physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = '{description}')""",
+        f"pct{n}": f"LEFT JOIN physicalcharacteristictype pct{n} ON pc{n}.physicalcharacteristictype_id = pct{n}.id",
+    })
+
+PERSON_FIELDS_COLUMNS.update({
+    "citizenship_id": ("c.id", "c"),
+    "citizenship_fromdate": ("c.fromdate", "c"),
+    "citizenship_thrudate": "CAST(NULL AS DATE)",
+    "country_id": ("c.country_id", "c"),
+    "country_isocode": ("co.isocode", "c", "co"),
+    "country_name_en": ("co.name_en", "c", "co"),
+    "country_name_th": ("co.name_th", "c", "co"),
+})
+PERSON_FIELDS_JOINS.update({
+    "c": """LEFT JOIN LATERAL (
+            -- Dual citizenship keeps one open row per country; show the latest one
+            SELECT id, fromdate, country_id FROM citizenship
+            WHERE person_id = p.id
+            AND thrudate IS NULL
+            ORDER BY fromdate DESC, id DESC
+            LIMIT 1
+        ) c ON TRUE""",
+    "co": "LEFT JOIN country co ON c.country_id = co.id",
+})
+
+PERSON_FIELDS = Projection("person p", PERSON_FIELDS_COLUMNS, PERSON_FIELDS_JOINS)
+
+@cached(*PERSON_ENTITIES)
+async def get_all_persons_json(fields: Optional[List[str]] = None) -> bytes:
+    # Same list as get_all_persons, encoded straight from the records (app/config/fast_json.py);
+    # with fields only those columns are selected and written
+    if not fields:
+        results = await database.fetch_all(query=GET_ALL_PERSONS_QUERY)
+        logger.info(f"Fetched {len(results)} persons")
+        return encode_persons(results)
+    query = f"""
+        {PERSON_FIELDS.sql(fields)}
         ORDER BY p.id ASC
     """
     results = await database.fetch_all(query=query)
-    logger.info(f"Fetched {len(results)} persons")
-    return [PersonOut(**result) for result in results]
+    logger.info(f"Fetched {len(results)} persons, fields={fields}")
+    return dumps([PERSON_FIELDS.row(result) for result in results])
 
+@cached(*PERSON_ENTITIES)
+async def get_person_json(person_id: int, fields: List[str]) -> Optional[bytes]:
+    # get_person with ?fields=, as JSON bytes
+    query = f"""
+        {PERSON_FIELDS.sql(fields)}
+        WHERE p.id = :id
+    """
+    result = await database.fetch_one(query=query, values={"id": person_id})
+    if not result:
+        logger.warning(f"Person not found: id={person_id}")
+        return None
+    logger.info(f"Fetched person: id={result['id']}, fields={fields}")
+    return dumps(PERSON_FIELDS.row(result))
+
+@bumps_version("person")
 async def update_person(person_id: int, person: PersonUpdate) -> Optional[PersonOut]:
     async with database.transaction():
         try:
             # Fetch current person data
-            current_person = await get_person(person_id)
+            current_person = await get_person.__wrapped__(person_id)
             if not current_person:
                 logger.warning(f"Person not found for update: id={person_id}")
                 return None
@@ -415,99 +497,74 @@ async def update_person(person_id: int, person: PersonUpdate) -> Optional[Person
             # Update personname for fname
             if person.fname and person.fname != current_person.fname:
                 query_fname_update = """
-                    WITH ranked_names AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id, personnametype_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM personname
-                        WHERE person_id = :person_id
-                        AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'FirstName')
-                        AND thrudate IS NULL
-                    )
                     UPDATE personname
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_names WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'FirstName')
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_fname_update, values={"person_id": person_id})
                 query_fname_insert = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'FirstName'), CURRENT_DATE)
+                    INSERT INTO personname (person_id, name, personnametype_id, fromdate, name_key, name_phonetic)
+                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'FirstName'), CURRENT_DATE, :name_key, :name_phonetic)
                 """
-                await database.execute(query_fname_insert, values={"person_id": person_id, "name": person.fname})
+                await database.execute(query_fname_insert, values={"person_id": person_id, "name": person.fname, **search_keys("name", person.fname)})
 
             # Update personname for mname
             if person.mname and person.mname != current_person.mname:
                 query_mname_update = """
-                    WITH ranked_names AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id, personnametype_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM personname
-                        WHERE person_id = :person_id
-                        AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'MiddleName')
-                        AND thrudate IS NULL
-                    )
                     UPDATE personname
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_names WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'MiddleName')
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_mname_update, values={"person_id": person_id})
                 query_mname_insert = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'MiddleName'), CURRENT_DATE)
+                    INSERT INTO personname (person_id, name, personnametype_id, fromdate, name_key, name_phonetic)
+                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'MiddleName'), CURRENT_DATE, :name_key, :name_phonetic)
                 """
-                await database.execute(query_mname_insert, values={"person_id": person_id, "name": person.mname})
+                await database.execute(query_mname_insert, values={"person_id": person_id, "name": person.mname, **search_keys("name", person.mname)})
 
             # Update personname for lname
             if person.lname and person.lname != current_person.lname:
                 query_lname_update = """
-                    WITH ranked_names AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id, personnametype_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM personname
-                        WHERE person_id = :person_id
-                        AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'LastName')
-                        AND thrudate IS NULL
-                    )
                     UPDATE personname
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_names WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'LastName')
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_lname_update, values={"person_id": person_id})
                 query_lname_insert = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'LastName'), CURRENT_DATE)
+                    INSERT INTO personname (person_id, name, personnametype_id, fromdate, name_key, name_phonetic)
+                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'LastName'), CURRENT_DATE, :name_key, :name_phonetic)
                 """
-                await database.execute(query_lname_insert, values={"person_id": person_id, "name": person.lname})
+                await database.execute(query_lname_insert, values={"person_id": person_id, "name": person.lname, **search_keys("name", person.lname)})
 
             # Update personname for nickname
             if person.nickname and person.nickname != current_person.nickname:
                 query_nickname_update = """
-                    WITH ranked_names AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id, personnametype_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM personname
-                        WHERE person_id = :person_id
-                        AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'Nickname')
-                        AND thrudate IS NULL
-                    )
                     UPDATE personname
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_names WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND personnametype_id = (SELECT id FROM personnametype WHERE description = 'Nickname')
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_nickname_update, values={"person_id": person_id})
                 query_nickname_insert = """
-                    INSERT INTO personname (person_id, name, personnametype_id, fromdate)
-                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'Nickname'), CURRENT_DATE)
+                    INSERT INTO personname (person_id, name, personnametype_id, fromdate, name_key, name_phonetic)
+                    VALUES (:person_id, :name, (SELECT id FROM personnametype WHERE description = 'Nickname'), CURRENT_DATE, :name_key, :name_phonetic)
                 """
-                await database.execute(query_nickname_insert, values={"person_id": person_id, "name": person.nickname})
+                await database.execute(query_nickname_insert, values={"person_id": person_id, "name": person.nickname, **search_keys("name", person.nickname)})
 
             # Update maritalstatus
             if person.marital_status_type_id and person.marital_status_type_id != current_person.marital_status_type_id:
                 query_marital_update = """
-                    WITH ranked_marital AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM maritalstatus
-                        WHERE person_id = :person_id
-                        AND thrudate IS NULL
-                    )
                     UPDATE maritalstatus
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_marital WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_marital_update, values={"person_id": person_id})
                 query_marital_insert = """
@@ -522,16 +579,11 @@ async def update_person(person_id: int, person: PersonUpdate) -> Optional[Person
             # Update physicalcharacteristic for height
             if person.height_val and person.height_val != current_person.height_val:
                 query_height_update = """
-                    WITH ranked_physical AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id, physicalcharacteristictype_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM physicalcharacteristic
-                        WHERE person_id = :person_id
-                        AND physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
-                        AND thrudate IS NULL
-                    )
                     UPDATE physicalcharacteristic
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_physical WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_height_update, values={"person_id": person_id})
                 query_height_insert = """
@@ -543,16 +595,11 @@ async def update_person(person_id: int, person: PersonUpdate) -> Optional[Person
             # Update physicalcharacteristic for weight
             if person.weight_val and person.weight_val != current_person.weight_val:
                 query_weight_update = """
-                    WITH ranked_physical AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id, physicalcharacteristictype_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM physicalcharacteristic
-                        WHERE person_id = :person_id
-                        AND physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')
-                        AND thrudate IS NULL
-                    )
                     UPDATE physicalcharacteristic
                     SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_physical WHERE rn = 1)
+                    WHERE person_id = :person_id
+                    AND physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')
+                    AND thrudate IS NULL
                 """
                 await database.execute(query_weight_update, values={"person_id": person_id})
                 query_weight_insert = """
@@ -564,28 +611,263 @@ async def update_person(person_id: int, person: PersonUpdate) -> Optional[Person
             # Update citizenship
             if person.country_id and person.country_id != current_person.country_id:
                 query_citizenship_update = """
-                    WITH ranked_citizenship AS (
-                        SELECT id, ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY fromdate DESC, id DESC) AS rn
-                        FROM citizenship
+                    UPDATE citizenship
+                    SET thrudate = CURRENT_DATE
+                    WHERE id = (
+                        SELECT id FROM citizenship
                         WHERE person_id = :person_id
                         AND thrudate IS NULL
+                        ORDER BY fromdate DESC, id DESC
+                        LIMIT 1
                     )
-                    UPDATE citizenship
-                    SET thrudate = CURRENT_DATE
-                    WHERE id IN (SELECT id FROM ranked_citizenship WHERE rn = 1)
                 """
                 await database.execute(query_citizenship_update, values={"person_id": person_id})
+                # A dual citizen may already hold the new country (citizenship_open_uidx): keep that row
                 query_citizenship_insert = """
                     INSERT INTO citizenship (person_id, country_id, fromdate)
-                    VALUES (:person_id, :country_id, CURRENT_DATE)
+                    SELECT :person_id, :country_id, CURRENT_DATE
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM citizenship
+                        WHERE person_id = :person_id AND country_id = :country_id AND thrudate IS NULL
+                    )
                 """
                 await database.execute(query_citizenship_insert, values={"person_id": person_id, "country_id": person.country_id})
 
-            return await get_person(person_id)
+            return await get_person.__wrapped__(person_id)
         except Exception as e:
             logger.error(f"Error updating person: {str(e)}")
             raise
 
+# PATCH /v1/person/{id}: temporal attributes keyed by the PersonUpdate field that sets them
+# field: (table, value column, value SQL type, type column, type id lookup)
+TEMPORAL_ATTRIBUTES = {
+    "fname": ("personname", "name", "VARCHAR", "personnametype_id", "(SELECT id FROM personnametype WHERE description = 'FirstName')"),
+    "mname": ("personname", "name", "VARCHAR", "personnametype_id", "(SELECT id FROM personnametype WHERE description = 'MiddleName')"),
+    "lname": ("personname", "name", "VARCHAR", "personnametype_id", "(SELECT id FROM personnametype WHERE description = 'LastName')"),
+    "nickname": ("personname", "name", "VARCHAR", "personnametype_id", "(SELECT id FROM personnametype WHERE description = 'Nickname')"),
+    "marital_status_type_id": ("maritalstatus", "maritalstatustype_id", "INT", None, None),
+    "height_val": ("physicalcharacteristic", "val", "INT", "physicalcharacteristictype_id", "(SELECT id FROM physicalcharacteristictype WHERE description = 'Height')"),
+    "weight_val": ("physicalcharacteristic", "val", "INT", "physicalcharacteristictype_id", "(SELECT id FROM physicalcharacteristictype WHERE description = 'Weight')"),
+    "country_id": ("citizenship", "country_id", "INT", None, None)
+}
+
+# Search key columns filled from the value column on insert (see app/models/search_key.py)
+TEMPORAL_SEARCH_KEYS = {"personname": "name"}
+
+# Fields sent as float (PersonUpdate) for an INT column: read as NUMERIC and rounded to INT the way
+# the stored value was, so a repeated PATCH with the same value matches the open row
+TEMPORAL_PARAM_TYPES = {"height_val": "NUMERIC", "weight_val": "NUMERIC"}
+
+# Tables that may hold several open rows (dual citizenship): like PUT, a new value closes only the
+# latest open row, the others stay open
+TEMPORAL_LATEST_ONLY = {"citizenship"}
+
+PERSON_COLUMNS = ["personal_id_number", "birthdate", "mothermaidenname", "totalyearworkexperience", "comment", "gender_type_id"]
+
+def _temporal_ctes(field: str) -> str:
+    # Close the open row (citizenship: the latest one) if its value differs, insert a new open row
+    # unless one with the same value exists.
+    # Both CTEs read the snapshot taken before the statement, so no ranking or pre-read is needed.
+    # The insert aggregates over the close CTE so the close always runs first: the partial unique
+    # index on open rows (temporal_single_open_row.sql) would reject the new row otherwise.
+    table, value_column, value_type, type_column, type_lookup = TEMPORAL_ATTRIBUTES[field]
+    type_filter = f"AND {type_column} = {type_lookup}" if type_column else ""
+    value = f"CAST(:{field} AS {value_type})"
+    if field in TEMPORAL_PARAM_TYPES:
+        value = f"CAST(CAST(:{field} AS {TEMPORAL_PARAM_TYPES[field]}) AS {value_type})"
+    latest_filter = f"""
+            AND id = (
+                SELECT id FROM {table}
+                WHERE person_id = :person_id {type_filter}
+                AND thrudate IS NULL
+                ORDER BY fromdate DESC, id DESC
+                LIMIT 1
+            )""" if table in TEMPORAL_LATEST_ONLY else ""
+    insert_columns = f"person_id, {value_column}, fromdate{', ' + type_column if type_column else ''}"
+    insert_values = f"p.id, {value}, CURRENT_DATE{', ' + type_lookup if type_column else ''}"
+    if table in TEMPORAL_SEARCH_KEYS:
+        insert_columns += f", {value_column}_key, {value_column}_phonetic"
+        insert_values += f", CAST(:{field}_key AS VARCHAR), CAST(:{field}_phonetic AS VARCHAR)"
+    return f"""
+        {field}_close AS (
+            UPDATE {table}
+            SET thrudate = CURRENT_DATE
+            WHERE person_id = :person_id {type_filter}
+            AND thrudate IS NULL
+            AND {value_column} IS DISTINCT FROM {value}{latest_filter}
+            RETURNING id
+        ),
+        {field}_insert AS (
+            INSERT INTO {table} ({insert_columns})
+            SELECT {insert_values}
+            FROM person p
+            CROSS JOIN (SELECT COUNT(*) FROM {field}_close) closed
+            WHERE p.id = :person_id
+            AND {value} IS NOT NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM {table}
+                WHERE person_id = :person_id {type_filter}
+                AND thrudate IS NULL
+                AND {value_column} = {value}
+            )
+            RETURNING *
+        )"""
+
+def _current_row(field: str, changed: bool) -> str:
+    # The row a profile shows for one attribute: the row inserted by this statement,
+    # otherwise the open row that was not closed by it
+    table, _, _, type_column, type_lookup = TEMPORAL_ATTRIBUTES[field]
+    type_filter = f"AND {type_column} = {type_lookup}" if type_column else ""
+    open_row = f"""
+            SELECT * FROM {table}
+            WHERE person_id = p.id {type_filter}
+            AND thrudate IS NULL
+            {f"AND id NOT IN (SELECT id FROM {field}_close)" if changed else ""}
+            ORDER BY fromdate DESC, id DESC
+            LIMIT 1"""
+    if not changed:
+        return open_row
+    return f"""
+            SELECT * FROM (
+                SELECT *, 0 AS priority FROM {field}_insert
+                UNION ALL
+                SELECT *, 1 AS priority FROM ({open_row}
+                ) open_row
+            ) current_row
+            ORDER BY priority
+            LIMIT 1"""
+
+@bumps_version("person")
+async def patch_person(person_id: int, person: PersonUpdate) -> Optional[PersonOut]:
+    # Applies only the fields sent by the client. The person row, every close-and-insert of
+    # names, marital status, physical characteristics and citizenship, and the returned profile
+    # are one statement, so there is no pre-read and no per-field round trip.
+    fields = person.model_dump(exclude_unset=True)
+    person_fields = [column for column in PERSON_COLUMNS if column in fields]
+    temporal_fields = [field for field in TEMPORAL_ATTRIBUTES if field in fields]
+    values = {"person_id": person_id}
+    values.update({column: fields[column] for column in person_fields})
+    values.update({field: fields[field] for field in temporal_fields})
+    for field in temporal_fields:
+        table, value_column = TEMPORAL_ATTRIBUTES[field][:2]
+        if table in TEMPORAL_SEARCH_KEYS:
+            keys = search_keys(value_column, fields[field])
+            values[f"{field}_key"] = keys[f"{value_column}_key"]
+            values[f"{field}_phonetic"] = keys[f"{value_column}_phonetic"]
+
+    ctes = [_temporal_ctes(field) for field in temporal_fields]
+    if person_fields:
+        ctes.insert(0, f"""
+        person_update AS (
+            UPDATE person
+            SET {', '.join(f"{column} = :{column}" for column in person_fields)}
+            WHERE id = :person_id
+            RETURNING *
+        )""")
+    with_clause = f"WITH {','.join(ctes)}" if ctes else ""
+    person_source = "person_update" if person_fields else "person"
+    current = {field: _current_row(field, field in temporal_fields) for field in TEMPORAL_ATTRIBUTES}
+
+    query = f"""
+        {with_clause}
+        SELECT 
+            p.id, 
+            p.personal_id_number, 
+            p.birthdate, 
+            p.mothermaidenname, 
+            p.totalyearworkexperience, 
+            p.comment, 
+            p.gender_type_id,
+            gt.description AS gender_description,
+            pn1.id AS fname_id,
+            pn1.name AS fname,
+            pn1.fromdate AS fname_fromdate,
+            pn1.thrudate AS fname_thrudate,
+            pn1.personnametype_id AS fname_personnametype_id,
+            pnt1.description AS fname_personnametype_description,
+            pn2.id AS mname_id,
+            pn2.name AS mname,
+            pn2.fromdate AS mname_fromdate,
+            pn2.thrudate AS mname_thrudate,
+            pn2.personnametype_id AS mname_personnametype_id,
+            pnt2.description AS mname_personnametype_description,
+            pn3.id AS lname_id,
+            pn3.name AS lname,
+            pn3.fromdate AS lname_fromdate,
+            pn3.thrudate AS lname_thrudate,
+            pn3.personnametype_id AS lname_personnametype_id,
+            pnt3.description AS lname_personnametype_description,
+            pn4.id AS nickname_id,
+            pn4.name AS nickname,
+            pn4.fromdate AS nickname_fromdate,
+            pn4.thrudate AS nickname_thrudate,
+            pn4.personnametype_id AS nickname_personnametype_id,
+            pnt4.description AS nickname_personnametype_description,
+            ms.id AS marital_status_id,
+            ms.fromdate AS marital_status_fromdate,
+            ms.thrudate AS marital_status_thrudate,
+            ms.maritalstatustype_id AS marital_status_type_id,
+            mst.description AS marital_status_type_description,
+            pc1.id AS height_id,
+            pc1.val AS height_val,
+            pc1.fromdate AS height_fromdate,
+            pc1.thrudate AS height_thrudate,
+            pc1.physicalcharacteristictype_id AS height_type_id,
+            pct1.description AS height_type_description,
+            pc2.id AS weight_id,
+            pc2.val AS weight_val,
+            pc2.fromdate AS weight_fromdate,
+            pc2.thrudate AS weight_thrudate,
+            pc2.physicalcharacteristictype_id AS weight_type_id,
+            pct2.description AS weight_type_description,
+            c.id AS citizenship_id,
+            c.fromdate AS citizenship_fromdate,
+            c.thrudate AS citizenship_thrudate,
+            c.country_id AS country_id,
+            co.isocode AS country_isocode,
+            co.name_en AS country_name_en,
+            co.name_th AS country_name_th
+        FROM {person_source} p
+        LEFT JOIN gender_type gt ON p.gender_type_id = gt.id
+        LEFT JOIN LATERAL ({current["fname"]}
+        ) pn1 ON TRUE
+        LEFT JOIN personnametype pnt1 ON pn1.personnametype_id = pnt1.id
+        LEFT JOIN LATERAL ({current["mname"]}
+        ) pn2 ON TRUE
+        LEFT JOIN personnametype pnt2 ON pn2.personnametype_id = pnt2.id
+        LEFT JOIN LATERAL ({current["lname"]}
+        ) pn3 ON TRUE
+        LEFT JOIN personnametype pnt3 ON pn3.personnametype_id = pnt3.id
+        LEFT JOIN LATERAL ({current["nickname"]}
+        ) pn4 ON TRUE
+        LEFT JOIN personnametype pnt4 ON pn4.personnametype_id = pnt4.id
+        LEFT JOIN LATERAL ({current["marital_status_type_id"]}
+        ) ms ON TRUE
+        LEFT JOIN maritalstatustype mst ON ms.maritalstatustype_id = mst.id
+        LEFT JOIN LATERAL ({current["height_val"]}
+        ) pc1 ON TRUE
+        LEFT JOIN physicalcharacteristictype pct1 ON pc1.physicalcharacteristictype_id = pct1.id
+        LEFT JOIN LATERAL ({current["weight_val"]}
+        ) pc2 ON TRUE
+        LEFT JOIN physicalcharacteristictype pct2 ON pc2.physicalcharacteristictype_id = pct2.id
+        LEFT JOIN LATERAL ({current["country_id"]}
+        ) c ON TRUE
+        LEFT JOIN country co ON c.country_id = co.id
+        WHERE p.id = :person_id
+    """
+    async with database.transaction():
+        try:
+            result = await database.fetch_one(query=query, values=values)
+            if not result:
+                logger.warning(f"Person not found for patch: id={person_id}")
+                return None
+            logger.info(f"Patched person: id={person_id}, fields={sorted(fields)}")
+            return PersonOut(**result)
+        except Exception as e:
+            logger.error(f"Error patching person: {str(e)}")
+            raise
+
+@bumps_version("person")
 async def delete_person(person_id: int) -> bool:
     async with database.transaction():
         try:
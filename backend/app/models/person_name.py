@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.person_name import PersonNameCreate, PersonNameUpdate, PersonNameOut
+from app.models.search_key import search_keys
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("person")
 async def create_person_name(person_name: PersonNameCreate) -> Optional[PersonNameOut]:
     query = """
         SELECT id FROM personname 
@@ -25,20 +28,41 @@ async def create_person_name(person_name: PersonNameCreate) -> Optional[PersonNa
         return None
 
     query = """
-        INSERT INTO personname (fromdate, thrudate, person_id, personnametype_id, name)
-        VALUES (:fromdate, :thrudate, :person_id, :personnametype_id, :name)
+        INSERT INTO personname (fromdate, thrudate, person_id, personnametype_id, name, name_key, name_phonetic)
+        VALUES (:fromdate, :thrudate, :person_id, :personnametype_id, :name, :name_key, :name_phonetic)
         RETURNING id, fromdate, thrudate, person_id, personnametype_id, name
     """
     try:
-        result = await database.fetch_one(query=query, values={
-            "fromdate": person_name.fromdate,
-            "thrudate": person_name.thrudate,
-            "person_id": person_name.person_id,
-            "personnametype_id": person_name.personnametype_id,
-            "name": person_name.name
-        })
-        logger.info(f"Created person name: id={result['id']}, name={result['name']}")
-        return PersonNameOut(**result)
+        async with database.transaction():
+            # One open row per name (person, name type): a new open row closes the current one
+            # A backdated row (older than the open one) goes in as closed history, ending where the open one starts
+            thrudate = person_name.thrudate
+            if thrudate is None:
+                query_close = """
+                    WITH newer AS (
+                        SELECT fromdate FROM personname
+                        WHERE person_id = :person_id AND personnametype_id = :personnametype_id AND thrudate IS NULL AND fromdate > :fromdate
+                    ), closed AS (
+                        UPDATE personname SET thrudate = :fromdate
+                        WHERE person_id = :person_id AND personnametype_id = :personnametype_id AND thrudate IS NULL AND fromdate <= :fromdate
+                    )
+                    SELECT fromdate FROM newer
+                """
+                thrudate = await database.fetch_val(query_close, values={
+                    "fromdate": person_name.fromdate,
+                    "person_id": person_name.person_id,
+                    "personnametype_id": person_name.personnametype_id
+                })
+            result = await database.fetch_one(query=query, values={
+                "fromdate": person_name.fromdate,
+                "thrudate": thrudate,
+                "person_id": person_name.person_id,
+                "personnametype_id": person_name.personnametype_id,
+                "name": person_name.name,
+                **search_keys("name", person_name.name)
+            })
+            logger.info(f"Created person name: id={result['id']}, name={result['name']}")
+            return PersonNameOut(**result)
     except Exception as e:
         logger.error(f"Error creating person name: {str(e)}")
         raise
@@ -64,6 +88,7 @@ async def get_all_person_names() -> List[PersonNameOut]:
     logger.info(f"Retrieved {len(results)} person names")
     return [PersonNameOut(**result) for result in results]
 
+@bumps_version("person")
 async def update_person_name(person_name_id: int, person_name: PersonNameUpdate) -> Optional[PersonNameOut]:
     if any([person_name.fromdate, person_name.thrudate, person_name.person_id, person_name.personnametype_id, person_name.name]):
         query = """
@@ -86,6 +111,23 @@ async def update_person_name(person_name_id: int, person_name: PersonNameUpdate)
         if existing:
             logger.warning(f"Person name already exists: person_id={person_name.person_id}, name={person_name.name}")
             return None
+        # The row stays or becomes open: another open row with the same key would break personname_open_uidx
+        query = """
+            SELECT o.id FROM personname c
+            JOIN personname o ON o.person_id = COALESCE(:person_id, c.person_id)
+                AND o.personnametype_id = COALESCE(:personnametype_id, c.personnametype_id)
+                AND o.thrudate IS NULL AND o.id != c.id
+            WHERE c.id = :id AND COALESCE(:thrudate, c.thrudate) IS NULL
+        """
+        open_row = await database.fetch_one(query=query, values={
+            "person_id": person_name.person_id,
+            "personnametype_id": person_name.personnametype_id,
+            "thrudate": person_name.thrudate,
+            "id": person_name_id
+        })
+        if open_row:
+            logger.warning(f"Person name has another open row: id={open_row['id']}")
+            return None
 
     query = """
         UPDATE personname
@@ -93,7 +135,9 @@ async def update_person_name(person_name_id: int, person_name: PersonNameUpdate)
             thrudate = COALESCE(:thrudate, thrudate),
             person_id = COALESCE(:person_id, person_id),
             personnametype_id = COALESCE(:personnametype_id, personnametype_id),
-            name = COALESCE(:name, name)
+            name = COALESCE(:name, name),
+            name_key = COALESCE(:name_key, name_key),
+            name_phonetic = COALESCE(:name_phonetic, name_phonetic)
         WHERE id = :id
         RETURNING id, fromdate, thrudate, person_id, personnametype_id, name
     """
@@ -104,6 +148,7 @@ async def update_person_name(person_name_id: int, person_name: PersonNameUpdate)
             "person_id": person_name.person_id,
             "personnametype_id": person_name.personnametype_id,
             "name": person_name.name,
+            **search_keys("name", person_name.name),
             "id": person_name_id
         })
         if not result:
@@ -115,6 +160,7 @@ async def update_person_name(person_name_id: int, person_name: PersonNameUpdate)
         logger.error(f"Error updating person name: {str(e)}")
         raise
 
+@bumps_version("person")
 async def delete_person_name(person_name_id: int) -> bool:
     query = """
         DELETE FROM personname WHERE id = :id
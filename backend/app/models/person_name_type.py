@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.person_name_type import PersonNameTypeCreate, PersonNameTypeUpdate, PersonNameTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("person_name_type")
 async def create_person_name_type(person_name_type: PersonNameTypeCreate) -> Optional[PersonNameTypeOut]:
     query = """
         SELECT id, description FROM personnametype WHERE description = :description
@@ -28,6 +31,7 @@ async def create_person_name_type(person_name_type: PersonNameTypeCreate) -> Opt
         logger.error(f"Error creating person name type: {str(e)}")
         raise
 
+@cached("person_name_type")
 async def get_person_name_type(person_name_type_id: int) -> Optional[PersonNameTypeOut]:
     query = """
         SELECT id, description FROM personnametype WHERE id = :id
@@ -39,6 +43,7 @@ async def get_person_name_type(person_name_type_id: int) -> Optional[PersonNameT
     logger.info(f"Retrieved person name type: id={result['id']}, description={result['description']}")
     return PersonNameTypeOut(**result)
 
+@cached("person_name_type")
 async def get_all_person_name_types() -> List[PersonNameTypeOut]:
     query = """
         SELECT id, description FROM personnametype
@@ -47,6 +52,7 @@ async def get_all_person_name_types() -> List[PersonNameTypeOut]:
     logger.info(f"Retrieved {len(results)} person name types")
     return [PersonNameTypeOut(**result) for result in results]
 
+@bumps_version("person_name_type")
 async def update_person_name_type(person_name_type_id: int, person_name_type: PersonNameTypeUpdate) -> Optional[PersonNameTypeOut]:
     if person_name_type.description:
         query = """
@@ -74,6 +80,7 @@ async def update_person_name_type(person_name_type_id: int, person_name_type: Pe
         logger.error(f"Error updating person name type: {str(e)}")
         raise
 
+@bumps_version("person_name_type")
 async def delete_person_name_type(person_name_type_id: int) -> bool:
     query = """
         DELETE FROM personnametype WHERE id = :id
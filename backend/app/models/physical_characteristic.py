@@ -1,11 +1,13 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.physical_characteristic import PhysicalCharacteristicCreate, PhysicalCharacteristicUpdate, PhysicalCharacteristicOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("person")
 async def create_physical_characteristic(physical_characteristic: PhysicalCharacteristicCreate) -> Optional[PhysicalCharacteristicOut]:
     query = """
         SELECT id FROM physicalcharacteristic 
@@ -30,15 +32,35 @@ async def create_physical_characteristic(physical_characteristic: PhysicalCharac
         RETURNING id, fromdate, thrudate, val, person_id, physicalcharacteristictype_id
     """
     try:
-        result = await database.fetch_one(query=query, values={
-            "fromdate": physical_characteristic.fromdate,
-            "thrudate": physical_characteristic.thrudate,
-            "val": physical_characteristic.val,
-            "person_id": physical_characteristic.person_id,
-            "physicalcharacteristictype_id": physical_characteristic.physicalcharacteristictype_id
-        })
-        logger.info(f"Created physical characteristic: id={result['id']}, person_id={result['person_id']}")
-        return PhysicalCharacteristicOut(**result)
+        async with database.transaction():
+            # One open row per characteristic (person, characteristic type): a new open row closes the current one
+            # A backdated row (older than the open one) goes in as closed history, ending where the open one starts
+            thrudate = physical_characteristic.thrudate
+            if thrudate is None:
+                query_close = """
+                    WITH newer AS (
+                        SELECT fromdate FROM physicalcharacteristic
+                        WHERE person_id = :person_id AND physicalcharacteristictype_id = :physicalcharacteristictype_id AND thrudate IS NULL AND fromdate > :fromdate
+                    ), closed AS (
+                        UPDATE physicalcharacteristic SET thrudate = :fromdate
+                        WHERE person_id = :person_id AND physicalcharacteristictype_id = :physicalcharacteristictype_id AND thrudate IS NULL AND fromdate <= :fromdate
+                    )
+                    SELECT fromdate FROM newer
+                """
+                thrudate = await database.fetch_val(query_close, values={
+                    "fromdate": physical_characteristic.fromdate,
+                    "person_id": physical_characteristic.person_id,
+                    "physicalcharacteristictype_id": physical_characteristic.physicalcharacteristictype_id
+                })
+            result = await database.fetch_one(query=query, values={
+                "fromdate": physical_characteristic.fromdate,
+                "thrudate": thrudate,
+                "val": physical_characteristic.val,
+                "person_id": physical_characteristic.person_id,
+                "physicalcharacteristictype_id": physical_characteristic.physicalcharacteristictype_id
+            })
+            logger.info(f"Created physical characteristic: id={result['id']}, person_id={result['person_id']}")
+            return PhysicalCharacteristicOut(**result)
     except Exception as e:
         logger.error(f"Error creating physical characteristic: {str(e)}")
         raise
@@ -64,6 +86,7 @@ async def get_all_physical_characteristics() -> List[PhysicalCharacteristicOut]:
     logger.info(f"Retrieved {len(results)} physical characteristics")
     return [PhysicalCharacteristicOut(**result) for result in results]
 
+@bumps_version("person")
 async def update_physical_characteristic(physical_characteristic_id: int, physical_characteristic: PhysicalCharacteristicUpdate) -> Optional[PhysicalCharacteristicOut]:
     if any([physical_characteristic.fromdate, physical_characteristic.thrudate, physical_characteristic.val, physical_characteristic.person_id, physical_characteristic.physicalcharacteristictype_id]):
         query = """
@@ -86,6 +109,23 @@ async def update_physical_characteristic(physical_characteristic_id: int, physic
         if existing:
             logger.warning(f"Physical characteristic already exists: person_id={physical_characteristic.person_id}, type_id={physical_characteristic.physicalcharacteristictype_id}")
             return None
+        # The row stays or becomes open: another open row with the same key would break physicalcharacteristic_open_uidx
+        query = """
+            SELECT o.id FROM physicalcharacteristic c
+            JOIN physicalcharacteristic o ON o.person_id = COALESCE(:person_id, c.person_id)
+                AND o.physicalcharacteristictype_id = COALESCE(:physicalcharacteristictype_id, c.physicalcharacteristictype_id)
+                AND o.thrudate IS NULL AND o.id != c.id
+            WHERE c.id = :id AND COALESCE(:thrudate, c.thrudate) IS NULL
+        """
+        open_row = await database.fetch_one(query=query, values={
+            "person_id": physical_characteristic.person_id,
+            "physicalcharacteristictype_id": physical_characteristic.physicalcharacteristictype_id,
+            "thrudate": physical_characteristic.thrudate,
+            "id": physical_characteristic_id
+        })
+        if open_row:
+            logger.warning(f"Physical characteristic has another open row: id={open_row['id']}")
+            return None
 
     query = """
         UPDATE physicalcharacteristic
@@ -115,6 +155,7 @@ async def update_physical_characteristic(physical_characteristic_id: int, physic
         logger.error(f"Error updating physical characteristic: {str(e)}")
         raise
 
+@bumps_version("person")
 async def delete_physical_characteristic(physical_characteristic_id: int) -> bool:
     query = """
         DELETE FROM physicalcharacteristic WHERE id = :id
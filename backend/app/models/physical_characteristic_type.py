@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.physical_characteristic_type import PhysicalCharacteristicTypeCreate, PhysicalCharacteristicTypeUpdate, PhysicalCharacteristicTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("physical_characteristic_type")
 async def create_physical_characteristic_type(physical_characteristic_type: PhysicalCharacteristicTypeCreate) -> Optional[PhysicalCharacteristicTypeOut]:
     query = """
         SELECT id, description FROM physicalcharacteristictype WHERE description = :description
@@ -28,6 +31,7 @@ async def create_physical_characteristic_type(physical_characteristic_type: Phys
         logger.error(f"Error creating physical characteristic type: {str(e)}")
         raise
 
+@cached("physical_characteristic_type")
 async def get_physical_characteristic_type(physical_characteristic_type_id: int) -> Optional[PhysicalCharacteristicTypeOut]:
     query = """
         SELECT id, description FROM physicalcharacteristictype WHERE id = :id
@@ -39,6 +43,7 @@ async def get_physical_characteristic_type(physical_characteristic_type_id: int)
     logger.info(f"Retrieved physical characteristic type: id={result['id']}, description={result['description']}")
     return PhysicalCharacteristicTypeOut(**result)
 
+@cached("physical_characteristic_type")
 async def get_all_physical_characteristic_types() -> List[PhysicalCharacteristicTypeOut]:
     query = """
         SELECT id, description FROM physicalcharacteristictype
@@ -47,6 +52,7 @@ async def get_all_physical_characteristic_types() -> List[PhysicalCharacteristic
     logger.info(f"Retrieved {len(results)} physical characteristic types")
     return [PhysicalCharacteristicTypeOut(**result) for result in results]
 
+@bumps_version("physical_characteristic_type")
 async def update_physical_characteristic_type(physical_characteristic_type_id: int, physical_characteristic_type: PhysicalCharacteristicTypeUpdate) -> Optional[PhysicalCharacteristicTypeOut]:
     if physical_characteristic_type.description:
         query = """
@@ -74,6 +80,7 @@ async def update_physical_characteristic_type(physical_characteristic_type_id: i
         logger.error(f"Error updating physical characteristic type: {str(e)}")
         raise
 
+@bumps_version("physical_characteristic_type")
 async def delete_physical_characteristic_type(physical_characteristic_type_id: int) -> bool:
     # Check if the type is referenced in physicalcharacteristic table
     query = """
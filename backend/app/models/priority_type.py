@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.priority_type import PriorityTypeCreate, PriorityTypeUpdate, PriorityTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("priority_type")
 async def create_priority_type(priority_type: PriorityTypeCreate) -> Optional[PriorityTypeOut]:
     async with database.transaction():
         try:
@@ -21,6 +24,7 @@ async def create_priority_type(priority_type: PriorityTypeCreate) -> Optional[Pr
             logger.error(f"Error creating priority_type: {str(e)}")
             raise
 
+@cached("priority_type")
 async def get_priority_type(priority_type_id: int) -> Optional[PriorityTypeOut]:
     query = """
         SELECT id, description
@@ -34,6 +38,7 @@ async def get_priority_type(priority_type_id: int) -> Optional[PriorityTypeOut]:
     logger.info(f"Retrieved priority_type: id={result['id']}")
     return PriorityTypeOut(**result)
 
+@cached("priority_type")
 async def get_all_priority_types() -> List[PriorityTypeOut]:
     query = """
         SELECT id, description
@@ -44,6 +49,7 @@ async def get_all_priority_types() -> List[PriorityTypeOut]:
     logger.info(f"Retrieved {len(results)} priority_types")
     return [PriorityTypeOut(**result) for result in results]
 
+@bumps_version("priority_type")
 async def update_priority_type(priority_type_id: int, priority_type: PriorityTypeUpdate) -> Optional[PriorityTypeOut]:
     async with database.transaction():
         try:
@@ -66,6 +72,7 @@ async def update_priority_type(priority_type_id: int, priority_type: PriorityTyp
             logger.error(f"Error updating priority_type: {str(e)}")
             raise
 
+@bumps_version("priority_type")
 async def delete_priority_type(priority_type_id: int) -> bool:
     async with database.transaction():
         try:
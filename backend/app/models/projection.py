@@ -0,0 +1,62 @@
+import json
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# ?fields= sparse fieldsets: a Projection maps each output field to its SQL expression and the
+# joins that expression needs, so a request for id,fname only selects those two columns and only
+# joins what they read. Joins are kept in declaration order (a join may use an earlier alias) and
+# are LEFT JOINs, so leaving one out never changes which rows come back. Joins listed in inner_joins
+# were INNER JOINs before ?fields= existed: the full response keeps them INNER, so rows without a match
+# (nullable foreign keys, CSV imports) stay filtered out as before.
+
+class Projection:
+    def __init__(
+        self,
+        from_sql: str,
+        columns: Dict[str, Union[str, Tuple[str, ...]]],
+        joins: Optional[Dict[str, str]] = None,
+        optional: Sequence[str] = (),
+        json_columns: Sequence[str] = (),
+        inner_joins: Sequence[str] = ()
+    ):
+        # columns: field -> "expression" or ("expression", join alias, ...)
+        # optional: fields left out of the full response (e.g. ?include=purposes)
+        # json_columns: json/jsonb results, which asyncpg returns as text
+        self.from_sql = from_sql
+        self.columns = {name: (column,) if isinstance(column, str) else column for name, column in columns.items()}
+        self.joins = joins or {}
+        self.default = [name for name in self.columns if name not in optional]
+        self.json_columns = set(json_columns)
+        self.inner_joins = set(inner_joins)
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self.columns)
+
+    def sql(self, fields: Optional[Sequence[str]] = None, include: Sequence[str] = ()) -> str:
+        # SELECT ... FROM ... with the joins the fields need; None selects the full response,
+        # include adds optional fields to either
+        select = []
+        needed = set()
+        names = list(fields or self.default)
+        names += [name for name in include if name not in names]
+        for name in names:
+            expression, *aliases = self.columns[name]
+            select.append(expression if expression.rsplit(".", 1)[-1] == name else f"{expression} AS {name}")
+            needed.update(aliases)
+        joins = "".join(
+            f"\n        {join[len('LEFT '):] if not fields and alias in self.inner_joins else join}"
+            for alias, join in self.joins.items() if alias in needed
+        )
+        select = ",\n               ".join(select)
+        return f"SELECT {select}\n        FROM {self.from_sql}{joins}"
+
+    def row(self, result) -> dict:
+        data = dict(result)
+        for name in self.json_columns:
+            if isinstance(data.get(name), str):
+                data[name] = json.loads(data[name])
+        return data
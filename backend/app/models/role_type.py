@@ -1,11 +1,14 @@
 from typing import Optional, List
 from app.config.database import database
+from app.config.cache import cached
+from app.config.entity_version import bumps_version
 import logging
 from app.schemas.role_type import RoleTypeCreate, RoleTypeUpdate, RoleTypeOut
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@bumps_version("role_type")
 async def create_role_type(role_type: RoleTypeCreate) -> Optional[RoleTypeOut]:
     async with database.transaction():
         try:
@@ -21,6 +24,7 @@ async def create_role_type(role_type: RoleTypeCreate) -> Optional[RoleTypeOut]:
             logger.error(f"Error creating role_type: {str(e)}")
             raise
 
+@cached("role_type")
 async def get_role_type(role_type_id: int) -> Optional[RoleTypeOut]:
     query = """
         SELECT id, description
@@ -34,6 +38,7 @@ async def get_role_type(role_type_id: int) -> Optional[RoleTypeOut]:
     logger.info(f"Retrieved role_type: id={result['id']}")
     return RoleTypeOut(**result)
 
+@cached("role_type")
 async def get_all_role_types() -> List[RoleTypeOut]:
     query = """
         SELECT id, description
@@ -44,6 +49,7 @@ async def get_all_role_types() -> List[RoleTypeOut]:
     logger.info(f"Retrieved {len(results)} role_types")
     return [RoleTypeOut(**result) for result in results]
 
+@bumps_version("role_type")
 async def update_role_type(role_type_id: int, role_type: RoleTypeUpdate) -> Optional[RoleTypeOut]:
     async with database.transaction():
         try:
@@ -66,6 +72,7 @@ async def update_role_type(role_type_id: int, role_type: RoleTypeUpdate) -> Opti
             logger.error(f"Error updating role_type: {str(e)}")
             raise
 
+@bumps_version("role_type")
 async def delete_role_type(role_type_id: int) -> bool:
     async with database.transaction():
         try:
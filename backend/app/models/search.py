@@ -0,0 +1,140 @@
+from typing import List
+import logging
+import unicodedata
+from app.config.database import database
+from app.config.replica import replica_read
+from app.models.search_key import normalize_name, phonetic_key
+from app.schemas.search import SearchResultOut
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Trigrams need at least 3 characters; shorter queries only use the prefix index
+TRIGRAM_MIN_LENGTH = 3
+# Shorter phonetic keys ("P" for "Piya") match too many names to be used as a prefix
+PHONETIC_PREFIX_MIN_LENGTH = 3
+
+def normalize_query(q: str) -> str:
+    # NFC so Thai vowels and tone marks compare equal however they were typed, single spaces
+    return " ".join(unicodedata.normalize("NFC", q).split())
+
+def _like_prefix(key: str) -> str:
+    escaped = key.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+def _match(column: str, trigram: bool, phonetic: bool) -> str:
+    # Exact / prefix on the normalized key and the phonetic key (btree text_pattern_ops),
+    # fuzzy / substring on the name itself (GIN gin_trgm_ops; word_similarity, so a query
+    # matching one word of a longer name is found)
+    conditions = [f"{column}_key LIKE :prefix"]
+    if phonetic:
+        conditions.append(f"{column}_phonetic LIKE :phonetic_prefix")
+    if trigram:
+        conditions.append(f":q <% {column}")
+    return " OR ".join(conditions)
+
+def _score(column: str) -> str:
+    # Exact name > prefix > sounds alike > fuzzy, ties broken by trigram word similarity
+    return f"""(
+        CASE
+            WHEN {column}_key = :key THEN 3
+            WHEN {column}_key LIKE :prefix THEN 2
+            WHEN {column}_phonetic = :phonetic THEN 1
+            WHEN {column}_phonetic LIKE :phonetic_prefix THEN 0.5
+            ELSE 0
+        END + word_similarity(:q, {column})
+    )"""
+
+@replica_read
+async def search_parties(q: str, limit: int = 20) -> List[SearchResultOut]:
+    # Current person names (open personname rows) and organization name_en / name_th.
+    # Each branch is answered from its own index and cut to :limit before the branches are
+    # merged, so the cost depends on the number of matches, not on the number of parties.
+    # Indexes: note_for_database/search_index.sql and search_key.sql
+    q = normalize_query(q)
+    key = normalize_name(q)
+    if not key:
+        return []
+    phonetic = phonetic_key(q)
+    trigram = len(q) >= TRIGRAM_MIN_LENGTH
+    phonetic_prefix = len(phonetic) >= PHONETIC_PREFIX_MIN_LENGTH
+    values = {
+        "q": q,
+        "key": key,
+        "prefix": _like_prefix(key),
+        "phonetic": phonetic or None,
+        # Without a usable prefix the phonetic key is only compared for equality
+        "phonetic_prefix": _like_prefix(phonetic) if phonetic_prefix else phonetic or None,
+        "limit": limit
+    }
+
+    query = f"""
+        WITH person_hits AS (
+            SELECT pn.person_id AS party_id, 'person' AS kind, pn.name AS matched_name,
+                   {_score("pn.name")} AS score
+            FROM personname pn
+            WHERE pn.thrudate IS NULL
+            AND ({_match("pn.name", trigram, bool(phonetic))})
+            ORDER BY score DESC
+            LIMIT :limit
+        ),
+        organization_en_hits AS (
+            SELECT o.id AS party_id, 'organization' AS kind, o.name_en AS matched_name,
+                   {_score("o.name_en")} AS score
+            FROM organization o
+            WHERE {_match("o.name_en", trigram, bool(phonetic))}
+            ORDER BY score DESC
+            LIMIT :limit
+        ),
+        organization_th_hits AS (
+            SELECT o.id AS party_id, 'organization' AS kind, o.name_th AS matched_name,
+                   {_score("o.name_th")} AS score
+            FROM organization o
+            WHERE {_match("o.name_th", trigram, bool(phonetic))}
+            ORDER BY score DESC
+            LIMIT :limit
+        ),
+        hits AS (
+            SELECT DISTINCT ON (party_id) party_id, kind, matched_name, score
+            FROM (
+                SELECT * FROM person_hits
+                UNION ALL
+                SELECT * FROM organization_en_hits
+                UNION ALL
+                SELECT * FROM organization_th_hits
+            ) all_hits
+            ORDER BY party_id, score DESC
+        )
+        SELECT
+            h.party_id,
+            CASE
+                WHEN h.kind = 'person' THEN 'person'
+                WHEN EXISTS (SELECT 1 FROM corporation WHERE id = h.party_id) THEN 'corporation'
+                WHEN EXISTS (SELECT 1 FROM government_agency WHERE id = h.party_id) THEN 'government_agency'
+                WHEN EXISTS (SELECT 1 FROM legal_organization WHERE id = h.party_id) THEN 'legal_organization'
+                WHEN EXISTS (SELECT 1 FROM team WHERE id = h.party_id) THEN 'team'
+                WHEN EXISTS (SELECT 1 FROM family WHERE id = h.party_id) THEN 'family'
+                WHEN EXISTS (SELECT 1 FROM other_informal_organization WHERE id = h.party_id) THEN 'other_informal_organization'
+                WHEN EXISTS (SELECT 1 FROM informal_organization WHERE id = h.party_id) THEN 'informal_organization'
+                ELSE 'organization'
+            END AS party_subtype,
+            CASE
+                WHEN h.kind = 'person' THEN (
+                    SELECT string_agg(pn.name, ' ' ORDER BY array_position(ARRAY['FirstName', 'MiddleName', 'LastName'], pnt.description::text))
+                    FROM personname pn
+                    JOIN personnametype pnt ON pn.personnametype_id = pnt.id
+                    WHERE pn.person_id = h.party_id
+                    AND pn.thrudate IS NULL
+                    AND pnt.description IN ('FirstName', 'MiddleName', 'LastName')
+                )
+                ELSE (SELECT COALESCE(o.name_en, o.name_th) FROM organization o WHERE o.id = h.party_id)
+            END AS name,
+            h.matched_name,
+            h.score
+        FROM hits h
+        ORDER BY h.score DESC, h.party_id
+        LIMIT :limit
+    """
+    results = await database.fetch_all(query=query, values=values)
+    logger.info(f"Search q={q!r} returned {len(results)} parties")
+    return [SearchResultOut(**result) for result in results]
@@ -0,0 +1,192 @@
+import re
+import unicodedata
+from typing import Optional
+
+# Search keys stored next to personname.name and organization.name_en / name_th
+# (columns added by note_for_database/search_key.sql, filled on every write by the model functions)
+#
+# <column>_key       normalize_name(): NFKC, case-folded, Latin accents removed, Thai tone marks,
+#                    maitaikhu and thanthakhat removed, punctuation to spaces. Exact and prefix match.
+# <column>_phonetic  phonetic_key(): Thai is romanized first (simplified RTGS), then every word is
+#                    reduced to a consonant skeleton with the sounds Thai romanizations mix up
+#                    folded together (ph/p, th/t, kh/k, ch/j, v/w, r/l, ...), so "สมชาย", "Somchai"
+#                    and "Somchay" share the key "SMC". Words are concatenated ("Krung Thep" and
+#                    "กรุงเทพ" are both "KLGTP"). Exact and prefix match.
+# None stays None so that COALESCE(:key, key) in partial updates behaves like the name itself.
+
+THAI_FIRST = "฀"
+THAI_LAST = "๿"
+# Maitaikhu and the four tone marks: people type them inconsistently, fold them away
+THAI_TONE_MARKS = {"็", "่", "้", "๊", "๋"}
+# Thanthakhat (karan) silences the consonant it sits on
+THANTHAKHAT = "์"
+# NFKC splits SARA AM into NIKHAHIT + SARA AA; put it back so keys keep the usual spelling
+SARA_AM_DECOMPOSED = "ํา"
+SARA_AM = "ำ"
+
+# consonant: (initial sound, final sound)
+THAI_CONSONANTS = {
+    "ก": ("k", "k"), "ข": ("kh", "k"), "ฃ": ("kh", "k"), "ค": ("kh", "k"), "ฅ": ("kh", "k"),
+    "ฆ": ("kh", "k"), "ง": ("ng", "ng"), "จ": ("ch", "t"), "ฉ": ("ch", "t"), "ช": ("ch", "t"),
+    "ซ": ("s", "t"), "ฌ": ("ch", "t"), "ญ": ("y", "n"), "ฎ": ("d", "t"), "ฏ": ("t", "t"),
+    "ฐ": ("th", "t"), "ฑ": ("th", "t"), "ฒ": ("th", "t"), "ณ": ("n", "n"), "ด": ("d", "t"),
+    "ต": ("t", "t"), "ถ": ("th", "t"), "ท": ("th", "t"), "ธ": ("th", "t"), "น": ("n", "n"),
+    "บ": ("b", "p"), "ป": ("p", "p"), "ผ": ("ph", "p"), "ฝ": ("f", "p"), "พ": ("ph", "p"),
+    "ฟ": ("f", "p"), "ภ": ("ph", "p"), "ม": ("m", "m"), "ย": ("y", "i"), "ร": ("r", "n"),
+    "ล": ("l", "n"), "ว": ("w", "o"), "ศ": ("s", "t"), "ษ": ("s", "t"), "ส": ("s", "t"),
+    "ห": ("h", ""), "ฬ": ("l", "n"), "อ": ("", "o"), "ฮ": ("h", ""),
+}
+# Initial clusters (ปร, กล, กว, ...): first and second consonant
+THAI_CLUSTER_FIRST = {"ก", "ข", "ค", "ต", "ป", "ผ", "พ", "บ", "ด", "ฟ"}
+THAI_CLUSTER_CONSONANTS = {"ร", "ล", "ว"}
+THAI_SILENT_BEFORE_RO = {"ท", "ต", "ด"}
+# Double ro (รร) is the vowel "a", closed by the next consonant (วรรณ = wan)
+THAI_RO_HAN = "รร"
+# Written before the consonant they follow in speech
+THAI_LEADING_VOWELS = {"เ": "e", "แ": "ae", "โ": "o", "ใ": "ai", "ไ": "ai"}
+THAI_FOLLOWING_VOWELS = {
+    "ะ": "a", "ั": "a", "า": "a", "ำ": "am", "ิ": "i", "ี": "i", "ึ": "ue", "ื": "ue",
+    "ุ": "u", "ู": "u", "ๅ": "", "ฤ": "rue", "ฦ": "lue",
+}
+
+# Placeholders are upper case so the single-letter rules below do not touch them
+PHONETIC_DIGRAPHS = (("ph", "p"), ("th", "t"), ("kh", "k"), ("ck", "k"), ("ch", "C"), ("sh", "C"), ("ng", "G"))
+PHONETIC_LETTERS = str.maketrans({"c": "k", "j": "C", "g": "k", "q": "k", "x": "k", "z": "s", "v": "w", "r": "l"})
+PHONETIC_SILENT = set("aeiouhwy")
+PHONETIC_VOWELS = set("aeiouy")
+# A consonant that closes a syllable is one of p, t, k, n, m, ng in Thai ("Manob" = มานพ)
+PHONETIC_FINALS = {"b": "p", "d": "t", "C": "t", "s": "t", "f": "p", "l": "n"}
+
+def _is_thai(ch: str) -> bool:
+    return THAI_FIRST <= ch <= THAI_LAST
+
+def _clean(name: str, keep_thanthakhat: bool) -> str:
+    text = unicodedata.normalize("NFD", unicodedata.normalize("NFKC", name))
+    chars = []
+    for ch in text:
+        if ch in THAI_TONE_MARKS or (ch == THANTHAKHAT and not keep_thanthakhat):
+            continue
+        if unicodedata.category(ch) == "Mn" and not _is_thai(ch):
+            continue  # Latin accents: é -> e
+        chars.append(ch if ch.isalnum() or _is_thai(ch) else " ")
+    text = unicodedata.normalize("NFC", "".join(chars)).replace(SARA_AM_DECOMPOSED, SARA_AM).casefold()
+    return " ".join(text.split())
+
+def normalize_name(name: Optional[str]) -> Optional[str]:
+    if name is None:
+        return None
+    return _clean(name, keep_thanthakhat=False)
+
+def _romanize_thai(word: str) -> str:
+    # Simplified RTGS, good enough for phonetic keys: decides initial / final sound of each
+    # consonant from its neighbours, inserts the unwritten vowels and moves leading vowels
+    # after their consonant. Tone marks are already removed.
+    chars = []
+    for ch in word:
+        if ch == THANTHAKHAT:
+            # The consonant under it is silent, together with a vowel written on it (ดิ์, ตุ์)
+            while chars and chars[-1] in THAI_FOLLOWING_VOWELS:
+                chars.pop()
+            if chars and chars.pop() == "ร" and chars and chars[-1] in THAI_SILENT_BEFORE_RO:
+                chars.pop()  # ทร์, ตร์: both silent (จันทร์, ศาสตร์)
+            continue
+        chars.append(ch)
+
+    out = []
+    pending = ""   # leading vowel waiting for its consonant
+    last = None    # "initial" (consonant still without vowel), "vowel", "final" or None
+    skip = False
+    for i, ch in enumerate(chars):
+        if skip:
+            skip = False
+            continue
+        prev = chars[i - 1] if i > 0 else ""
+        nxt = chars[i + 1] if i + 1 < len(chars) else ""
+        after = chars[i + 2] if i + 2 < len(chars) else ""
+        if ch in THAI_LEADING_VOWELS:
+            if last == "initial":
+                out.append("o")
+            pending = THAI_LEADING_VOWELS[ch]
+            last = None
+        elif ch in THAI_FOLLOWING_VOWELS:
+            out.append(THAI_FOLLOWING_VOWELS[ch])
+            last = "vowel"
+        elif ch + nxt == THAI_RO_HAN and last == "initial":
+            out.append("a")
+            last = "vowel"
+            skip = True
+        elif ch in THAI_CONSONANTS:
+            initial, final = THAI_CONSONANTS[ch]
+            vowel_follows = nxt in THAI_FOLLOWING_VOWELS
+            if pending:
+                out.append(initial)
+                if (ch in THAI_CLUSTER_FIRST and nxt in THAI_CLUSTER_CONSONANTS
+                        and after and after not in THAI_CONSONANTS):
+                    last = "initial"  # cluster: the vowel goes after the second consonant
+                else:
+                    out.append(pending)
+                    pending = ""
+                    last = "vowel"
+            elif last == "initial" and vowel_follows:
+                if not (prev in THAI_CLUSTER_FIRST and ch in THAI_CLUSTER_CONSONANTS):
+                    out.append("a")  # unwritten short a between two initials
+                out.append(initial)
+            elif last == "initial":
+                out.append("o")  # unwritten o of a closed syllable
+                out.append(final)
+                last = "final"
+            elif (last == "vowel" and not vowel_follows and not (nxt in THAI_CONSONANTS and not after)
+                    and not (ch == "ร" and nxt)):  # ร inside a word starts a syllable (สุรชัย)
+                out.append(final)
+                last = "final"
+            else:
+                out.append(initial)
+                last = "initial"
+        else:
+            out.append(ch)
+            last = None
+    if pending:
+        out.append(pending)
+    elif last == "initial":
+        out.append("o")
+    return "".join(out)
+
+def _phonetic_word(word: str) -> str:
+    for digraph, sound in PHONETIC_DIGRAPHS:
+        word = word.replace(digraph, sound)
+    # r before a consonant or at the end is not pronounced in Thai names ("Thanakorn" = ธนากร)
+    word = re.sub(r"r(?![aeiouy])", "", word)
+    # Soft c of English loan words ("Cement" = ซีเมนต์)
+    word = re.sub(r"c(?=[eiy])", "s", word)
+    word = word.translate(PHONETIC_LETTERS)
+    if not word:
+        return ""
+    # Final sounds: consonant at the end or before another consonant that is not the l / w of a cluster
+    word = "".join(
+        PHONETIC_FINALS.get(ch, ch)
+        if i > 0 and (i + 1 == len(word) or (word[i + 1] not in PHONETIC_VOWELS and word[i + 1] not in "lw"))
+        else ch
+        for i, ch in enumerate(word)
+    )
+    key = [word[0]]
+    for ch in word[1:]:
+        if ch in PHONETIC_SILENT or ch == key[-1]:
+            continue
+        key.append(ch)
+    return "".join(key).upper()
+
+def phonetic_key(name: Optional[str]) -> Optional[str]:
+    if name is None:
+        return None
+    words = []
+    for word in _clean(name, keep_thanthakhat=True).split():
+        if any(_is_thai(ch) for ch in word):
+            word = _romanize_thai(word)
+        key = _phonetic_word(word.replace(THANTHAKHAT, ""))
+        if key:
+            words.append(key)
+    return "".join(words)
+
+def search_keys(column: str, name: Optional[str]) -> dict:
+    # Values for <column>_key / <column>_phonetic, ready to merge into query values
+    return {f"{column}_key": normalize_name(name), f"{column}_phonetic": phonetic_key(name)}
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from app.config.database import database
+from app.config.compression import ENCODINGS
+from app.config.settings import DATABASE_POOL_MIN_SIZE, WARMUP_TIMEOUT_SECONDS
+from app.config.startup import startup_report
+from app.models.person import GET_PERSON_QUERY
+from app.models.party_role import get_party_roles_by_party_id
+from app.models.party_relationship import get_party_relationships_by_from_party_role_id, get_party_relationships_by_to_party_role_id
+from app.models.communication_event import get_communication_events_by_party_relationship_id
+from app.models.communication_event_purpose_type import get_all_communication_event_purpose_types
+from app.models.communication_event_status_type import get_all_communication_event_status_types
+from app.models.contact_mechanism_type import get_all_contact_mechanism_types
+from app.models.country import get_all_countries, get_all_countries_body
+from app.models.employee_count_range import get_all_employee_count_ranges
+from app.models.ethnicity import get_all_ethnicities
+from app.models.gender_type import get_all_gender_types
+from app.models.income_range import get_all_income_ranges
+from app.models.industry_type import get_all_industry_types, get_all_industry_types_body
+from app.models.marital_status_type import get_all_marital_status_types
+from app.models.minority_type import get_all_minority_types
+from app.models.party_relationship_status_type import get_all_party_relationship_status_types
+from app.models.party_relationship_type import get_all_party_relationship_types
+from app.models.party_type import get_all_party_types
+from app.models.person_name_type import get_all_person_name_types
+from app.models.physical_characteristic_type import get_all_physical_characteristic_types
+from app.models.priority_type import get_all_priority_types
+from app.models.role_type import get_all_role_types
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Warm-up after startup, so the first requests after a deploy do not pay the cold costs:
+#
+# 1. pool: the hot reads run once on every connection the pool opened (DATABASE_POOL_MIN_SIZE),
+#    all held at the same time so each one gets them. asyncpg keeps the prepared statements per
+#    connection and the server backend loads its catalog caches on the first query; with id 0
+#    nothing is found, so it costs one index probe each.
+# 2. reference cache: the reference lists are loaded into the shared cache (app/config/cache.py),
+#    country and industry_type also pre-compressed in every encoding. person_name_type and
+#    physical_characteristic_type are the id maps of the person queries, which look the ids up by
+#    description in the same statement.
+#
+# Until it has finished GET /v1/health/ready answers 503. A failed or timed out warm-up is logged
+# and the app is marked ready anyway: it works, only the first requests are slower.
+
+REFERENCE_LOADERS = [
+    get_all_communication_event_purpose_types,
+    get_all_communication_event_status_types,
+    get_all_contact_mechanism_types,
+    get_all_countries,
+    get_all_employee_count_ranges,
+    get_all_ethnicities,
+    get_all_gender_types,
+    get_all_income_ranges,
+    get_all_industry_types,
+    get_all_marital_status_types,
+    get_all_minority_types,
+    get_all_party_relationship_status_types,
+    get_all_party_relationship_types,
+    get_all_party_types,
+    get_all_person_name_types,
+    get_all_physical_characteristic_types,
+    get_all_priority_types,
+    get_all_role_types,
+]
+
+PRECOMPRESSED_LOADERS = [get_all_countries_body, get_all_industry_types_body]
+
+async def _run_hot_reads() -> None:
+    await database.fetch_one(query=GET_PERSON_QUERY, values={"id": 0})
+    await get_party_roles_by_party_id(0)
+    await get_party_relationships_by_from_party_role_id(0)
+    await get_party_relationships_by_to_party_role_id(0)
+    await get_communication_events_by_party_relationship_id(0)
+
+async def _warm_connection(held: list, all_held: asyncio.Event, size: int) -> None:
+    # Each task has its own connection; it is kept until all size tasks hold one, so the
+    # hot reads run on size different connections
+    async with database.connection():
+        await _run_hot_reads()
+        held.append(True)
+        if len(held) == size:
+            all_held.set()
+        await all_held.wait()
+
+async def warm_up() -> None:
+    with startup_report.phase("warm-up pool"):
+        held, all_held = [], asyncio.Event()
+        await asyncio.gather(*(_warm_connection(held, all_held, DATABASE_POOL_MIN_SIZE) for _ in range(DATABASE_POOL_MIN_SIZE)))
+    with startup_report.phase("warm-up reference cache"):
+        await asyncio.gather(
+            *(loader() for loader in REFERENCE_LOADERS),
+            *(loader(encoding) for loader in PRECOMPRESSED_LOADERS for encoding in (None, *ENCODINGS))
+        )
+
+async def run_warm_up() -> None:
+    # Background task started by the startup handler of app/main.py
+    try:
+        await asyncio.wait_for(warm_up(), WARMUP_TIMEOUT_SECONDS)
+        startup_report.warmup = "done"
+    except asyncio.TimeoutError:
+        logger.error(f"Warm-up did not finish within {WARMUP_TIMEOUT_SECONDS} s, marking ready without it")
+        startup_report.warmup = "timed out"
+    except Exception as e:
+        logger.error(f"Warm-up failed, marking ready without it: {str(e)}")
+        startup_report.warmup = "failed"
+    startup_report.ready()
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+class CacheMetricsOut(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    coalesced: int
+    errors: int
+    hit_ratio: float
+    avg_hit_ms: float
+    avg_load_ms: float
+    saved_seconds: float
+
+    class Config:
+        from_attributes = True
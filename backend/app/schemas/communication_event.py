@@ -1,6 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
+from app.schemas.communication_event_purpose import CommunicationEventPurposeOut
 
 class CommunicationEventCreate(BaseModel):
     datetime_start: Optional[datetime] = None
@@ -29,6 +30,7 @@ class CommunicationEventOut(BaseModel):
     contact_mechanism_type_description: Optional[str] = None
     communication_event_status_type_description: Optional[str] = None
     party_relationship_comment: Optional[str] = None
+    purposes: Optional[List[CommunicationEventPurposeOut]] = None
 
     class Config:
         from_attributes = True
\ No newline at end of file
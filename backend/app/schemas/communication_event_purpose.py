@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
+from datetime import datetime
 
 class CommunicationEventPurposeCreate(BaseModel):
     communication_event_id: int
@@ -12,6 +13,7 @@ class CommunicationEventPurposeUpdate(BaseModel):
 class CommunicationEventPurposeOut(BaseModel):
     id: int
     communication_event_id: int
+    communication_event_datetime_start: Optional[datetime] = None
     communication_event_purpose_type_id: int
     communication_event_note: Optional[str] = None
     communication_event_purpose_type_description: Optional[str] = None
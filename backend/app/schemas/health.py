@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Optional, Dict
+
+class ReadinessOut(BaseModel):
+    status: str
+    warmup: Optional[str] = None
+    ready_ms: Optional[float] = None
+    phases_ms: Dict[str, float] = {}
+    imports_ms: Dict[str, float] = {}
+
+    class Config:
+        from_attributes = True
\ No newline at end of file
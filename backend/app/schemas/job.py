@@ -0,0 +1,103 @@
+import os
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Optional, Literal, Type
+from datetime import datetime
+from app.config.settings import (
+    COMMUNICATION_EVENT_PARTITION_MONTHS_AHEAD, COMMUNICATION_EVENT_RETENTION_MONTHS,
+    PARTY_DEDUP_MIN_SCORE, PARTY_DEDUP_MAX_BLOCK_SIZE, JOB_IMPORT_BASE_DIR, JOB_EXPORT_BASE_DIR
+)
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+class JobCreate(BaseModel):
+    kind: str
+    params: dict = {}
+    max_attempts: Optional[int] = Field(None, ge=1, le=10)  # default JOB_MAX_ATTEMPTS
+
+def resolve_job_path(base: str, path: str) -> str:
+    # "dir" / "out" params are relative to a configured base directory and may not leave it
+    if os.path.isabs(path):
+        raise ValueError("must be a path relative to the job base directory")
+    base = os.path.realpath(base)
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError("must stay inside the job base directory")
+    return resolved
+
+# One params model per job kind (app/models/job.py JOB_KINDS), checked by POST /v1/jobs/
+# and again by the handler in the worker
+class JobParams(BaseModel):
+    class Config:
+        extra = "forbid"
+
+class AnalyticsExportParams(JobParams):
+    out: str = "."  # inside JOB_EXPORT_BASE_DIR
+    format: Literal["csv", "parquet", "arrow"] = "parquet"
+    only: Optional[List[Literal["persons", "organizations", "classifications", "relationships", "communication_events"]]] = None
+    full: bool = False
+    jobs: int = Field(2, ge=1, le=16)
+    batch_size: int = Field(50000, ge=1, le=1000000)
+
+    @field_validator("out")
+    @classmethod
+    def check_out(cls, value: str) -> str:
+        resolve_job_path(JOB_EXPORT_BASE_DIR, value)
+        return value
+
+class CommunicationEventPartitionParams(JobParams):
+    months_ahead: int = Field(COMMUNICATION_EVENT_PARTITION_MONTHS_AHEAD, ge=0, le=120)
+    detach: bool = True
+    retention_months: int = Field(COMMUNICATION_EVENT_RETENTION_MONTHS, ge=1)
+
+class CsvLoadParams(JobParams):
+    dir: str = "."  # inside JOB_IMPORT_BASE_DIR
+    only: Optional[List[str]] = None
+    truncate: bool = False
+    jobs: int = Field(4, ge=1, le=32)
+    search_keys: bool = True
+
+    @field_validator("dir")
+    @classmethod
+    def check_dir(cls, value: str) -> str:
+        resolve_job_path(JOB_IMPORT_BASE_DIR, value)
+        return value
+
+class PartyDedupParams(JobParams):
+    kinds: Optional[List[Literal["person", "organization"]]] = None
+    min_score: float = Field(PARTY_DEDUP_MIN_SCORE, ge=0, le=1)
+    max_block_size: int = Field(PARTY_DEDUP_MAX_BLOCK_SIZE, ge=2)
+    workers: Optional[int] = Field(None, ge=1, le=64)  # default: CPUs of the worker host
+    chunk_size: int = Field(5000, ge=1)
+
+class SearchKeyBackfillParams(JobParams):
+    batch_size: int = Field(1000, ge=1, le=100000)
+    all: bool = False
+
+JOB_PARAMS: Dict[str, Type[JobParams]] = {
+    "analytics_export": AnalyticsExportParams,
+    "communication_event_partition": CommunicationEventPartitionParams,
+    "csv_load": CsvLoadParams,
+    "party_dedup": PartyDedupParams,
+    "search_key_backfill": SearchKeyBackfillParams,
+}
+
+class JobOut(BaseModel):
+    id: int
+    kind: str
+    params: dict = {}
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    progress: Optional[dict] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    worker: Optional[str] = None
+    created_by: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Optional, Literal, Dict
+from datetime import datetime
+
+class PartyTimelineItemOut(BaseModel):
+    item_type: Literal["party_role", "party_relationship", "communication_event", "party_classification"]
+    item_id: int
+    change: Literal["start", "end"]
+    event_time: datetime
+    item_key: str
+    description: Optional[str] = None
+    party_role_id: Optional[int] = None
+    party_relationship_id: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+class PartyMergeOut(BaseModel):
+    party_id: int
+    target_party_id: int
+    party_kind: Literal["person", "organization"]
+    moved: Dict[str, int]
+    closed: Dict[str, int]
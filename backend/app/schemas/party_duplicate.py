@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Optional, List, Literal
+from datetime import datetime
+
+class PartyDuplicateCandidateUpdate(BaseModel):
+    status: Literal["pending", "merged", "rejected"]
+
+class PartyDuplicateCandidateOut(BaseModel):
+    id: int
+    party_id: Optional[int] = None  # NULL once that party was merged away
+    duplicate_party_id: Optional[int] = None
+    party_kind: Literal["person", "organization"]
+    score: float
+    reasons: List[str] = []
+    status: Literal["pending", "merged", "rejected"]
+    created_at: datetime
+    reviewed_at: Optional[datetime] = None
+    merged_party_id: Optional[int] = None
+    merged_into_party_id: Optional[int] = None
+
+    class Config:
+        from_attributes = True
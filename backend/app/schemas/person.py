@@ -1,6 +1,10 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 from datetime import date
+from app.schemas.classify_by_eeoc import ClassifyByEeocOut, ClassifyByEeocByPersonIdOut
+from app.schemas.classify_by_income import ClassifyByIncomeByPersonIdOut
+from app.schemas.passport import PassportOut
+from app.schemas.party_role import PartyRoleOut
 
 class PersonCreate(BaseModel):
     personal_id_number: Optional[str] = None
@@ -69,4 +73,34 @@ class PersonOut(PersonCreate):
     country_name_th: Optional[str] = None
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+# POST /v1/person/onboard: a new person with classification and roles, in one transaction
+class PersonOnboardClassifyByEeoc(BaseModel):
+    fromdate: Optional[date] = None
+    thrudate: Optional[date] = None
+    party_type_id: Optional[int] = 1
+    ethnicity_id: int
+
+class PersonOnboardPartyRole(BaseModel):
+    role_type_id: int
+    fromdate: Optional[date] = None
+    thrudate: Optional[date] = None
+
+class PersonOnboardCreate(BaseModel):
+    person: PersonCreate
+    classify_by_eeoc: Optional[PersonOnboardClassifyByEeoc] = None
+    party_roles: List[PersonOnboardPartyRole] = []
+
+class PersonOnboardOut(BaseModel):
+    person: PersonOut
+    classify_by_eeoc: Optional[ClassifyByEeocOut] = None
+    party_roles: List[PartyRoleOut] = []
+
+# GET /v1/person/{id}/full: profile with classifications, passports and roles in one response
+class PersonFullOut(BaseModel):
+    profile: PersonOut
+    classify_by_eeoc: List[ClassifyByEeocByPersonIdOut] = []
+    classify_by_income: List[ClassifyByIncomeByPersonIdOut] = []
+    passports: List[PassportOut] = []
+    party_roles: List[PartyRoleOut] = []
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional, Literal
+
+class SearchResultOut(BaseModel):
+    party_id: int
+    party_subtype: Literal[
+        "person", "corporation", "government_agency", "legal_organization",
+        "team", "family", "other_informal_organization", "informal_organization", "organization"
+    ]
+    name: Optional[str] = None
+    matched_name: str
+    score: float
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import importlib.util
+import logging
+import os
+from typing import Optional, Tuple
+import uvicorn
+from databases import Database
+from app.config.settings import (
+    DATABASE_URL, API_HOST, API_PORT, DATABASE_POOL_MIN_SIZE, DATABASE_POOL_MAX_SIZE,
+    DATABASE_RESERVED_CONNECTIONS, SERVER_WORKERS, GRACEFUL_SHUTDOWN_SECONDS, REDIS_URL
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Production entry point: several uvicorn worker processes behind one port.
+#   python -m app.server
+#   python -m app.server --workers 4 --port 8080
+# docker-compose.yml keeps uvicorn --reload for development; the backend-prod service
+# (docker compose --profile prod up) runs this.
+#
+# Pool size per worker: every worker opens its own pool, so before starting the workers the
+# server reads max_connections from Postgres and caps DATABASE_POOL_MAX_SIZE so that
+# workers x pool stays within max_connections - superuser_reserved_connections -
+# DATABASE_RESERVED_CONNECTIONS (left for jobs, migrations and psql). The sizes reach the
+# workers through the environment, which app/config/settings.py reads.
+#
+# More than one worker needs REDIS_URL: without it every worker has its own cache and entity
+# versions (app/config/cache.py), a write bumps only the versions of the worker that served it and
+# the others keep answering with cached data and 304s for the old ETags. The server refuses to start.
+#
+# uvloop and httptools are used when installed (requirements.txt), otherwise asyncio and h11.
+#
+# SIGTERM: the workers stop accepting connections, let the requests in flight finish (their
+# transactions, e.g. create_person, commit as usual) for up to GRACEFUL_SHUTDOWN_SECONDS, then
+# run the shutdown handler of app/main.py, which disconnects the pool. Requests still running
+# after that are cancelled and their transactions roll back.
+
+async def read_connection_budget() -> Optional[Tuple[int, int]]:
+    # (max_connections, superuser_reserved_connections), None when the database is not reachable
+    database = Database(DATABASE_URL, min_size=1, max_size=1)
+    try:
+        await database.connect()
+        result = await database.fetch_one("""
+            SELECT CAST(current_setting('max_connections') AS INT) AS max_connections,
+                   CAST(current_setting('superuser_reserved_connections') AS INT) AS reserved
+        """)
+        return result["max_connections"], result["reserved"]
+    except Exception as e:
+        logger.warning(f"Could not read max_connections, using the configured pool size: {str(e)}")
+        return None
+    finally:
+        if database.is_connected:
+            await database.disconnect()
+
+def pool_size_per_worker(workers: int, budget: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    if budget is None:
+        return DATABASE_POOL_MIN_SIZE, DATABASE_POOL_MAX_SIZE
+    max_connections, reserved = budget
+    available = max_connections - reserved - DATABASE_RESERVED_CONNECTIONS
+    max_size = max(1, min(DATABASE_POOL_MAX_SIZE, available // workers))
+    if max_size < DATABASE_POOL_MAX_SIZE:
+        logger.warning(
+            f"max_connections={max_connections} allows {max_size} connections per worker for {workers} workers "
+            f"(DATABASE_POOL_MAX_SIZE={DATABASE_POOL_MAX_SIZE})"
+        )
+    return min(DATABASE_POOL_MIN_SIZE, max_size), max_size
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default="app.main:app")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS or os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if args.workers > 1 and not REDIS_URL:
+        logger.error(f"{args.workers} workers need REDIS_URL for a shared cache and entity versions; set it or use --workers 1")
+        raise SystemExit(1)
+
+    min_size, max_size = pool_size_per_worker(args.workers, asyncio.run(read_connection_budget()))
+    os.environ["DATABASE_POOL_MIN_SIZE"] = str(min_size)
+    os.environ["DATABASE_POOL_MAX_SIZE"] = str(max_size)
+
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(
+        f"Starting {args.workers} workers on {args.host}:{args.port} "
+        f"(loop={loop}, http={http}, pool {min_size}-{max_size} per worker)"
+    )
+    uvicorn.run(
+        args.app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=loop,
+        http=http,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+if __name__ == "__main__":
+    main()
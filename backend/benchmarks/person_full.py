@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import logging
+import time
+from app.config.database import database
+from app.config.concurrent import gather_reads
+from app.models.person import get_person
+from app.models.classify_by_eeoc import get_classify_by_eeoc_by_person_id
+from app.models.classify_by_income import get_classify_by_income_by_person_id
+from app.models.passport import get_passports_by_person_id
+from app.models.party_role import get_party_roles_by_party_id
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Latency of the reads behind GET /v1/person/{id}/full: one after the other against gather_reads
+# (app/config/concurrent.py). get_person is read past the cache so every read hits the database.
+# Run from backend/ against a seeded database:
+#   python -m benchmarks.person_full --persons 200 --rounds 3
+
+def reads(person_id: int) -> dict:
+    return {
+        "profile": get_person.__wrapped__(person_id),
+        "classify_by_eeoc": get_classify_by_eeoc_by_person_id(person_id),
+        "classify_by_income": get_classify_by_income_by_person_id(person_id),
+        "passports": get_passports_by_person_id(person_id),
+        "party_roles": get_party_roles_by_party_id(person_id),
+    }
+
+async def sequential(person_id: int) -> dict:
+    return {name: await read for name, read in reads(person_id).items()}
+
+async def concurrent(person_id: int) -> dict:
+    return await gather_reads(**reads(person_id))
+
+async def measure(name: str, func, ids: list, rounds: int) -> float:
+    latencies = []
+    for _ in range(rounds):
+        for person_id in ids:
+            started = time.perf_counter()
+            await func(person_id)
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"{name:<11} {len(latencies):>6} requests  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms")
+    return p50
+
+async def run(persons: int, rounds: int) -> None:
+    await database.connect()
+    try:
+        rows = await database.fetch_all(query="SELECT id FROM person ORDER BY id LIMIT :limit", values={"limit": persons})
+        ids = [row["id"] for row in rows]
+        # warm the pool and the statement caches of its connections first
+        await measure("warm-up", concurrent, ids[:20], 1)
+        before = await measure("sequential", sequential, ids, rounds)
+        after = await measure("concurrent", concurrent, ids, rounds)
+        print(f"speedup     {before / after:.2f}x")
+    finally:
+        await database.disconnect()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sequential against concurrent reads of /v1/person/{id}/full")
+    parser.add_argument("--persons", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.persons, args.rounds))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, timedelta
+from typing import List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.config import fast_json
+from app.config.fast_json import record_encoder
+from app.schemas.person import PersonOut
+
+# GET /v1/person/ response bytes: the default path against the fast path of app/config/fast_json.py,
+# no database needed (records are generated in the shape the SELECT of get_all_persons returns)
+#   python -m benchmarks.person_list_json
+#   python -m benchmarks.person_list_json --persons 10000 --rounds 5
+#
+# default: PersonOut(**record) per row in the model, then what FastAPI does with
+#          response_model=List[PersonOut] (validate again, jsonable_encoder, json.dumps)
+# fast:    record_encoder(PersonOut), with orjson and with the json fallback
+
+NAME_TYPES = [("fname", 1, "FirstName"), ("mname", 2, "MiddleName"), ("lname", 3, "LastName"), ("nickname", 4, "Nickname")]
+
+def make_records(count: int) -> List[dict]:
+    rng = random.Random(42)
+    records = []
+    for i in range(1, count + 1):
+        since = date(2020, 1, 1) + timedelta(days=rng.randrange(1500))
+        record = {
+            "id": i,
+            "personal_id_number": f"{rng.randrange(10**12, 10**13)}",
+            "birthdate": date(1950, 1, 1) + timedelta(days=rng.randrange(20000)),
+            "mothermaidenname": f"Mother{i}",
+            "totalyearworkexperience": rng.randrange(40),
+            "comment": None if i % 3 else f"comment {i}",
+            "gender_type_id": rng.randrange(1, 3),
+            "gender_description": "Male",
+        }
+        for prefix, type_id, description in NAME_TYPES:
+            has_name = prefix != "mname" or i % 4 == 0
+            record.update({
+                f"{prefix}_id": i * 4 + type_id if has_name else None,
+                prefix: f"{description}{i}" if has_name else None,
+                f"{prefix}_fromdate": since if has_name else None,
+                f"{prefix}_thrudate": None,
+                f"{prefix}_personnametype_id": type_id if has_name else None,
+                f"{prefix}_personnametype_description": description if has_name else None,
+            })
+        record.update({
+            "marital_status_id": i, "marital_status_fromdate": since, "marital_status_thrudate": None,
+            "marital_status_type_id": 1, "marital_status_type_description": "Single",
+        })
+        for prefix, type_id, low, high in (("height", 1, 150, 195), ("weight", 2, 45, 110)):
+            record.update({
+                f"{prefix}_id": i * 2 + type_id, f"{prefix}_val": rng.randrange(low, high),
+                f"{prefix}_fromdate": since, f"{prefix}_thrudate": None,
+                f"{prefix}_type_id": type_id, f"{prefix}_type_description": prefix.capitalize(),
+            })
+        record.update({
+            "citizenship_id": i, "citizenship_fromdate": since, "citizenship_thrudate": None,
+            "country_id": 764, "country_isocode": "TH", "country_name_en": "Thailand", "country_name_th": "ไทย",
+        })
+        records.append(record)
+    return records
+
+async def default_path(records: List[dict]) -> bytes:
+    field = create_model_field(name="Response_get_all_persons", type_=List[PersonOut], mode="serialization")
+    results = [PersonOut(**record) for record in records]
+    content = await serialize_response(field=field, response_content=results, is_coroutine=True)
+    return JSONResponse(content).body
+
+async def fast_path(records: List[dict]) -> bytes:
+    return record_encoder(PersonOut)(records)
+
+async def fast_path_json(records: List[dict]) -> bytes:
+    orjson = fast_json.orjson
+    fast_json.orjson = None
+    try:
+        return record_encoder(PersonOut)(records)
+    finally:
+        fast_json.orjson = orjson
+
+async def measure(name: str, func, records: List[dict], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        body = await func(records)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<14} {best * 1000:9.1f} ms  {len(records) / best:11,.0f} rows/s  {len(body) / 1024:8,.0f} KiB")
+    return best
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--persons", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    records = make_records(args.persons)
+
+    # Same document either way
+    expected = json.loads(await default_path(records))
+    assert json.loads(await fast_path(records)) == expected, "fast path output differs"
+    assert json.loads(await fast_path_json(records)) == expected, "json fallback output differs"
+
+    print(f"{args.persons} persons, {len(PersonOut.model_fields)} fields, best of {args.rounds}")
+    baseline = await measure("default", default_path, records, args.rounds)
+    if fast_json.orjson is not None:
+        fast = await measure("fast (orjson)", fast_path, records, args.rounds)
+        print(f"orjson fast path: {baseline / fast:.1f}x")
+    fallback = await measure("fast (json)", fast_path_json, records, args.rounds)
+    print(f"json fallback:    {baseline / fallback:.1f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main())
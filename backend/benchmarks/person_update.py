@@ -0,0 +1,76 @@
+import argparse
+import asyncio
+import logging
+import time
+from app.config.database import database
+from app.models.person import create_person, update_person, patch_person, delete_person
+from app.schemas.person import PersonCreate, PersonUpdate
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Updates/sec of update_person (PUT: pre-read + per-field statements + full re-read)
+# against patch_person (PATCH: one statement)
+# Run from backend/ against a seeded database:
+#   python -m benchmarks.person_update --persons 200 --rounds 5 --concurrency 8
+# Creates its own persons and deletes them at the end.
+
+async def seed(count: int) -> list:
+    ids = []
+    for i in range(count):
+        person = await create_person(PersonCreate(
+            personal_id_number=f"BENCH{i:08d}", comment="benchmark",
+            fname=f"First{i}", lname=f"Last{i}", nickname=f"Nick{i}",
+            height_val=170, weight_val=70
+        ))
+        ids.append(person.id)
+    return ids
+
+def make_update(person_id: int, round_no: int) -> PersonUpdate:
+    # Three temporal attributes and one person column change every round
+    return PersonUpdate(
+        fname=f"First{person_id}r{round_no}",
+        lname=f"Last{person_id}r{round_no}",
+        weight_val=60 + round_no,
+        comment=f"benchmark round {round_no}"
+    )
+
+async def measure(name: str, func, ids: list, rounds: int, concurrency: int, round_offset: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(person_id: int, round_no: int):
+        async with semaphore:
+            await func(person_id, make_update(person_id, round_no))
+
+    started = time.perf_counter()
+    for round_no in range(round_offset, round_offset + rounds):
+        await asyncio.gather(*(one(person_id, round_no) for person_id in ids))
+    elapsed = time.perf_counter() - started
+    total = len(ids) * rounds
+    rate = total / elapsed
+    print(f"{name:<14} {total:>7} updates  {elapsed:8.2f}s  {rate:9.1f} updates/sec")
+    return rate
+
+async def run(persons: int, rounds: int, concurrency: int) -> None:
+    await database.connect()
+    ids = []
+    try:
+        ids = await seed(persons)
+        before = await measure("update_person", update_person, ids, rounds, concurrency, 0)
+        after = await measure("patch_person", patch_person, ids, rounds, concurrency, rounds)
+        print(f"speedup        {after / before:.2f}x")
+    finally:
+        for person_id in ids:
+            await delete_person(person_id)
+        await database.disconnect()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark update_person against patch_person")
+    parser.add_argument("--persons", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(run(args.persons, args.rounds, args.concurrency))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+from fastapi.routing import APIRoute
+from app.config.database import database
+from app.main import app
+from benchmarks.server_throughput import token
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Realistic request mix: replays the requests of a Postman collection (docs/postman) against a
+# running app, with many concurrent keep-alive connections, and reports throughput, latency
+# percentiles and a latency histogram per route.
+# Run from backend/ against a seeded database (python -m app.jobs.csv_load) and a started server:
+#   python -m benchmarks.postman_replay --url http://127.0.0.1:8080 --concurrency 32 --seconds 30
+#   python -m benchmarks.postman_replay --mix list=5,get=85,create=5,update=5 --folder "person|passport"
+#   python -m benchmarks.postman_replay --seconds 60 --json replay.json
+#
+# - Only the /v1 requests are replayed (not login / users). Each one is matched to a route of
+#   app.main (the trailing slash of list / create is added); requests without a route are skipped.
+# - Ids are not replayed as written: every id in the path (/v1/person/1, /v1/partyrole/bypartyid/2)
+#   and every *_id field of a body is replaced by a random existing id of its table, sampled from
+#   the database once (--ids per table). Bodies are otherwise sent as written in the collection.
+# - --mix weighs the categories list (GET without id), get (GET with id), create (POST), update
+#   (PUT) and delete (DELETE); a route is then picked at random within its category. delete is 0
+#   by default: it removes seeded rows, and later requests for them are 404s.
+# - Statuses outside 2xx are counted per route, latencies are kept for 2xx only.
+
+DEFAULT_COLLECTION = os.path.join("..", "docs", "postman", "party model_v3_fin_all.postman_collection.json")
+
+DEFAULT_MIX = "list=10,get=75,create=10,update=5,delete=0"
+
+# Upper bounds in ms; the last bucket is everything above
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+TABLES_QUERY = """
+    SELECT c.relname AS table_name
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p') AND NOT c.relispartition
+"""
+
+class Route(NamedTuple):
+    folder: str
+    name: str
+    method: str
+    # path with {table} for each id, e.g. /v1/partyrole/bypartyid/{party}
+    template: str
+    body: Optional[dict]
+    category: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.template}"
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+
+def table_for(name: str, tables: Dict[str, str]) -> Optional[str]:
+    # personname / classifybyeeoc / from_party_role -> table; tables maps name without "_" to name
+    name = name.replace("_", "")
+    for prefix in ("", "from", "to"):
+        if name.startswith(prefix) and name[len(prefix):] in tables:
+            return tables[name[len(prefix):]]
+    return None
+
+def app_route_matches(path: str, method: str) -> bool:
+    return any(
+        isinstance(route, APIRoute) and method in route.methods and route.path_regex.match(path)
+        for route in app.routes
+    )
+
+def parse_route(folder: str, item: dict, tables: Dict[str, str]) -> Optional[Route]:
+    request = item["request"]
+    url = request["url"] if isinstance(request["url"], str) else request["url"].get("raw", "")
+    path = urlsplit(url.replace("{{backend}}", "")).path
+    if not path.startswith("/v1/"):
+        return None
+    method = request["method"]
+    if not app_route_matches(path, method):
+        if app_route_matches(path + "/", method):
+            path += "/"
+        else:
+            logger.warning(f"Skipped {folder} / {item['name']}: no route for {method} {path}")
+            return None
+
+    # /v1/<resource>/<id> and /v1/<resource>/by<table>id/<id>
+    segments = path.split("/")
+    for index, segment in enumerate(segments):
+        if not segment.isdigit():
+            continue
+        previous = segments[index - 1]
+        owner = previous[2:-2] if previous.startswith("by") and previous.endswith("id") else segments[2]
+        table = table_for(owner, tables)
+        if table is None:
+            logger.warning(f"Skipped {folder} / {item['name']}: no table for the id in {path}")
+            return None
+        segments[index] = "{" + table + "}"
+    template = "/".join(segments)
+
+    body = None
+    raw = (request.get("body") or {}).get("raw")
+    if raw and method in ("POST", "PUT"):
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            logger.warning(f"Skipped {folder} / {item['name']}: body is not JSON")
+            return None
+
+    has_id = "{" in template
+    category = {"GET": "get" if has_id else "list", "POST": "create", "PUT": "update", "DELETE": "delete"}.get(method)
+    if category is None:
+        return None
+    return Route(folder, item["name"], method, template, body, category)
+
+def parse_collection(path: str, tables: Dict[str, str], folder_pattern: Optional[str]) -> List[Route]:
+    with open(path, encoding="utf-8") as file:
+        collection = json.load(file)
+    routes = {}
+
+    def walk(items: list, folder: str) -> None:
+        for item in items:
+            if "item" in item:
+                walk(item["item"], item["name"])
+            elif not folder_pattern or re.search(folder_pattern, folder):
+                route = parse_route(folder, item, tables)
+                # the same request saved twice (e.g. "create" and "create test fail") is replayed once
+                if route is not None and route.key not in routes:
+                    routes[route.key] = route
+
+    walk(collection["item"], "")
+    return list(routes.values())
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight)
+    return weights
+
+async def load_ids(routes: List[Route], tables: Dict[str, str], per_table: int) -> Dict[str, List[int]]:
+    # Random existing ids of every table a path or body refers to
+    needed = set()
+    for route in routes:
+        needed.update(re.findall(r"\{(\w+)\}", route.template))
+        for field in (route.body or {}):
+            if field.endswith("_id") and table_for(field[:-3], tables):
+                needed.add(table_for(field[:-3], tables))
+    pools = {}
+    for table in sorted(needed):
+        rows = await database.fetch_all(query=f'SELECT id FROM "{table}" ORDER BY random() LIMIT :limit', values={"limit": per_table})
+        pools[table] = [row["id"] for row in rows]
+        if not pools[table]:
+            logger.warning(f"No rows in {table}: requests using its ids are skipped")
+    return pools
+
+def has_ids(route: Route, pools: Dict[str, List[int]]) -> bool:
+    # build_request() needs an id of every table in the path
+    return all(pools.get(table) for table in re.findall(r"\{(\w+)\}", route.template))
+
+def build_request(route: Route, pools: Dict[str, List[int]], tables: Dict[str, str], headers: str) -> Optional[bytes]:
+    ids = {}
+    for table in re.findall(r"\{(\w+)\}", route.template):
+        if not pools.get(table):
+            return None
+        ids[table] = random.choice(pools[table])
+    path = route.template.format(**ids)
+    payload = b""
+    if route.body is not None:
+        body = dict(route.body)
+        for field in body:
+            table = table_for(field[:-3], tables) if field.endswith("_id") else None
+            if table and pools.get(table):
+                body[field] = random.choice(pools[table])
+        payload = json.dumps(body).encode()
+    head = f"{route.method} {path} HTTP/1.1\r\n{headers}Content-Length: {len(payload)}\r\n"
+    if payload:
+        head += "Content-Type: application/json\r\n"
+    return (head + "\r\n").encode() + payload
+
+async def send(reader, writer, request: bytes) -> int:
+    # One keep-alive request; reads a Content-Length or a chunked body
+    writer.write(request)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by the server")
+    length, chunked = 0, False
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+async def client(host: str, port: int, routes: Dict[str, List[Route]], weights: Dict[str, float], pools, tables,
+                 headers: str, until: float, stats: Dict[str, RouteStats]) -> None:
+    categories = [category for category in routes if weights.get(category, 0) > 0]
+    category_weights = [weights[category] for category in categories]
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.monotonic() < until:
+            route = random.choice(routes[random.choices(categories, category_weights)[0]])
+            request = build_request(route, pools, tables, headers)
+            if request is None:
+                # Routes without ids are dropped in run(); never spin without yielding
+                await asyncio.sleep(0)
+                continue
+            started = time.perf_counter()
+            try:
+                status = await send(reader, writer, request)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                stats[route.key].statuses[0] += 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            stats[route.key].statuses[status] += 1
+            if 200 <= status < 300:
+                stats[route.key].latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+def histogram(latencies: List[float]) -> List[int]:
+    counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+    for latency in latencies:
+        ms = latency * 1000
+        index = next((i for i, bound in enumerate(HISTOGRAM_BUCKETS_MS) if ms <= bound), len(HISTOGRAM_BUCKETS_MS))
+        counts[index] += 1
+    return counts
+
+def percentile(latencies: List[float], fraction: float) -> float:
+    return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+def summarize(name: str, latencies: List[float], statuses: Counter, seconds: float) -> dict:
+    latencies.sort()
+    summary = {
+        "requests": sum(statuses.values()),
+        "ok": len(latencies),
+        "rps": len(latencies) / seconds,
+        "errors": {str(status): count for status, count in sorted(statuses.items()) if not 200 <= status < 300},
+        "histogram_ms": dict(zip([f"<={bound}" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}"], histogram(latencies))),
+    }
+    if latencies:
+        summary.update({
+            "p50_ms": percentile(latencies, 0.5),
+            "p90_ms": percentile(latencies, 0.9),
+            "p99_ms": percentile(latencies, 0.99),
+            "max_ms": latencies[-1] * 1000,
+        })
+    errors = sum(summary["errors"].values())
+    if latencies:
+        print(f"{name:<62} {summary['ok']:>7} {summary['rps']:>8.1f} {summary['p50_ms']:>7.1f} {summary['p90_ms']:>7.1f} "
+              f"{summary['p99_ms']:>7.1f} {summary['max_ms']:>8.1f} {errors:>6}")
+    else:
+        print(f"{name:<62} {0:>7} {0:>8.1f} {'-':>7} {'-':>7} {'-':>7} {'-':>8} {errors:>6}")
+    return summary
+
+def print_histogram(summary: dict) -> None:
+    total = max(summary["ok"], 1)
+    for bucket, count in summary["histogram_ms"].items():
+        print(f"  {bucket + ' ms':>10} {count:>8}  {'#' * round(50 * count / total)}")
+
+async def run(args) -> None:
+    random.seed(args.seed)
+    await database.connect()
+    try:
+        tables = {row["table_name"].replace("_", ""): row["table_name"] for row in await database.fetch_all(query=TABLES_QUERY)}
+        routes = parse_collection(args.collection, tables, args.folder)
+        pools = await load_ids(routes, tables, args.ids)
+    finally:
+        await database.disconnect()
+
+    weights = parse_mix(args.mix)
+    by_category = defaultdict(list)
+    for route in routes:
+        if weights.get(route.category, 0) > 0:
+            if not has_ids(route, pools):
+                logger.warning(f"Skipped {route.key}: no ids for its path")
+                continue
+            by_category[route.category].append(route)
+    if not by_category:
+        raise SystemExit(f"No routes for mix {args.mix}")
+    print(f"{sum(len(r) for r in by_category.values())} routes ({', '.join(f'{c} {len(r)}' for c, r in sorted(by_category.items()))}), "
+          f"{args.concurrency} connections, {args.seconds:.0f} s")
+
+    target = urlsplit(args.url)
+    host, port = target.hostname, target.port or 80
+    headers = f"Host: {target.netloc}\r\nConnection: keep-alive\r\nAuthorization: Bearer {token(args.user_id)}\r\n"
+    stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+    until = time.monotonic() + args.seconds
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, by_category, weights, pools, tables, headers, until, stats) for _ in range(args.concurrency)
+    ))
+    seconds = time.perf_counter() - started
+
+    print(f"{'route':<62} {'ok':>7} {'req/s':>8} {'p50':>7} {'p90':>7} {'p99':>7} {'max ms':>8} {'errors':>6}")
+    results = {key: summarize(key, stats[key].latencies, stats[key].statuses, seconds) for key in sorted(stats)}
+    all_latencies = [latency for route_stats in stats.values() for latency in route_stats.latencies]
+    all_statuses = sum((route_stats.statuses for route_stats in stats.values()), Counter())
+    print("-" * 112)
+    total = summarize("total", all_latencies, all_statuses, seconds)
+    print_histogram(total)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"seconds": seconds, "concurrency": args.concurrency, "mix": weights, "total": total, "routes": results}, file, indent=2)
+        print(f"Wrote {args.json}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a Postman collection as a load test with a request mix")
+    parser.add_argument("--collection", default=DEFAULT_COLLECTION)
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--user-id", default="1", help="sub of the admin token signed with SECRET_KEY")
+    parser.add_argument("--concurrency", type=int, default=32, help="keep-alive connections")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="weights of list / get / create / update / delete")
+    parser.add_argument("--folder", help="regex on the collection folder names, e.g. 'person|passport'")
+    parser.add_argument("--ids", type=int, default=1000, help="ids sampled per table")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results (with histograms) to this file")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import random
+import time
+from collections import Counter
+from app.models.search_key import normalize_name, phonetic_key, THAI_TONE_MARKS
+
+# Quality and speed of the search keys in app/models/search_key.py, no database needed
+#   python -m benchmarks.search_key
+#   python -m benchmarks.search_key --names 200000
+#
+# Corpus: common Thai given names, organization words and place names with the romanizations
+# people actually type (RTGS, passport spellings, informal spellings)
+CORPUS = [
+    ("สมชาย", ["Somchai", "Somchay", "Somchaai"]),
+    ("สมศักดิ์", ["Somsak", "Somsuk"]),
+    ("วิชัย", ["Wichai", "Vichai", "Wichay"]),
+    ("อนันต์", ["Anan", "Anand"]),
+    ("ณัฐพล", ["Nattapon", "Nattaphon", "Natthaphon", "Nuttapol"]),
+    ("กิตติ", ["Kitti", "Kittee"]),
+    ("ธนากร", ["Thanakorn", "Tanakorn", "Thanakon"]),
+    ("สุภชัย", ["Supachai", "Suphachai"]),
+    ("บุญมี", ["Boonmee", "Bunmi", "Boonmi"]),
+    ("ประเสริฐ", ["Prasert", "Prasoet"]),
+    ("นภา", ["Napa", "Napha"]),
+    ("ชัยวัฒน์", ["Chaiwat", "Chaiwatt", "Chaiyawat"]),
+    ("ศิริพร", ["Siriporn", "Siriphon", "Siripon"]),
+    ("สุภาพร", ["Supaporn", "Suphaphon"]),
+    ("วีระ", ["Weera", "Veera", "Wira"]),
+    ("ปิยะ", ["Piya", "Piyah"]),
+    ("เกศินี", ["Kesinee", "Kesini", "Ketsini"]),
+    ("จันทร์เพ็ญ", ["Chanpen", "Janpen", "Chanphen"]),
+    ("พิมพ์ชนก", ["Pimchanok", "Phimchanok"]),
+    ("ไพโรจน์", ["Pairoj", "Phairot", "Pairote"]),
+    ("สุรชัย", ["Surachai", "Surachay"]),
+    ("ปรีชา", ["Preecha", "Pricha"]),
+    ("ขวัญใจ", ["Kwanjai", "Khwanchai"]),
+    ("มานพ", ["Manop", "Manob"]),
+    ("ธีรพงษ์", ["Teerapong", "Thiraphong", "Theerapong"]),
+    ("วรรณา", ["Wanna", "Vanna"]),
+    ("อรุณ", ["Arun", "Aroon"]),
+    ("สมพร", ["Somporn", "Somphon"]),
+    ("กรุงเทพ", ["Krungthep", "Krung Thep"]),
+    ("พลังงาน", ["Palangngan", "Phalangngan"]),
+]
+
+def _drop_tone_marks(name: str) -> str:
+    return "".join(ch for ch in name if ch not in THAI_TONE_MARKS)
+
+def quality() -> None:
+    tone_hits = 0
+    tone_total = 0
+    cross_hits = 0
+    cross_total = 0
+    misses = []
+    for thai, latin_names in CORPUS:
+        # Tone marks typed or not: same normalized key
+        tone_total += 1
+        tone_hits += normalize_name(thai) == normalize_name(_drop_tone_marks(thai))
+        # Thai script vs each romanization: same phonetic key
+        thai_key = phonetic_key(thai)
+        for latin in latin_names:
+            cross_total += 1
+            if phonetic_key(latin) == thai_key:
+                cross_hits += 1
+            else:
+                misses.append(f"{thai}={thai_key} {latin}={phonetic_key(latin)}")
+    # Different names should not share a phonetic key
+    keys = Counter(phonetic_key(thai) for thai, _ in CORPUS)
+    collisions = sum(count - 1 for count in keys.values() if count > 1)
+
+    print(f"tone-mark folding      {tone_hits}/{tone_total}")
+    print(f"Thai <-> Latin recall  {cross_hits}/{cross_total} ({100 * cross_hits / cross_total:.0f}%)")
+    print(f"phonetic collisions    {collisions} of {len(CORPUS)} distinct names")
+    for miss in misses:
+        print(f"  miss  {miss}")
+
+def speed(count: int) -> None:
+    # Full names as stored in personname / organization, half Thai and half Latin
+    rng = random.Random(42)
+    names = []
+    for _ in range(count):
+        thai, latin_names = rng.choice(CORPUS)
+        names.append(thai if rng.random() < 0.5 else rng.choice(latin_names))
+    started = time.perf_counter()
+    for name in names:
+        normalize_name(name)
+        phonetic_key(name)
+    elapsed = time.perf_counter() - started
+    print(f"keys                   {count} names in {elapsed:.2f}s ({count / elapsed:,.0f} names/sec)")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark normalized / phonetic search keys")
+    parser.add_argument("--names", type=int, default=100000)
+    args = parser.parse_args()
+    quality()
+    speed(args.names)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import List, Optional
+from jose import jwt
+from app.config.settings import SECRET_KEY
+
+# Requests/sec of the development setup (one uvicorn process) against the production entry point
+# (python -m app.server, several workers), same app, same port, one after the other.
+# Run from backend/ with the database of app/config/settings.py reachable:
+#   python -m benchmarks.server_throughput
+#   python -m benchmarks.server_throughput --path /v1/person/ --workers 4 --connections 128 --seconds 20
+#
+# Paths under /v1 need an admin token; one is signed with SECRET_KEY for --user-id. The load is plain
+# HTTP/1.1 keep-alive GETs from --connections concurrent connections in this process, so on a
+# small machine the client competes with the workers for CPU: compare the two numbers, not
+# absolute values.
+
+def start_server(command: List[str], port: int) -> subprocess.Popen:
+    return subprocess.Popen(command + ["--port", str(port)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+async def get(reader, writer, request: bytes) -> int:
+    writer.write(request)
+    await writer.drain()
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+async def wait_ready(port: int, request: bytes, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                if await get(reader, writer, request) == 200:
+                    return
+            finally:
+                writer.close()
+        except (OSError, asyncio.IncompleteReadError, IndexError):
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"server on port {port} not ready after {timeout} s")
+
+async def client(port: int, request: bytes, until: float, latencies: List[float], errors: List[int]) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.monotonic() < until:
+            started = time.perf_counter()
+            status = await get(reader, writer, request)
+            if status == 200:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors.append(status)
+    finally:
+        writer.close()
+
+async def run_load(port: int, request: bytes, connections: int, seconds: float) -> None:
+    latencies, errors = [], []
+    until = time.monotonic() + seconds
+    await asyncio.gather(*(client(port, request, until, latencies, errors) for _ in range(connections)))
+    latencies.sort()
+    if not latencies:
+        print(f"  no successful requests, {len(errors)} errors (statuses {sorted(set(errors))})")
+        return
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"  {len(latencies) / seconds:10,.0f} req/s  p50 {p50:6.1f} ms  p99 {p99:6.1f} ms  errors {len(errors)}")
+
+async def measure(name: str, command: List[str], port: int, request: bytes, args) -> None:
+    print(f"{name}: {' '.join(command)}")
+    server = start_server(command, port)
+    try:
+        await wait_ready(port, request, args.startup_timeout)
+        await run_load(port, request, args.connections, args.seconds)
+    finally:
+        # SIGTERM, as the container platform does, and wait for the drain
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+
+def token(user_id: Optional[str]) -> Optional[str]:
+    # The claims get_current_user checks
+    if not user_id:
+        return None
+    return jwt.encode({"sub": user_id, "role": "admin", "exp": int(time.time()) + 3600}, SECRET_KEY, algorithm="HS256")
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default="app.main:app")
+    parser.add_argument("--path", default="/v1/health/live")
+    parser.add_argument("--user-id", default="1")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--startup-timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    headers = f"GET {args.path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: keep-alive\r\n"
+    bearer = token(args.user_id) if args.path.startswith("/v1/") else None
+    if bearer:
+        headers += f"Authorization: Bearer {bearer}\r\n"
+    request = (headers + "\r\n").encode()
+
+    print(f"GET {args.path}, {args.connections} connections, {args.seconds:.0f} s each")
+    await measure("single process", [sys.executable, "-m", "uvicorn", args.app], args.port, request, args)
+    await measure(f"{args.workers} workers", [sys.executable, "-m", "app.server", "--app", args.app, "--workers", str(args.workers)], args.port, request, args)
+
+if __name__ == "__main__":
+    asyncio.run(main())
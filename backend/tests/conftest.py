@@ -0,0 +1,32 @@
+import asyncio
+import os
+import pytest
+
+# Run from backend/:  python -m pytest -q
+#
+# Most tests need nothing but the code. Tests using the `rollback` fixture run against
+# TEST_DATABASE_URL (a scratch database with create_table_v3.sql and the note_for_database/*.sql
+# migrations applied) and are skipped when it is not set; everything they write is rolled back.
+
+if os.getenv("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+
+@pytest.fixture
+def rollback():
+    # rollback(scenario) runs `await scenario()` on the app's database inside a transaction
+    # that is rolled back afterwards, and returns its result
+    if not os.getenv("TEST_DATABASE_URL"):
+        pytest.skip("TEST_DATABASE_URL is not set")
+    from app.config.database import database
+
+    def run(scenario):
+        async def main():
+            await database.connect()
+            try:
+                async with database.transaction(force_rollback=True):
+                    return await scenario()
+            finally:
+                await database.disconnect()
+        return asyncio.run(main())
+
+    return run
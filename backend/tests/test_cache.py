@@ -0,0 +1,81 @@
+import asyncio
+from pydantic import TypeAdapter
+from app.config.cache import InMemoryCache, SharedCache
+
+ADAPTER = TypeAdapter(dict)
+
+def _loader(calls: list, value, delay: float = 0.01):
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if isinstance(value, Exception):
+            raise value
+        return value
+    return load
+
+def test_concurrent_misses_share_one_load():
+    async def main():
+        cache = SharedCache(InMemoryCache())
+        calls = []
+        load = _loader(calls, {"id": 1})
+        results = await asyncio.gather(*(cache.get_or_load(["person"], "p:1", load, ADAPTER, 60) for _ in range(5)))
+        cached = await cache.get_or_load(["person"], "p:1", load, ADAPTER, 60)
+        return calls, results, cached, cache.metrics
+
+    calls, results, cached, metrics = asyncio.run(main())
+    assert len(calls) == 1
+    assert results == [{"id": 1}] * 5 and cached == {"id": 1}
+    assert (metrics.misses, metrics.coalesced, metrics.hits) == (5, 4, 1)
+
+def test_a_failed_load_reaches_every_waiter_and_is_not_kept():
+    async def main():
+        cache = SharedCache(InMemoryCache())
+        calls = []
+        failing = _loader(calls, RuntimeError("database down"))
+        results = await asyncio.gather(
+            *(cache.get_or_load(["person"], "p:1", failing, ADAPTER, 60) for _ in range(3)), return_exceptions=True
+        )
+        retry = await cache.get_or_load(["person"], "p:1", _loader(calls, {"id": 1}), ADAPTER, 60)
+        return calls, results, retry, cache._inflight
+
+    calls, results, retry, inflight = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 2 and retry == {"id": 1} and inflight == {}
+
+def test_bump_invalidates_only_that_entity():
+    async def main():
+        cache = SharedCache(InMemoryCache())
+        calls = []
+        first = await cache.versions(["person", "country"])
+        await cache.get_or_load(["person"], "p:1", _loader(calls, {"v": 1}), ADAPTER, 60)
+        await cache.get_or_load(["country"], "c", _loader(calls, {"v": 1}), ADAPTER, 60)
+        await cache.bump(["person"])
+        person = await cache.get_or_load(["person"], "p:1", _loader(calls, {"v": 2}), ADAPTER, 60)
+        country = await cache.get_or_load(["country"], "c", _loader(calls, {"v": 2}), ADAPTER, 60)
+        return first, await cache.versions(["person", "country"]), calls, person, country
+
+    first, second, calls, person, country = asyncio.run(main())
+    epoch = first.split("-")[0]
+    assert (first, second) == (f"{epoch}-0.0", f"{epoch}-1.0")
+    assert len(calls) == 3 and person == {"v": 2} and country == {"v": 1}
+
+def test_none_is_not_cached():
+    async def main():
+        cache = SharedCache(InMemoryCache())
+        calls = []
+        for _ in range(2):
+            assert await cache.get_or_load(["person"], "p:404", _loader(calls, None), ADAPTER, 60) is None
+        return calls
+
+    assert len(asyncio.run(main())) == 2
+
+def test_backend_errors_fall_back_to_the_loader():
+    class Down(InMemoryCache):
+        async def mget(self, keys):
+            raise ConnectionError("redis down")
+
+    async def main():
+        cache = SharedCache(Down())
+        return await cache.get_or_load(["person"], "p:1", _loader([], {"id": 1}), ADAPTER, 60), cache.metrics.errors
+
+    assert asyncio.run(main()) == ({"id": 1}, 1)
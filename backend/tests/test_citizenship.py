@@ -0,0 +1,52 @@
+from datetime import date
+from app.config.database import database
+from app.models.citizenship import create_citizenship, update_citizenship
+from app.schemas.citizenship import CitizenshipCreate, CitizenshipUpdate
+
+async def _new_person() -> int:
+    party_id = await database.fetch_val(query="INSERT INTO party DEFAULT VALUES RETURNING id")
+    await database.execute(query="INSERT INTO person (id) VALUES (:id)", values={"id": party_id})
+    return party_id
+
+async def _new_country(isocode: str) -> int:
+    return await database.fetch_val(
+        query="INSERT INTO country (isocode, name_en, name_th) VALUES (:isocode, :isocode, :isocode) RETURNING id",
+        values={"isocode": isocode}
+    )
+
+async def _citizenships(person_id: int) -> list:
+    rows = await database.fetch_all(
+        query="SELECT country_id, fromdate, thrudate FROM citizenship WHERE person_id = :person_id ORDER BY fromdate",
+        values={"person_id": person_id}
+    )
+    return [(row["country_id"], row["fromdate"], row["thrudate"]) for row in rows]
+
+def test_backdated_create_goes_in_as_closed_history(rollback):
+    async def scenario():
+        person_id = await _new_person()
+        country_id = await _new_country("XA")
+        await create_citizenship(CitizenshipCreate(person_id=person_id, country_id=country_id, fromdate=date(2020, 1, 1)))
+        await create_citizenship(CitizenshipCreate(person_id=person_id, country_id=country_id, fromdate=date(2010, 1, 1)))
+        await create_citizenship(CitizenshipCreate(person_id=person_id, country_id=country_id, fromdate=date(2022, 1, 1)))
+        return country_id, await _citizenships(person_id)
+
+    country_id, rows = rollback(scenario)
+    assert rows == [
+        (country_id, date(2010, 1, 1), date(2020, 1, 1)),
+        (country_id, date(2020, 1, 1), date(2022, 1, 1)),
+        (country_id, date(2022, 1, 1), None),
+    ]
+
+def test_update_onto_an_open_country_is_refused(rollback):
+    async def scenario():
+        person_id = await _new_person()
+        first, second = [await _new_country(code) for code in ("XA", "XB")]
+        await create_citizenship(CitizenshipCreate(person_id=person_id, country_id=first, fromdate=date(2000, 1, 1)))
+        moved = await create_citizenship(CitizenshipCreate(person_id=person_id, country_id=second, fromdate=date(2010, 1, 1)))
+        refused = await update_citizenship(moved.id, CitizenshipUpdate(country_id=first, fromdate=date(2012, 1, 1)))
+        closed = await update_citizenship(moved.id, CitizenshipUpdate(country_id=first, thrudate=date(2011, 1, 1)))
+        return refused, closed, first
+
+    refused, closed, first = rollback(scenario)
+    assert refused is None
+    assert (closed.country_id, closed.thrudate) == (first, date(2011, 1, 1))
@@ -0,0 +1,33 @@
+import gzip
+import zlib
+import pytest
+from app.config.compression import ENCODINGS, StreamCompressor, accepted_encoding
+
+def test_accepted_encoding_follows_q_values():
+    assert accepted_encoding(None) is None
+    assert accepted_encoding("identity") is None
+    assert accepted_encoding("gzip") == "gzip"
+    assert accepted_encoding("gzip;q=0") is None
+    assert accepted_encoding("*") == ENCODINGS[0]
+    assert accepted_encoding("*, gzip;q=0") == ("br" if "br" in ENCODINGS else None)
+    assert accepted_encoding("GZIP ; q=0.5, deflate") == "gzip"
+    assert accepted_encoding("gzip;q=abc") is None
+
+def test_brotli_preferred_when_installed():
+    if "br" not in ENCODINGS:
+        pytest.skip("Brotli is not installed")
+    assert accepted_encoding("gzip, br") == "br"
+    assert accepted_encoding("br;q=0.1, gzip;q=0.9") == "gzip"
+
+def test_stream_compressor_flushes_every_chunk():
+    compressor = StreamCompressor("gzip")
+    decompressor = zlib.decompressobj(31)
+    chunks = [b'{"id": %d}\n' % i for i in range(3)]
+    body = b""
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        body += compressed
+        # Everything sent so far decodes without waiting for more
+        assert decompressor.decompress(compressed) == chunk
+    body += compressor.finish(b"end\n")
+    assert gzip.decompress(body) == b"".join(chunks) + b"end\n"
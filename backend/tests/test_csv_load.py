@@ -0,0 +1,36 @@
+import pytest
+from app.jobs.csv_load import CsvFile, ForeignKey, dependency_levels, derived_columns
+
+def _file(table: str, columns=("id",)) -> CsvFile:
+    return CsvFile(f"{table}/{table}.csv", table, list(columns), 1)
+
+def test_dependency_levels_load_parents_first():
+    files = [_file("person"), _file("party"), _file("personname"), _file("personnametype")]
+    foreign_keys = {
+        "person": [ForeignKey("party", ["id"], ["id"])],
+        "personname": [ForeignKey("person", ["person_id"], ["id"]), ForeignKey("personnametype", ["personnametype_id"], ["id"])],
+        # Self reference and a table that is not being loaded do not order anything
+        "party": [ForeignKey("party", ["parent_id"], ["id"]), ForeignKey("country", ["country_id"], ["id"])],
+    }
+    levels = [[file.table for file in level] for level in dependency_levels(files, foreign_keys)]
+    assert levels == [["party", "personnametype"], ["person"], ["personname"]]
+
+def test_dependency_levels_report_cycles():
+    foreign_keys = {"a": [ForeignKey("b", ["b_id"], ["id"])], "b": [ForeignKey("a", ["a_id"], ["id"])]}
+    with pytest.raises(ValueError, match="cycle between: a, b"):
+        dependency_levels([_file("a"), _file("b"), _file("c")], foreign_keys)
+
+def test_derived_columns_fill_a_partition_key_from_the_parent():
+    file = _file("communication_event_purpose", ("id", "communication_event_id", "communication_event_purpose_type_id"))
+    fk = ForeignKey(
+        "communication_event",
+        ["communication_event_id", "communication_event_datetime_start"],
+        ["id", "datetime_start"]
+    )
+    required = ["id", "communication_event_id", "communication_event_datetime_start", "communication_event_purpose_type_id"]
+    assert derived_columns(file, required, [fk]) == [(fk, {"communication_event_datetime_start": "datetime_start"})]
+    assert derived_columns(_file("x", required), required, [fk]) == []
+
+def test_derived_columns_report_what_cannot_be_filled():
+    with pytest.raises(ValueError, match="required columns name of x are missing"):
+        derived_columns(_file("x"), ["id", "name"], [])
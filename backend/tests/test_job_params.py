@@ -0,0 +1,39 @@
+import os
+import pytest
+from pydantic import ValidationError
+from app.config.settings import JOB_EXPORT_BASE_DIR, JOB_IMPORT_BASE_DIR
+from app.models.job import JOB_KINDS
+from app.schemas.job import JOB_PARAMS, AnalyticsExportParams, CsvLoadParams, resolve_job_path
+
+def test_every_job_kind_has_a_params_model():
+    assert sorted(JOB_PARAMS) == sorted(JOB_KINDS)
+    for model in JOB_PARAMS.values():
+        model.model_validate({})
+
+def test_unknown_and_mistyped_params_are_rejected():
+    with pytest.raises(ValidationError):
+        CsvLoadParams.model_validate({"truncat": True})
+    with pytest.raises(ValidationError):
+        CsvLoadParams.model_validate({"jobs": 0})
+    with pytest.raises(ValidationError):
+        AnalyticsExportParams.model_validate({"format": "xlsx"})
+
+def test_only_must_be_a_list():
+    # A string would be matched as a substring ("person" in "personname")
+    with pytest.raises(ValidationError):
+        CsvLoadParams.model_validate({"only": "personname"})
+    with pytest.raises(ValidationError):
+        AnalyticsExportParams.model_validate({"only": ["people"]})
+    assert CsvLoadParams.model_validate({"only": ["personname"]}).only == ["personname"]
+
+@pytest.mark.parametrize("path", ["/etc", "..", "../..", "snapshots/../../x"])
+def test_paths_outside_the_base_directory_are_rejected(path):
+    with pytest.raises(ValidationError):
+        CsvLoadParams.model_validate({"dir": path})
+    with pytest.raises(ValidationError):
+        AnalyticsExportParams.model_validate({"out": path})
+
+def test_paths_resolve_inside_the_base_directory():
+    assert resolve_job_path(JOB_IMPORT_BASE_DIR, ".") == os.path.realpath(JOB_IMPORT_BASE_DIR)
+    assert resolve_job_path(JOB_EXPORT_BASE_DIR, "daily/persons") == \
+        os.path.join(os.path.realpath(JOB_EXPORT_BASE_DIR), "daily", "persons")
@@ -0,0 +1,36 @@
+from app.config.database import database
+from app.models.job import enqueue_job, claim_job, complete_job, fail_job, get_job, requeue_stale_jobs
+
+async def _expire_lease(job_id: int) -> None:
+    await database.execute(query="UPDATE job SET heartbeat_at = now() - interval '1 hour' WHERE id = :id", values={"id": job_id})
+    await requeue_stale_jobs(60)
+
+def test_late_outcome_of_an_expired_attempt_is_dropped(rollback):
+    async def scenario():
+        job = await enqueue_job("party_dedup", {})
+        first = await claim_job("worker-a")
+        await _expire_lease(job.id)
+        second = await claim_job("worker-b")
+        late_complete = await complete_job(job.id, "worker-a", first.attempts, {"from": "a"})
+        late_fail = await fail_job(job.id, "worker-a", first.attempts, "boom")
+        after_late = await get_job(job.id)
+        completed = await complete_job(job.id, "worker-b", second.attempts, {"from": "b"})
+        return late_complete, late_fail, after_late, completed, await get_job(job.id)
+
+    late_complete, late_fail, after_late, completed, final = rollback(scenario)
+    assert (late_complete, late_fail) == (False, None)
+    assert (after_late.status, after_late.worker, after_late.attempts) == ("running", "worker-b", 2)
+    assert completed is True
+    assert (final.status, final.result) == ("succeeded", {"from": "b"})
+
+def test_same_worker_name_with_an_older_attempt_is_dropped(rollback):
+    async def scenario():
+        job = await enqueue_job("party_dedup", {})
+        first = await claim_job("worker-a")
+        await _expire_lease(job.id)
+        await claim_job("worker-a")
+        return await complete_job(job.id, "worker-a", first.attempts, {}), await get_job(job.id)
+
+    completed, final = rollback(scenario)
+    assert completed is False
+    assert final.status == "running"
@@ -0,0 +1,24 @@
+from app.config.database import database
+from app.jobs.party_dedup import dedup
+
+def test_progress_counts_scored_pairs_up_to_the_total(rollback):
+    async def scenario():
+        for _ in range(5):
+            party_id = await database.fetch_val(query="INSERT INTO party DEFAULT VALUES RETURNING id")
+            await database.execute(
+                query="INSERT INTO person (id, personal_id_number) VALUES (:id, '9-9999-99999-99-9')",
+                values={"id": party_id}
+            )
+        reports = []
+
+        async def progress(done, total=None, message=None):
+            reports.append((done, total))
+
+        await dedup("person", 0.3, 50, 1, 1, progress)
+        return reports
+
+    reports = rollback(scenario)
+    done = [report[0] for report in reports]
+    total = reports[-1][1]
+    assert total >= 10  # the 5 look-alikes give 10 pairs
+    assert done == list(range(1, total + 1))  # one report per chunk of one pair, drain loop included
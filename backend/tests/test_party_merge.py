@@ -0,0 +1,37 @@
+from app.config.database import database
+from app.models.party import merge_party
+
+async def _new_person() -> int:
+    party_id = await database.fetch_val(query="INSERT INTO party DEFAULT VALUES RETURNING id")
+    await database.execute(query="INSERT INTO person (id) VALUES (:id)", values={"id": party_id})
+    return party_id
+
+async def _new_candidate(party_id: int, duplicate_party_id: int, status: str) -> int:
+    return await database.fetch_val(query="""
+        INSERT INTO party_duplicate_candidate (party_id, duplicate_party_id, party_kind, score, status)
+        VALUES (LEAST(CAST(:a AS INT), CAST(:b AS INT)), GREATEST(CAST(:a AS INT), CAST(:b AS INT)), 'person', 0.9, :status)
+        RETURNING id
+    """, values={"a": party_id, "b": duplicate_party_id, "status": status})
+
+def test_merge_marks_the_candidate_merged_and_keeps_it(rollback):
+    async def scenario():
+        source, target, pending_other, rejected_other = [await _new_person() for _ in range(4)]
+        merged_pair = await _new_candidate(source, target, "pending")
+        pending_pair = await _new_candidate(source, pending_other, "pending")
+        rejected_pair = await _new_candidate(source, rejected_other, "rejected")
+        result = await merge_party(source, target)
+        rows = await database.fetch_all(query="""
+            SELECT id, party_id, duplicate_party_id, status, merged_party_id, merged_into_party_id, reviewed_at
+            FROM party_duplicate_candidate WHERE id IN (:merged, :pending, :rejected)
+        """, values={"merged": merged_pair, "pending": pending_pair, "rejected": rejected_pair})
+        return source, target, rejected_other, result, {row["id"]: dict(row) for row in rows}, merged_pair, pending_pair, rejected_pair
+
+    source, target, rejected_other, result, rows, merged_pair, pending_pair, rejected_pair = rollback(scenario)
+    assert result.closed["party_duplicate_candidate"] == 1
+    assert pending_pair not in rows
+    merged = rows[merged_pair]
+    assert (merged["status"], merged["merged_party_id"], merged["merged_into_party_id"]) == ("merged", source, target)
+    assert {merged["party_id"], merged["duplicate_party_id"]} == {None, target}
+    assert merged["reviewed_at"] is not None
+    rejected = rows[rejected_pair]
+    assert (rejected["status"], rejected["party_id"], rejected["duplicate_party_id"]) == ("rejected", None, rejected_other)
@@ -0,0 +1,69 @@
+from datetime import date
+from app.config.database import database
+from app.models.person import patch_person, update_person
+from app.schemas.person import PersonUpdate
+
+async def _new_person() -> int:
+    party_id = await database.fetch_val(query="INSERT INTO party DEFAULT VALUES RETURNING id")
+    await database.execute(query="INSERT INTO person (id) VALUES (:id)", values={"id": party_id})
+    return party_id
+
+async def _new_country(isocode: str) -> int:
+    return await database.fetch_val(
+        query="INSERT INTO country (isocode, name_en, name_th) VALUES (:isocode, :isocode, :isocode) RETURNING id",
+        values={"isocode": isocode}
+    )
+
+async def _rows(query: str, person_id: int) -> list:
+    return [row[0] for row in await database.fetch_all(query=query, values={"person_id": person_id})]
+
+def test_patch_country_closes_only_the_latest_open_citizenship(rollback):
+    async def scenario():
+        person_id = await _new_person()
+        first, second, third = [await _new_country(code) for code in ("XA", "XB", "XC")]
+        for country_id, fromdate in ((first, date(2000, 1, 1)), (second, date(2010, 1, 1))):
+            await database.execute(
+                query="INSERT INTO citizenship (person_id, country_id, fromdate) VALUES (:person_id, :country_id, :fromdate)",
+                values={"person_id": person_id, "country_id": country_id, "fromdate": fromdate}
+            )
+        profile = await patch_person(person_id, PersonUpdate(country_id=third))
+        open_countries = await _rows(
+            "SELECT country_id FROM citizenship WHERE person_id = :person_id AND thrudate IS NULL ORDER BY country_id", person_id
+        )
+        return profile, open_countries, (first, second, third)
+
+    profile, open_countries, (first, second, third) = rollback(scenario)
+    assert open_countries == sorted([first, third])
+    assert profile.country_isocode == "XC"
+
+def test_repeated_patch_with_fractional_height_adds_no_history(rollback):
+    async def scenario():
+        person_id = await _new_person()
+        await patch_person(person_id, PersonUpdate(height_val=170.6))
+        await patch_person(person_id, PersonUpdate(height_val=170.6))
+        return await _rows("""
+            SELECT val FROM physicalcharacteristic
+            WHERE person_id = :person_id
+            AND physicalcharacteristictype_id = (SELECT id FROM physicalcharacteristictype WHERE description = 'Height')
+        """, person_id)
+
+    assert rollback(scenario) == [171]
+
+def test_put_country_already_held_by_a_dual_citizen_adds_no_row(rollback):
+    async def scenario():
+        person_id = await _new_person()
+        first, second = [await _new_country(code) for code in ("XA", "XB")]
+        for country_id, fromdate in ((first, date(2000, 1, 1)), (second, date(2010, 1, 1))):
+            await database.execute(
+                query="INSERT INTO citizenship (person_id, country_id, fromdate) VALUES (:person_id, :country_id, :fromdate)",
+                values={"person_id": person_id, "country_id": country_id, "fromdate": fromdate}
+            )
+        profile = await update_person(person_id, PersonUpdate(country_id=first))
+        open_countries = await _rows(
+            "SELECT country_id FROM citizenship WHERE person_id = :person_id AND thrudate IS NULL", person_id
+        )
+        return profile, open_countries, first
+
+    profile, open_countries, first = rollback(scenario)
+    assert open_countries == [first]
+    assert profile.country_isocode == "XA"
@@ -0,0 +1,48 @@
+from app.models.projection import Projection
+
+PROJECTION = Projection(
+    "person p",
+    {
+        "id": "p.id",
+        "gender": ("gt.description", "gt"),
+        "fname": ("n.fname", "n"),
+        "purposes": ("pu.purposes", "gt", "pu"),
+    },
+    joins={
+        "gt": "LEFT JOIN gender_type gt ON gt.id = p.gender_type_id",
+        "n": "LEFT JOIN LATERAL (SELECT 'a' AS fname) n ON TRUE",
+        "pu": "LEFT JOIN LATERAL (SELECT gt.id::text AS purposes) pu ON TRUE",
+    },
+    optional=["purposes"],
+    json_columns=["purposes"],
+)
+
+def test_default_fields_leave_out_optional_ones():
+    sql = PROJECTION.sql()
+    assert "gt.description AS gender" in sql and "n.fname" in sql
+    assert "purposes" not in sql
+    assert PROJECTION.fields == ["id", "gender", "fname", "purposes"]
+
+def test_only_the_joins_of_the_requested_fields():
+    sql = PROJECTION.sql(["id", "fname"])
+    assert sql.startswith("SELECT p.id,")
+    assert "gender_type" not in sql and "LATERAL (SELECT 'a' AS fname)" in sql
+
+def test_joins_keep_declaration_order():
+    sql = PROJECTION.sql(["purposes"])
+    assert sql.index("gender_type") < sql.index("AS purposes) pu")
+
+def test_row_decodes_json_columns():
+    assert PROJECTION.row({"id": 1, "purposes": '["a"]'}) == {"id": 1, "purposes": ["a"]}
+    assert PROJECTION.row({"id": 1, "purposes": None}) == {"id": 1, "purposes": None}
+
+def test_inner_joins_only_in_the_full_response():
+    projection = Projection(
+        "party_relationship pr",
+        {"id": "pr.id", "priority": ("pt.description", "pt")},
+        joins={"pt": "LEFT JOIN priority_type pt ON pr.priority_type_id = pt.id"},
+        inner_joins=["pt"],
+    )
+    assert "\n        JOIN priority_type pt" in projection.sql()
+    assert "LEFT JOIN priority_type pt" in projection.sql(["id", "priority"])
+    assert "priority_type" not in projection.sql(["id"])
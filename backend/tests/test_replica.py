@@ -0,0 +1,10 @@
+from app.config.replica import parse_lsn
+
+def test_parse_lsn_orders_like_postgres():
+    assert parse_lsn("16/B374D848") == (0x16 << 32) | 0xB374D848
+    assert parse_lsn("0/0") == 0
+    assert parse_lsn("1/0") > parse_lsn("0/FFFFFFFF")
+
+def test_parse_lsn_rejects_missing_or_malformed():
+    for value in (None, "", "16", "x/1", "1/zz"):
+        assert parse_lsn(value) is None
@@ -0,0 +1,19 @@
+from app.models.search_key import normalize_name, phonetic_key, search_keys
+
+def test_normalize_name_folds_case_accents_and_punctuation():
+    assert normalize_name("  José  O'Brien ") == "jose o brien"
+    assert normalize_name(None) is None
+
+def test_normalize_name_drops_thai_tone_marks_and_thanthakhat():
+    assert normalize_name("น้ำ") == "นำ"
+    assert normalize_name("ศักดิ์") == "ศักดิ"
+
+def test_phonetic_key_matches_thai_and_romanized_spellings():
+    assert phonetic_key("สมชาย") == phonetic_key("Somchai") == phonetic_key("Somchay") == "SMC"
+    assert phonetic_key("กรุงเทพ") == phonetic_key("Krung Thep") == "KLGTP"
+    assert phonetic_key("ธนากร") == phonetic_key("Thanakorn")
+    assert phonetic_key("มานพ") == phonetic_key("Manob")
+
+def test_search_keys_keeps_none():
+    assert search_keys("name", "Somchai") == {"name_key": "somchai", "name_phonetic": "SMC"}
+    assert search_keys("name_en", None) == {"name_en_key": None, "name_en_phonetic": None}
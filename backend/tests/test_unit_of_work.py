@@ -0,0 +1,24 @@
+from app.config.unit_of_work import _positional
+
+def test_positional_numbers_each_name_once_in_order():
+    sql, args = _positional(
+        "INSERT INTO t (a, b, c) VALUES (:b, :a, :b)",
+        [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    )
+    assert sql == "INSERT INTO t (a, b, c) VALUES ($1, $2, $1)"
+    assert args == [[2, 1], [4, 3]]
+
+def test_positional_leaves_casts_alone():
+    # As with SQLAlchemy text(), :name::text is not a bind parameter (use CAST(:name AS TEXT))
+    # and must not be cut to :nam
+    sql, args = _positional(
+        "VALUES (:person_id, :name::text, CAST(:x AS INT), now()::date)",
+        [{"person_id": 1, "x": "2"}]
+    )
+    assert sql == "VALUES ($1, :name::text, CAST($2 AS INT), now()::date)"
+    assert args == [[1, "2"]]
+
+def test_positional_skips_escaped_colons():
+    sql, args = _positional(r"SELECT '\:literal', :id", [{"id": 7}])
+    assert sql == r"SELECT '\:literal', $1"
+    assert args == [[7]]
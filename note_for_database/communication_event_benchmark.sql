@@ -0,0 +1,116 @@
+-- Benchmark for communication_event time-range queries at 10M rows
+-- Runs in its own schema so it does not touch application data
+-- Usage (inside the db container):
+--   psql -U spa -d myapp -f /path/to/communication_event_benchmark.sql
+-- Compare the EXPLAIN output of step 3 (no index) with step 5 (indexes from communication_event_index.sql)
+
+\timing on
+
+DROP SCHEMA IF EXISTS bench CASCADE;
+CREATE SCHEMA bench;
+
+-- 1. Same columns as public.communication_event, without foreign keys
+CREATE TABLE bench.communication_event (LIKE public.communication_event INCLUDING DEFAULTS);
+CREATE TABLE bench.communication_event_purpose (LIKE public.communication_event_purpose INCLUDING DEFAULTS);
+
+-- 2. 10M events spread over ~3 years, inserted in time order like production traffic
+INSERT INTO bench.communication_event (id, datetime_start, datetime_end, note, contact_mechanism_type_id,
+                                       communication_event_status_type_id, party_relationship_id)
+SELECT g,
+       TIMESTAMP '2023-01-01' + (g * INTERVAL '9 seconds'),
+       TIMESTAMP '2023-01-01' + (g * INTERVAL '9 seconds') + ((g % 60) * INTERVAL '1 minute'),
+       'bench event ' || g,
+       1 + (g % 5),
+       1 + (g % 4),
+       1 + (g % 100000)
+FROM generate_series(1, 10000000) AS g;
+
+INSERT INTO bench.communication_event_purpose (id, communication_event_id, communication_event_purpose_type_id)
+SELECT g, g, 1 + (g % 8)
+FROM generate_series(1, 10000000) AS g;
+
+ANALYZE bench.communication_event;
+ANALYZE bench.communication_event_purpose;
+
+-- 3. Baseline: first page of one day, then a filtered page (sequential scan expected)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT ce.*
+FROM bench.communication_event ce
+WHERE ce.datetime_start >= TIMESTAMP '2024-06-01'
+  AND ce.datetime_start <= TIMESTAMP '2024-06-02'
+  AND COALESCE(ce.datetime_end, ce.datetime_start) <= TIMESTAMP '2024-06-02'
+ORDER BY ce.datetime_start ASC, ce.id ASC
+LIMIT 100;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT ce.*
+FROM bench.communication_event ce
+WHERE ce.datetime_start >= TIMESTAMP '2024-06-01'
+  AND ce.datetime_start <= TIMESTAMP '2024-06-30'
+  AND COALESCE(ce.datetime_end, ce.datetime_start) <= TIMESTAMP '2024-06-30'
+  AND ce.communication_event_status_type_id = 2
+  AND EXISTS (
+      SELECT 1 FROM bench.communication_event_purpose cep
+      WHERE cep.communication_event_id = ce.id
+      AND cep.communication_event_purpose_type_id = 3
+  )
+ORDER BY ce.datetime_start ASC, ce.id ASC
+LIMIT 100;
+
+-- 4. Same indexes as communication_event_index.sql
+CREATE INDEX ON bench.communication_event (datetime_start, id);
+CREATE INDEX ON bench.communication_event USING BRIN (datetime_start) WITH (pages_per_range = 32);
+CREATE INDEX ON bench.communication_event_purpose (communication_event_id);
+CREATE INDEX ON bench.communication_event_purpose (communication_event_purpose_type_id, communication_event_id);
+ANALYZE bench.communication_event;
+ANALYZE bench.communication_event_purpose;
+
+SELECT relname, pg_size_pretty(pg_relation_size(oid)) AS size
+FROM pg_class
+WHERE relnamespace = 'bench'::regnamespace
+ORDER BY relname;
+
+-- 5. Indexed: first page, deep keyset page, filtered page, wide aggregate (BRIN)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT ce.*
+FROM bench.communication_event ce
+WHERE ce.datetime_start >= TIMESTAMP '2024-06-01'
+  AND ce.datetime_start <= TIMESTAMP '2024-06-02'
+  AND COALESCE(ce.datetime_end, ce.datetime_start) <= TIMESTAMP '2024-06-02'
+ORDER BY ce.datetime_start ASC, ce.id ASC
+LIMIT 100;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT ce.*
+FROM bench.communication_event ce
+WHERE ce.datetime_start >= TIMESTAMP '2024-06-01'
+  AND ce.datetime_start <= TIMESTAMP '2024-06-02'
+  AND COALESCE(ce.datetime_end, ce.datetime_start) <= TIMESTAMP '2024-06-02'
+  AND (ce.datetime_start, ce.id) > (TIMESTAMP '2024-06-01 18:00:00', 0)
+ORDER BY ce.datetime_start ASC, ce.id ASC
+LIMIT 100;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT ce.*
+FROM bench.communication_event ce
+WHERE ce.datetime_start >= TIMESTAMP '2024-06-01'
+  AND ce.datetime_start <= TIMESTAMP '2024-06-30'
+  AND COALESCE(ce.datetime_end, ce.datetime_start) <= TIMESTAMP '2024-06-30'
+  AND ce.communication_event_status_type_id = 2
+  AND EXISTS (
+      SELECT 1 FROM bench.communication_event_purpose cep
+      WHERE cep.communication_event_id = ce.id
+      AND cep.communication_event_purpose_type_id = 3
+  )
+ORDER BY ce.datetime_start ASC, ce.id ASC
+LIMIT 100;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT ce.communication_event_status_type_id, COUNT(*)
+FROM bench.communication_event ce
+WHERE ce.datetime_start >= TIMESTAMP '2024-01-01'
+  AND ce.datetime_start < TIMESTAMP '2024-04-01'
+GROUP BY ce.communication_event_status_type_id;
+
+-- Clean up
+DROP SCHEMA bench CASCADE;
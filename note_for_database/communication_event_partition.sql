@@ -0,0 +1,180 @@
+-- Monthly range partitioning for communication_event and communication_event_purpose
+-- Run once after create_table_v3.sql (replaces the indexes from communication_event_index.sql)
+-- Needs PostgreSQL 15+ (cross-partition UPDATE with ON UPDATE CASCADE foreign keys)
+--
+-- Layout
+-- communication_event          PARTITION BY RANGE (datetime_start), one partition per month
+-- communication_event_purpose  PARTITION BY RANGE (communication_event_datetime_start), same months
+--
+-- A partitioned table can only have a primary key that contains the partition key, so the
+-- key becomes (id, datetime_start). communication_event_purpose carries a copy of its event's
+-- datetime_start (communication_event_datetime_start) so that
+--   * its foreign key can reference (id, datetime_start)
+--   * it lands in the same month as its event, and old months of both tables detach together
+--   * joins on (id, datetime_start) can be done partition by partition
+-- Queries that bound datetime_start only touch the matching months (partition pruning).
+-- Lookups by id alone still work but probe every partition's primary key index.
+--
+-- Partition maintenance is done by create_communication_event_partitions() and
+-- detach_communication_event_partitions() below, called by app/jobs/communication_event_partition.py.
+-- The DEFAULT partitions only catch rows outside the created months; keep them empty by running
+-- the job ahead of time (a month cannot be created while the DEFAULT partition holds rows for it).
+
+BEGIN;
+
+-- 1. Keep the old tables aside and free their sequences
+ALTER TABLE communication_event_purpose RENAME TO communication_event_purpose_old;
+ALTER TABLE communication_event RENAME TO communication_event_old;
+ALTER SEQUENCE communication_event_id_seq OWNED BY NONE;
+ALTER SEQUENCE communication_event_purpose_id_seq OWNED BY NONE;
+
+-- 2. Partitioned tables
+CREATE TABLE communication_event (
+    id INT NOT NULL DEFAULT nextval('communication_event_id_seq'), -- Unique identifier for each communication event
+    datetime_start TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Start date and time of the communication event (partition key)
+    datetime_end TIMESTAMP,             -- End date and time of the communication event
+    note VARCHAR(128),                 -- Additional notes about the event
+    contact_mechanism_type_id INT REFERENCES contact_mechanism_type(id) ON DELETE CASCADE, -- Foreign key linking to contact mechanism type
+    communication_event_status_type_id INT REFERENCES communication_event_status_type(id) ON DELETE CASCADE, -- Foreign key linking to status type
+    party_relationship_id INT REFERENCES party_relationship(id) ON DELETE CASCADE, -- Foreign key linking to party relationship
+    PRIMARY KEY (id, datetime_start)
+) PARTITION BY RANGE (datetime_start);
+
+CREATE TABLE communication_event_purpose (
+    id INT NOT NULL DEFAULT nextval('communication_event_purpose_id_seq'), -- Unique identifier for each purpose association
+    communication_event_id INT NOT NULL, -- Foreign key linking to communication event
+    communication_event_datetime_start TIMESTAMP NOT NULL, -- Copy of communication_event.datetime_start (partition key)
+    communication_event_purpose_type_id INT REFERENCES communication_event_purpose_type(id) ON DELETE CASCADE, -- Foreign key linking to purpose type
+    PRIMARY KEY (id, communication_event_datetime_start),
+    FOREIGN KEY (communication_event_id, communication_event_datetime_start)
+        REFERENCES communication_event (id, datetime_start) ON UPDATE CASCADE ON DELETE CASCADE
+) PARTITION BY RANGE (communication_event_datetime_start);
+
+ALTER SEQUENCE communication_event_id_seq OWNED BY communication_event.id;
+ALTER SEQUENCE communication_event_purpose_id_seq OWNED BY communication_event_purpose.id;
+
+CREATE TABLE communication_event_default PARTITION OF communication_event DEFAULT;
+CREATE TABLE communication_event_purpose_default PARTITION OF communication_event_purpose DEFAULT;
+
+-- 3. Maintenance functions
+CREATE OR REPLACE FUNCTION create_communication_event_partitions(p_from DATE, p_months INT)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_month DATE := date_trunc('month', p_from)::date;
+    v_suffix TEXT;
+BEGIN
+    FOR i IN 0..p_months LOOP
+        v_suffix := to_char(v_month, '"y"YYYY"m"MM');
+        IF to_regclass('communication_event_' || v_suffix) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I PARTITION OF communication_event FOR VALUES FROM (%L) TO (%L)',
+                           'communication_event_' || v_suffix, v_month, (v_month + INTERVAL '1 month')::date);
+            RETURN NEXT 'communication_event_' || v_suffix;
+        END IF;
+        IF to_regclass('communication_event_purpose_' || v_suffix) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I PARTITION OF communication_event_purpose FOR VALUES FROM (%L) TO (%L)',
+                           'communication_event_purpose_' || v_suffix, v_month, (v_month + INTERVAL '1 month')::date);
+            RETURN NEXT 'communication_event_purpose_' || v_suffix;
+        END IF;
+        v_month := (v_month + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$;
+
+-- Detaches every month that ends on or before p_before and moves it to the
+-- communication_event_archive schema, where it can be dumped and dropped
+CREATE SCHEMA IF NOT EXISTS communication_event_archive;
+
+CREATE OR REPLACE FUNCTION detach_communication_event_partitions(p_before DATE)
+RETURNS SETOF TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    r RECORD;
+    c RECORD;
+    v_suffix TEXT;
+    v_purpose TEXT;
+BEGIN
+    FOR r IN
+        SELECT child.relname
+        FROM pg_inherits i
+        JOIN pg_class child ON child.oid = i.inhrelid
+        WHERE i.inhparent = 'communication_event'::regclass
+          AND child.relname ~ '^communication_event_y[0-9]{4}m[0-9]{2}$'
+        ORDER BY child.relname
+    LOOP
+        v_suffix := right(r.relname, 8);
+        IF (to_date(v_suffix, '"y"YYYY"m"MM') + INTERVAL '1 month')::date > p_before THEN
+            CONTINUE;
+        END IF;
+
+        -- Purposes first: the event partition cannot leave while rows still reference it
+        v_purpose := 'communication_event_purpose_' || v_suffix;
+        IF to_regclass(v_purpose) IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE communication_event_purpose DETACH PARTITION %I', v_purpose);
+            FOR c IN
+                SELECT conname FROM pg_constraint
+                WHERE conrelid = to_regclass(v_purpose)
+                  AND contype = 'f'
+                  AND confrelid = 'communication_event'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', v_purpose, c.conname);
+            END LOOP;
+            EXECUTE format('ALTER TABLE %I SET SCHEMA communication_event_archive', v_purpose);
+            RETURN NEXT v_purpose;
+        END IF;
+
+        EXECUTE format('ALTER TABLE communication_event DETACH PARTITION %I', r.relname);
+        EXECUTE format('ALTER TABLE %I SET SCHEMA communication_event_archive', r.relname);
+        RETURN NEXT r.relname;
+    END LOOP;
+END;
+$$;
+
+-- 4. Months covering the existing data plus three months ahead
+SELECT create_communication_event_partitions(
+    COALESCE((SELECT MIN(datetime_start) FROM communication_event_old), CURRENT_TIMESTAMP)::date,
+    (
+        EXTRACT(YEAR FROM age(date_trunc('month', CURRENT_DATE),
+                              date_trunc('month', COALESCE((SELECT MIN(datetime_start) FROM communication_event_old), CURRENT_TIMESTAMP)))) * 12
+        + EXTRACT(MONTH FROM age(date_trunc('month', CURRENT_DATE),
+                                 date_trunc('month', COALESCE((SELECT MIN(datetime_start) FROM communication_event_old), CURRENT_TIMESTAMP))))
+        + 3
+    )::int
+);
+
+-- 5. Copy the data (events without a start time take their end time, or now)
+INSERT INTO communication_event (id, datetime_start, datetime_end, note, contact_mechanism_type_id,
+                                 communication_event_status_type_id, party_relationship_id)
+SELECT id, COALESCE(datetime_start, datetime_end, CURRENT_TIMESTAMP), datetime_end, note, contact_mechanism_type_id,
+       communication_event_status_type_id, party_relationship_id
+FROM communication_event_old;
+
+INSERT INTO communication_event_purpose (id, communication_event_id, communication_event_datetime_start,
+                                         communication_event_purpose_type_id)
+SELECT cep.id, cep.communication_event_id, ce.datetime_start, cep.communication_event_purpose_type_id
+FROM communication_event_purpose_old cep
+JOIN communication_event ce ON ce.id = cep.communication_event_id;
+
+DROP TABLE communication_event_purpose_old;
+DROP TABLE communication_event_old;
+
+-- 6. Indexes (created on the parent, cascaded to every partition; see communication_event_index.sql)
+CREATE INDEX communication_event_datetime_start_id_btree
+    ON communication_event (datetime_start, id);
+
+CREATE INDEX communication_event_datetime_start_brin
+    ON communication_event USING BRIN (datetime_start) WITH (pages_per_range = 32);
+
+CREATE INDEX communication_event_party_relationship_id_datetime_start_btree
+    ON communication_event (party_relationship_id, datetime_start DESC, id DESC);
+
+CREATE INDEX communication_event_purpose_communication_event_id_btree
+    ON communication_event_purpose (communication_event_id, communication_event_datetime_start);
+
+CREATE INDEX communication_event_purpose_type_id_communication_event_id_btree
+    ON communication_event_purpose (communication_event_purpose_type_id, communication_event_id);
+
+COMMIT;
+
+ANALYZE communication_event;
+ANALYZE communication_event_purpose;
@@ -0,0 +1,43 @@
+-- Background job queue for app/jobs/worker.py (enqueue: POST /v1/jobs/, poll: GET /v1/jobs/{id})
+-- Run once after create_table_v3.sql (safe to re-run)
+--
+-- Workers claim the oldest due queued job with FOR UPDATE SKIP LOCKED, so several workers never
+-- take the same job and never wait on each other. A running job sends a heartbeat; one whose
+-- worker died (no heartbeat for JOB_LEASE_SECONDS) is queued again, or failed once it has used
+-- max_attempts. Failed attempts are retried after a delay that grows with the attempt number.
+
+CREATE TABLE IF NOT EXISTS job (
+    id BIGSERIAL PRIMARY KEY,               -- Unique identifier for each job
+    kind VARCHAR(64) NOT NULL,              -- Handler name, e.g. 'party_dedup' (JOB_KINDS in app/models/job.py)
+    params JSONB NOT NULL DEFAULT '{}',     -- Handler arguments
+    status VARCHAR(16) NOT NULL DEFAULT 'queued', -- queued, running, succeeded, failed
+    attempts INT NOT NULL DEFAULT 0,        -- Attempts started so far
+    max_attempts INT NOT NULL DEFAULT 3,    -- Attempts before the job is failed for good
+    run_after TIMESTAMPTZ NOT NULL DEFAULT now(), -- Not claimed before this time (retry delay)
+    progress JSONB,                         -- {"done": ..., "total": ..., "message": ...} reported by the handler
+    result JSONB,                           -- Handler return value once succeeded
+    error TEXT,                             -- Last error
+    worker VARCHAR(128),                    -- host:pid of the worker running / that ran the job
+    created_by INT,                         -- users.id of the requester, NULL for jobs queued by scripts
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    started_at TIMESTAMPTZ,                 -- Start of the last attempt
+    heartbeat_at TIMESTAMPTZ,               -- Last sign of life of the running attempt
+    finished_at TIMESTAMPTZ,
+    CHECK (status IN ('queued', 'running', 'succeeded', 'failed'))
+);
+
+-- Claim: due queued jobs, oldest first
+CREATE INDEX IF NOT EXISTS job_queued_run_after_btree
+    ON job (run_after, id)
+    WHERE status = 'queued';
+
+-- Lease check: running jobs by heartbeat
+CREATE INDEX IF NOT EXISTS job_running_heartbeat_btree
+    ON job (heartbeat_at)
+    WHERE status = 'running';
+
+-- GET /v1/jobs/ : newest first
+CREATE INDEX IF NOT EXISTS job_created_at_btree
+    ON job (created_at DESC, id DESC);
+
+ANALYZE job;
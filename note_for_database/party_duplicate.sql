@@ -0,0 +1,56 @@
+-- Review table for duplicate-party candidates found by app/jobs/party_dedup.py
+-- Run once after create_table_v3.sql and search_key.sql (safe to re-run)
+--
+-- One row per candidate pair, stored with party_id < duplicate_party_id so a pair is only
+-- found once. Re-running the job refreshes score and reasons of pending pairs; pairs already
+-- reviewed (merged / rejected) keep their status.
+--
+-- POST /v1/party/{id}/merge_into/{target} marks the pair it merged as 'merged' and records both
+-- ids before deleting the source party; the foreign keys are ON DELETE SET NULL so that row (and
+-- other reviewed rows of the deleted party) stay as history. Pending pairs of the deleted party
+-- are removed by the merge, the next party_dedup run finds them again against the target.
+
+CREATE TABLE IF NOT EXISTS party_duplicate_candidate (
+    id SERIAL PRIMARY KEY,                  -- Unique identifier for each candidate pair
+    party_id INT REFERENCES party(id) ON DELETE SET NULL,           -- Lower party id of the pair (NULL once merged away)
+    duplicate_party_id INT REFERENCES party(id) ON DELETE SET NULL, -- Higher party id of the pair (NULL once merged away)
+    party_kind VARCHAR(16) NOT NULL,        -- 'person' or 'organization'
+    score NUMERIC(5, 4) NOT NULL,           -- 0..1, higher is more likely the same party
+    reasons TEXT[] NOT NULL DEFAULT '{}',   -- Matching evidence, e.g. {personal_id_number,birthdate}
+    status VARCHAR(16) NOT NULL DEFAULT 'pending', -- pending, merged, rejected
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    reviewed_at TIMESTAMP,
+    merged_party_id INT,                    -- Party deleted by the merge (status 'merged')
+    merged_into_party_id INT REFERENCES party(id) ON DELETE SET NULL, -- Party it was merged into
+    UNIQUE (party_id, duplicate_party_id),
+    CHECK (party_id < duplicate_party_id),
+    CHECK (status IN ('pending', 'merged', 'rejected'))
+);
+
+-- Tables created before merges were recorded: keep merged rows instead of cascading them away
+ALTER TABLE party_duplicate_candidate
+    ALTER COLUMN party_id DROP NOT NULL,
+    ALTER COLUMN duplicate_party_id DROP NOT NULL,
+    ADD COLUMN IF NOT EXISTS merged_party_id INT,
+    ADD COLUMN IF NOT EXISTS merged_into_party_id INT REFERENCES party(id) ON DELETE SET NULL,
+    DROP CONSTRAINT IF EXISTS party_duplicate_candidate_party_id_fkey,
+    DROP CONSTRAINT IF EXISTS party_duplicate_candidate_duplicate_party_id_fkey,
+    ADD CONSTRAINT party_duplicate_candidate_party_id_fkey
+        FOREIGN KEY (party_id) REFERENCES party(id) ON DELETE SET NULL,
+    ADD CONSTRAINT party_duplicate_candidate_duplicate_party_id_fkey
+        FOREIGN KEY (duplicate_party_id) REFERENCES party(id) ON DELETE SET NULL;
+
+-- Review queue: best pending candidates first
+CREATE INDEX IF NOT EXISTS party_duplicate_candidate_pending_score_btree
+    ON party_duplicate_candidate (score DESC, id)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS party_duplicate_candidate_duplicate_party_id_btree
+    ON party_duplicate_candidate (duplicate_party_id);
+
+-- Deleting a party sets merged_into_party_id to NULL without a scan
+CREATE INDEX IF NOT EXISTS party_duplicate_candidate_merged_into_party_id_btree
+    ON party_duplicate_candidate (merged_into_party_id)
+    WHERE merged_into_party_id IS NOT NULL;
+
+ANALYZE party_duplicate_candidate;
@@ -0,0 +1,28 @@
+-- Indexes for POST /v1/party/{id}/merge_into/{target} (merge_party in app/models/party.py)
+-- Run once after create_table_v3.sql, party_timeline_index.sql and temporal_single_open_row.sql (safe to re-run)
+-- Every merge step is "UPDATE ... WHERE <foreign key> = :party_id", and deleting the source party
+-- cascades into each table that references it. Without an index on the referencing column each of
+-- those is a sequential scan of the whole table while both parties are locked.
+-- party_role (party_id), party_relationship (from/to_party_role_id) and party_classification (party_id)
+-- come from party_timeline_index.sql; the *_open_uidx indexes only cover open rows.
+
+CREATE INDEX IF NOT EXISTS personname_person_id_btree
+    ON personname (person_id);
+
+CREATE INDEX IF NOT EXISTS maritalstatus_person_id_btree
+    ON maritalstatus (person_id);
+
+CREATE INDEX IF NOT EXISTS physicalcharacteristic_person_id_btree
+    ON physicalcharacteristic (person_id);
+
+CREATE INDEX IF NOT EXISTS citizenship_person_id_btree
+    ON citizenship (person_id);
+
+CREATE INDEX IF NOT EXISTS passport_citizenship_id_btree
+    ON passport (citizenship_id);
+
+ANALYZE personname;
+ANALYZE maritalstatus;
+ANALYZE physicalcharacteristic;
+ANALYZE citizenship;
+ANALYZE passport;
@@ -0,0 +1,22 @@
+-- Indexes for GET /v1/party/{id}/timeline (app/models/party.py)
+-- Run once after create_table_v3.sql (safe to re-run)
+-- PostgreSQL does not index foreign keys automatically; the timeline walks
+-- party -> party_role -> party_relationship (either side) -> communication_event
+-- and party -> party_classification, so each hop needs an index on the referencing column.
+-- communication_event (party_relationship_id, datetime_start DESC, id DESC) comes from communication_event_index.sql.
+
+CREATE INDEX IF NOT EXISTS party_role_party_id_btree
+    ON party_role (party_id);
+
+CREATE INDEX IF NOT EXISTS party_relationship_from_party_role_id_btree
+    ON party_relationship (from_party_role_id);
+
+CREATE INDEX IF NOT EXISTS party_relationship_to_party_role_id_btree
+    ON party_relationship (to_party_role_id);
+
+CREATE INDEX IF NOT EXISTS party_classification_party_id_btree
+    ON party_classification (party_id);
+
+ANALYZE party_role;
+ANALYZE party_relationship;
+ANALYZE party_classification;
@@ -0,0 +1,112 @@
+-- Benchmark for GET /v1/search at 1M parties (800k persons, 200k organizations)
+-- Runs in its own schema so it does not touch application data
+-- Usage (inside the db container):
+--   psql -U spa -d myapp -f /path/to/search_benchmark.sql
+-- Compare the EXPLAIN output of step 3 (no index) with step 5 (indexes from search_index.sql);
+-- target is well under 50 ms per query with the indexes
+
+\timing on
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DROP SCHEMA IF EXISTS bench_search CASCADE;
+CREATE SCHEMA bench_search;
+
+-- 1. Same columns as public.personname / public.organization, without foreign keys
+CREATE TABLE bench_search.personname (LIKE public.personname INCLUDING DEFAULTS);
+CREATE TABLE bench_search.organization (LIKE public.organization INCLUDING DEFAULTS);
+
+-- 2. Names built from Latin and Thai syllables; 2 current names per person plus 1 closed name
+INSERT INTO bench_search.personname (id, fromdate, thrudate, person_id, personnametype_id, name)
+SELECT g * 3 + k,
+       DATE '2020-01-01',
+       CASE WHEN k = 2 THEN DATE '2022-01-01' END,
+       g,
+       CASE k WHEN 0 THEN 1 WHEN 1 THEN 3 ELSE 1 END,
+       CASE WHEN g % 2 = 0
+            THEN (ARRAY['Som','Sup','Kit','Wan','Nat','Pra','Cha','Ara'])[1 + (g + k) % 8]
+                 || (ARRAY['chai','porn','ti','na','thida','sert','lerm','wut'])[1 + (g / 8 + k) % 8]
+                 || CASE WHEN k = 1 THEN (g % 997)::text ELSE '' END
+            ELSE (ARRAY['สม','สุ','กิต','วัน','ณัฐ','ประ','ชา','อรุ'])[1 + (g + k) % 8]
+                 || (ARRAY['ชาย','พร','ติ','นา','ธิดา','เสริฐ','เลิศ','วุฒิ'])[1 + (g / 8 + k) % 8]
+                 || CASE WHEN k = 1 THEN (g % 997)::text ELSE '' END
+       END
+FROM generate_series(1, 800000) AS g, generate_series(0, 2) AS k;
+
+INSERT INTO bench_search.organization (id, name_en, name_th)
+SELECT 800000 + g,
+       (ARRAY['Siam','Bangkok','Thai','Chiang Mai','Phuket','Isan','Mekong','Andaman'])[1 + g % 8]
+           || ' ' || (ARRAY['Cement','Trading','Logistics','Foods','Bank','Energy','Textile','Holdings'])[1 + (g / 8) % 8]
+           || ' ' || g,
+       (ARRAY['สยาม','กรุงเทพ','ไทย','เชียงใหม่','ภูเก็ต','อีสาน','แม่โขง','อันดามัน'])[1 + g % 8]
+           || (ARRAY['ซีเมนต์','การค้า','ขนส่ง','อาหาร','ธนาคาร','พลังงาน','สิ่งทอ','โฮลดิ้ง'])[1 + (g / 8) % 8]
+           || ' ' || g
+FROM generate_series(1, 200000) AS g;
+
+ANALYZE bench_search.personname;
+ANALYZE bench_search.organization;
+
+-- 3. Baseline: prefix and fuzzy lookups (sequential scans expected)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT person_id, name, word_similarity('Somchai', name) AS score
+FROM bench_search.personname
+WHERE thrudate IS NULL
+AND (lower(name) LIKE 'somchai%' OR 'Somchai' <% name)
+ORDER BY score DESC
+LIMIT 20;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id, name_th, word_similarity('สยามซีเมน', name_th) AS score
+FROM bench_search.organization
+WHERE lower(name_th) LIKE 'สยามซีเมน%' OR 'สยามซีเมน' <% name_th
+ORDER BY score DESC
+LIMIT 20;
+
+-- 4. Same indexes as search_index.sql
+CREATE INDEX ON bench_search.personname (lower(name) text_pattern_ops) WHERE thrudate IS NULL;
+CREATE INDEX ON bench_search.personname USING GIN (name gin_trgm_ops) WHERE thrudate IS NULL;
+CREATE INDEX ON bench_search.organization (lower(name_en) text_pattern_ops);
+CREATE INDEX ON bench_search.organization USING GIN (name_en gin_trgm_ops);
+CREATE INDEX ON bench_search.organization (lower(name_th) text_pattern_ops);
+CREATE INDEX ON bench_search.organization USING GIN (name_th gin_trgm_ops);
+ANALYZE bench_search.personname;
+ANALYZE bench_search.organization;
+
+SELECT relname, pg_size_pretty(pg_relation_size(oid)) AS size
+FROM pg_class
+WHERE relnamespace = 'bench_search'::regnamespace
+ORDER BY relname;
+
+-- 5. Indexed: short prefix (btree only), Latin fuzzy with a typo, Thai fuzzy, organization substring
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT person_id, name
+FROM bench_search.personname
+WHERE thrudate IS NULL
+AND lower(name) LIKE 'so%'
+LIMIT 20;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT person_id, name, word_similarity('Somchia', name) AS score
+FROM bench_search.personname
+WHERE thrudate IS NULL
+AND (lower(name) LIKE 'somchia%' OR 'Somchia' <% name)
+ORDER BY score DESC
+LIMIT 20;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT person_id, name, word_similarity('สมชาย', name) AS score
+FROM bench_search.personname
+WHERE thrudate IS NULL
+AND (lower(name) LIKE 'สมชาย%' OR 'สมชาย' <% name)
+ORDER BY score DESC
+LIMIT 20;
+
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id, name_en, word_similarity('Cement', name_en) AS score
+FROM bench_search.organization
+WHERE lower(name_en) LIKE 'cement%' OR 'Cement' <% name_en
+ORDER BY score DESC
+LIMIT 20;
+
+-- Clean up
+DROP SCHEMA bench_search CASCADE;
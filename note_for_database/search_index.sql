@@ -0,0 +1,44 @@
+-- Indexes for GET /v1/search (app/models/search.py)
+-- Run once after create_table_v3.sql and temporal_single_open_row.sql (safe to re-run)
+--
+-- Each searched column gets two indexes:
+-- 1. BTREE (lower(column) text_pattern_ops)
+--    Prefix search: lower(name) LIKE 'som%' is a range scan. text_pattern_ops compares
+--    byte-wise, so it works whatever the database collation is and for Thai as well as Latin.
+-- 2. GIN (column gin_trgm_ops)
+--    Fuzzy and substring search: :q <% name (word_similarity) finds typos ("Somchia") and
+--    matches inside longer names ("Siam" in "Siam Cement Group"). Trigrams are case-folded.
+--    Thai letters count as word characters as long as the database locale is UTF-8
+--    (the default for the postgres image); with LC_CTYPE=C they would be ignored.
+--    Queries shorter than 3 characters skip this index and only use the prefix one.
+--
+-- personname indexes are partial (thrudate IS NULL): only current names are searched, and
+-- the search query repeats the predicate so the planner can use them.
+--
+-- Tuning: the fuzzy match threshold is pg_trgm.word_similarity_threshold (default 0.6).
+--   ALTER DATABASE myapp SET pg_trgm.word_similarity_threshold = 0.5;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS personname_open_name_prefix_btree
+    ON personname (lower(name) text_pattern_ops)
+    WHERE thrudate IS NULL;
+
+CREATE INDEX IF NOT EXISTS personname_open_name_trgm_gin
+    ON personname USING GIN (name gin_trgm_ops)
+    WHERE thrudate IS NULL;
+
+CREATE INDEX IF NOT EXISTS organization_name_en_prefix_btree
+    ON organization (lower(name_en) text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS organization_name_en_trgm_gin
+    ON organization USING GIN (name_en gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS organization_name_th_prefix_btree
+    ON organization (lower(name_th) text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS organization_name_th_trgm_gin
+    ON organization USING GIN (name_th gin_trgm_ops);
+
+ANALYZE personname;
+ANALYZE organization;
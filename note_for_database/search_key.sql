@@ -0,0 +1,50 @@
+-- Normalized and phonetic search keys for personname and organization names
+-- Run once after search_index.sql (safe to re-run), then fill existing rows with
+--   docker compose exec backend python -m app.jobs.search_key_backfill
+--
+-- The keys are computed in Python (app/models/search_key.py) by the model functions that write
+-- personname and organization, so every write path produces the same keys as the search query.
+--
+-- <column>_key       Unicode-normalized, case-folded, Thai tone marks removed
+--                    "น้ำ" and "นํ้า" and "น้ํา" -> "นำ", "Café" -> "cafe"
+-- <column>_phonetic  consonant skeleton of the (romanized) name
+--                    "สมชาย", "Somchai", "Somchay" -> "SMC"
+--
+-- Both are matched with = and LIKE 'prefix%' through btree text_pattern_ops indexes, which
+-- replace the lower(name) prefix indexes from search_index.sql. The trigram indexes stay for
+-- fuzzy and substring matching.
+
+ALTER TABLE personname ADD COLUMN IF NOT EXISTS name_key VARCHAR(128);          -- normalize_name(name)
+ALTER TABLE personname ADD COLUMN IF NOT EXISTS name_phonetic VARCHAR(128);     -- phonetic_key(name)
+
+ALTER TABLE organization ADD COLUMN IF NOT EXISTS name_en_key VARCHAR(128);      -- normalize_name(name_en)
+ALTER TABLE organization ADD COLUMN IF NOT EXISTS name_en_phonetic VARCHAR(128); -- phonetic_key(name_en)
+ALTER TABLE organization ADD COLUMN IF NOT EXISTS name_th_key VARCHAR(128);      -- normalize_name(name_th)
+ALTER TABLE organization ADD COLUMN IF NOT EXISTS name_th_phonetic VARCHAR(128); -- phonetic_key(name_th)
+
+DROP INDEX IF EXISTS personname_open_name_prefix_btree;
+DROP INDEX IF EXISTS organization_name_en_prefix_btree;
+DROP INDEX IF EXISTS organization_name_th_prefix_btree;
+
+CREATE INDEX IF NOT EXISTS personname_open_name_key_btree
+    ON personname (name_key text_pattern_ops)
+    WHERE thrudate IS NULL;
+
+CREATE INDEX IF NOT EXISTS personname_open_name_phonetic_btree
+    ON personname (name_phonetic text_pattern_ops)
+    WHERE thrudate IS NULL;
+
+CREATE INDEX IF NOT EXISTS organization_name_en_key_btree
+    ON organization (name_en_key text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS organization_name_en_phonetic_btree
+    ON organization (name_en_phonetic text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS organization_name_th_key_btree
+    ON organization (name_th_key text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS organization_name_th_phonetic_btree
+    ON organization (name_th_phonetic text_pattern_ops);
+
+ANALYZE personname;
+ANALYZE organization;
@@ -0,0 +1,110 @@
+-- At most one open row (thrudate IS NULL) per person and attribute
+-- Run once after create_table_v3.sql (safe to re-run)
+--
+-- personname, maritalstatus, physicalcharacteristic and citizenship keep history: the current
+-- value is the row whose thrudate is NULL. Nothing used to stop two open rows for the same
+-- attribute, so every read ranked rows by fromdate DESC, id DESC. With the constraints below
+-- the current value is a single-row lookup on a small partial index.
+--
+-- Partial unique indexes instead of EXCLUDE USING gist (daterange(fromdate, thrudate) WITH &&):
+--   * the application only ever asks for the open row, not "the row valid on date X"
+--   * an exclusion constraint on (person_id, type, daterange) needs the btree_gist extension and
+--     also rejects overlapping closed history that the imported CSV data already contains
+--   * the partial index only holds open rows, so it stays small, and INCLUDE makes the lookups
+--     in app/models/person.py index-only
+--
+-- Keys
+--   personname              (person_id, personnametype_id)
+--   maritalstatus           (person_id)
+--   physicalcharacteristic  (person_id, physicalcharacteristictype_id)
+--   citizenship             (person_id, country_id)   dual citizenship stays possible
+--
+-- Writes keep the invariant by closing the open row before inserting a new one
+-- (update_person, patch_person and the create_* functions of each table).
+
+BEGIN;
+
+-- 1. Repair: keep the row the old reads showed (latest by fromdate DESC, id DESC) and close the rest
+WITH ranked AS (
+    SELECT id, fromdate,
+           FIRST_VALUE(fromdate) OVER w AS kept_fromdate,
+           ROW_NUMBER() OVER w AS rn
+    FROM personname
+    WHERE thrudate IS NULL
+    WINDOW w AS (PARTITION BY person_id, personnametype_id ORDER BY fromdate DESC, id DESC)
+)
+UPDATE personname t
+SET thrudate = GREATEST(COALESCE(r.kept_fromdate, CURRENT_DATE), r.fromdate)
+FROM ranked r
+WHERE t.id = r.id AND r.rn > 1;
+
+WITH ranked AS (
+    SELECT id, fromdate,
+           FIRST_VALUE(fromdate) OVER w AS kept_fromdate,
+           ROW_NUMBER() OVER w AS rn
+    FROM maritalstatus
+    WHERE thrudate IS NULL
+    WINDOW w AS (PARTITION BY person_id ORDER BY fromdate DESC, id DESC)
+)
+UPDATE maritalstatus t
+SET thrudate = GREATEST(COALESCE(r.kept_fromdate, CURRENT_DATE), r.fromdate)
+FROM ranked r
+WHERE t.id = r.id AND r.rn > 1;
+
+WITH ranked AS (
+    SELECT id, fromdate,
+           FIRST_VALUE(fromdate) OVER w AS kept_fromdate,
+           ROW_NUMBER() OVER w AS rn
+    FROM physicalcharacteristic
+    WHERE thrudate IS NULL
+    WINDOW w AS (PARTITION BY person_id, physicalcharacteristictype_id ORDER BY fromdate DESC, id DESC)
+)
+UPDATE physicalcharacteristic t
+SET thrudate = GREATEST(COALESCE(r.kept_fromdate, CURRENT_DATE), r.fromdate)
+FROM ranked r
+WHERE t.id = r.id AND r.rn > 1;
+
+WITH ranked AS (
+    SELECT id, fromdate,
+           FIRST_VALUE(fromdate) OVER w AS kept_fromdate,
+           ROW_NUMBER() OVER w AS rn
+    FROM citizenship
+    WHERE thrudate IS NULL
+    WINDOW w AS (PARTITION BY person_id, country_id ORDER BY fromdate DESC, id DESC)
+)
+UPDATE citizenship t
+SET thrudate = GREATEST(COALESCE(r.kept_fromdate, CURRENT_DATE), r.fromdate)
+FROM ranked r
+WHERE t.id = r.id AND r.rn > 1;
+
+-- 2. Constraints (the INCLUDE columns are the ones get_person / get_all_persons read)
+CREATE UNIQUE INDEX IF NOT EXISTS personname_open_uidx
+    ON personname (person_id, personnametype_id) INCLUDE (id, name, fromdate)
+    WHERE thrudate IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS maritalstatus_open_uidx
+    ON maritalstatus (person_id) INCLUDE (id, maritalstatustype_id, fromdate)
+    WHERE thrudate IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS physicalcharacteristic_open_uidx
+    ON physicalcharacteristic (person_id, physicalcharacteristictype_id) INCLUDE (id, val, fromdate)
+    WHERE thrudate IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS citizenship_open_uidx
+    ON citizenship (person_id, country_id)
+    WHERE thrudate IS NULL;
+
+-- Latest open citizenship of a person (ORDER BY fromdate DESC, id DESC LIMIT 1)
+CREATE INDEX IF NOT EXISTS citizenship_open_person_id_fromdate_btree
+    ON citizenship (person_id, fromdate DESC, id DESC) INCLUDE (country_id)
+    WHERE thrudate IS NULL;
+
+COMMIT;
+
+ANALYZE personname;
+ANALYZE maritalstatus;
+ANALYZE physicalcharacteristic;
+ANALYZE citizenship;
+
+-- Index-only scans also need an up-to-date visibility map; autovacuum keeps it current,
+-- right after the repair run VACUUM personname, maritalstatus, physicalcharacteristic, citizenship;